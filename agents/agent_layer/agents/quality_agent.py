@@ -51,11 +51,12 @@ from shared.primitives.quality import (
     check_low_confidence,
     check_completeness,
     get_resorts_needing_audit,
-    log_quality_issue,
+    log_quality_issues,
     log_audit_run,
     calculate_fix_priority,
     batch_issues_for_fix,
 )
+from shared.primitives.quality_engine import formula_issues, load_quality_frame
 from shared.primitives import (
     log_reasoning,
     get_daily_spend,
@@ -64,7 +65,7 @@ from shared.primitives import (
     make_decision,
 )
 from shared.config import settings
-from shared.supabase_client import get_supabase_client
+from shared.supabase_client import get_supabase_client, run_db
 
 
 class QualityAuditAgent(BaseAgent):
@@ -371,39 +372,16 @@ This is comprehensive but more expensive."""
         return result
 
     async def _execute_quick_scan(self, result: AuditResult, plan: AgentPlan) -> None:
-        """Execute quick scan - database queries only."""
-        # Get all published resorts
-        client = get_supabase_client()
-        response = (
-            client.table("resorts")
-            .select("id, name")
-            .eq("status", "published")
-            .execute()
-        )
-
-        resorts = response.data or []
-        result.resorts_audited = len(resorts)
-
-        for resort in resorts:
-            resort_id = resort["id"]
+        """Execute quick scan - database queries only.
 
-            # Check staleness
-            stale_issue = check_staleness(resort_id)
-            if stale_issue:
-                result.issues.append(stale_issue)
-                log_quality_issue(stale_issue)
-
-            # Check confidence
-            confidence_issue = check_low_confidence(resort_id)
-            if confidence_issue:
-                result.issues.append(confidence_issue)
-                log_quality_issue(confidence_issue)
+        Loads every published resort and its content in a few bulk queries
+        and runs the formula checks over all of them at once.
+        """
+        frame = await run_db(load_quality_frame, status="published", page_data=False)
+        result.resorts_audited = len(frame)
 
-            # Check completeness
-            completeness_issues = check_completeness(resort_id)
-            for issue in completeness_issues:
-                result.issues.append(issue)
-                log_quality_issue(issue)
+        result.issues.extend(formula_issues(frame))
+        await run_db(log_quality_issues, result.issues)
 
         # Calculate total fix cost
         result.total_fix_cost_estimate = sum(i.estimated_fix_cost for i in result.issues)
@@ -418,29 +396,25 @@ This is comprehensive but more expensive."""
         sample = await self._select_audit_sample(sample_size=10, prioritize_countries=[])
         result.resorts_audited = len(sample)
 
+        # Run formula checks first (free), for the whole sample at once
+        frame = await run_db(
+            load_quality_frame,
+            status=None,
+            resort_ids=[r["id"] for r in sample],
+            page_data=False,
+        )
+        result.issues.extend(formula_issues(frame))
+
         for resort in sample:
             resort_id = resort["id"]
 
-            # Run formula checks first (free)
-            stale_issue = check_staleness(resort_id)
-            if stale_issue:
-                result.issues.append(stale_issue)
-
-            confidence_issue = check_low_confidence(resort_id)
-            if confidence_issue:
-                result.issues.append(confidence_issue)
-
-            completeness_issues = check_completeness(resort_id)
-            result.issues.extend(completeness_issues)
-
             # For resorts with issues, run LLM assessment
             resort_issues = [i for i in result.issues if i.resort_id == resort_id]
             if resort_issues:
                 await self._llm_assess_resort(resort, resort_issues, result)
 
         # Log all issues
-        for issue in result.issues:
-            log_quality_issue(issue)
+        await run_db(log_quality_issues, result.issues)
 
         result.total_fix_cost_estimate = sum(i.estimated_fix_cost for i in result.issues)
         await self._queue_fixes(result)
@@ -483,8 +457,7 @@ This is comprehensive but more expensive."""
         await self._llm_assess_resort(resort, result.issues, result)
 
         # Log issues
-        for issue in result.issues:
-            log_quality_issue(issue)
+        await run_db(log_quality_issues, result.issues)
 
         result.total_fix_cost_estimate = sum(i.estimated_fix_cost for i in result.issues)
         await self._queue_fixes(result)
@@ -15,7 +15,7 @@ from enum import Enum
 from typing import Any
 from uuid import uuid4
 
-from shared.supabase_client import get_supabase_client
+from shared.supabase_client import execute_async, get_supabase_client
 
 
 class MessageType(Enum):
@@ -152,7 +152,7 @@ class AgentCoordinator:
         )
 
         try:
-            self.client.table("agent_messages").insert(message.to_dict()).execute()
+            await execute_async(self.client.table("agent_messages").insert(message.to_dict()))
         except Exception as e:
             print(f"Warning: Failed to send message: {e}")
             # Continue anyway - message sending shouldn't block execution
@@ -175,7 +175,7 @@ class AgentCoordinator:
             List of pending messages, highest priority first
         """
         try:
-            result = (
+            result = await execute_async(
                 self.client.table("agent_messages")
                 .select("*")
                 .eq("to_agent", agent_name)
@@ -183,7 +183,6 @@ class AgentCoordinator:
                 .order("priority", desc=True)
                 .order("created_at", desc=False)
                 .limit(limit)
-                .execute()
             )
 
             return [AgentMessage.from_dict(row) for row in (result.data or [])]
@@ -215,7 +214,9 @@ class AgentCoordinator:
             if response:
                 update_data["response"] = json.dumps(response, default=str)
 
-            self.client.table("agent_messages").update(update_data).eq("id", message_id).execute()
+            await execute_async(
+                self.client.table("agent_messages").update(update_data).eq("id", message_id)
+            )
             return True
         except Exception as e:
             print(f"Warning: Failed to acknowledge message: {e}")
@@ -242,12 +243,11 @@ class AgentCoordinator:
 
         while elapsed < timeout_seconds:
             try:
-                result = (
+                result = await execute_async(
                     self.client.table("agent_messages")
                     .select("status, response")
                     .eq("id", message_id)
                     .single()
-                    .execute()
                 )
 
                 if result.data and result.data.get("status") in ("completed", "failed"):
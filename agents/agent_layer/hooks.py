@@ -15,7 +15,7 @@ from enum import Enum
 from typing import Any, Callable
 from uuid import uuid4
 
-from shared.supabase_client import get_supabase_client
+from shared.supabase_client import execute_async, get_supabase_client
 
 
 class HookType(Enum):
@@ -262,7 +262,7 @@ class HookRegistry:
         )
 
         try:
-            self.client.table("agent_pending_approvals").insert({
+            await execute_async(self.client.table("agent_pending_approvals").insert({
                 "id": approval.id,
                 "hook_type": hook_type.value,
                 "agent_name": self.agent_name,
@@ -270,7 +270,7 @@ class HookRegistry:
                 "context": json.dumps(context, default=str),
                 "status": "pending",
                 "expires_at": approval.expires_at.isoformat() if approval.expires_at else None,
-            }).execute()
+            }))
         except Exception as e:
             print(f"Warning: Failed to persist pending approval: {e}")
 
@@ -323,12 +323,11 @@ class HookRegistry:
 
         while elapsed < timeout_seconds:
             try:
-                result = (
+                result = await execute_async(
                     self.client.table("agent_pending_approvals")
                     .select("*")
                     .eq("id", approval_id)
                     .single()
-                    .execute()
                 )
 
                 if result.data:
@@ -384,10 +383,10 @@ class HookRegistry:
     async def _expire_approval(self, approval_id: str) -> None:
         """Mark an approval as expired."""
         try:
-            self.client.table("agent_pending_approvals").update({
+            await execute_async(self.client.table("agent_pending_approvals").update({
                 "status": "expired",
                 "resolved_at": datetime.utcnow().isoformat(),
-            }).eq("id", approval_id).execute()
+            }).eq("id", approval_id))
         except Exception as e:
             print(f"Warning: Failed to expire approval: {e}")
 
@@ -419,7 +418,11 @@ class HookRegistry:
             if modified_data:
                 update_data["modified_data"] = json.dumps(modified_data, default=str)
 
-            self.client.table("agent_pending_approvals").update(update_data).eq("id", approval_id).execute()
+            await execute_async(
+                self.client.table("agent_pending_approvals")
+                .update(update_data)
+                .eq("id", approval_id)
+            )
             return True
         except Exception as e:
             print(f"Warning: Failed to approve: {e}")
@@ -442,12 +445,12 @@ class HookRegistry:
             True if update succeeded
         """
         try:
-            self.client.table("agent_pending_approvals").update({
+            await execute_async(self.client.table("agent_pending_approvals").update({
                 "status": "rejected",
                 "resolved_by": rejected_by,
                 "resolved_at": datetime.utcnow().isoformat(),
                 "resolution_notes": reason,
-            }).eq("id", approval_id).execute()
+            }).eq("id", approval_id))
             return True
         except Exception as e:
             print(f"Warning: Failed to reject: {e}")
@@ -472,7 +475,7 @@ class HookRegistry:
             if not include_expired:
                 query = query.eq("status", "pending")
 
-            result = query.order("created_at", desc=True).execute()
+            result = await execute_async(query.order("created_at", desc=True))
 
             return [
                 PendingApproval(
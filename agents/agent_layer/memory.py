@@ -7,16 +7,104 @@ Memory Tiers:
 
 Design Principle: Memory enables agents to learn from experience and
 maintain context across runs without explicit programming.
+
+Episode recall is indexed: the objective keys recall matches on
+(resort_name, country, task_type) are stored in their own agent_episodes
+columns (migration 051). recall_similar() reads only summary columns, not
+the plan/result/observation blobs. Recall and pattern results are cached
+per process for a few minutes, and storing an episode or pattern
+invalidates the agent's cached entries.
 """
 
+import asyncio
 import json
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from shared.supabase_client import get_supabase_client
+from shared.supabase_client import execute_async, get_supabase_client
 from shared.primitives import learn_from_outcome, LearningOutcome
 
+# Objective keys copied into indexed agent_episodes columns, in recall
+# priority order: same resort first, then same country, then same task.
+# Values are the column recall matches on; *_key columns hold lowercased
+# values so matching is case-insensitive.
+INDEXED_OBJECTIVE_KEYS = {
+    "resort_name": "resort_key",
+    "country": "country_key",
+    "task_type": "task_type",
+}
+
+# Columns recall_similar() returns (no plan/result/observation blobs)
+EPISODE_SUMMARY_COLUMNS = "run_id, resort_name, country, task_type, success, created_at"
+
+# Episodes scanned when the context has no indexed key (or before migration 051)
+LEGACY_SCAN_LIMIT = 50
+
+RECALL_CACHE_TTL_SECONDS = 600
+
+# (agent_name, kind, args) -> (expires_at, value)
+_recall_cache: dict[tuple, tuple[float, Any]] = {}
+_recall_cache_lock = threading.Lock()
+
+
+def _objective_key(value: Any) -> str | None:
+    """Normalized form of an objective value for the *_key columns."""
+    if value is None:
+        return None
+    key = str(value).strip().lower()
+    return key or None
+
+
+def _match_value(key: str, value: Any) -> str | None:
+    """Value to compare against key's indexed column."""
+    if value is None:
+        return None
+    if INDEXED_OBJECTIVE_KEYS[key] == key:
+        return str(value).strip() or None  # Stored as-is
+    return _objective_key(value)
+
+
+def _cache_get(key: tuple) -> Any | None:
+    with _recall_cache_lock:
+        entry = _recall_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        _recall_cache.pop(key, None)
+    return None
+
+
+def _cache_put(key: tuple, value: Any) -> None:
+    with _recall_cache_lock:
+        _recall_cache[key] = (time.monotonic() + RECALL_CACHE_TTL_SECONDS, value)
+
+
+def invalidate_recall_cache(agent_name: str | None = None) -> None:
+    """Drop cached recall results (for one agent, or all)."""
+    with _recall_cache_lock:
+        if agent_name is None:
+            _recall_cache.clear()
+            return
+        for key in [k for k in _recall_cache if k[0] == agent_name]:
+            del _recall_cache[key]
+
+
+def _episode_summary(row: dict[str, Any]) -> dict[str, Any]:
+    """Shape an indexed agent_episodes row like a recalled episode."""
+    objective = {
+        key: row[key]
+        for key in INDEXED_OBJECTIVE_KEYS
+        if row.get(key) is not None
+    }
+    return {
+        "run_id": row["run_id"],
+        "objective": objective,
+        "success": row.get("success", False),
+        "created_at": row.get("created_at"),
+    }
+
 
 @dataclass
 class Episode:
@@ -139,22 +227,37 @@ class AgentMemory:
             "observation": json.dumps(obs_dict, default=str),
             "success": obs_dict.get("success", False) if isinstance(obs_dict, dict) else False,
         }
+        # Indexed copies of the objective keys recall_similar() matches on
+        indexed = {}
+        for key, column in INDEXED_OBJECTIVE_KEYS.items():
+            value = objective.get(key) if isinstance(objective, dict) else None
+            if value is not None:
+                indexed[key] = str(value)
+                if column != key:
+                    indexed[column] = _objective_key(value)
 
         try:
-            self.client.table("agent_episodes").insert(episode_data).execute()
+            await execute_async(
+                self.client.table("agent_episodes").insert({**episode_data, **indexed})
+            )
         except Exception as e:
-            # Log but don't fail - memory is enhancement, not critical path
-            print(f"Warning: Failed to store episode: {e}")
+            try:
+                # Migration 051 not applied yet: store without the key columns
+                await execute_async(self.client.table("agent_episodes").insert(episode_data))
+            except Exception:
+                # Log but don't fail - memory is enhancement, not critical path
+                print(f"Warning: Failed to store episode: {e}")
+
+        invalidate_recall_cache(self.agent_name)
 
     async def recall_episode(self, run_id: str) -> dict[str, Any] | None:
         """Retrieve a specific episode by run_id."""
         try:
-            result = (
+            result = await execute_async(
                 self.client.table("agent_episodes")
                 .select("*")
                 .eq("run_id", run_id)
                 .single()
-                .execute()
             )
             if result.data:
                 return {
@@ -176,41 +279,110 @@ class AgentMemory:
     ) -> list[dict[str, Any]]:
         """Recall episodes similar to the given context.
 
-        Uses simple keyword matching for now. Could be enhanced with
-        embeddings for semantic similarity.
+        Matches the indexed objective keys (resort_name, country, task_type):
+        episodes for the same resort come first, then the same country, then
+        the same task type, most recent first within each. Results are
+        summaries (run_id, objective keys, success, created_at) and are
+        cached for a few minutes.
 
         Args:
             context: Dict with keys to match (e.g., {"resort_name": "Zermatt"})
             limit: Maximum episodes to return
 
         Returns:
-            List of relevant episodes, most recent first
+            List of relevant episode summaries
         """
+        terms = {}
+        for key in INDEXED_OBJECTIVE_KEYS:
+            value = _match_value(key, context.get(key))
+            if value:
+                terms[key] = value
+        cache_key = (
+            self.agent_name,
+            "similar",
+            tuple(sorted((k, _objective_key(v)) for k, v in context.items())),
+            limit,
+        )
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        episodes = None
+        if terms:
+            episodes = await self._recall_indexed(terms, limit)
+        if episodes is None:
+            episodes = await self._recall_by_scan(context, limit)
+
+        _cache_put(cache_key, episodes)
+        return list(episodes)
+
+    async def _recall_indexed(
+        self,
+        terms: dict[str, str],
+        limit: int,
+    ) -> list[dict[str, Any]] | None:
+        """One indexed query per objective key. None if the columns don't exist."""
+
+        def tier_query(key: str, value: str):
+            return execute_async(
+                self.client.table("agent_episodes")
+                .select(EPISODE_SUMMARY_COLUMNS)
+                .eq("agent_name", self.agent_name)
+                .eq(INDEXED_OBJECTIVE_KEYS[key], value)
+                .order("created_at", desc=True)
+                .limit(limit)
+            )
+
         try:
-            # Get recent episodes for this agent
-            result = (
+            tiers = await asyncio.gather(
+                *(tier_query(key, value) for key, value in terms.items())
+            )
+        except Exception:
+            return None  # Migration 051 not applied: fall back to scanning
+
+        episodes = []
+        seen = set()
+        for response in tiers:
+            for row in response.data or []:
+                if row["run_id"] in seen:
+                    continue
+                seen.add(row["run_id"])
+                episodes.append(_episode_summary(row))
+                if len(episodes) >= limit:
+                    return episodes
+        return episodes
+
+    async def _recall_by_scan(
+        self,
+        context: dict[str, Any],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Substring match over the most recent objectives (unindexed keys)."""
+        try:
+            result = await execute_async(
                 self.client.table("agent_episodes")
-                .select("*")
+                .select("run_id, objective, success, created_at")
                 .eq("agent_name", self.agent_name)
                 .order("created_at", desc=True)
-                .limit(50)
-                .execute()
+                .limit(LEGACY_SCAN_LIMIT)
             )
 
             episodes = []
             search_terms = set(str(v).lower() for v in context.values() if v)
 
             for row in result.data or []:
-                # Check if any search terms appear in objective
-                objective_str = row.get("objective", "").lower()
+                objective = row.get("objective") or ""
+                objective_str = (
+                    objective if isinstance(objective, str) else json.dumps(objective)
+                ).lower()
                 if any(term in objective_str for term in search_terms):
                     episodes.append({
                         "run_id": row["run_id"],
-                        "objective": json.loads(row["objective"]),
-                        "plan": json.loads(row["plan"]),
-                        "result": json.loads(row["result"]),
-                        "observation": json.loads(row["observation"]),
+                        "objective": (
+                            json.loads(objective) if isinstance(objective, str) else objective
+                        ),
                         "success": row["success"],
+                        "created_at": row.get("created_at"),
                     })
                     if len(episodes) >= limit:
                         break
@@ -223,14 +395,13 @@ class AgentMemory:
     async def recall_successful(self, limit: int = 10) -> list[dict[str, Any]]:
         """Recall recent successful episodes for pattern extraction."""
         try:
-            result = (
+            result = await execute_async(
                 self.client.table("agent_episodes")
                 .select("*")
                 .eq("agent_name", self.agent_name)
                 .eq("success", True)
                 .order("created_at", desc=True)
                 .limit(limit)
-                .execute()
             )
 
             return [
@@ -269,10 +440,12 @@ class AgentMemory:
         }
 
         try:
-            self.client.table("agent_patterns").insert(pattern_data).execute()
+            await execute_async(self.client.table("agent_patterns").insert(pattern_data))
         except Exception as e:
             print(f"Warning: Failed to store pattern: {e}")
 
+        invalidate_recall_cache(self.agent_name)
+
     async def recall_patterns(
         self,
         context: str | None = None,
@@ -285,8 +458,13 @@ class AgentMemory:
             min_confidence: Minimum confidence threshold
 
         Returns:
-            List of relevant patterns
+            List of relevant patterns (cached for a few minutes)
         """
+        cache_key = (self.agent_name, "patterns", context, min_confidence)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
             query = (
                 self.client.table("agent_patterns")
@@ -296,7 +474,7 @@ class AgentMemory:
                 .order("confidence", desc=True)
             )
 
-            result = query.execute()
+            result = await execute_async(query)
 
             patterns = []
             for row in result.data or []:
@@ -318,6 +496,7 @@ class AgentMemory:
                     last_validated=datetime.fromisoformat(row["last_validated"]) if row.get("last_validated") else None,
                 ))
 
+            _cache_put(cache_key, patterns)
             return patterns
 
         except Exception:
@@ -372,14 +551,13 @@ class AgentMemory:
     async def _recall_failed(self, limit: int = 10) -> list[dict[str, Any]]:
         """Recall recent failed episodes for pattern extraction."""
         try:
-            result = (
+            result = await execute_async(
                 self.client.table("agent_episodes")
                 .select("*")
                 .eq("agent_name", self.agent_name)
                 .eq("success", False)
                 .order("created_at", desc=True)
                 .limit(limit)
-                .execute()
             )
 
             return [
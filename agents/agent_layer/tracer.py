@@ -1,7 +1,8 @@
 """AgentTracer - Observability and distributed tracing for agent execution.
 
 Provides visibility into agent behavior for debugging and improvement.
-All spans are persisted to the agent_audit_log table.
+All spans are persisted to the agent_audit_log table through the buffered
+audit sink (shared/audit_sink.py), so a run's spans go out in bulk inserts.
 
 Design Principle: Every agent action should be traceable back to its
 reasoning, enabling post-hoc analysis and continuous improvement.
@@ -308,7 +309,7 @@ class AgentTracer:
         self._flush()
 
     def _flush(self) -> None:
-        """Persist all spans to the agent_audit_log table."""
+        """Hand all spans to the audit sink (non-blocking; written in bulk)."""
         for span in self.spans:
             try:
                 log_reasoning(
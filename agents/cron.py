@@ -10,6 +10,9 @@ Usage:
     # Custom max resorts
     python cron.py --max-resorts 2
 
+    # Process up to 4 resorts in parallel
+    python cron.py --concurrency 4
+
     # Dry run (see what would happen without doing it)
     python cron.py --dry-run
 
@@ -31,6 +34,12 @@ Usage:
     # Full autonomous mode: discovery + mixed selection
     python cron.py --run-discovery --use-mixed-selection
 
+Side Jobs:
+    GSC fetch, link validation, email sequences and guide generation run in
+    the same event loop as the resort pipeline, concurrently with it. Each
+    has a time and cost budget (CRON_JOBS); a job that overruns either is
+    cancelled. Per-job wall time and spend are reported under "jobs".
+
 Refresh Modes:
     - Full: Complete pipeline (research, content, images, approval panel)
     - Light: Skip research/content, only update costs/links/images (~80% cheaper)
@@ -55,17 +64,31 @@ import argparse
 import asyncio
 import json
 import sys
+import time
+import traceback
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Awaitable, Callable
 
 from pipeline import run_daily_pipeline, run_single_resort
 from pipeline.guide_orchestrator import run_guide_generation
+from shared.budget_ledger import metered_spend
+
+# Links checked per weekly validation run (oldest-checked first)
+LINK_VALIDATION_BATCH = 2000
+
+# Scheduler: how often budgets are checked, and how long a cancelled job
+# gets to unwind before we stop waiting for it
+JOB_POLL_SECONDS = 1.0
+JOB_CANCEL_GRACE_SECONDS = 10.0
 
 
 async def run_external_link_validation() -> dict:
     """Validate external links weekly (runs on Sundays only).
 
     Checks if external links in entity_link_cache are still valid.
-    Broken links hurt SEO trust signals.
+    Broken links hurt SEO trust signals. Each run checks the least recently
+    checked slice of the cache, so consecutive weeks cover all of it.
 
     Returns a dict with results suitable for logging.
     """
@@ -83,10 +106,13 @@ async def run_external_link_validation() -> dict:
 
     print("Validating external links (weekly check)...")
     try:
-        result = await validate_external_links(max_links=100)
+        result = await validate_external_links(max_links=LINK_VALIDATION_BATCH)
 
         if result.success:
-            print(f"✓ Link validation: {result.valid_count} valid, {result.invalid_count} broken")
+            print(
+                f"✓ Link validation: {result.valid_count} valid, {result.invalid_count} broken "
+                f"({result.unique_urls} unique URLs, {result.skipped_count} skipped)"
+            )
             if result.broken_links:
                 print(f"  Broken links found:")
                 for broken in result.broken_links[:5]:  # Show first 5
@@ -101,6 +127,8 @@ async def run_external_link_validation() -> dict:
             "total_checked": result.total_checked,
             "valid_count": result.valid_count,
             "invalid_count": result.invalid_count,
+            "skipped_count": result.skipped_count,
+            "unique_urls": result.unique_urls,
             "broken_links": result.broken_links,
             "error": result.error,
         }
@@ -352,30 +380,156 @@ def validate_environment():
     print("✓ Environment validation passed\n")
 
 
-def main():
-    # Validate environment FIRST - fail fast before incurring API costs
-    validate_environment()
+# =============================================================================
+# JOB SCHEDULER
+# =============================================================================
+
+
+@dataclass
+class CronJob:
+    """A cron job with its budgets. Its result lands under its name."""
 
-    # Fetch GSC data (independent of content pipeline)
-    # This enables data-driven SEO decisions by tracking impressions, clicks, CTR
-    gsc_result = asyncio.run(run_gsc_fetch())
+    name: str
+    run: Callable[[], Awaitable[dict]]
+    time_budget_seconds: float | None = None
+    cost_budget_usd: float | None = None
 
-    # Validate external links (weekly, Sundays only)
-    # Broken links hurt SEO trust signals
-    link_validation_result = asyncio.run(run_external_link_validation())
 
-    # Run email sequences (independent of content pipeline)
-    # This advances subscribers through welcome sequences, sends due emails
-    email_result = asyncio.run(run_email_sequences())
+@dataclass
+class JobOutcome:
+    """How a scheduled job finished."""
+
+    name: str
+    status: str  # completed, failed, timed_out, over_budget
+    wall_seconds: float
+    cost_usd: float
+    result: dict
+    time_budget_seconds: float | None = None
+    cost_budget_usd: float | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "wall_seconds": round(self.wall_seconds, 1),
+            "cost_usd": round(self.cost_usd, 4),
+            "time_budget_seconds": self.time_budget_seconds,
+            "cost_budget_usd": self.cost_budget_usd,
+        }
+
+
+# Side jobs run concurrently with the resort pipeline. They are independent
+# of it and of each other; mostly I/O (GSC, HTTP checks, email) plus the
+# twice-weekly guide pipeline.
+# DISABLED: Newsletter writing handed off to head of growth/GTM (Feb 2026)
+# To re-enable: add CronJob("weekly_newsletter", run_weekly_newsletter, 900, 3.0)
+CRON_JOBS = [
+    # Enables data-driven SEO decisions by tracking impressions, clicks, CTR
+    CronJob("gsc_fetch", run_gsc_fetch, time_budget_seconds=300),
+    # Weekly (Sundays only); broken links hurt SEO trust signals
+    CronJob("link_validation", run_external_link_validation, time_budget_seconds=900),
+    # Advances subscribers through welcome sequences, sends due emails
+    CronJob("email_sequences", run_email_sequences, time_budget_seconds=300),
+    # Monday and Thursday: 2 guides through discovery and 3-agent approval
+    CronJob(
+        "guide_generation",
+        run_guide_generation,
+        time_budget_seconds=1800,
+        cost_budget_usd=5.0,
+    ),
+]
+
+NEWSLETTER_DISABLED_RESULT = {
+    "success": True,
+    "status": "disabled",
+    "message": "Newsletter generation disabled - managed by GTM team",
+}
+
+
+async def run_job(job: CronJob) -> JobOutcome:
+    """Run one job, cancelling it if it overruns its time or cost budget.
+
+    Never raises: exceptions and overruns become a failed result dict.
+    """
+    started = time.monotonic()
+    deadline = started + job.time_budget_seconds if job.time_budget_seconds else None
+
+    with metered_spend(job.name, limit_usd=job.cost_budget_usd) as meter:
+        task = asyncio.create_task(job.run())  # Inherits the meter
+
+    overrun = None
+    while True:
+        wait_for = JOB_POLL_SECONDS
+        if deadline is not None:
+            wait_for = max(0.0, min(wait_for, deadline - time.monotonic()))
+        done, _ = await asyncio.wait({task}, timeout=wait_for)
+        if done:
+            break
+        if meter.exceeded:
+            overrun = "over_budget"
+            reason = f"spent ${meter.spent:.2f} of ${job.cost_budget_usd:.2f} budget"
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            overrun = "timed_out"
+            reason = f"exceeded {job.time_budget_seconds:.0f}s time budget"
+            break
+
+    if overrun:
+        task.cancel()
+        await asyncio.wait({task}, timeout=JOB_CANCEL_GRACE_SECONDS)
+        print(f"⏱️  {job.name} cancelled: {reason}")
+        status, result = overrun, {"success": False, "status": overrun, "error": reason}
+    else:
+        try:
+            result = task.result()
+            status = "completed" if result.get("success", True) else "failed"
+        except Exception as e:
+            print(f"❌ {job.name} failed: {e}")
+            traceback.print_exc()
+            status, result = "failed", {"success": False, "status": "error", "error": str(e)}
+
+    return JobOutcome(
+        name=job.name,
+        status=status,
+        wall_seconds=time.monotonic() - started,
+        cost_usd=meter.spent,
+        result=result,
+        time_budget_seconds=job.time_budget_seconds,
+        cost_budget_usd=job.cost_budget_usd,
+    )
 
-    # DISABLED: Newsletter writing handed off to head of growth/GTM (Feb 2026)
-    # To re-enable: uncomment the line below
-    # newsletter_result = asyncio.run(run_weekly_newsletter())
-    newsletter_result = {"success": True, "status": "disabled", "message": "Newsletter generation disabled - managed by GTM team"}
 
-    # Run guide generation (Monday and Thursday)
-    # Produces 2 guides/week through autonomous discovery and 3-agent approval
-    guide_result = asyncio.run(run_guide_generation())
+async def run_scheduled(pipeline_job: CronJob, side_jobs: list[CronJob]) -> dict:
+    """Run the pipeline and the side jobs concurrently in one event loop.
+
+    Returns the pipeline's result with each side job's result under its
+    name and per-job timings under "jobs".
+    """
+    side_tasks = [asyncio.create_task(run_job(job)) for job in side_jobs]
+    pipeline_outcome = await run_job(pipeline_job)
+    side_outcomes = await asyncio.gather(*side_tasks)
+
+    result = pipeline_outcome.result
+    for outcome in side_outcomes:
+        result[outcome.name] = outcome.result
+    result["weekly_newsletter"] = NEWSLETTER_DISABLED_RESULT
+    result["jobs"] = [outcome.to_dict() for outcome in (pipeline_outcome, *side_outcomes)]
+
+    overruns = [o for o in side_outcomes if o.status in ("timed_out", "over_budget")]
+    if overruns:
+        from shared.primitives.alerts import alert_pipeline_error
+
+        alert_pipeline_error(
+            error_type="CronJobOverrun",
+            error_message="; ".join(f"{o.name}: {o.result['error']}" for o in overruns),
+        )
+
+    return result
+
+
+def main():
+    # Validate environment FIRST - fail fast before incurring API costs
+    validate_environment()
 
     parser = argparse.ArgumentParser(
         description="Snowthere autonomous content generation pipeline"
@@ -388,6 +542,13 @@ def main():
         help="Maximum resorts to process (default: 8)",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Resorts to process in parallel (default: PIPELINE_CONCURRENCY setting, 1)",
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -457,7 +618,7 @@ def main():
         print(f"SINGLE RESORT MODE ({mode_label}): {args.resort}, {args.country}")
         print(f"{'='*60}\n")
 
-        result = asyncio.run(run_single_resort(
+        pipeline_job = CronJob("single_resort", lambda: run_single_resort(
             resort_name=args.resort,
             country=args.country,
             auto_publish=not args.no_publish,
@@ -471,30 +632,31 @@ def main():
 
         print(f"\n{'='*60}")
         print(f"DAILY PIPELINE - {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}")
-        print(f"Max resorts: {args.max_resorts} | Dry run: {args.dry_run}")
+        print(f"Max resorts: {args.max_resorts} | Concurrency: {args.concurrency or 'default'} | Dry run: {args.dry_run}")
         print(f"Selection: {selection_mode} | Discovery: {discovery_mode}")
         print(f"{'='*60}\n")
 
-        result = asyncio.run(run_daily_pipeline(
+        pipeline_job = CronJob("daily_pipeline", lambda: run_daily_pipeline(
             max_resorts=args.max_resorts,
             dry_run=args.dry_run,
             use_mixed_selection=args.use_mixed_selection,
             run_discovery=args.run_discovery,
             force_discovery=args.force_discovery,
+            concurrency=args.concurrency,
         ))
 
-    # Add GSC, link validation, email, newsletter, and guide results to output
-    result["gsc_fetch"] = gsc_result
-    result["link_validation"] = link_validation_result
-    result["email_sequences"] = email_result
-    result["weekly_newsletter"] = newsletter_result
-    result["guide_generation"] = guide_result
+    # Side jobs (GSC, link validation, email, guides) run alongside the pipeline
+    result = asyncio.run(run_scheduled(pipeline_job, CRON_JOBS))
 
     # Output results
     if args.json:
         print(json.dumps(result, indent=2, default=str))
     else:
-        print_human_readable(result, single_resort=bool(args.resort), email_result=email_result)
+        print_human_readable(
+            result,
+            single_resort=bool(args.resort),
+            email_result=result.get("email_sequences"),
+        )
 
     # Exit with appropriate code
     status = result.get("status", "unknown")
@@ -599,6 +761,16 @@ def print_human_readable(result: dict, single_resort: bool = False, email_result
             print(f"Guide Generation: {status}")
         print()
 
+    # Per-job wall time and spend
+    jobs = result.get("jobs")
+    if jobs:
+        print("Jobs:")
+        for job in jobs:
+            budget = f" / {job['time_budget_seconds']:.0f}s" if job.get("time_budget_seconds") else ""
+            cost = f", ${job['cost_usd']:.2f}" if job.get("cost_usd") else ""
+            print(f"  - {job['name']}: {job['status']} in {job['wall_seconds']:.1f}s{budget}{cost}")
+        print()
+
     print(f"Status: {result.get('status', 'unknown').upper()}")
 
     if single_resort:
@@ -622,6 +794,7 @@ def print_human_readable(result: dict, single_resort: bool = False, email_result
         print(f"Duration: {summary.get('duration', 'N/A')}")
         print(f"Daily Spend: {summary.get('daily_spend', 'N/A')}")
         print(f"Selection Method: {summary.get('selection_method', 'N/A')}")
+        print(f"Concurrency: {summary.get('concurrency', 1)}")
 
         # Show discovery result if available
         discovery_result = result.get("discovery_result")
@@ -12,7 +12,8 @@ from ..shared.primitives.content import (
     generate_seo_meta,
     write_section,
 )
-from ..shared.primitives.system import log_cost, log_reasoning
+from ..shared.llm_metering import set_cost_attribution
+from ..shared.primitives.system import log_reasoning
 from ..shared.voice_profiles import get_voice_profile
 from .schemas import FAQItem, GenerateInput, GenerateOutput, SEOMetadata
 
@@ -49,6 +50,13 @@ class GenerateGuideAgent:
                 metadata={"sections": sections_to_generate},
             )
 
+        # Claude calls below log their metered cost against this task
+        set_cost_attribution(
+            task_id=self.task_id,
+            resort=research.resort_name,
+            stage="generate_guide",
+        )
+
         # Build context from research
         context = self._build_context(research)
 
@@ -77,14 +85,6 @@ class GenerateGuideAgent:
         # Generate llms.txt
         llms_txt = self._generate_llms_txt(research, sections, faqs)
 
-        # Estimate token cost (~$0.50-1.00 per resort for Opus)
-        estimated_cost = self.total_tokens * 0.000015  # Opus pricing
-        if self.task_id:
-            log_cost("anthropic", estimated_cost, self.task_id, {
-                "tokens": self.total_tokens,
-                "resort": research.resort_name,
-            })
-
         # Build output
         output = GenerateOutput(
             resort_name=research.resort_name,
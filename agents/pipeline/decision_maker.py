@@ -21,6 +21,7 @@ from typing import Any
 import anthropic
 
 from shared.config import settings
+from shared.llm_client import create_message
 from shared.primitives import (
     list_resorts,
     get_stale_resorts,
@@ -35,11 +36,6 @@ from shared.primitives import (
 from shared.primitives.intelligence import validate_resort_selection
 
 
-def get_claude_client() -> anthropic.Anthropic:
-    """Get Anthropic client."""
-    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-
 def get_discovery_candidates_count() -> tuple[int, list[dict]]:
     """Get count and top discovery candidates.
 
@@ -182,7 +178,6 @@ async def pick_resorts_to_research(
             "filtered_count": int  # How many duplicates were filtered
         }
     """
-    client = get_claude_client()
     context = generate_context()
 
     # Phase 1: Get Claude's suggestions (request 2x to account for filtering)
@@ -217,7 +212,8 @@ Think step by step about what would be most valuable, then respond with ONLY the
 """
 
     try:
-        response = client.messages.create(
+        response = await create_message(
+            call="resort_selection",
             model="claude-sonnet-4-20250514",  # Fast, capable, cheaper
             max_tokens=1500,
             messages=[{"role": "user", "content": prompt}],
@@ -312,7 +308,7 @@ Think step by step about what would be most valuable, then respond with ONLY the
     return result
 
 
-def decide_to_publish(
+async def decide_to_publish(
     resort_name: str,
     content_summary: str,
     confidence_score: float,
@@ -338,8 +334,6 @@ def decide_to_publish(
         }
 
     # Borderline - ask Claude
-    client = get_claude_client()
-
     prompt = f"""You are the quality gatekeeper for Snowthere, a family ski resort directory.
 
 ## Task
@@ -371,7 +365,8 @@ Respond with JSON:
 }}
 """
 
-    response = client.messages.create(
+    response = await create_message(
+        call="publish_decision",
         model="claude-sonnet-4-20250514",
         max_tokens=512,
         messages=[{"role": "user", "content": prompt}],
@@ -410,7 +405,7 @@ Respond with JSON:
     return result
 
 
-def handle_error(
+async def handle_error(
     error: Exception,
     resort_name: str,
     stage: str,
@@ -420,7 +415,6 @@ def handle_error(
 
     Returns recommended action: retry, skip, or alert_human.
     """
-    client = get_claude_client()
 
     prompt = f"""You are the error handler for Snowthere's content pipeline.
 
@@ -450,7 +444,8 @@ Respond with JSON:
 """
 
     try:
-        response = client.messages.create(
+        response = await create_message(
+            call="error_handling",
             model="claude-sonnet-4-20250514",
             max_tokens=256,
             messages=[{"role": "user", "content": prompt}],
@@ -25,6 +25,7 @@ from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
+from shared.llm_metering import set_cost_stage
 from shared.primitives.guides import (
     GuideCandidate,
     GuideOutline,
@@ -38,6 +39,7 @@ from shared.primitives.guides import (
 )
 from shared.primitives.expert_panel import expert_approval_loop, ExpertApprovalLoopResult
 from shared.primitives.images import generate_image_with_fallback, AspectRatio
+from shared.primitives.outbox import flushes_page_changes
 from shared.primitives.publishing import revalidate_page
 from shared.supabase_client import get_supabase_client
 
@@ -263,6 +265,7 @@ async def generate_single_guide(
         )
 
 
+@flushes_page_changes
 async def run_guide_pipeline(
     max_guides: int = 2,
     dry_run: bool = False,
@@ -279,6 +282,7 @@ async def run_guide_pipeline(
     """
     start_time = datetime.now(PT_TIMEZONE)
     logger.info(f"Starting guide pipeline (max: {max_guides}, dry_run: {dry_run})")
+    set_cost_stage("guide_generation")
 
     results = []
     published = 0
@@ -5,7 +5,7 @@ This is what Railway cron calls daily. It:
 2. Optionally runs discovery to find new resort opportunities
 3. Generates system context (what exists, what's stale, what's discovered)
 4. Selects work items from multiple sources (discovery, quality, stale, queue)
-5. Runs the full pipeline for each resort
+5. Runs the full pipeline for each resort (bounded worker pool, shared budget)
 6. Compiles and sends a daily digest
 
 Design Decision (MCP vs Direct Code):
@@ -26,25 +26,29 @@ The runner.py module handles HOW to do each individual resort.
 """
 
 import asyncio
-import time
 from datetime import datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
+from shared.budget_ledger import get_budget_ledger
 from shared.config import settings
 from shared.primitives import (
     check_budget,
     get_daily_spend,
+    get_low_scoring_resorts,
     get_queue_stats,
     get_stale_resorts,
     list_queue,
     log_reasoning,
-    log_cost,
+    refresh_page_scores,
     alert_pipeline_summary,
     alert_pipeline_error,
     alert_budget_warning,
+    flushes_page_changes,
 )
-from shared.supabase_client import get_supabase_client
+from shared.primitives.resort_index import index_candidate
+from shared.llm_metering import set_cost_attribution, set_cost_stage
+from shared.supabase_client import execute_async, get_supabase_client, run_db
 
 from .decision_maker import pick_resorts_to_research, generate_context
 from .runner import run_resort_pipeline
@@ -259,6 +263,91 @@ def get_quality_improvement_items(
         return []
 
 
+# Pages scoring below this are re-run through the pipeline when the content
+# queue doesn't fill the quality slots (same bar as the runner's publish gate)
+PAGE_SCORE_QUEUE_THRESHOLD = 70.0
+
+# Failing checks a light refresh (~$0.50: costs, links, images) can fix.
+# Pages failing anything else (content wording, pro tips, generated data,
+# trail map) need the $10 full pipeline to improve.
+LIGHT_REFRESH_CHECKS = frozenset({
+    "has_lift_prices",
+    "has_lodging_prices",
+    "has_official_link",
+    "has_outbound_links",
+    "has_hero_image",
+})
+
+
+def page_score_refresh_mode(failing_checks: list[str]) -> str:
+    """Cheapest refresh mode that can fix every failing check."""
+    if failing_checks and set(failing_checks) <= LIGHT_REFRESH_CHECKS:
+        return "light"
+    return "full"
+
+
+def get_low_page_score_items(
+    limit: int = 5,
+    threshold_pct: float = PAGE_SCORE_QUEUE_THRESHOLD,
+    cooling_off_days: int = 45,
+) -> list[dict[str, Any]]:
+    """Get published resorts with the lowest materialized Perfect Page scores.
+
+    One indexed query on resort_page_scores (kept current by
+    refresh_page_scores() at the start of each run). Items run as a light
+    refresh only when every failing check is in LIGHT_REFRESH_CHECKS,
+    otherwise as a full refresh.
+
+    Args:
+        limit: Maximum items to return
+        threshold_pct: Only pages scoring below this percentage
+        cooling_off_days: Skip resorts refreshed within this many days,
+                         same cooling-off as the quality improvement queue
+
+    Returns:
+        List of resort dicts needing quality improvement
+    """
+    if limit <= 0:
+        return []
+
+    try:
+        cutoff_date = (datetime.utcnow() - timedelta(days=cooling_off_days)).isoformat() + "+00:00"
+        low_scores = get_low_scoring_resorts(
+            threshold_pct=threshold_pct,
+            limit=limit,
+            refreshed_before=cutoff_date,
+        )
+
+        items = []
+        for resort in low_scores:
+            failing = resort.get("failing_checks") or []
+            items.append({
+                "name": resort.get("name") or "Unknown",
+                "country": resort.get("country") or "Unknown",
+                "reasoning": (
+                    f"Page score {resort['quality_score']:.0f}% "
+                    f"({resort['passed']}/{resort['total']}): failing {', '.join(failing[:3])}"
+                ),
+                "source": "page_score",
+                "refresh_mode": page_score_refresh_mode(failing),
+                "resort_id": resort.get("id"),
+                "quality_score": resort.get("quality_score"),
+                "failing_checks": failing,
+            })
+
+        return items
+
+    except Exception as e:
+        log_reasoning(
+            task_id=None,
+            agent_name="orchestrator",
+            action="get_page_score_items_error",
+            reasoning=f"Failed to get low page score items: {e}",
+            metadata={"error": str(e)},
+        )
+        return []
+
+
 def escalate_stuck_quality_items(max_attempts: int = 5) -> dict[str, Any]:
     """Escalate quality items that have hit max attempts to needs_review status.
 
@@ -396,7 +485,7 @@ def get_work_items_mixed(
     This is the primary work selection function for the daily pipeline.
     It balances between:
     - Discovery candidates (new opportunities)
-    - Quality fixes (issues found by audit)
+    - Quality fixes (issues found by audit, then lowest Perfect Page scores)
     - Stale content (needs refresh)
     - Manual queue (explicitly requested)
 
@@ -444,6 +533,11 @@ def get_work_items_mixed(
         quality_items = get_quality_improvement_items(limit=quality_count)
         items.extend(quality_items)
         sources_used["quality"] = len(quality_items)
+
+        # Fill unused quality slots with the lowest-scoring pages
+        page_score_items = get_low_page_score_items(limit=quality_count - len(quality_items))
+        items.extend(page_score_items)
+        sources_used["page_score"] = len(page_score_items)
     else:
         sources_used["quality"] = 0
 
@@ -505,7 +599,7 @@ def mark_discovery_candidate_queued(candidate_id: str) -> bool:
     try:
         supabase = get_supabase_client()
 
-        supabase.table("discovery_candidates")\
+        result = supabase.table("discovery_candidates")\
             .update({
                 "status": "queued",
                 "queued_at": datetime.utcnow().isoformat(),
@@ -513,6 +607,8 @@ def mark_discovery_candidate_queued(candidate_id: str) -> bool:
             .eq("id", candidate_id)\
             .execute()
 
+        if result.data:
+            index_candidate(result.data[0])
         return True
 
     except Exception as e:
@@ -542,7 +638,7 @@ def mark_discovery_candidate_processed(
     try:
         supabase = get_supabase_client()
 
-        supabase.table("discovery_candidates")\
+        result = supabase.table("discovery_candidates")\
             .update({
                 "status": status,
                 "processed_at": datetime.utcnow().isoformat(),
@@ -550,6 +646,8 @@ def mark_discovery_candidate_processed(
             .eq("id", candidate_id)\
             .execute()
 
+        if result.data:
+            index_candidate(result.data[0])
         return True
 
     except Exception as e:
@@ -657,17 +755,188 @@ async def run_discovery_if_needed(
         }
 
 
+# =============================================================================
+# Concurrent Resort Execution
+# =============================================================================
+
+# Estimated worst-case spend per resort, reserved on the budget ledger up
+# front so concurrent runs can't collectively overshoot daily_budget_limit
+RESORT_COST_ESTIMATES = {
+    "full": 10.0,  # Opus content + research APIs
+    "light": 1.0,  # Costs, links, images only
+}
+
+# Pause before a worker slot starts its next resort (rate limit headroom)
+RESORT_START_DELAY_SECONDS = 2
+
+
+async def _process_work_item(
+    resort_info: dict[str, Any],
+    index: int,
+    total: int,
+    run_id: str,
+) -> dict[str, Any] | None:
+    """Run the pipeline for one selected resort.
+
+    Never raises: errors are logged, alerted and returned as an "error"
+    entry so one failing resort can't take down the rest of the pool.
+
+    Returns:
+        Digest entry for the resort, or None if skipped for budget
+    """
+    resort_name = resort_info.get("name")
+    country = resort_info.get("country")
+    source = resort_info.get("source", "claude_selection")
+    candidate_id = resort_info.get("candidate_id")  # For discovery candidates
+    refresh_mode = resort_info.get("refresh_mode", "full")  # "full" or "light"
+
+    log_reasoning(
+        task_id=None,
+        agent_name="orchestrator",
+        action="processing_resort",
+        reasoning=f"Processing resort {index+1}/{total}: {resort_name}, {country} (source: {source}, mode: {refresh_mode})",
+        metadata={
+            "run_id": run_id,
+            "resort": resort_name,
+            "country": country,
+            "index": index,
+            "source": source,
+            "candidate_id": candidate_id,
+            "refresh_mode": refresh_mode,
+        },
+    )
+
+    # Reserve budget before starting (accounts for resorts still in flight)
+    ledger = get_budget_ledger()
+    estimate = RESORT_COST_ESTIMATES.get(refresh_mode, RESORT_COST_ESTIMATES["full"])
+    reservation = await run_db(ledger.reserve, estimate)
+    if reservation is None:
+        log_reasoning(
+            task_id=None,
+            agent_name="orchestrator",
+            action="budget_limit_reached",
+            reasoning=f"Budget limit reached mid-pipeline. Skipping {resort_name} ({index+1} of {total}).",
+            metadata={"run_id": run_id, "resort": resort_name, "reserved": ledger.reserved()},
+        )
+        if candidate_id:
+            # Not attempted - leave it for tomorrow's run
+            await run_db(mark_discovery_candidate_processed, candidate_id, status="pending")
+        return None
+
+    # Run the pipeline for this resort
+    try:
+        result = await run_resort_pipeline(
+            resort_name=resort_name,
+            country=country,
+            task_id=None,  # No queue task - run_id tracked in metadata
+            auto_publish=True,
+            refresh_mode=refresh_mode,  # Pass refresh mode to runner
+        )
+
+        # Determine status for discovery candidate update
+        status = result.get("status")
+        if status == "published":
+            candidate_status = "published"
+        elif status == "draft":
+            candidate_status = "researched"
+        elif status in ("failed", "budget_exceeded"):
+            candidate_status = "rejected"
+        else:
+            candidate_status = "researched"
+
+        # Update discovery candidate status if applicable
+        if candidate_id:
+            await run_db(mark_discovery_candidate_processed, candidate_id, status=candidate_status)
+            log_reasoning(
+                task_id=None,
+                agent_name="orchestrator",
+                action="candidate_status_updated",
+                reasoning=f"Updated discovery candidate {candidate_id} to status: {candidate_status}",
+                metadata={"candidate_id": candidate_id, "status": candidate_status},
+            )
+
+        return {
+            "resort": resort_name,
+            "country": country,
+            "status": status,
+            "confidence": result.get("confidence"),
+            "resort_id": result.get("resort_id"),
+            "reasoning": resort_info.get("reasoning"),
+            "source": source,
+            "candidate_id": candidate_id,
+        }
+
+    except Exception as e:
+        import traceback
+        log_reasoning(
+            task_id=None,
+            agent_name="orchestrator",
+            action="resort_error",
+            reasoning=f"Error processing {resort_name}: {type(e).__name__}: {e}",
+            metadata={
+                "run_id": run_id,
+                "resort": resort_name,
+                "error": str(e),
+                "traceback": traceback.format_exc(),
+            },
+        )
+
+        # Send Slack alert for this error
+        alert_pipeline_error(
+            error_type=type(e).__name__,
+            error_message=str(e),
+            resort_name=resort_name,
+            task_id=run_id,
+        )
+
+        # Mark discovery candidate based on error type
+        # Rate limits and transient errors → back to pending for retry
+        # Permanent errors → rejected
+        if candidate_id:
+            error_str = str(e).lower()
+            is_retryable = any(term in error_str for term in [
+                "429", "rate limit", "timeout", "connection",
+                "503", "502", "overloaded",
+            ])
+            if is_retryable:
+                await run_db(mark_discovery_candidate_processed, candidate_id, status="pending")
+                log_reasoning(
+                    task_id=None,
+                    agent_name="orchestrator",
+                    action="candidate_retryable_error",
+                    reasoning=f"Retryable error for {resort_name}, resetting to pending: {e}",
+                    metadata={"candidate_id": candidate_id},
+                )
+            else:
+                await run_db(mark_discovery_candidate_processed, candidate_id, status="rejected")
+
+        return {
+            "resort": resort_name,
+            "country": country,
+            "status": "error",
+            "error": str(e),
+            "source": source,
+            "candidate_id": candidate_id,
+        }
+
+    finally:
+        # Costs were recorded on the ledger by log_cost as they happened
+        ledger.commit(reservation)
+
+
 # =============================================================================
 # Main Pipeline
 # =============================================================================
 
 
+@flushes_page_changes
 async def run_daily_pipeline(
     max_resorts: int = 8,
     dry_run: bool = False,
     use_mixed_selection: bool = True,  # Prioritize site growth
     run_discovery: bool = False,
     force_discovery: bool = False,
+    concurrency: int | None = None,
 ) -> dict[str, Any]:
     """Run the daily content generation pipeline.
 
@@ -680,6 +949,7 @@ async def run_daily_pipeline(
                             (discovery, stale, queue) instead of Claude-based selection
         run_discovery: If True, optionally run discovery agent before selection
         force_discovery: If True, force discovery run even if ran recently
+        concurrency: Resorts to process in parallel (default: settings.pipeline_concurrency)
 
     Returns:
         Daily digest with results for all processed resorts
@@ -699,6 +969,9 @@ async def run_daily_pipeline(
         "summary": {},
     }
 
+    # Orchestrator costs (selection, discovery, intros) carry the run ID
+    set_cost_attribution(run_id=run_id, stage=None)
+
     log_reasoning(
         task_id=None,  # Orchestrator-level logging, not tied to queue task
         agent_name="orchestrator",
@@ -741,6 +1014,32 @@ async def run_daily_pipeline(
             metadata={"run_id": run_id, "escalated": escalation_result},
         )
 
+    # =========================================================================
+    # STEP 1.2: Refresh Stale Page Scores
+    # =========================================================================
+    # Triggers mark a resort's score stale when its content, metrics, costs,
+    # images or links change; only those resorts are re-scored here. The
+    # first run scores every resort, so keep it off the event loop.
+    try:
+        score_stats = await run_db(refresh_page_scores)
+        if score_stats["checked"]:
+            log_reasoning(
+                task_id=None,
+                agent_name="orchestrator",
+                action="page_scores_refreshed",
+                reasoning=f"Re-scored {score_stats['rescored']} of {score_stats['checked']} stale pages",
+                metadata={"run_id": run_id, **score_stats},
+            )
+    except Exception as e:
+        # Non-critical: the quality queue just reads slightly older scores
+        log_reasoning(
+            task_id=None,
+            agent_name="orchestrator",
+            action="page_score_refresh_error",
+            reasoning=f"Failed to refresh page scores: {e}",
+            metadata={"run_id": run_id, "error": str(e)},
+        )
+
     # Need at least $1.50 for one resort
     if remaining_budget < 1.5:
         digest["status"] = "budget_exhausted"
@@ -771,6 +1070,7 @@ async def run_daily_pipeline(
             metadata={"run_id": run_id},
         )
 
+        set_cost_stage("discovery")
         discovery_result = await run_discovery_if_needed(force=force_discovery)
         digest["discovery_result"] = discovery_result
 
@@ -823,7 +1123,7 @@ async def run_daily_pipeline(
         # Mark discovery candidates as queued
         for resort in resorts_to_process:
             if resort.get("source") == "discovery" and resort.get("candidate_id"):
-                mark_discovery_candidate_queued(resort["candidate_id"])
+                await run_db(mark_discovery_candidate_queued, resort["candidate_id"])
 
         selection_reasoning = f"Mixed selection: {len(resorts_to_process)} items from discovery/stale/queue sources"
 
@@ -837,6 +1137,7 @@ async def run_daily_pipeline(
             metadata={"run_id": run_id},
         )
 
+        set_cost_stage("resort_selection")
         selection = await pick_resorts_to_research(max_resorts=max_resorts, task_id=None)
 
         if selection.get("error"):
@@ -850,9 +1151,6 @@ async def run_daily_pipeline(
         resorts_to_process = selection.get("resorts", [])
         selection_reasoning = selection.get("overall_reasoning", "No reasoning provided")
 
-        # Log the cost of the selection call (~$0.01 for Sonnet)
-        log_cost("anthropic", 0.01, None, {"run_id": run_id, "stage": "resort_selection"})
-
     log_reasoning(
         task_id=None,
         agent_name="orchestrator",
@@ -873,149 +1171,48 @@ async def run_daily_pipeline(
     # =========================================================================
     # STEP 4: Process Each Resort
     # =========================================================================
-    results = []
-    published_count = 0
-    draft_count = 0
-    failed_count = 0
-
-    for i, resort_info in enumerate(resorts_to_process):
-        resort_name = resort_info.get("name")
-        country = resort_info.get("country")
-        source = resort_info.get("source", "claude_selection")
-        candidate_id = resort_info.get("candidate_id")  # For discovery candidates
-        refresh_mode = resort_info.get("refresh_mode", "full")  # "full" or "light"
-
-        log_reasoning(
-            task_id=None,
-            agent_name="orchestrator",
-            action="processing_resort",
-            reasoning=f"Processing resort {i+1}/{len(resorts_to_process)}: {resort_name}, {country} (source: {source}, mode: {refresh_mode})",
-            metadata={
-                "run_id": run_id,
-                "resort": resort_name,
-                "country": country,
-                "index": i,
-                "source": source,
-                "candidate_id": candidate_id,
-                "refresh_mode": refresh_mode,
-            },
-        )
+    # Resorts run through a bounded worker pool. Each resort reserves its
+    # estimated cost before starting so parallel runs can't collectively
+    # overshoot the daily budget, and each runs in isolation so one failure
+    # doesn't stall the others. concurrency=1 keeps the original sequential
+    # behaviour.
+    concurrency = max(1, concurrency or settings.pipeline_concurrency)
+    worker_slots = asyncio.Semaphore(concurrency)
 
-        # Check budget before each resort
-        current_spend = get_daily_spend()
-        if current_spend + 1.5 > settings.daily_budget_limit:
-            log_reasoning(
-                task_id=None,
-                agent_name="orchestrator",
-                action="budget_limit_reached",
-                reasoning=f"Budget limit reached mid-pipeline. Processed {i} of {len(resorts_to_process)} resorts.",
-                metadata={"run_id": run_id},
-            )
-            break
+    log_reasoning(
+        task_id=None,
+        agent_name="orchestrator",
+        action="processing_resorts",
+        reasoning=f"Processing {len(resorts_to_process)} resorts with concurrency {concurrency}",
+        metadata={"run_id": run_id, "count": len(resorts_to_process), "concurrency": concurrency},
+    )
 
-        # Run the pipeline for this resort
-        try:
-            result = await run_resort_pipeline(
-                resort_name=resort_name,
-                country=country,
-                task_id=None,  # No queue task - run_id tracked in metadata
-                auto_publish=True,
-                refresh_mode=refresh_mode,  # Pass refresh mode to runner
+    async def _worker(i: int, resort_info: dict[str, Any]) -> dict[str, Any] | None:
+        async with worker_slots:
+            entry = await _process_work_item(
+                resort_info=resort_info,
+                index=i,
+                total=len(resorts_to_process),
+                run_id=run_id,
             )
 
-            # Determine status for discovery candidate update
-            status = result.get("status")
-            if status == "published":
-                published_count += 1
-                candidate_status = "published"
-            elif status == "draft":
-                draft_count += 1
-                candidate_status = "researched"
-            elif status in ("failed", "budget_exceeded"):
-                failed_count += 1
-                candidate_status = "rejected"
-            else:
-                candidate_status = "researched"
-
-            # Update discovery candidate status if applicable
-            if candidate_id:
-                mark_discovery_candidate_processed(candidate_id, status=candidate_status)
-                log_reasoning(
-                    task_id=None,
-                    agent_name="orchestrator",
-                    action="candidate_status_updated",
-                    reasoning=f"Updated discovery candidate {candidate_id} to status: {candidate_status}",
-                    metadata={"candidate_id": candidate_id, "status": candidate_status},
-                )
-
-            results.append({
-                "resort": resort_name,
-                "country": country,
-                "status": status,
-                "confidence": result.get("confidence"),
-                "resort_id": result.get("resort_id"),
-                "reasoning": resort_info.get("reasoning"),
-                "source": source,
-                "candidate_id": candidate_id,
-            })
-
-        except Exception as e:
-            import traceback
-            log_reasoning(
-                task_id=None,
-                agent_name="orchestrator",
-                action="resort_error",
-                reasoning=f"Error processing {resort_name}: {type(e).__name__}: {e}",
-                metadata={
-                    "run_id": run_id,
-                    "resort": resort_name,
-                    "error": str(e),
-                    "traceback": traceback.format_exc(),
-                },
-            )
+            # Small delay before this slot picks up the next resort (rate limits)
+            if i < len(resorts_to_process) - concurrency:
+                await asyncio.sleep(RESORT_START_DELAY_SECONDS)
 
-            # Send Slack alert for this error
-            alert_pipeline_error(
-                error_type=type(e).__name__,
-                error_message=str(e),
-                resort_name=resort_name,
-                task_id=run_id,
-            )
+            return entry
 
-            # Mark discovery candidate based on error type
-            # Rate limits and transient errors → back to pending for retry
-            # Permanent errors → rejected
-            if candidate_id:
-                error_str = str(e).lower()
-                is_retryable = any(term in error_str for term in [
-                    "429", "rate limit", "timeout", "connection",
-                    "503", "502", "overloaded",
-                ])
-                if is_retryable:
-                    mark_discovery_candidate_processed(candidate_id, status="pending")
-                    log_reasoning(
-                        task_id=None,
-                        agent_name="orchestrator",
-                        action="candidate_retryable_error",
-                        reasoning=f"Retryable error for {resort_name}, resetting to pending: {e}",
-                        metadata={"candidate_id": candidate_id},
-                    )
-                else:
-                    mark_discovery_candidate_processed(candidate_id, status="rejected")
-
-            results.append({
-                "resort": resort_name,
-                "country": country,
-                "status": "error",
-                "error": str(e),
-                "source": source,
-                "candidate_id": candidate_id,
-            })
-            failed_count += 1
+    entries = await asyncio.gather(
+        *(_worker(i, resort_info) for i, resort_info in enumerate(resorts_to_process))
+    )
 
-        # Small delay between resorts to avoid rate limits
-        if i < len(resorts_to_process) - 1:
-            time.sleep(2)
+    # Keep selection order in the digest regardless of completion order
+    results = [entry for entry in entries if entry is not None]
+    published_count = sum(1 for r in results if r.get("status") == "published")
+    draft_count = sum(1 for r in results if r.get("status") == "draft")
+    failed_count = sum(
+        1 for r in results if r.get("status") in ("failed", "budget_exceeded", "error")
+    )
 
     # =========================================================================
     # STEP 5: Compile Digest
@@ -1054,7 +1251,8 @@ async def run_daily_pipeline(
     # =========================================================================
     if not dry_run and published_count > 0:
         try:
-            country_intros_result = generate_missing_country_intros()
+            set_cost_stage("country_intros")
+            country_intros_result = await generate_missing_country_intros()
             digest["country_intros"] = country_intros_result
         except Exception as e:
             log_reasoning(
@@ -1076,6 +1274,7 @@ async def run_daily_pipeline(
         "daily_spend": f"${final_spend:.2f}",
         "duration": f"{duration:.1f}s",
         "selection_method": "mixed" if use_mixed_selection else "claude",
+        "concurrency": concurrency,
         "source_breakdown": source_counts,
         "selection_reasoning": selection_reasoning,
         "quality_queue": quality_metrics,
@@ -1102,7 +1301,7 @@ async def run_daily_pipeline(
     return digest
 
 
-def generate_missing_country_intros(min_resorts: int = 3, max_generate: int = 3) -> dict[str, Any]:
+async def generate_missing_country_intros(min_resorts: int = 3, max_generate: int = 3) -> dict[str, Any]:
     """Generate country intro content for countries with enough resorts but no intro.
 
     Runs after the daily resort pipeline to enrich country pages with unique,
@@ -1121,11 +1320,10 @@ def generate_missing_country_intros(min_resorts: int = 3, max_generate: int = 3)
     client = get_supabase_client()
 
     # Get all countries with published resort counts
-    resorts_resp = (
+    resorts_resp = await execute_async(
         client.table("resorts")
         .select("country, slug, name, resort_family_metrics(family_overall_score, best_age_min, best_age_max), resort_costs(estimated_family_daily)")
         .eq("status", "published")
-        .execute()
     )
 
     # Group resorts by country
@@ -1137,10 +1335,9 @@ def generate_missing_country_intros(min_resorts: int = 3, max_generate: int = 3)
         country_resorts[country].append(r)
 
     # Check which countries already have intros
-    existing_resp = (
+    existing_resp = await execute_async(
         client.table("country_content")
         .select("country")
-        .execute()
     )
     existing_countries = {r["country"] for r in existing_resp.data or []}
 
@@ -1183,19 +1380,19 @@ def generate_missing_country_intros(min_resorts: int = 3, max_generate: int = 3)
             })
 
         try:
-            intro_text = generate_country_intro(country, resort_data)
+            intro_text = await generate_country_intro(country, resort_data)
 
             # Calculate avg cost
             costs_list = [rd["daily_cost"] for rd in resort_data if rd.get("daily_cost")]
             avg_cost = sum(costs_list) / len(costs_list) if costs_list else None
 
             # Upsert into country_content
-            client.table("country_content").upsert({
+            await execute_async(client.table("country_content").upsert({
                 "country": country,
                 "intro_text": intro_text,
                 "resort_count": len(resorts),
                 "avg_daily_cost": avg_cost,
-            }, on_conflict="country").execute()
+            }, on_conflict="country"))
 
             results["generated"].append(country)
             generated_count += 1
@@ -1226,6 +1423,7 @@ def generate_missing_country_intros(min_resorts: int = 3, max_generate: int = 3)
     return results
 
 
+@flushes_page_changes
 async def run_single_resort(
     resort_name: str,
     country: str,
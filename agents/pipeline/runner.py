@@ -31,7 +31,8 @@ from uuid import uuid4
 from agent_layer.memory import AgentMemory
 
 # Supabase client for direct DB operations
-from shared.supabase_client import get_supabase_client
+from shared.llm_metering import set_cost_attribution, set_cost_stage
+from shared.supabase_client import get_supabase_client, run_db
 
 logger = logging.getLogger(__name__)
 
@@ -86,11 +87,19 @@ from shared.primitives import (
     # Approval Panel (Three-agent quality evaluation)
     approval_loop,
     format_loop_summary,
+    # Linking (incremental similarity + "similar" internal links)
+    update_similarities_for_resort,
 )
 # Style editing (Round 24 - deterministic post-processing)
 from shared.primitives.style import apply_deterministic_style
 
 from .decision_maker import handle_error
+from .stages import StageTask, run_stage_graph, summarize_stage_graph
+
+
+# Stage 3.3: independent content steps (sections, FAQs, SEO meta)
+CONTENT_STEP_CONCURRENCY = 4  # Claude calls in flight per resort
+CONTENT_STEP_RETRIES = 1  # Extra attempts per step on API errors
 
 
 async def _run_light_refresh(
@@ -188,6 +197,7 @@ async def _run_light_refresh(
             reasoning=f"Attempting cost update for {resort_name}",
         )
 
+        set_cost_stage("light_cost_update")
         cost_result = await acquire_resort_costs(
             resort_name=resort_name,
             country=country,
@@ -197,7 +207,6 @@ async def _run_light_refresh(
 
         if cost_result.success:
             update_resort_costs(resort_id, cost_result.costs)
-            log_cost("research_apis", 0.05, None, {"run_id": run_id, "stage": "light_cost_update"})
             result["stages"]["cost_update"] = {
                 "status": "complete",
                 "source": cost_result.source,
@@ -216,6 +225,7 @@ async def _run_light_refresh(
     # STAGE 4: Re-inject External Links
     # =========================================================================
     try:
+        set_cost_stage("light_link_injection")
         # Get existing content
         client = get_supabase_client()
         content_result = client.table("resort_content")\
@@ -244,7 +254,6 @@ async def _run_light_refresh(
             if injected_links:
                 # Update content with new links
                 update_resort_content(resort_id, modified_content)
-                log_cost("anthropic", 0.02, None, {"run_id": run_id, "stage": "light_link_injection"})
                 result["stages"]["link_injection"] = {
                     "status": "complete",
                     "links_injected": len(injected_links),
@@ -264,6 +273,7 @@ async def _run_light_refresh(
     # STAGE 5: Refresh Images (if needed)
     # =========================================================================
     try:
+        set_cost_stage("light_images")
         # Check if resort has images
         image_result = client.table("resort_images")\
             .select("id")\
@@ -306,6 +316,19 @@ async def _run_light_refresh(
         result["stages"]["images"] = {"status": "failed", "error": str(e)}
         print(f"⚠️  Light Refresh: Image fetch failed - {e}")
 
+    # =========================================================================
+    # STAGE 5.5: Similarity & Internal Links (costs may have changed)
+    # =========================================================================
+    try:
+        similarity_stats = await run_db(update_similarities_for_resort, resort_id)
+        result["stages"]["similarity"] = {"status": "complete", **similarity_stats}
+        print(
+            f"✓ Light Refresh: {similarity_stats['similarities_upserted']} similarities updated"
+        )
+    except Exception as e:
+        result["stages"]["similarity"] = {"status": "failed", "error": str(e)}
+        print(f"⚠️  Light Refresh: Similarity update failed - {e}")
+
     # =========================================================================
     # STAGE 6: Mark as Refreshed
     # =========================================================================
@@ -555,6 +578,10 @@ async def run_resort_pipeline(
         "stages": {},
     }
 
+    # Costs logged from here on (Claude usage, search APIs) carry the run,
+    # resort and current stage
+    set_cost_attribution(run_id=run_id, resort=resort_name, stage=None)
+
     # =========================================================================
     # MEMORY: Initialize and retrieve context from past runs
     # =========================================================================
@@ -633,11 +660,9 @@ async def run_resort_pipeline(
             reasoning=f"Researching {resort_name} using Exa, SerpAPI, and Tavily",
         )
 
+        set_cost_stage("research")
         research_data = await search_resort_info(resort_name, country)
 
-        # Log research cost (~$0.20 for 3 API calls)
-        log_cost("research_apis", 0.20, None, {"run_id": run_id, "stage": "research"})
-
         # Calculate confidence
         confidence = calculate_confidence(research_data)
         result["confidence"] = confidence
@@ -667,6 +692,7 @@ async def run_resort_pipeline(
 
         # Extract region for location display ("Region, Country" instead of just "Country")
         from shared.primitives.intelligence import extract_region
+        set_cost_stage("region_extraction")
         region = await extract_region(resort_name, country)
         if region:
             research_data["region"] = region
@@ -677,8 +703,6 @@ async def run_resort_pipeline(
                 reasoning=f"Extracted region: {region}",
                 metadata={"region": region},
             )
-            # Log cost (~$0.002 for Haiku)
-            log_cost("anthropic", 0.002, None, {"run_id": run_id, "stage": "region_extraction"})
 
         # =====================================================================
         # EXTRACTION: Transform raw research into structured costs/family_metrics
@@ -693,6 +717,7 @@ async def run_resort_pipeline(
             reasoning=f"Extracting structured costs and family metrics from raw research for {resort_name}",
         )
 
+        set_cost_stage("extraction")
         extracted = await extract_resort_data(
             raw_research=research_data,
             resort_name=resort_name,
@@ -703,9 +728,6 @@ async def run_resort_pipeline(
         research_data["costs"] = extracted.costs
         research_data["family_metrics"] = extracted.family_metrics
 
-        # Log extraction cost (~$0.01 for Sonnet)
-        log_cost("anthropic", 0.01, None, {"run_id": run_id, "stage": "extraction"})
-
         log_reasoning(
             task_id=None,
             agent_name="pipeline_runner",
@@ -735,6 +757,7 @@ async def run_resort_pipeline(
         # STAGE 2.2: Multi-Strategy Cost Acquisition
         # If extraction didn't find good cost data, try additional strategies
         # =====================================================================
+        set_cost_stage("cost_acquisition")
         costs = research_data.get("costs", {})
         needs_cost_acquisition = (
             not costs.get("lift_adult_daily")
@@ -826,7 +849,7 @@ async def run_resort_pipeline(
             }
 
     except Exception as e:
-        error_decision = handle_error(e, resort_name, "research", None)
+        error_decision = await handle_error(e, resort_name, "research", None)
         result["status"] = "failed"
         result["error"] = f"Research failed: {e}"
         result["stages"]["research"] = {"status": "failed", "error": str(e)}
@@ -965,6 +988,7 @@ async def run_resort_pipeline(
             reasoning=f"Generating ski quality calendar for {resort_name}",
         )
 
+        set_cost_stage("calendar")
         calendar_result = await generate_and_store_calendar(
             resort_id=resort_id,
             resort_name=resort_name,
@@ -985,7 +1009,6 @@ async def run_resort_pipeline(
             )
 
         if calendar_result.success:
-            log_cost("anthropic", 0.003, None, {"run_id": run_id, "stage": "calendar"})
             result["stages"]["calendar"] = {
                 "status": "complete",
                 "months": len(calendar_result.months),
@@ -1031,15 +1054,13 @@ async def run_resort_pipeline(
             reasoning=f"Extracting editorial context for Quick Take: {resort_name}",
         )
 
+        set_cost_stage("quick_take_context")
         qt_context_result = await extract_quick_take_context(
             resort_name=resort_name,
             country=country,
             research_data=research_data,
         )
 
-        # Log cost (~$0.01 for Sonnet)
-        log_cost("anthropic", 0.01, None, {"run_id": run_id, "stage": "quick_take_context"})
-
         log_reasoning(
             task_id=None,
             agent_name="pipeline_runner",
@@ -1089,14 +1110,12 @@ async def run_resort_pipeline(
             reasoning=f"Generating Quick Take with Editorial Verdict Model for {resort_name}",
         )
 
+        set_cost_stage("quick_take_generation")
         quick_take_result = await generate_quick_take(
             context=qt_context,
             voice_profile="snowthere_guide",
         )
 
-        # Log cost (~$0.10 for Opus)
-        log_cost("anthropic", 0.10, None, {"run_id": run_id, "stage": "quick_take_generation"})
-
         # Store Quick Take in content (but NOT perfect_if/skip_if - those go to family_metrics)
         content["quick_take"] = quick_take_result.quick_take_html
 
@@ -1165,28 +1184,57 @@ async def run_resort_pipeline(
             **research_data,
         }
 
-        for section in sections:
-            content[section] = await write_section(
-                section_name=section,
-                context=content_context,
-                voice_profile="snowthere_guide",
-                max_tokens=2500,
+        # Sections, FAQs and SEO meta don't read each other's output, so they
+        # run together (bounded) with per-step retries
+        def _section_task(section: str, max_tokens: int) -> StageTask:
+            return StageTask(
+                name=section,
+                run=lambda deps: write_section(
+                    section_name=section,
+                    context=content_context,
+                    voice_profile="snowthere_guide",
+                    max_tokens=max_tokens,
+                ),
+                retries=CONTENT_STEP_RETRIES,
             )
 
-        # Generate FAQs
-        content["faqs"] = await generate_faq(
-            resort_name=resort_name,
-            country=country,
-            context=content_context,
-            num_questions=6,
-            voice_profile="snowthere_guide",
+        content_tasks = [_section_task(section, 2500) for section in sections]
+        content_tasks.append(StageTask(
+            name="faqs",
+            run=lambda deps: generate_faq(
+                resort_name=resort_name,
+                country=country,
+                context=content_context,
+                num_questions=6,
+                voice_profile="snowthere_guide",
+            ),
+            retries=CONTENT_STEP_RETRIES,
+        ))
+        content_tasks.append(StageTask(
+            name="seo_meta",
+            run=lambda deps: generate_seo_meta(
+                resort_name=resort_name,
+                country=country,
+                quick_take=content["quick_take"],
+            ),
+            retries=CONTENT_STEP_RETRIES,
+        ))
+
+        set_cost_stage("content_generation")
+        content_outcomes = await run_stage_graph(
+            content_tasks, max_concurrency=CONTENT_STEP_CONCURRENCY
         )
+        content_timing = summarize_stage_graph(content_tasks, content_outcomes)
 
-        # Generate SEO meta
-        content["seo_meta"] = await generate_seo_meta(
-            resort_name=resort_name,
-            country=country,
-            quick_take=content["quick_take"],
+        for name, outcome in content_outcomes.items():
+            if not outcome.ok:
+                raise outcome.error
+            content[name] = outcome.value
+
+        print(
+            f"✓ Content sections: {content_timing.wall_ms / 1000:.1f}s wall, "
+            f"slowest {' -> '.join(content_timing.critical_path)} "
+            f"({content_timing.critical_path_ms / 1000:.1f}s)"
         )
 
         # Generate unique tagline using Agent-Native approach (Round 12)
@@ -1194,6 +1242,7 @@ async def run_resort_pipeline(
         # 2. Generate with structural diversity
         # 3. Evaluate quality with LLM-based rubric
         # 4. Retry with higher temperature if quality < threshold
+        set_cost_stage("tagline_generation")
         tagline_atoms = await extract_tagline_atoms(
             resort_name=resort_name,
             country=country,
@@ -1258,12 +1307,6 @@ async def run_resort_pipeline(
         # Use best tagline found (or fallback from last attempt)
         content["tagline"] = best_tagline or f"Your family adventure starts in {resort_name}"
 
-        # Log tagline generation cost (~$0.035 for 3 attempts)
-        log_cost("anthropic", 0.035, None, {"run_id": run_id, "stage": "tagline_generation"})
-
-        # Log content generation cost (~$0.70 for Claude API, Quick Take logged separately)
-        log_cost("anthropic", 0.70, None, {"run_id": run_id, "stage": "content_generation"})
-
         # Truncation detection: flag sections that end mid-sentence
         truncated_sections = []
         for section in sections:
@@ -1277,15 +1320,19 @@ async def run_resort_pipeline(
         # Retry truncated sections with higher max_tokens
         if truncated_sections:
             print(f"  ⚠️ Truncated sections detected: {truncated_sections} — retrying with max_tokens=4000", file=sys.stderr)
-            for section in truncated_sections:
-                retried = await write_section(
-                    section_name=section,
-                    context=content_context,
-                    voice_profile="snowthere_guide",
-                    max_tokens=4000,
-                )
-                content[section] = retried
-                log_cost("anthropic", 0.04, None, {"run_id": run_id, "stage": "truncation_retry", "section": section})
+            retry_tasks = [_section_task(section, 4000) for section in truncated_sections]
+            set_cost_stage("truncation_retry")
+            retry_outcomes = await run_stage_graph(
+                retry_tasks, max_concurrency=CONTENT_STEP_CONCURRENCY
+            )
+            for section, outcome in retry_outcomes.items():
+                if not outcome.ok:
+                    raise outcome.error
+                content[section] = outcome.value
+            content_timing.latency_ms.update({
+                f"{section}_retry": outcome.latency_ms
+                for section, outcome in retry_outcomes.items()
+            })
 
             # Re-check after retry
             still_truncated = []
@@ -1302,13 +1349,18 @@ async def run_resort_pipeline(
                 result["quality_gate_failed"] = True
 
         # Total sections = 6 regular + 1 quick_take (generated earlier)
-        result["stages"]["content"] = {"status": "complete", "sections": len(sections) + 1}
+        result["stages"]["content"] = {
+            "status": "complete",
+            "sections": len(sections) + 1,
+            "timing": content_timing.to_dict(),
+        }
 
         log_reasoning(
             task_id=None,
             agent_name="pipeline_runner",
             action="content_complete",
-            reasoning=f"Generated {len(sections)} content sections + FAQs + SEO meta",
+            reasoning=f"Generated {len(sections)} content sections + FAQs + SEO meta in {content_timing.wall_ms / 1000:.1f}s",
+            metadata={"timing": content_timing.to_dict()},
         )
 
     except Exception as e:
@@ -1320,7 +1372,7 @@ async def run_resort_pipeline(
             reasoning=f"Content generation failed for {resort_name}: {type(e).__name__}: {e}",
             metadata={"error_type": type(e).__name__, "error_message": str(e)},
         )
-        error_decision = handle_error(e, resort_name, "content_generation", None)
+        error_decision = await handle_error(e, resort_name, "content_generation", None)
         result["status"] = "failed"
         result["error"] = f"Content generation failed: {e}"
         result["stages"]["content"] = {"status": "failed", "error": str(e)}
@@ -1330,6 +1382,7 @@ async def run_resort_pipeline(
     # STAGE 4: Database Storage
     # =========================================================================
     try:
+        set_cost_stage("storage")
         log_reasoning(
             task_id=None,
             agent_name="pipeline_runner",
@@ -1531,6 +1584,7 @@ async def run_resort_pipeline(
     # Philosophy: Families deserve REAL images, not AI-generated approximations.
     # Priority: Official website > Google Places UGC > No image (NO AI generation)
     try:
+        set_cost_stage("official_images")
         log_reasoning(
             task_id=None,
             agent_name="pipeline_runner",
@@ -1609,6 +1663,7 @@ async def run_resort_pipeline(
     # =========================================================================
     # Note: Hero image already fetched in 4.5 (may include UGC fallback).
     # This stage fetches ADDITIONAL gallery photos if we don't already have them.
+    set_cost_stage("ugc_photos")
     hero_source = result.get("stages", {}).get("images", {}).get("source", "")
     if hero_source == "google_places":
         # We already got UGC photos via the fallback, skip duplicate fetch
@@ -1706,6 +1761,7 @@ async def run_resort_pipeline(
             # Get research sources for link curation
             research_sources = research_data.get("sources", [])
 
+            set_cost_stage("link_curation")
             link_result = await curate_resort_links(
                 resort_name=resort_name,
                 country=country,
@@ -1728,9 +1784,6 @@ async def run_resort_pipeline(
                     except Exception as link_err:
                         logger.warning(f"Failed to store link {link.url}: {link_err}")
 
-                # Log cost (~$0.01 for Sonnet)
-                log_cost("anthropic", 0.01, None, {"run_id": run_id, "stage": "link_curation"})
-
                 log_reasoning(
                     task_id=None,
                     agent_name="pipeline_runner",
@@ -1778,6 +1831,7 @@ async def run_resort_pipeline(
     # Part of Round 7.3: Inject links to hotels, restaurants, ski schools, etc.
     # Uses Google Places API for entity resolution and affiliate URL transformation.
     try:
+        set_cost_stage("link_injection")
         from shared.primitives.external_links import inject_links_in_content_sections
 
         log_reasoning(
@@ -1953,6 +2007,7 @@ async def run_resort_pipeline(
 
             # Run approval panel (TrustGuard + FamilyValue + VoiceCoach)
             # This iterates up to 3 times, improving content based on feedback
+            set_cost_stage("approval_panel")
             approval_result = await approval_loop(
                 content=content,
                 sources=research_data.get("sources", []),
@@ -1961,14 +2016,6 @@ async def run_resort_pipeline(
                 max_iterations=3,
             )
 
-            # Log approval panel cost (~$0.45-0.60 for 3 agents × up to 3 iterations)
-            panel_cost = 0.15 * approval_result.iterations  # ~$0.15 per panel run
-            log_cost("anthropic", panel_cost, None, {
-                "run_id": run_id,
-                "stage": "approval_panel",
-                "iterations": approval_result.iterations,
-            })
-
             # Update content with improved version
             if approval_result.final_content:
                 content = approval_result.final_content
@@ -2079,6 +2126,23 @@ async def run_resort_pipeline(
         result["status"] = "draft"
         result["stages"]["approval_panel"] = {"status": "skipped", "reason": "auto_publish=False"}
 
+    # =========================================================================
+    # STAGE 5.5: Similarity & Internal Links (this resort's row only)
+    # =========================================================================
+    if resort_id and result["status"] in ("published", "published_with_issues"):
+        try:
+            similarity_stats = await run_db(update_similarities_for_resort, resort_id)
+            result["stages"]["similarity"] = {"status": "complete", **similarity_stats}
+            print(
+                f"✓ Similarities: {similarity_stats['similarities_upserted']} updated, "
+                f"{similarity_stats['similarities_deleted']} removed, "
+                f"{similarity_stats['links_upserted']} links refreshed"
+            )
+        except Exception as e:
+            # Non-critical: the next run or a full refresh will catch up
+            result["stages"]["similarity"] = {"status": "failed", "error": str(e)}
+            print(f"⚠️  Similarity update failed (non-critical): {e}", file=sys.stderr)
+
     # =========================================================================
     # Complete
     # =========================================================================
@@ -0,0 +1,185 @@
+"""Dependency-aware stage executor for independent pipeline steps.
+
+Several pipeline stages are made of steps that don't read each other's
+output (e.g. the six content sections, FAQs and SEO meta in Stage 3.3).
+run_stage_graph() fans those steps out together, bounded by a concurrency
+cap, retries each step independently, and records per-step latency so
+the slowest chain (the critical path) is visible in the pipeline result.
+
+Usage:
+    tasks = [
+        StageTask("getting_there", lambda deps: write_section(...)),
+        StageTask("faqs", lambda deps: generate_faq(...)),
+        StageTask("summary", lambda deps: summarize(deps["faqs"]), depends_on=("faqs",)),
+    ]
+    outcomes = await run_stage_graph(tasks, max_concurrency=4)
+    content = {name: o.value for name, o in outcomes.items() if o.ok}
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageTask:
+    """A single step in a stage graph.
+
+    run receives a dict of completed dependency values keyed by task name.
+    """
+
+    name: str
+    run: Callable[[dict[str, Any]], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+    retries: int = 1  # Extra attempts after the first failure
+
+
+@dataclass
+class StageOutcome:
+    """Result of one step, with timing for critical-path analysis."""
+
+    name: str
+    value: Any = None
+    error: Exception | None = None
+    attempts: int = 0
+    started_ms: int = 0  # Offset from graph start
+    latency_ms: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def finished_ms(self) -> int:
+        return self.started_ms + self.latency_ms
+
+
+@dataclass
+class StageGraphReport:
+    """Timing summary for a completed stage graph."""
+
+    wall_ms: int
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_ms: int = 0
+    latency_ms: dict[str, int] = field(default_factory=dict)
+    failed: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "wall_ms": self.wall_ms,
+            "critical_path": self.critical_path,
+            "critical_path_ms": self.critical_path_ms,
+            "latency_ms": self.latency_ms,
+            "failed": self.failed,
+        }
+
+
+async def run_stage_graph(
+    tasks: list[StageTask],
+    max_concurrency: int = 4,
+    retry_delay_seconds: float = 2.0,
+) -> dict[str, StageOutcome]:
+    """Run a set of steps, starting each as soon as its dependencies finish.
+
+    A step whose dependency failed is not run; its outcome carries the
+    dependency's error. Steps never raise out of the graph, so callers
+    decide which failures are fatal.
+
+    Args:
+        tasks: Steps to run (names must be unique)
+        max_concurrency: Maximum steps in flight at once
+        retry_delay_seconds: Base backoff between attempts (doubles each retry)
+
+    Returns:
+        Outcomes keyed by task name, in the order tasks were given
+    """
+    by_name = {task.name: task for task in tasks}
+    if len(by_name) != len(tasks):
+        raise ValueError("Stage task names must be unique")
+    for task in tasks:
+        missing = [dep for dep in task.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"Stage task {task.name} depends on unknown tasks: {missing}")
+
+    slots = asyncio.Semaphore(max(1, max_concurrency))
+    graph_start = time.monotonic()
+    futures: dict[str, asyncio.Task] = {}
+
+    async def _run(task: StageTask) -> StageOutcome:
+        # Wait for dependencies (they are scheduled independently)
+        deps: dict[str, Any] = {}
+        for dep in task.depends_on:
+            dep_outcome = await futures[dep]
+            if not dep_outcome.ok:
+                return StageOutcome(name=task.name, error=dep_outcome.error)
+            deps[dep] = dep_outcome.value
+
+        async with slots:
+            outcome = StageOutcome(
+                name=task.name,
+                started_ms=int((time.monotonic() - graph_start) * 1000),
+            )
+            step_start = time.monotonic()
+
+            for attempt in range(task.retries + 1):
+                outcome.attempts = attempt + 1
+                try:
+                    outcome.value = await task.run(deps)
+                    outcome.error = None
+                    break
+                except Exception as e:
+                    outcome.error = e
+                    if attempt < task.retries:
+                        delay = retry_delay_seconds * (2 ** attempt)
+                        logger.warning(
+                            f"Stage step {task.name} failed (attempt {attempt + 1}), "
+                            f"retrying in {delay:.0f}s: {e}"
+                        )
+                        await asyncio.sleep(delay)
+
+            outcome.latency_ms = int((time.monotonic() - step_start) * 1000)
+            return outcome
+
+    for task in tasks:
+        futures[task.name] = asyncio.ensure_future(_run(task))
+
+    await asyncio.gather(*futures.values())
+    return {name: future.result() for name, future in futures.items()}
+
+
+def summarize_stage_graph(
+    tasks: list[StageTask],
+    outcomes: dict[str, StageOutcome],
+) -> StageGraphReport:
+    """Build a timing report, including the longest dependency chain."""
+    by_name = {task.name: task for task in tasks}
+    path_cache: dict[str, tuple[int, list[str]]] = {}
+
+    def _longest(name: str) -> tuple[int, list[str]]:
+        if name not in path_cache:
+            best_ms, best_path = 0, []
+            for dep in by_name[name].depends_on:
+                dep_ms, dep_path = _longest(dep)
+                if dep_ms > best_ms:
+                    best_ms, best_path = dep_ms, dep_path
+            own_ms = outcomes[name].latency_ms
+            path_cache[name] = (best_ms + own_ms, best_path + [name])
+        return path_cache[name]
+
+    critical_ms, critical_path = 0, []
+    for name in by_name:
+        total_ms, path = _longest(name)
+        if total_ms > critical_ms:
+            critical_ms, critical_path = total_ms, path
+
+    return StageGraphReport(
+        wall_ms=max((o.finished_ms for o in outcomes.values()), default=0),
+        critical_path=critical_path,
+        critical_path_ms=critical_ms,
+        latency_ms={name: o.latency_ms for name, o in outcomes.items()},
+        failed=[name for name, o in outcomes.items() if not o.ok],
+    )
@@ -115,14 +115,11 @@ def test_anthropic_connection() -> bool:
     print("=" * 60)
 
     try:
-        from anthropic import Anthropic
-        from shared.config import settings
-
-        print("\nInitializing Anthropic client...")
-        client = Anthropic(api_key=settings.anthropic_api_key)
+        from shared.llm_client import create_message_sync
 
         print("Sending test message (simple ping)...")
-        response = client.messages.create(
+        response = create_message_sync(
+            call="railway_check",
             model="claude-haiku-4-5-20251001",
             max_tokens=10,
             messages=[{"role": "user", "content": "Say 'OK' and nothing else."}]
@@ -10,12 +10,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import anthropic
-
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from shared.config import settings
+from shared.llm_client import create_message
 
 
 EVALUATION_PROMPT = """You are evaluating a search result for a family ski directory research task.
@@ -102,7 +100,6 @@ Respond with ONLY a JSON object (no markdown, no explanation):
 
 
 async def evaluate_single_result(
-    client: anthropic.Anthropic,
     result: dict[str, Any],
     resort: str,
     country: str,
@@ -122,7 +119,8 @@ async def evaluate_single_result(
     )
 
     try:
-        response = client.messages.create(
+        response = await create_message(
+            call="api_comparison_eval",
             model="claude-sonnet-4-20250514",  # Fast, cost-effective for bulk evaluation
             max_tokens=500,
             messages=[{"role": "user", "content": prompt}],
@@ -163,7 +161,6 @@ async def evaluate_single_result(
 
 
 async def evaluate_query_results(
-    client: anthropic.Anthropic,
     query_data: dict[str, Any],
     max_results_per_api: int = 5,
 ) -> dict[str, Any]:
@@ -192,7 +189,7 @@ async def evaluate_query_results(
             print(f"      {api}[{i+1}]...", end=" ", flush=True)
 
             eval_result = await evaluate_single_result(
-                client, result, resort, country, query_type, query_text
+                result, resort, country, query_type, query_text
             )
             eval_result["rank"] = i + 1
 
@@ -259,7 +256,6 @@ async def evaluate_all(
     print(f"  Total evaluations: {total_evaluations}")
     print(f"  Estimated cost: ~${estimated_cost:.2f}")
 
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
     evaluated: list[dict[str, Any]] = []
 
     for i, query_data in enumerate(raw_data):
@@ -269,7 +265,7 @@ async def evaluate_all(
         print(f"\n[{i+1}/{len(raw_data)}] {resort} - {query_type}")
 
         query_eval = await evaluate_query_results(
-            client, query_data, max_results_per_api
+            query_data, max_results_per_api
         )
         evaluated.append(query_eval)
 
@@ -9,6 +9,9 @@ Usage:
     python scripts/backfill_costs.py --dry-run           # Preview only
     python scripts/backfill_costs.py --limit 5           # Process 5 resorts
     python scripts/backfill_costs.py --resort "Zermatt"  # Single resort
+    python scripts/backfill_costs.py --max-cost 2        # Stop after $2 of API spend
+
+Runs through shared/backfill.py (concurrency, retries, resume).
 """
 
 import argparse
@@ -19,12 +22,17 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.supabase_client import get_supabase_client
+from shared.backfill import (
+    BackfillContext,
+    BackfillRunner,
+    SkipItem,
+    add_backfill_arguments,
+    fetch_published_resorts,
+)
+from shared.llm_client import call_claude
+from shared.llm_metering import cost_attribution
+from shared.supabase_client import execute_async, get_supabase_client, run_db
 from shared.primitives.database import update_resort_costs
-from shared.primitives.system import log_cost
-
-import anthropic
-from shared.config import settings
 
 
 async def estimate_cost_from_content(
@@ -33,9 +41,13 @@ async def estimate_cost_from_content(
     content: dict,
     country_avg: float | None,
 ) -> float | None:
-    """Use Claude to estimate daily family cost from content sections."""
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    """Use Claude to estimate daily family cost from content sections.
+
+    API errors propagate so the backfill runner can retry them.
 
+    Returns:
+        Estimated daily cost, or None if Claude's answer couldn't be parsed
+    """
     content_text = ""
     for section_name in ["lift_tickets", "where_to_stay", "off_mountain", "getting_there"]:
         section = content.get(section_name, "")
@@ -56,49 +68,32 @@ Content sections:
 Return ONLY a JSON object: {{"estimated_family_daily": <number>, "currency": "USD"}}
 No explanation, just the JSON."""
 
+    with cost_attribution(resort=resort_name, stage="backfill_cost_estimate"):
+        text = await call_claude(prompt, max_tokens=100, call="backfill_cost_estimate")
+
+    text = text.strip()
+    if "```" in text:
+        text = text.split("```")[1].split("```")[0]
+        if text.startswith("json"):
+            text = text[4:]
     try:
-        message = client.messages.create(
-            model=settings.default_model,
-            max_tokens=100,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        text = message.content[0].text.strip()
-        if "```" in text:
-            text = text.split("```")[1].split("```")[0]
-            if text.startswith("json"):
-                text = text[4:]
         parsed = json.loads(text.strip())
-        return parsed.get("estimated_family_daily")
-    except Exception as e:
-        print(f"  Estimation failed: {e}")
-        return country_avg
+        return float(parsed["estimated_family_daily"])
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        print(f"  Could not parse estimate for {resort_name}: {e}")
+        return None
 
 
-async def backfill_costs(
-    dry_run: bool = False,
-    limit: int | None = None,
-    resort_filter: str | None = None,
-):
+async def backfill_costs(args: argparse.Namespace):
     """Backfill missing cost data."""
     client = get_supabase_client()
 
-    # Get resorts missing cost data
-    query = (
-        client.table("resorts")
-        .select("id, name, country, slug")
-        .eq("status", "published")
-    )
-    if resort_filter:
-        query = query.ilike("name", f"%{resort_filter}%")
-
-    resorts_resp = query.execute()
-    resorts = resorts_resp.data or []
+    resorts = await fetch_published_resorts("id, name, country, slug", name_filter=args.resort)
 
     # Batch-fetch all cost data in one query (avoids N+1)
-    all_costs_resp = (
+    all_costs_resp = await execute_async(
         client.table("resort_costs")
         .select("resort_id, estimated_family_daily")
-        .execute()
     )
     cost_lookup = {
         c["resort_id"]: c.get("estimated_family_daily")
@@ -108,8 +103,8 @@ async def backfill_costs(
         r for r in resorts if cost_lookup.get(r["id"]) is None
     ]
 
-    if limit:
-        missing_cost_resorts = missing_cost_resorts[:limit]
+    if args.limit:
+        missing_cost_resorts = missing_cost_resorts[:args.limit]
 
     print(f"Found {len(missing_cost_resorts)} resorts missing cost data")
 
@@ -125,15 +120,12 @@ async def backfill_costs(
             country_costs.setdefault(country, []).append(c["estimated_family_daily"])
     country_avgs = {c: sum(v) / len(v) for c, v in country_costs.items() if v}
 
-    for resort in missing_cost_resorts:
-        print(f"\nProcessing: {resort['name']} ({resort['country']})")
-
+    async def estimate_resort(resort: dict, ctx: BackfillContext) -> str:
         # Get content for estimation
-        content_resp = (
+        content_resp = await execute_async(
             client.table("resort_content")
             .select("*")
             .eq("resort_id", resort["id"])
-            .execute()
         )
         content = content_resp.data[0] if content_resp.data else {}
         country_avg = country_avgs.get(resort["country"])
@@ -141,33 +133,28 @@ async def backfill_costs(
         estimated = await estimate_cost_from_content(
             resort["name"], resort["country"], content, country_avg
         )
+        if not estimated:
+            raise SkipItem("Could not parse a cost estimate")
+
+        if ctx.apply:
+            await run_db(update_resort_costs, resort["id"], {
+                "estimated_family_daily": estimated,
+                "currency": "USD",
+            })
+        return f"${estimated:.0f}/day"
 
-        if estimated:
-            print(f"  Estimated: ${estimated:.0f}/day")
-            if not dry_run:
-                update_resort_costs(resort["id"], {
-                    "estimated_family_daily": estimated,
-                    "currency": "USD",
-                })
-                print(f"  Saved to database")
-            else:
-                print(f"  [DRY RUN] Would save ${estimated:.0f}/day")
-        else:
-            print(f"  Could not estimate cost")
+    runner = BackfillRunner.from_args("costs", estimate_resort, args)
+    await runner.run(missing_cost_resorts)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Backfill missing cost data")
-    parser.add_argument("--dry-run", action="store_true", help="Preview only")
     parser.add_argument("--limit", type=int, help="Max resorts to process")
     parser.add_argument("--resort", type=str, help="Filter by resort name")
+    add_backfill_arguments(parser)
     args = parser.parse_args()
 
-    asyncio.run(backfill_costs(
-        dry_run=args.dry_run,
-        limit=args.limit,
-        resort_filter=args.resort,
-    ))
+    asyncio.run(backfill_costs(args))
 
 
 if __name__ == "__main__":
@@ -16,8 +16,12 @@ Usage:
     python scripts/backfill_data_quality.py --verbose           # Show detail
     python scripts/backfill_data_quality.py --resort zermatt    # Single resort
     python scripts/backfill_data_quality.py --skip-research     # Re-extract only (no API calls)
+    python scripts/backfill_data_quality.py --apply --concurrency 8 --max-cost 5
 
 Estimated cost: ~$0.20/resort (research + extraction), ~$6 total for 30 resorts.
+
+Runs through shared/backfill.py: a crashed run resumes where it stopped
+(pass --restart to start over).
 """
 
 import argparse
@@ -29,7 +33,13 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.supabase_client import get_supabase_client
+from shared.backfill import (
+    BackfillContext,
+    BackfillRunner,
+    SkipItem,
+    add_backfill_arguments,
+)
+from shared.supabase_client import get_supabase_client, run_db
 from shared.primitives.scoring import (
     KEY_COMPLETENESS_FIELDS,
     calculate_data_completeness,
@@ -40,6 +50,9 @@ from shared.primitives.intelligence import extract_resort_data
 from shared.primitives.research import search_resort_info
 from shared.primitives.system import log_reasoning
 
+# Reserved from the daily budget per resort while it runs
+RESORT_COST_ESTIMATE = 0.20
+
 
 def get_published_resorts(slug_filter: str | None = None) -> list[dict]:
     """Get published resorts, optionally filtered by slug."""
@@ -82,39 +95,33 @@ def get_current_costs(resort_id: str) -> dict | None:
     return response.data[0] if response.data else None
 
 
-def update_metrics(resort_id: str, updates: dict) -> bool:
+def update_metrics(resort_id: str, updates: dict) -> None:
     """Update family metrics in database."""
     supabase = get_supabase_client()
-    try:
-        supabase.table("resort_family_metrics").update(
-            updates
-        ).eq("resort_id", resort_id).execute()
-        return True
-    except Exception as e:
-        print(f"  Error updating metrics: {e}")
-        return False
+    supabase.table("resort_family_metrics").update(
+        updates
+    ).eq("resort_id", resort_id).execute()
 
 
-def update_costs(resort_id: str, updates: dict) -> bool:
+def update_costs(resort_id: str, updates: dict) -> None:
     """Update cost data in database."""
     supabase = get_supabase_client()
-    try:
-        supabase.table("resort_costs").update(
-            updates
-        ).eq("resort_id", resort_id).execute()
-        return True
-    except Exception as e:
-        print(f"  Error updating costs: {e}")
-        return False
+    supabase.table("resort_costs").update(
+        updates
+    ).eq("resort_id", resort_id).execute()
 
 
 async def backfill_resort(
     resort: dict,
-    apply: bool = False,
+    ctx: BackfillContext,
     verbose: bool = False,
     skip_research: bool = False,
 ) -> dict:
-    """Backfill data quality for a single resort."""
+    """Backfill data quality for a single resort.
+
+    Research, extraction and database errors propagate so the runner
+    retries the resort.
+    """
     resort_id = resort["id"]
     name = resort["name"]
     country = resort["country"]
@@ -123,7 +130,7 @@ async def backfill_resort(
         "name": name,
         "country": country,
         "resort_id": resort_id,
-        "status": "skipped",
+        "status": "unchanged",
         "old_score": None,
         "new_score": None,
         "old_completeness": None,
@@ -132,12 +139,11 @@ async def backfill_resort(
     }
 
     # Get current state
-    old_metrics = get_current_metrics(resort_id)
-    old_costs = get_current_costs(resort_id)
+    old_metrics = await run_db(get_current_metrics, resort_id)
+    old_costs = await run_db(get_current_costs, resort_id)
 
     if not old_metrics:
-        print(f"  [SKIP] No family metrics row for {name}")
-        return result
+        raise SkipItem("No family metrics row")
 
     old_score = old_metrics.get("family_overall_score")
     old_completeness = calculate_data_completeness(old_metrics)
@@ -145,30 +151,22 @@ async def backfill_resort(
     result["old_completeness"] = round(old_completeness, 2)
 
     if verbose:
-        print(f"  Before: score={old_score}, completeness={old_completeness:.0%}")
+        ctx.log(f"Before: score={old_score}, completeness={old_completeness:.0%}")
         null_fields = [f for f in KEY_COMPLETENESS_FIELDS if old_metrics.get(f) is None]
         if null_fields:
-            print(f"  NULL key fields: {', '.join(null_fields)}")
+            ctx.log(f"NULL key fields: {', '.join(null_fields)}")
 
     # Step 1: Re-research (unless skipping)
     raw_research = None
     if not skip_research:
-        print(f"  Researching {name}, {country}...")
-        try:
-            raw_research = await search_resort_info(name, country)
-        except Exception as e:
-            print(f"  [WARN] Research failed: {e}")
-            raw_research = None
+        ctx.log(f"Researching {name}, {country}...")
+        raw_research = await search_resort_info(name, country)
 
     # Step 2: Re-extract with improved prompt
     extracted = None
     if raw_research:
-        print(f"  Extracting structured data...")
-        try:
-            extracted = await extract_resort_data(raw_research, name, country)
-        except Exception as e:
-            print(f"  [WARN] Extraction failed: {e}")
-            extracted = None
+        ctx.log("Extracting structured data...")
+        extracted = await extract_resort_data(raw_research, name, country)
 
     # Step 3: Merge extracted data with existing (fill gaps, don't overwrite with None)
     new_metrics = dict(old_metrics)  # Start with existing
@@ -194,10 +192,10 @@ async def backfill_resort(
                     fields_improved.append(f"cost.{key}: None → {value}")
 
         if verbose and extracted.reasoning:
-            print(f"  Extraction reasoning: {extracted.reasoning}")
-            print(f"  Confidence: {extracted.confidence:.2f}")
+            ctx.log(f"Extraction reasoning: {extracted.reasoning}")
+            ctx.log(f"Confidence: {extracted.confidence:.2f}")
     elif extracted:
-        print(f"  [SKIP] Low confidence extraction ({extracted.confidence:.2f})")
+        ctx.log(f"[SKIP] Low confidence extraction ({extracted.confidence:.2f})")
 
     # Step 4: Recalculate score and completeness
     new_score = calculate_family_score(new_metrics)
@@ -209,14 +207,14 @@ async def backfill_resort(
     result["status"] = "updated" if fields_improved or new_score != old_score else "unchanged"
 
     if verbose:
-        print(f"  After: score={new_score}, completeness={new_completeness:.0%}")
+        ctx.log(f"After: score={new_score}, completeness={new_completeness:.0%}")
         if fields_improved:
-            print(f"  Fields improved: {len(fields_improved)}")
+            ctx.log(f"Fields improved: {len(fields_improved)}")
             for f in fields_improved:
-                print(f"    {f}")
+                ctx.log(f"  {f}")
 
     # Step 5: Apply updates
-    if apply and (fields_improved or new_score != old_score):
+    if ctx.apply and (fields_improved or new_score != old_score):
         # Build update payload for metrics
         metrics_update = {
             "family_overall_score": new_score,
@@ -232,11 +230,8 @@ async def backfill_resort(
             if new_metrics.get(key) is not None and old_metrics.get(key) is None:
                 metrics_update[key] = new_metrics[key]
 
-        success = update_metrics(resort_id, metrics_update)
-        if success:
-            print(f"  [UPDATED] Metrics")
-        else:
-            result["status"] = "error"
+        await run_db(update_metrics, resort_id, metrics_update)
+        ctx.log("[UPDATED] Metrics")
 
         # Update costs if improved
         if old_costs and any(k.startswith("cost.") for f in fields_improved for k in [f.split(":")[0]]):
@@ -245,9 +240,8 @@ async def backfill_resort(
                 if value is not None and new_costs.get(key) != (old_costs or {}).get(key):
                     cost_update[key] = value
             if cost_update:
-                cost_success = update_costs(resort_id, cost_update)
-                if cost_success:
-                    print(f"  [UPDATED] Costs")
+                await run_db(update_costs, resort_id, cost_update)
+                ctx.log("[UPDATED] Costs")
 
         # Step 6: Log reasoning
         score_delta = round(new_score - (old_score or 0), 1)
@@ -271,49 +265,44 @@ async def backfill_resort(
             },
         )
 
-    elif apply and new_score == old_score and not fields_improved:
+    elif ctx.apply and new_score == old_score and not fields_improved:
         # Still store completeness even if nothing else changed
-        update_metrics(resort_id, {
+        await run_db(update_metrics, resort_id, {
             "data_completeness": round(new_completeness, 2),
         })
 
     return result
 
 
-async def main(
-    apply: bool = False,
-    verbose: bool = False,
-    resort_slug: str | None = None,
-    skip_research: bool = False,
-):
+async def main(args: argparse.Namespace):
     """Run the backfill."""
-    print("=" * 70)
-    print("DATA QUALITY BACKFILL")
-    print("=" * 70)
-
-    if not apply:
-        print("\n[DRY RUN] - Use --apply to update the database\n")
-    else:
-        print("\n[LIVE] - Will update the database\n")
-
-    resorts = get_published_resorts(slug_filter=resort_slug)
-    print(f"Found {len(resorts)} resort(s) to process\n")
-
+    resorts = await run_db(get_published_resorts, slug_filter=args.resort)
     if not resorts:
         print("No resorts found!")
         return
 
     results = []
-    for i, resort in enumerate(resorts, 1):
-        print(f"[{i}/{len(resorts)}] {resort['name']} ({resort['country']})")
+
+    async def backfill_item(resort: dict, ctx: BackfillContext) -> str:
         result = await backfill_resort(
             resort,
-            apply=apply,
-            verbose=verbose,
-            skip_research=skip_research,
+            ctx,
+            verbose=args.verbose,
+            skip_research=args.skip_research,
         )
         results.append(result)
-        print()
+        return (
+            f"{result['status']}, score {result['old_score']} → {result['new_score']}, "
+            f"+{len(result['fields_improved'])} fields"
+        )
+
+    runner = BackfillRunner.from_args(
+        "data_quality",
+        backfill_item,
+        args,
+        item_cost_estimate_usd=0.0 if args.skip_research else RESORT_COST_ESTIMATE,
+    )
+    await runner.run(resorts)
 
     # Summary
     print("=" * 70)
@@ -322,14 +311,10 @@ async def main(
 
     updated = [r for r in results if r["status"] == "updated"]
     unchanged = [r for r in results if r["status"] == "unchanged"]
-    skipped = [r for r in results if r["status"] == "skipped"]
-    errors = [r for r in results if r["status"] == "error"]
 
     print(f"\nProcessed: {len(results)}")
     print(f"Updated:   {len(updated)}")
     print(f"Unchanged: {len(unchanged)}")
-    print(f"Skipped:   {len(skipped)}")
-    print(f"Errors:    {len(errors)}")
 
     if updated:
         print(f"\nScore Changes:")
@@ -358,7 +343,7 @@ async def main(
         print(f"  Show partial:    {show_partial} resorts")
         print(f"  Keep hidden:     {hidden} resorts")
 
-    if not apply and updated:
+    if args.dry_run and updated:
         print(f"\n[DRY RUN] Run with --apply to update {len(updated)} resorts")
 
 
@@ -366,11 +351,6 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Backfill data quality for published resorts"
     )
-    parser.add_argument(
-        "--apply",
-        action="store_true",
-        help="Actually update the database (default is dry run)",
-    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -387,11 +367,7 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip re-research, only re-extract and re-score with existing data",
     )
+    add_backfill_arguments(parser, write_flag="--apply")
     args = parser.parse_args()
 
-    asyncio.run(main(
-        apply=args.apply,
-        verbose=args.verbose,
-        resort_slug=args.resort,
-        skip_research=args.skip_research,
-    ))
+    asyncio.run(main(args))
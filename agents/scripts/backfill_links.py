@@ -13,6 +13,10 @@ Usage:
     python scripts/backfill_links.py --content-only         # Only inject in-content links
     python scripts/backfill_links.py --resort "Zermatt"     # Single resort
     python scripts/backfill_links.py --clear-cache          # Clear low-confidence cache before backfill
+    python scripts/backfill_links.py --concurrency 8 --max-cost 2
+
+Runs through shared/backfill.py: a crashed run resumes where it stopped
+(pass --restart to start over).
 """
 
 import argparse
@@ -24,7 +28,14 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.supabase_client import get_supabase_client
+from shared.backfill import (
+    BackfillContext,
+    BackfillRunner,
+    SkipItem,
+    add_backfill_arguments,
+    fetch_published_resorts,
+)
+from shared.supabase_client import execute_async, get_supabase_client, run_db
 from shared.primitives.external_links import (
     WELL_KNOWN_BRANDS,
     clear_low_confidence_cache,
@@ -33,7 +44,6 @@ from shared.primitives.external_links import (
 )
 from shared.primitives.intelligence import curate_resort_links
 from shared.primitives.links import get_resort_links
-from shared.primitives.system import log_cost
 
 
 def _strip_existing_links(html_content: str) -> str:
@@ -73,14 +83,13 @@ async def backfill_sidebar_links(
 
     # Get research sources from audit log (most recent research for this resort)
     # Fall back to empty sources if none found -- Claude will use its knowledge
-    sources_response = (
+    sources_response = await execute_async(
         client.table("agent_audit_log")
         .select("metadata")
         .eq("action", "research_complete")
         .like("reasoning", f"%{resort_name}%")
         .order("created_at", desc=True)
         .limit(1)
-        .execute()
     )
 
     research_sources = []
@@ -119,24 +128,20 @@ async def backfill_sidebar_links(
             print(f"    [{link.category}] {link.title}: {link.url[:60]}...")
         return {"status": "dry_run", "links_count": len(link_result.links)}
 
-    # Store curated links
-    stored = 0
-    for link in link_result.links:
-        try:
-            client.table("resort_links").upsert({
-                "resort_id": resort_id,
-                "title": link.title,
-                "url": link.url,
-                "category": link.category,
-                "description": link.description,
-            }, on_conflict="resort_id,url").execute()
-            stored += 1
-        except Exception as e:
-            print(f"    Failed to store link {link.url}: {e}")
-
-    log_cost("anthropic", 0.01, None, {"stage": "backfill_sidebar_links", "resort": resort_name})
+    # Store curated links in one upsert
+    rows = [
+        {
+            "resort_id": resort_id,
+            "title": link.title,
+            "url": link.url,
+            "category": link.category,
+            "description": link.description,
+        }
+        for link in link_result.links
+    ]
+    await execute_async(client.table("resort_links").upsert(rows, on_conflict="resort_id,url"))
 
-    return {"status": "complete", "links_stored": stored, "has_official": link_result.has_official}
+    return {"status": "complete", "links_stored": len(rows), "has_official": link_result.has_official}
 
 
 async def backfill_content_links(
@@ -159,12 +164,11 @@ async def backfill_content_links(
     client = get_supabase_client()
 
     # Get existing content
-    content_response = (
+    content_response = await execute_async(
         client.table("resort_content")
         .select("*")
         .eq("resort_id", resort_id)
         .single()
-        .execute()
     )
 
     if not content_response.data:
@@ -223,7 +227,9 @@ async def backfill_content_links(
             update_data[section_name] = html_content
 
     if update_data:
-        client.table("resort_content").update(update_data).eq("resort_id", resort_id).execute()
+        await execute_async(
+            client.table("resort_content").update(update_data).eq("resort_id", resort_id)
+        )
 
     # Store entities as atoms in resort_entities table
     entities_stored = 0
@@ -234,7 +240,8 @@ async def backfill_content_links(
             if link.is_maps_search_fallback:
                 resolution_status = "resolved"  # Maps search is a valid resolution
 
-            stored = upsert_resort_entity(
+            stored = await run_db(
+                upsert_resort_entity,
                 resort_id=resort_id,
                 name=link.entity_name,
                 entity_type=link.entity_type,
@@ -247,8 +254,6 @@ async def backfill_content_links(
             if stored:
                 entities_stored += 1
 
-    log_cost("anthropic", 0.01, None, {"stage": "backfill_content_links", "resort": resort_name})
-
     return {
         "status": "complete",
         "links_injected": len(injected_links),
@@ -259,159 +264,117 @@ async def backfill_content_links(
     }
 
 
-async def backfill_links(
-    dry_run: bool = False,
-    limit: int | None = None,
-    sidebar_only: bool = False,
-    content_only: bool = False,
-    resort_name_filter: str | None = None,
-    clear_cache: bool = False,
-):
+async def backfill_links(args: argparse.Namespace):
     """Run the link backfill across all published resorts."""
-    client = get_supabase_client()
-
     # Clear low-confidence cache entries if requested
-    if clear_cache:
+    if args.clear_cache:
         print("Clearing low-confidence cache entries...")
-        cleared = clear_low_confidence_cache(min_confidence=0.65)
+        cleared = await run_db(clear_low_confidence_cache, min_confidence=0.65)
         print(f"Cleared {cleared} entries\n")
 
-    # Get published resorts
-    query = (
-        client.table("resorts")
-        .select("id, name, country, slug")
-        .eq("status", "published")
-        .order("name")
+    resorts = await fetch_published_resorts(
+        "id, name, country, slug", name_filter=args.resort, limit=args.limit
     )
 
-    if resort_name_filter:
-        query = query.ilike("name", f"%{resort_name_filter}%")
-
-    if limit:
-        query = query.limit(limit)
-
-    resorts_response = query.execute()
-    resorts = resorts_response.data or []
+    do_sidebar = not args.content_only
+    do_content = not args.sidebar_only
+    dry_run = args.dry_run
 
-    do_sidebar = not content_only
-    do_content = not sidebar_only
-
-    print(f"\n{'='*60}")
-    print(f"LINK BACKFILL")
-    print(f"{'='*60}")
-    print(f"Mode: {'DRY RUN' if dry_run else 'LIVE'}")
-    print(f"Resorts: {len(resorts)}")
     print(f"Sidebar links: {'YES' if do_sidebar else 'SKIP'}")
     print(f"Content links: {'YES' if do_content else 'SKIP'}")
-    print(f"Clear cache: {'YES' if clear_cache else 'NO'}")
-    print(f"{'='*60}\n")
-
-    sidebar_updated = 0
-    sidebar_skipped = 0
-    content_updated = 0
-    content_skipped = 0
-    failed = 0
-    total_entity_links = 0
-    total_affiliate_links = 0
-    total_maps_fallback = 0
-    total_entities_stored = 0
-
-    for i, resort in enumerate(resorts, 1):
+
+    totals = {
+        "sidebar_updated": 0,
+        "content_updated": 0,
+        "entity_links": 0,
+        "affiliate_links": 0,
+        "maps_fallback": 0,
+        "entities_stored": 0,
+    }
+
+    async def backfill_resort(resort: dict, ctx: BackfillContext) -> str:
         resort_id = resort["id"]
         name = resort["name"]
         country = resort["country"]
-        slug = resort["slug"]
+        notes = []
 
-        print(f"\n[{i}/{len(resorts)}] {name}, {country}")
-        print("-" * 40)
+        # Sidebar links
+        if do_sidebar:
+            sidebar_result = await backfill_sidebar_links(
+                resort_id=resort_id,
+                resort_name=name,
+                country=country,
+                dry_run=dry_run,
+            )
+            status = sidebar_result.get("status", "unknown")
+            if status in ("complete", "dry_run"):
+                totals["sidebar_updated"] += 1
+                count = sidebar_result.get("links_stored") or sidebar_result.get("links_count", 0)
+                notes.append(f"{count} sidebar links")
+            else:
+                reason = sidebar_result.get("reason", sidebar_result.get("error", "unknown"))
+                ctx.log(f"Sidebar skipped: {reason}")
 
-        try:
-            # Sidebar links
-            if do_sidebar:
-                print("  Sidebar links:")
-                sidebar_result = await backfill_sidebar_links(
-                    resort_id=resort_id,
-                    resort_name=name,
-                    country=country,
-                    dry_run=dry_run,
-                )
-                status = sidebar_result.get("status", "unknown")
-                if status in ("complete", "dry_run"):
-                    sidebar_updated += 1
-                    count = sidebar_result.get("links_stored") or sidebar_result.get("links_count", 0)
-                    print(f"    {count} links curated")
-                else:
-                    sidebar_skipped += 1
-                    print(f"    Skipped: {sidebar_result.get('reason', sidebar_result.get('error', 'unknown'))}")
-
-            # Content links
-            if do_content:
-                print("  Content links:")
-                content_result = await backfill_content_links(
-                    resort_id=resort_id,
-                    resort_name=name,
-                    country=country,
-                    resort_slug=slug,
-                    dry_run=dry_run,
-                )
-                status = content_result.get("status", "unknown")
-                if status in ("complete", "dry_run"):
-                    content_updated += 1
-                    count = content_result.get("links_injected") or content_result.get("links_count", 0)
-                    aff = content_result.get("affiliate_count", 0)
-                    maps_fb = content_result.get("maps_fallback_count", 0)
-                    ent_stored = content_result.get("entities_stored", 0)
-                    total_entity_links += count
-                    total_affiliate_links += aff
-                    total_maps_fallback += maps_fb
-                    total_entities_stored += ent_stored
-                    print(f"    {count} entity links ({aff} affiliate, {maps_fb} maps fallback)")
-                    if ent_stored:
-                        print(f"    {ent_stored} entities stored as atoms")
-                else:
-                    content_skipped += 1
-                    print(f"    Skipped: {content_result.get('reason', content_result.get('error', 'unknown'))}")
+        # Content links
+        if do_content:
+            content_result = await backfill_content_links(
+                resort_id=resort_id,
+                resort_name=name,
+                country=country,
+                resort_slug=resort["slug"],
+                dry_run=dry_run,
+            )
+            status = content_result.get("status", "unknown")
+            if status in ("complete", "dry_run"):
+                totals["content_updated"] += 1
+                count = content_result.get("links_injected") or content_result.get("links_count", 0)
+                aff = content_result.get("affiliate_count", 0)
+                maps_fb = content_result.get("maps_fallback_count", 0)
+                ent_stored = content_result.get("entities_stored", 0)
+                totals["entity_links"] += count
+                totals["affiliate_links"] += aff
+                totals["maps_fallback"] += maps_fb
+                totals["entities_stored"] += ent_stored
+                notes.append(f"{count} entity links ({aff} affiliate, {maps_fb} maps fallback)")
+                if ent_stored:
+                    ctx.log(f"{ent_stored} entities stored as atoms")
+            else:
+                reason = content_result.get("reason", content_result.get("error", "unknown"))
+                ctx.log(f"Content skipped: {reason}")
 
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            failed += 1
+        if not notes:
+            raise SkipItem("Nothing to link")
+        return ", ".join(notes)
+
+    runner = BackfillRunner.from_args("links", backfill_resort, args)
+    await runner.run(resorts)
 
-    # Summary
-    print(f"\n{'='*60}")
-    print(f"BACKFILL COMPLETE")
-    print(f"{'='*60}")
     if do_sidebar:
-        print(f"Sidebar: {sidebar_updated} updated, {sidebar_skipped} skipped")
+        print(f"Sidebar: {totals['sidebar_updated']} updated")
     if do_content:
-        print(f"Content: {content_updated} updated, {content_skipped} skipped")
-        print(f"Entity links injected: {total_entity_links} ({total_affiliate_links} affiliate, {total_maps_fallback} maps fallback)")
-        print(f"Entity atoms stored: {total_entities_stored}")
-    print(f"Failed: {failed}")
-    print(f"{'='*60}\n")
+        print(f"Content: {totals['content_updated']} updated")
+        print(
+            f"Entity links injected: {totals['entity_links']} "
+            f"({totals['affiliate_links']} affiliate, {totals['maps_fallback']} maps fallback)"
+        )
+        print(f"Entity atoms stored: {totals['entities_stored']}")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Backfill external links for published resorts")
-    parser.add_argument("--dry-run", action="store_true", help="Preview only, don't save changes")
     parser.add_argument("--limit", type=int, help="Limit number of resorts to process")
     parser.add_argument("--sidebar-only", action="store_true", help="Only re-curate sidebar links")
     parser.add_argument("--content-only", action="store_true", help="Only inject in-content links")
     parser.add_argument("--resort", type=str, help="Process a single resort by name")
     parser.add_argument("--clear-cache", action="store_true", help="Clear low-confidence cache entries before backfill")
+    add_backfill_arguments(parser)
     args = parser.parse_args()
 
     if args.sidebar_only and args.content_only:
         print("Error: Cannot use --sidebar-only and --content-only together")
         sys.exit(1)
 
-    asyncio.run(backfill_links(
-        dry_run=args.dry_run,
-        limit=args.limit,
-        sidebar_only=args.sidebar_only,
-        content_only=args.content_only,
-        resort_name_filter=args.resort,
-        clear_cache=args.clear_cache,
-    ))
+    asyncio.run(backfill_links(args))
 
 
 if __name__ == "__main__":
@@ -26,6 +26,12 @@ Usage:
 
     # Re-acquire pricing for ALL published resorts
     python scripts/backfill_pricing.py --all --write
+
+    # More resorts at once, stopping after $3 of API spend
+    python scripts/backfill_pricing.py --all --write --concurrency 8 --max-cost 3
+
+Fixes run through shared/backfill.py: a crashed run resumes where it
+stopped (pass --restart to start over).
 """
 
 import argparse
@@ -35,7 +41,8 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.supabase_client import get_supabase_client
+from shared.backfill import BackfillContext, BackfillRunner, add_backfill_arguments
+from shared.supabase_client import execute_async, get_supabase_client, run_db
 from shared.primitives.costs import (
     acquire_resort_costs,
     validate_costs,
@@ -99,8 +106,12 @@ def audit_pricing() -> dict[str, list[dict]]:
     return {"missing": missing, "wrong": wrong, "suspicious": suspicious, "ok": ok}
 
 
-async def fix_resort_pricing(resort: dict, write: bool) -> dict:
-    """Fix pricing for a single resort using the new Exa+Claude pipeline."""
+async def fix_resort_pricing(resort: dict, ctx: BackfillContext) -> str:
+    """Fix pricing for a single resort using the new Exa+Claude pipeline.
+
+    Raises if no strategy finds pricing, so the runner retries the resort
+    and leaves it out of the checkpoint.
+    """
     name = resort["name"]
     country = resort["country"]
     resort_id = resort["id"]
@@ -108,12 +119,14 @@ async def fix_resort_pricing(resort: dict, write: bool) -> dict:
 
     # Clear bad cache entry
     client = get_supabase_client()
-    result = client.table("pricing_cache").delete().eq(
-        "resort_name", name
-    ).eq("country", country).execute()
+    result = await execute_async(
+        client.table("pricing_cache").delete().eq(
+            "resort_name", name
+        ).eq("country", country)
+    )
     deleted = len(result.data) if result.data else 0
     if deleted:
-        print(f"    Cleared {deleted} cache entries")
+        ctx.log(f"Cleared {deleted} cache entries")
 
     # Re-acquire pricing with new system
     cost_result = await acquire_resort_costs(name, country)
@@ -131,12 +144,12 @@ async def fix_resort_pricing(resort: dict, write: bool) -> dict:
         if old_adult and new_adult:
             change = f" (was ${old_adult})"
 
-        print(f"    Adult: ${new_adult}{change}, Child: ${new_child}")
-        print(f"    Source: {source}, Confidence: {confidence:.2f}")
+        ctx.log(f"Adult: ${new_adult}{change}, Child: ${new_child}")
+        ctx.log(f"Source: {source}, Confidence: {confidence:.2f}")
         for note in notes:
-            print(f"    Note: {note}")
+            ctx.log(f"Note: {note}")
 
-        if write and new_adult is not None:
+        if ctx.apply and new_adult is not None:
             update_data = {}
             if new_adult is not None:
                 update_data["lift_adult_daily"] = new_adult
@@ -147,45 +160,38 @@ async def fix_resort_pricing(resort: dict, write: bool) -> dict:
             if update_data:
                 update_data["currency"] = cost_result.currency or COUNTRY_CURRENCIES.get(country.lower(), "USD")
                 update_data["resort_id"] = resort_id
-                client.table("resort_costs").upsert(
-                    update_data, on_conflict="resort_id"
-                ).execute()
+                await execute_async(
+                    client.table("resort_costs").upsert(
+                        update_data, on_conflict="resort_id"
+                    )
+                )
                 # Update USD comparison columns for cross-country comparisons
                 currency = update_data.get("currency", "USD")
-                update_usd_columns(resort_id, update_data, currency)
-                print(f"    Written to DB (+ USD columns)")
+                await run_db(update_usd_columns, resort_id, update_data, currency)
+                ctx.log("Written to DB (+ USD columns)")
 
-        return {
-            "name": name,
-            "status": "fixed",
-            "old_adult": old_adult,
-            "new_adult": new_adult,
-            "new_child": new_child,
-            "source": source,
-            "confidence": confidence,
-        }
-    else:
-        error = cost_result.error if cost_result else "No result"
-        print(f"    FAILED: {error}")
-        return {"name": name, "status": "failed", "error": error}
+        return f"adult ${new_adult}{change} via {source}"
+
+    error = cost_result.error if cost_result else "No result"
+    raise RuntimeError(error)
 
 
 async def main():
     parser = argparse.ArgumentParser(description="Backfill/fix resort pricing")
     parser.add_argument("--audit", action="store_true", help="Audit only, show categories")
-    parser.add_argument("--write", action="store_true", help="Write fixes to DB")
     parser.add_argument("--resort", help="Fix a single resort by name")
     parser.add_argument("--missing-only", action="store_true", help="Only fix missing prices")
     parser.add_argument("--wrong-only", action="store_true", help="Only fix clearly wrong prices")
     parser.add_argument("--all", action="store_true", help="Re-acquire pricing for ALL published resorts")
+    add_backfill_arguments(parser, write_flag="--write")
     args = parser.parse_args()
 
     print("Pricing Backfill")
-    print(f"  Write: {args.write}")
+    print(f"  Write: {not args.dry_run}")
     print()
 
     # Always audit first
-    categories = audit_pricing()
+    categories = await run_db(audit_pricing)
     missing = categories["missing"]
     wrong = categories["wrong"]
     suspicious = categories["suspicious"]
@@ -223,12 +229,11 @@ async def main():
     targets = []
     if args.resort:
         client = get_supabase_client()
-        response = (
+        response = await execute_async(
             client.table("resorts")
             .select("id, name, country, slug, resort_costs(lift_adult_daily, lift_child_daily, currency)")
             .ilike("name", f"%{args.resort}%")
             .limit(5)
-            .execute()
         )
         for r in response.data or []:
             costs_data = r.get("resort_costs")
@@ -254,26 +259,11 @@ async def main():
         print("No resorts to fix")
         return
 
-    print(f"Fixing {len(targets)} resorts...")
-    print()
-
-    fixed = 0
-    failed = 0
-    for i, resort in enumerate(targets):
-        print(f"  [{i+1}/{len(targets)}] {resort['name']} ({resort['country']})")
-        result = await fix_resort_pricing(resort, args.write)
-        if result["status"] == "fixed":
-            fixed += 1
-        else:
-            failed += 1
-        print()
-
-        # Small delay to avoid rate limits on Exa + Anthropic APIs
-        await asyncio.sleep(1)
+    runner = BackfillRunner.from_args("pricing", fix_resort_pricing, args)
+    report = await runner.run(targets)
 
-    print(f"Results: {fixed} fixed, {failed} failed")
-    print(f"Daily spend: ${get_daily_spend():.2f}")
-    if not args.write and fixed > 0:
+    print(f"Daily spend: ${await run_db(get_daily_spend):.2f}")
+    if args.dry_run and report.count("done") > 0:
         print("  (Dry run — use --write to save to DB)")
 
 
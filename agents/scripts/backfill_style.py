@@ -17,6 +17,10 @@ Usage:
     # Batch with offset/limit
     python scripts/backfill_style.py --batch --batch-limit 10 --batch-offset 20 --layers det --write
 
+    # Full style edit for all resorts via the Message Batches API (half price).
+    # Safe to re-run: already-submitted batches are polled, not resubmitted.
+    python scripts/backfill_style.py --batch --batch-api --layers det,style --write
+
 Cost estimates (for ~95 resorts):
     det only:           $0.00
     det + em_dash:      ~$0.20
@@ -31,11 +35,18 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.supabase_client import get_supabase_client
+from shared.llm_batch import BatchResult, MessageBatchJob
+from shared.supabase_client import execute_async, get_supabase_client
 from shared.primitives.style import (
+    EM_DASH_MODEL,
+    STYLE_EDIT_MODEL,
     apply_deterministic_style,
     apply_em_dash_fix,
     apply_full_style_edit,
+    build_em_dash_prompt,
+    build_style_edit_prompt,
+    em_dash_max_tokens,
+    style_edit_max_tokens,
 )
 from shared.style_profiles import get_style_profile
 from shared.primitives.system import get_daily_spend
@@ -163,6 +174,98 @@ async def process_resort(
     return result
 
 
+# Per-section cost at standard prices (see shared/primitives/style.py)
+BATCH_LAYER_COSTS = {"em_dash": 0.002, "style": 0.40}
+
+
+async def batch_api_style(
+    resorts: list[dict],
+    layers: list[str],
+    profile_name: str,
+    write: bool,
+    timeout: float | None,
+) -> None:
+    """Run one LLM layer over many resorts as a message batch.
+
+    Deterministic fixes are applied and written first. Each LLM section
+    result is written as it comes back, so an interrupted run loses nothing
+    and a re-run only collects what is still outstanding.
+    """
+    llm_layers = [layer for layer in layers if layer in BATCH_LAYER_COSTS]
+    if len(llm_layers) != 1:
+        print("--batch-api runs exactly one LLM layer (em_dash or style) per invocation")
+        return
+    layer = llm_layers[0]
+    profile = get_style_profile(profile_name)
+    client = get_supabase_client()
+
+    job = MessageBatchJob(
+        f"style-{layer}-{profile_name}",
+        cost_per_request_usd=BATCH_LAYER_COSTS[layer],
+        record_deliveries=write,
+    )
+
+    def make_handler(resort: dict, section: str):
+        async def handle(result: BatchResult) -> None:
+            if not result.succeeded:
+                print(f"  {resort['name']}/{section}: {result.status} ({result.error})")
+                return
+            text = result.text.strip()
+            status = "written" if write else "dry-run"
+            if write:
+                await execute_async(
+                    client.table("resort_content")
+                    .update({section: text})
+                    .eq("resort_id", resort["id"])
+                )
+            before = count_em_dashes(resort["sections"])
+            after = count_em_dashes({section: text})
+            print(f"  {resort['name']}/{section}: {before} → {after} em-dashes ({status})")
+        return handle
+
+    for resort in resorts:
+        current = dict(resort["sections"])
+        if "det" in layers:
+            current = apply_deterministic_style(current, profile)
+            changed = {
+                col: current[col] for col in PROSE_SECTIONS
+                if col in current and current[col] != resort["sections"].get(col)
+            }
+            if write and changed:
+                await execute_async(
+                    client.table("resort_content").update(changed).eq("resort_id", resort["id"])
+                )
+
+        for section, text in current.items():
+            custom_id = f"{resort['id']}-{section}"
+            if not isinstance(text, str) or job.was_delivered(custom_id):
+                continue
+            if layer == "em_dash" and "\u2014" not in text:
+                continue
+            if layer == "style" and len(text) < 100:
+                continue
+
+            if layer == "em_dash":
+                prompt = build_em_dash_prompt(text)
+                model, max_tokens = EM_DASH_MODEL, em_dash_max_tokens(text)
+            else:
+                prompt = build_style_edit_prompt(text, section, profile)
+                model, max_tokens = STYLE_EDIT_MODEL, style_edit_max_tokens(text)
+
+            job.add(
+                custom_id,
+                prompt,
+                handler=make_handler({**resort, "sections": {section: text}}, section),
+                model=model,
+                max_tokens=max_tokens,
+            )
+
+    print(f"  {len(job)} sections queued for the {layer} batch")
+    report = await job.run(timeout=timeout)
+    if report.pending:
+        print(f"  {report.pending} sections still processing; re-run the same command to collect them")
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Backfill style editing")
     parser.add_argument("--resort", help="Single resort name")
@@ -172,6 +275,14 @@ async def main():
     parser.add_argument("--layers", default="det", help="Comma-separated: det,em_dash,style")
     parser.add_argument("--profile", default="spielplatz", help="Style profile name")
     parser.add_argument("--write", action="store_true", help="Write changes to DB")
+    parser.add_argument(
+        "--batch-api", action="store_true",
+        help="With --batch: send the LLM layer through the Message Batches API",
+    )
+    parser.add_argument(
+        "--batch-timeout", type=float,
+        help="With --batch-api: stop waiting after N seconds (re-run to resume)",
+    )
 
     args = parser.parse_args()
     layers = [l.strip() for l in args.layers.split(",")]
@@ -234,6 +345,11 @@ async def main():
         print(f"  Found {len(resorts)} published resorts")
         print()
 
+        if args.batch_api:
+            await batch_api_style(resorts, layers, args.profile, args.write, args.batch_timeout)
+            print(f"  Daily spend: ${get_daily_spend():.2f}")
+            return
+
         total_removed = 0
         for i, resort in enumerate(resorts):
             result = await process_resort(resort, layers, args.profile, args.write)
@@ -9,6 +9,10 @@ Usage:
     python scripts/backfill_taglines.py           # Full backfill
     python scripts/backfill_taglines.py --dry-run # Preview only (no saves)
     python scripts/backfill_taglines.py --limit 5 # Process only 5 resorts
+    python scripts/backfill_taglines.py --concurrency 8 --max-cost 5
+
+Runs through shared/backfill.py: a crashed run resumes where it stopped
+(pass --restart to start over).
 """
 
 import argparse
@@ -19,7 +23,13 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.supabase_client import get_supabase_client
+from shared.backfill import (
+    BackfillContext,
+    BackfillRunner,
+    add_backfill_arguments,
+    fetch_published_resorts,
+)
+from shared.supabase_client import execute_async, get_supabase_client, run_db
 from shared.primitives.intelligence import (
     extract_tagline_atoms,
     generate_diverse_tagline,
@@ -28,177 +38,135 @@ from shared.primitives.intelligence import (
 from shared.primitives.database import get_recent_portfolio_taglines
 
 
-async def backfill_taglines(dry_run: bool = False, limit: int | None = None):
-    """Run the new tagline system against all published resorts."""
-
+async def retag_resort(resort: dict, ctx: BackfillContext) -> str:
+    """Generate (and on apply, save) a new tagline for one resort."""
     client = get_supabase_client()
-
-    # Get all published resorts with their content
-    query = (
-        client.table("resorts")
-        .select("id, name, country, slug")
-        .eq("status", "published")
-        .order("name")
+    resort_id = resort["id"]
+    name = resort["name"]
+    country = resort["country"]
+
+    # Get existing content
+    content_response = await execute_async(
+        client.table("resort_content")
+        .select("tagline, quick_take")
+        .eq("resort_id", resort_id)
+        .single()
+    )
+    content = content_response.data or {}
+    old_tagline = content.get("tagline", "")
+    quick_take = content.get("quick_take", "")
+
+    # Get family metrics
+    metrics_response = await execute_async(
+        client.table("resort_family_metrics")
+        .select("*")
+        .eq("resort_id", resort_id)
+        .single()
     )
+    family_metrics = metrics_response.data or {}
+
+    # Get costs
+    costs_response = await execute_async(
+        client.table("resort_costs")
+        .select("*")
+        .eq("resort_id", resort_id)
+        .single()
+    )
+    costs = costs_response.data or {}
+
+    # Prepare research data from existing database content
+    research_data = {
+        "family_metrics": family_metrics,
+        "costs": costs,
+        "quick_take": quick_take,
+    }
+
+    # Extract quick take context if available
+    quick_take_context = None
+    if quick_take:
+        # We'll extract atoms from the quick_take text
+        quick_take_context = {
+            "unique_angle": None,  # Would need to re-extract
+            "signature_experience": None,
+            "memorable_detail": None,
+        }
+
+    ctx.log(f"Old tagline: \"{old_tagline}\"")
+
+    # Step 1: Extract tagline atoms
+    atoms = await extract_tagline_atoms(
+        resort_name=name,
+        country=country,
+        research_data=research_data,
+        quick_take_context=quick_take_context,
+    )
+
+    if atoms.numbers:
+        ctx.log(f"Atoms found: {len(atoms.numbers)} numbers, landmark={atoms.landmark_or_icon is not None}")
+
+    # Step 2: Get recent portfolio taglines for diversity
+    recent_taglines = await run_db(get_recent_portfolio_taglines, limit=10, exclude_country=country)
+
+    # Step 3: Quality loop (max 3 attempts)
+    best_tagline = None
+    best_quality = None
+
+    for attempt in range(3):
+        temperature = 0.7 + (attempt * 0.15)
+
+        candidate = await generate_diverse_tagline(
+            resort_name=name,
+            country=country,
+            atoms=atoms,
+            recent_taglines=recent_taglines,
+            temperature=temperature,
+        )
+
+        quality = await evaluate_tagline_quality(
+            tagline=candidate,
+            atoms=atoms,
+            resort_name=name,
+            recent_taglines=recent_taglines,
+        )
+
+        if best_quality is None or quality.overall_score > best_quality.overall_score:
+            best_tagline = candidate
+            best_quality = quality
+
+        if quality.passes_threshold and quality.structure_novelty >= 0.6:
+            ctx.log(f"Accepted on attempt {attempt + 1}")
+            break
+
+    new_tagline = best_tagline or f"Your family adventure starts in {name}"
+
+    ctx.log(f"Quality: score={best_quality.overall_score:.2f}, novelty={best_quality.structure_novelty:.2f}")
+
+    # Step 4: Save unless dry run
+    if ctx.apply:
+        await execute_async(
+            client.table("resort_content").update({
+                "tagline": new_tagline
+            }).eq("resort_id", resort_id)
+        )
+
+    return f"\"{new_tagline}\""
+
+
+async def backfill_taglines(args: argparse.Namespace):
+    """Run the new tagline system against all published resorts."""
+    resorts = await fetch_published_resorts("id, name, country, slug", limit=args.limit)
 
-    if limit:
-        query = query.limit(limit)
-
-    resorts_response = query.execute()
-    resorts = resorts_response.data or []
-
-    print(f"\n{'='*60}")
-    print(f"TAGLINE BACKFILL - Agent-Native System (Round 12)")
-    print(f"{'='*60}")
-    print(f"Mode: {'DRY RUN (no saves)' if dry_run else 'LIVE (will save changes)'}")
-    print(f"Resorts to process: {len(resorts)}")
-    print(f"{'='*60}\n")
-
-    updated = 0
-    skipped = 0
-    failed = 0
-
-    for i, resort in enumerate(resorts, 1):
-        resort_id = resort["id"]
-        name = resort["name"]
-        country = resort["country"]
-
-        print(f"\n[{i}/{len(resorts)}] {name}, {country}")
-        print("-" * 40)
-
-        try:
-            # Get existing content
-            content_response = (
-                client.table("resort_content")
-                .select("tagline, quick_take")
-                .eq("resort_id", resort_id)
-                .single()
-                .execute()
-            )
-            content = content_response.data or {}
-            old_tagline = content.get("tagline", "")
-            quick_take = content.get("quick_take", "")
-
-            # Get family metrics
-            metrics_response = (
-                client.table("resort_family_metrics")
-                .select("*")
-                .eq("resort_id", resort_id)
-                .single()
-                .execute()
-            )
-            family_metrics = metrics_response.data or {}
-
-            # Get costs
-            costs_response = (
-                client.table("resort_costs")
-                .select("*")
-                .eq("resort_id", resort_id)
-                .single()
-                .execute()
-            )
-            costs = costs_response.data or {}
-
-            # Prepare research data from existing database content
-            research_data = {
-                "family_metrics": family_metrics,
-                "costs": costs,
-                "quick_take": quick_take,
-            }
-
-            # Extract quick take context if available
-            quick_take_context = None
-            if quick_take:
-                # We'll extract atoms from the quick_take text
-                quick_take_context = {
-                    "unique_angle": None,  # Would need to re-extract
-                    "signature_experience": None,
-                    "memorable_detail": None,
-                }
-
-            print(f"  Old tagline: \"{old_tagline}\"")
-
-            # Step 1: Extract tagline atoms
-            atoms = await extract_tagline_atoms(
-                resort_name=name,
-                country=country,
-                research_data=research_data,
-                quick_take_context=quick_take_context,
-            )
-
-            if atoms.numbers:
-                print(f"  Atoms found: {len(atoms.numbers)} numbers, landmark={atoms.landmark_or_icon is not None}")
-
-            # Step 2: Get recent portfolio taglines for diversity
-            recent_taglines = get_recent_portfolio_taglines(limit=10, exclude_country=country)
-
-            # Step 3: Quality loop (max 3 attempts)
-            best_tagline = None
-            best_quality = None
-
-            for attempt in range(3):
-                temperature = 0.7 + (attempt * 0.15)
-
-                candidate = await generate_diverse_tagline(
-                    resort_name=name,
-                    country=country,
-                    atoms=atoms,
-                    recent_taglines=recent_taglines,
-                    temperature=temperature,
-                )
-
-                quality = await evaluate_tagline_quality(
-                    tagline=candidate,
-                    atoms=atoms,
-                    resort_name=name,
-                    recent_taglines=recent_taglines,
-                )
-
-                if best_quality is None or quality.overall_score > best_quality.overall_score:
-                    best_tagline = candidate
-                    best_quality = quality
-
-                if quality.passes_threshold and quality.structure_novelty >= 0.6:
-                    print(f"  Accepted on attempt {attempt + 1}")
-                    break
-
-            new_tagline = best_tagline or f"Your family adventure starts in {name}"
-
-            print(f"  New tagline: \"{new_tagline}\"")
-            print(f"  Quality: score={best_quality.overall_score:.2f}, novelty={best_quality.structure_novelty:.2f}")
-
-            # Step 4: Save if not dry run
-            if not dry_run:
-                client.table("resort_content").update({
-                    "tagline": new_tagline
-                }).eq("resort_id", resort_id).execute()
-                print(f"  ✅ Saved")
-                updated += 1
-            else:
-                print(f"  [DRY RUN - not saved]")
-                updated += 1
-
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            failed += 1
-
-    # Summary
-    print(f"\n{'='*60}")
-    print(f"BACKFILL COMPLETE")
-    print(f"{'='*60}")
-    print(f"Updated: {updated}")
-    print(f"Skipped: {skipped}")
-    print(f"Failed: {failed}")
-    print(f"{'='*60}\n")
+    runner = BackfillRunner.from_args("taglines", retag_resort, args)
+    await runner.run(resorts)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Backfill taglines with Agent-Native system")
-    parser.add_argument("--dry-run", action="store_true", help="Preview only, don't save")
     parser.add_argument("--limit", type=int, help="Limit number of resorts to process")
+    add_backfill_arguments(parser)
     args = parser.parse_args()
 
-    asyncio.run(backfill_taglines(dry_run=args.dry_run, limit=args.limit))
+    asyncio.run(backfill_taglines(args))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Anthropic Message Batches API.
+
+Lets batch jobs (shared/llm_batch.py) be exercised end to end without
+spending money or waiting hours: batches "process" for a few seconds and
+then return canned responses.
+
+Supports:
+    POST /v1/messages/batches                 Create a batch
+    GET  /v1/messages/batches/{id}            Batch status
+    GET  /v1/messages/batches/{id}/results    JSONL results
+    POST /v1/messages                         Single message (same canned reply)
+
+Each reply is "[stub] <first 200 chars of the prompt>", so handlers see
+something request-specific. --error-rate makes a share of requests come
+back errored, to exercise resubmission.
+
+Usage:
+    python scripts/batch_api_stub.py --port 8765 --latency 5
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 \
+        python scripts/backfill_style.py --batch --batch-api --layers det,em_dash
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _message(params: dict) -> dict:
+    """Canned Messages API response for a request."""
+    prompt = ""
+    for message in params.get("messages", []):
+        content = message.get("content")
+        prompt = content if isinstance(content, str) else json.dumps(content)
+    text = f"[stub] {prompt[:200]}"
+    return {
+        "id": f"msg_{uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": params.get("model", "stub"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": max(1, len(prompt) // 4),
+            "output_tokens": max(1, len(text) // 4),
+        },
+    }
+
+
+class StubState:
+    """Batches held in memory by the stub server."""
+
+    def __init__(self, latency: float, error_rate: float):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.batches: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def create(self, requests: list[dict]) -> str:
+        batch_id = f"msgbatch_{uuid4().hex[:24]}"
+        results = []
+        for request in requests:
+            if random.random() < self.error_rate:
+                result = {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {"type": "api_error", "message": "stub error"},
+                    },
+                }
+            else:
+                result = {"type": "succeeded", "message": _message(request["params"])}
+            results.append({"custom_id": request["custom_id"], "result": result})
+
+        with self.lock:
+            self.batches[batch_id] = {
+                "created": time.time(),
+                "results": results,
+            }
+        return batch_id
+
+    def describe(self, batch_id: str, base_url: str) -> dict | None:
+        with self.lock:
+            batch = self.batches.get(batch_id)
+        if batch is None:
+            return None
+
+        created = batch["created"]
+        ended = time.time() - created >= self.latency
+        results = batch["results"]
+        succeeded = sum(1 for r in results if r["result"]["type"] == "succeeded")
+        counts = {
+            "processing": 0 if ended else len(results),
+            "succeeded": succeeded if ended else 0,
+            "errored": len(results) - succeeded if ended else 0,
+            "canceled": 0,
+            "expired": 0,
+        }
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": counts,
+            "created_at": _iso(created),
+            "expires_at": _iso(created + timedelta(days=1).total_seconds()),
+            "ended_at": _iso(created + self.latency) if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{base_url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+
+def make_handler(state: StubState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # Keep script output readable
+            pass
+
+        def _base_url(self) -> str:
+            host, port = self.server.server_address[:2]
+            return f"http://{host}:{port}"
+
+        def _send(self, status: int, body: dict | str, content_type: str = "application/json"):
+            payload = body if isinstance(body, str) else json.dumps(body)
+            data = payload.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _not_found(self):
+            self._send(404, {
+                "type": "error",
+                "error": {"type": "not_found_error", "message": self.path},
+            })
+
+        def _read_json(self) -> dict:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_POST(self):
+            path = self.path.split("?")[0].rstrip("/")
+            if path == "/v1/messages/batches":
+                batch_id = state.create(self._read_json().get("requests", []))
+                self._send(200, state.describe(batch_id, self._base_url()))
+            elif path == "/v1/messages":
+                self._send(200, _message(self._read_json()))
+            else:
+                self._not_found()
+
+        def do_GET(self):
+            parts = self.path.split("?")[0].strip("/").split("/")
+            if parts[:3] != ["v1", "messages", "batches"] or len(parts) not in (4, 5):
+                return self._not_found()
+
+            batch = state.describe(parts[3], self._base_url())
+            if batch is None:
+                return self._not_found()
+
+            if len(parts) == 4:
+                return self._send(200, batch)
+
+            if batch["processing_status"] != "ended":
+                return self._not_found()
+            with state.lock:
+                results = state.batches[parts[3]]["results"]
+            lines = "".join(json.dumps(r) + "\n" for r in results)
+            self._send(200, lines, content_type="application/binary")
+
+    return Handler
+
+
+def start_stub_server(
+    port: int = 0,
+    latency: float = 2.0,
+    error_rate: float = 0.0,
+) -> ThreadingHTTPServer:
+    """Start the stub in a background thread. Port 0 picks a free port."""
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", port), make_handler(StubState(latency, error_rate))
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Message Batches API stub")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=5.0, help="Seconds until a batch ends")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of errored results")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", args.port), make_handler(StubState(args.latency, args.error_rate))
+    )
+    print(f"Batch API stub on http://127.0.0.1:{args.port} (latency {args.latency}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.supabase_client import get_supabase_client
+from shared.primitives.image_store import DuplicateFilter, derivative_fields, fingerprint_image
 from shared.primitives.ugc_photos import (
     find_place_id,
     get_place_details,
@@ -89,6 +90,7 @@ async def fetch_best_hero_photo(
     best_photo = None
     best_score = 0.0
     best_metadata = None
+    dedupe = DuplicateFilter()
 
     for i, ref_data in enumerate(photo_refs[:8]):  # Check up to 8 photos
         photo_ref = ref_data.get("photo_reference")
@@ -109,6 +111,13 @@ async def fetch_best_hero_photo(
             print(f"    Photo {i+1}: Skipping portrait orientation")
             continue
 
+        # Places often returns the same view several times: classify it once
+        fingerprint = fingerprint_image(photo_bytes)
+        if dedupe.seen(fingerprint):
+            print(f"    Photo {i+1}: Skipping near-duplicate")
+            continue
+        dedupe.add(fingerprint)
+
         # Use vision to classify
         category, relevance = await classify_photo_with_vision(photo_bytes)
 
@@ -142,6 +151,7 @@ async def fetch_best_hero_photo(
                 "place_id": place_id,
                 "photo_index": i,
                 "attributions": ref_data.get("html_attributions", []),
+                **fingerprint.as_metadata(),
             }
 
     if best_photo and best_score >= 0.5:
@@ -187,6 +197,7 @@ async def store_hero_image(
             "source": "google_places",
             "alt_text": f"{resort_name} ski resort - family skiing destination",
             "metadata": metadata,
+            **derivative_fields(url),
         }).execute()
 
         return url
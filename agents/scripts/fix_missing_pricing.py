@@ -22,6 +22,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.config import settings
+from shared.llm_client import create_message
+from shared.llm_metering import cost_attribution
 from shared.supabase_client import get_supabase_client
 from shared.primitives.costs import (
     validate_costs,
@@ -108,16 +110,15 @@ async def exa_search_with_content(resort_name: str, country: str) -> list[str]:
 
 async def extract_pricing(resort_name: str, country: str, snippets: list[str]) -> dict | None:
     """Use Claude Haiku to extract pricing from search snippets."""
-    import anthropic
-
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
     combined = "\n\n---\n\n".join(snippets)
     currency = get_currency_for_country(country)
 
-    response = client.messages.create(
-        model="claude-haiku-4-5-20251001",
-        max_tokens=500,
-        messages=[{"role": "user", "content": f"""Extract ski lift ticket pricing for {resort_name}, {country} from these search results.
+    with cost_attribution(resort=resort_name, stage="pricing_extraction"):
+        response = await create_message(
+            call="pricing_extraction",
+            model="claude-haiku-4-5-20251001",
+            max_tokens=500,
+            messages=[{"role": "user", "content": f"""Extract ski lift ticket pricing for {resort_name}, {country} from these search results.
 
 Search results:
 {combined}
@@ -134,9 +135,7 @@ Extract the STANDARD ADULT 1-DAY WINDOW PRICE for the current/recent season.
 Not multi-day, not promo, not online-only discounts.
 If the results mention prices in a different currency, convert to {currency}.
 Be conservative — only extract prices you're confident about."""}],
-    )
-
-    log_cost("anthropic", 0.003, None, {"stage": "pricing_extraction", "resort": resort_name})
+        )
 
     text = response.content[0].text
     json_match = re.search(r"\{[^{}]+\}", text, re.DOTALL)
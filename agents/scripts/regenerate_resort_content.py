@@ -13,7 +13,11 @@ Single resort:
 Batch mode (all published resorts, oldest first):
     python scripts/regenerate_resort_content.py --batch --batch-limit 5
     python scripts/regenerate_resort_content.py --batch --batch-limit 10 --write
-    python scripts/regenerate_resort_content.py --batch --batch-limit 10 --batch-offset 10 --write
+    python scripts/regenerate_resort_content.py --batch --batch-limit 50 --write --concurrency 2 --max-cost 40
+
+Batch mode runs through shared/backfill.py: a crashed run resumes where it
+stopped (pass --restart to start over), and it stops before a resort would
+overrun the daily budget.
 
 Cost: ~$0.50-$1.00 per resort (Opus for content, Sonnet for extraction, Haiku for atoms).
 """
@@ -30,7 +34,8 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.supabase_client import get_supabase_client
+from shared.backfill import BackfillContext, BackfillRunner, add_backfill_arguments
+from shared.supabase_client import execute_async, get_supabase_client, run_db
 from shared.primitives.content import write_section, generate_faq, generate_seo_meta
 from shared.primitives.quick_take import QuickTakeContext, generate_quick_take
 from shared.primitives.intelligence import (
@@ -44,9 +49,7 @@ from shared.primitives.database import (
     update_resort_family_metrics,
     get_recent_portfolio_taglines,
 )
-from shared.primitives.system import get_daily_spend
 from shared.primitives.style import apply_deterministic_style
-from shared.config import settings
 
 
 CONTENT_SECTIONS = [
@@ -58,6 +61,12 @@ CONTENT_SECTIONS = [
     "parent_reviews_summary",
 ]
 
+# Reserved from the daily budget per resort while it regenerates
+RESORT_COST_ESTIMATE = 1.50
+
+# Each resort prints a long before/after report; keep batches readable
+BATCH_CONCURRENCY = 1
+
 SCRATCHPAD = Path(
     os.environ.get(
         "SCRATCHPAD_DIR",
@@ -67,7 +76,11 @@ SCRATCHPAD = Path(
 
 
 def fetch_resort_data(resort_name: str) -> dict:
-    """Fetch all stored data for a resort from Supabase."""
+    """Fetch all stored data for a resort from Supabase.
+
+    Raises:
+        LookupError: If no resort has this name
+    """
     client = get_supabase_client()
 
     # Find the resort
@@ -79,8 +92,7 @@ def fetch_resort_data(resort_name: str) -> dict:
         .execute()
     )
     if not resort_resp.data:
-        print(f"Resort not found: {resort_name}")
-        sys.exit(1)
+        raise LookupError(f"Resort not found: {resort_name}")
 
     resort = resort_resp.data[0]
     resort_id = resort["id"]
@@ -232,7 +244,7 @@ async def regenerate(
 
     # 1. Fetch stored data
     print("[1/11] Fetching stored data from Supabase...")
-    stored = fetch_resort_data(resort_name)
+    stored = await run_db(fetch_resort_data, resort_name)
     resort = stored["resort"]
     resort_id = resort["id"]
     slug = resort["slug"]
@@ -362,7 +374,9 @@ async def regenerate(
         )
         print(f"  Atoms: {len(atoms.numbers)} numbers, landmark={atoms.landmark_or_icon is not None}")
 
-        recent_taglines = get_recent_portfolio_taglines(limit=10, exclude_country=country)
+        recent_taglines = await run_db(
+            get_recent_portfolio_taglines, limit=10, exclude_country=country
+        )
 
         best_tagline = None
         best_quality = None
@@ -464,7 +478,7 @@ async def regenerate(
         # Apply deterministic style fixes before writing
         content_update = apply_deterministic_style(content_update)
 
-        update_resort_content(resort_id, content_update)
+        await run_db(update_resort_content, resort_id, content_update)
         print(f"  Updated resort_content for {resort['name']}")
 
         # Update perfect_if / skip_if in family_metrics
@@ -474,7 +488,7 @@ async def regenerate(
                 metrics_update["perfect_if"] = new_content["_perfect_if"]
             if "_skip_if" in new_content:
                 metrics_update["skip_if"] = new_content["_skip_if"]
-            update_resort_family_metrics(resort_id, metrics_update)
+            await run_db(update_resort_family_metrics, resort_id, metrics_update)
             print(f"  Updated perfect_if/skip_if in family_metrics")
 
         print("  Done.")
@@ -485,76 +499,43 @@ async def regenerate(
 
 
 async def batch_regenerate(
-    limit: int = 10,
-    offset: int = 0,
-    write: bool = False,
+    args: argparse.Namespace,
     sections_filter: list[str] | None = None,
 ):
     """Regenerate content for multiple published resorts, oldest first."""
     client = get_supabase_client()
+    offset, limit = args.batch_offset, args.batch_limit
 
-    resorts = (
+    resorts = await execute_async(
         client.table("resorts")
-        .select("name, slug, updated_at")
+        .select("id, name, slug, updated_at")
         .eq("status", "published")
         .order("updated_at", desc=False)
         .range(offset, offset + limit - 1)
-        .execute()
     )
 
     if not resorts.data:
         print("No published resorts found.")
         return
 
-    total = len(resorts.data)
-    print(f"\n{'='*70}")
-    print(f"BATCH CONTENT REGENERATION")
-    print(f"{'='*70}")
-    print(f"Resorts: {total} (offset={offset}, limit={limit})")
-    print(f"Mode: {'WRITE' if write else 'DRY RUN'}")
+    print(f"Resorts: {len(resorts.data)} (offset={offset}, limit={limit})")
     if sections_filter:
         print(f"Sections: {', '.join(sections_filter)}")
-    print(f"{'='*70}\n")
-
-    succeeded, failed, skipped = 0, 0, 0
-
-    for i, resort in enumerate(resorts.data):
-        # Budget guard: ~$1.50 per resort, leave $2 buffer
-        try:
-            spend = get_daily_spend()
-            budget = getattr(settings, "daily_budget_limit", 50.0)
-            if spend + 1.5 > budget:
-                print(f"\nBudget limit reached (${spend:.2f}/${budget:.2f}).")
-                print(f"Resume with: --batch-offset {offset + i}")
-                break
-        except Exception:
-            pass  # Budget check is best-effort
-
-        print(f"\n[{i + 1}/{total}] {resort['name']} (updated: {resort.get('updated_at', 'N/A')[:10]})")
 
-        try:
-            await regenerate(
-                resort["name"],
-                write=write,
-                sections_filter=sections_filter,
-            )
-            succeeded += 1
-        except Exception as e:
-            print(f"FAILED: {resort['name']}: {e}")
-            failed += 1
-
-        # Rate limit courtesy between resorts
-        if i < total - 1:
-            print("  Waiting 5s...")
-            await asyncio.sleep(5)
+    async def regenerate_item(resort: dict, ctx: BackfillContext) -> None:
+        await regenerate(
+            resort["name"],
+            write=ctx.apply,
+            sections_filter=sections_filter,
+        )
 
-    print(f"\n{'='*70}")
-    print(f"BATCH COMPLETE")
-    print(f"{'='*70}")
-    print(f"Succeeded: {succeeded}")
-    print(f"Failed: {failed}")
-    if offset + limit < 200:  # rough upper bound
-        print(f"Next run: --batch-offset {offset + succeeded + failed}")
+    runner = BackfillRunner.from_args(
+        "regenerate_content",
+        regenerate_item,
+        args,
+        item_cost_estimate_usd=RESORT_COST_ESTIMATE,
+    )
+    await runner.run(resorts.data)
 
 
 def main():
@@ -564,9 +545,6 @@ def main():
     parser.add_argument(
         "--resort", help='Resort name (e.g., "Garmisch-Partenkirchen")'
     )
-    parser.add_argument(
-        "--write", action="store_true", help="Write results back to Supabase (default: dry run)"
-    )
     parser.add_argument(
         "--sections",
         help="Comma-separated list of sections to regenerate (default: all). "
@@ -583,8 +561,10 @@ def main():
     )
     parser.add_argument(
         "--batch-offset", type=int, default=0,
-        help="Skip first N resorts (for resuming batch runs)",
+        help="Skip first N resorts",
     )
+    add_backfill_arguments(parser, write_flag="--write")
+    parser.set_defaults(concurrency=BATCH_CONCURRENCY)
 
     args = parser.parse_args()
 
@@ -596,14 +576,13 @@ def main():
         sections_filter = [s.strip() for s in args.sections.split(",")]
 
     if args.batch:
-        asyncio.run(batch_regenerate(
-            limit=args.batch_limit,
-            offset=args.batch_offset,
-            write=args.write,
-            sections_filter=sections_filter,
-        ))
+        asyncio.run(batch_regenerate(args, sections_filter=sections_filter))
     else:
-        asyncio.run(regenerate(args.resort, write=args.write, sections_filter=sections_filter))
+        try:
+            asyncio.run(regenerate(args.resort, write=not args.dry_run, sections_filter=sections_filter))
+        except LookupError as e:
+            print(e)
+            sys.exit(1)
 
 
 if __name__ == "__main__":
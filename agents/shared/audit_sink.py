@@ -0,0 +1,297 @@
+"""Buffered writer for agent_audit_log.
+
+log_reasoning() and log_cost() are called dozens of times per resort. Doing
+one blocking insert per call meant 50+ round trips per resort just for
+logging. They now hand rows to a process-wide AuditLogSink. A background
+thread writes them in bulk inserts once the buffer reaches batch_size or
+every flush_interval seconds, whichever comes first.
+
+Durability:
+- The buffer is flushed at interpreter exit (atexit). SIGTERM/SIGHUP raise
+  SystemExit, like SIGINT raises KeyboardInterrupt, so the flush runs from
+  normal control flow once the stack unwinds. Flushing inside the handler
+  could deadlock on locks the interrupted code holds.
+- If Supabase is unreachable, rows are appended to a local JSONL spool and
+  replayed ahead of the next successful flush.
+- If Supabase rejects a batch (e.g. one row has a bad task_id FK), the rows
+  are retried one at a time so a single bad row doesn't drop the rest.
+
+Usage:
+    get_audit_sink().enqueue(row)
+    get_audit_sink().flush()  # Force a synchronous write (e.g. before exit)
+"""
+
+import atexit
+import json
+import logging
+import signal
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from postgrest.exceptions import APIError
+from postgrest.types import ReturnMethod
+
+from .config import settings
+from .supabase_client import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+AUDIT_TABLE = "agent_audit_log"
+DEFAULT_SPOOL_PATH = Path(__file__).resolve().parent.parent / ".audit_spool.jsonl"
+
+
+class AuditLogSink:
+    """Buffers audit rows in memory and writes them in bulk."""
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        flush_interval: float = 2.0,
+        spool_path: Path = DEFAULT_SPOOL_PATH,
+    ):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.spool_path = spool_path
+
+        self._buffer: list[dict[str, Any]] = []
+        self._inflight: list[dict[str, Any]] = []
+        self._spooled: list[dict[str, Any]] = []  # Rows written to the spool by this process
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # One writer at a time
+        self._wake = threading.Event()
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run, name="audit-log-sink", daemon=True
+        )
+        self._thread.start()
+
+    # =========================================================================
+    # Producer side
+    # =========================================================================
+
+    def enqueue(self, row: dict[str, Any]) -> None:
+        """Buffer a row for the next bulk insert (never blocks on the network)."""
+        row.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+
+        with self._lock:
+            self._buffer.append(row)
+            closed = self._closed
+            full = len(self._buffer) >= self.batch_size
+
+        if closed:
+            # Late writes after shutdown have no background thread to flush them
+            self.flush()
+        elif full:
+            self._wake.set()
+
+    def pending_cost_usd(self, since_iso: str | None = None) -> float:
+        """Sum api_cost amounts that are logged but not yet in the table.
+
+        The budget ledger adds this when it loads the day's total, so costs
+        still sitting in the buffer aren't missed.
+        """
+        with self._lock:
+            rows = self._buffer + self._inflight + self._spooled
+
+        total = 0.0
+        for row in rows:
+            if row.get("action") != "api_cost":
+                continue
+            if since_iso and row.get("created_at", "") < since_iso:
+                continue
+            total += (row.get("input_data") or {}).get("amount_usd", 0)
+        return total
+
+    # =========================================================================
+    # Writer side
+    # =========================================================================
+
+    def flush(self) -> int:
+        """Write everything buffered (and any spooled rows) to Supabase.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                self._inflight = batch
+
+            try:
+                spooled = self._read_spool()
+                rows = spooled + batch
+                if not rows:
+                    return 0
+
+                try:
+                    written = self._write(rows)
+                except Exception as e:
+                    # Supabase unreachable: keep this batch on disk for later
+                    if batch:
+                        logger.warning(f"Audit log flush failed, spooling {len(batch)} rows: {e}")
+                    self._append_spool(batch)
+                    # Move, not copy: pending_cost_usd() must see each row once
+                    with self._lock:
+                        self._spooled.extend(batch)
+                        self._inflight = []
+                    return 0
+
+                if spooled:
+                    self._clear_spool()
+                with self._lock:
+                    if spooled:
+                        self._spooled = []
+                    self._inflight = []
+                return written
+            except BaseException:
+                # Interrupted mid-write (e.g. SystemExit from SIGTERM): put the
+                # batch back so close() at exit still writes it. Replays of rows
+                # that did commit are ignored as duplicates.
+                with self._lock:
+                    if self._inflight:
+                        self._buffer[:0] = self._inflight
+                        self._inflight = []
+                raise
+
+    def close(self) -> None:
+        """Stop the background thread and flush whatever is left."""
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._lock:
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Audit log sink error: {e}")
+
+    def _write(self, rows: list[dict[str, Any]]) -> int:
+        client = get_supabase_client()
+        try:
+            # ignore_duplicates makes spool replays safe if an earlier
+            # insert committed but its response was lost
+            client.table(AUDIT_TABLE).upsert(
+                rows, ignore_duplicates=True, returning=ReturnMethod.minimal
+            ).execute()
+            return len(rows)
+        except APIError as e:
+            # Reachable but rejected: isolate the bad rows
+            logger.warning(f"Bulk audit insert rejected ({e}), retrying rows individually")
+
+        written = 0
+        for row in rows:
+            try:
+                client.table(AUDIT_TABLE).upsert(
+                    row, ignore_duplicates=True, returning=ReturnMethod.minimal
+                ).execute()
+                written += 1
+            except APIError as e:
+                logger.warning(f"Dropped audit row {row.get('action')}: {e}")
+        return written
+
+    # =========================================================================
+    # Local spool
+    # =========================================================================
+
+    def _read_spool(self) -> list[dict[str, Any]]:
+        if not self.spool_path.exists():
+            return []
+        rows = []
+        with self.spool_path.open(encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        rows.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # Partial line from a crash mid-write
+        return rows
+
+    def _append_spool(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        try:
+            self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.spool_path.open("a", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row, default=str) + "\n")
+        except OSError as e:
+            logger.error(f"Could not spool {len(rows)} audit rows: {e}")
+
+    def _clear_spool(self) -> None:
+        try:
+            self.spool_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not clear audit spool: {e}")
+
+
+# =============================================================================
+# Process-wide sink
+# =============================================================================
+
+_sink: AuditLogSink | None = None
+_sink_lock = threading.Lock()
+
+
+def get_audit_sink() -> AuditLogSink:
+    """Get the process-wide sink, starting it (and its shutdown hooks) on first use."""
+    global _sink
+
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                spool_path = (
+                    Path(settings.audit_spool_path)
+                    if settings.audit_spool_path
+                    else DEFAULT_SPOOL_PATH
+                )
+                _sink = AuditLogSink(
+                    batch_size=settings.audit_batch_size,
+                    flush_interval=settings.audit_flush_interval,
+                    spool_path=spool_path,
+                )
+                atexit.register(_sink.close)
+                _install_signal_handlers()
+
+    return _sink
+
+
+def flush_audit_log() -> int:
+    """Synchronously write any buffered audit rows."""
+    return get_audit_sink().flush() if _sink is not None else 0
+
+
+def _install_signal_handlers() -> None:
+    """Turn SIGTERM/SIGHUP into SystemExit so the atexit flush runs.
+
+    The handler itself touches no sink state: it can interrupt the main
+    thread while it holds the sink's locks. A handler installed before ours
+    still runs instead; the atexit flush covers it if it exits.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return  # signal.signal() only works from the main thread
+
+    for sig_name in ("SIGTERM", "SIGHUP"):
+        sig = getattr(signal, sig_name, None)
+        if sig is None:
+            continue  # Not available on this platform
+        previous = signal.getsignal(sig)
+
+        def _handler(signum, frame, previous=previous):
+            if callable(previous):
+                previous(signum, frame)
+            elif previous != signal.SIG_IGN:
+                # Default action is to terminate: exit through atexit instead
+                raise SystemExit(128 + signum)
+
+        signal.signal(sig, _handler)
@@ -0,0 +1,507 @@
+"""Resumable, concurrent runner for the backfill scripts in scripts/.
+
+Each backfill script used to fetch every published resort and await a
+per-resort coroutine in a plain for loop. A crash at resort 140 of 300
+meant starting over from zero and paying for the first 139 again.
+
+BackfillRunner takes the per-resort coroutine and adds:
+- Bounded concurrency (a fixed pool of workers pulling from one queue)
+- A local JSONL checkpoint per backfill, so a re-run skips finished items
+- Per-item retry with exponential backoff and jitter
+- A dry-run/apply split (ctx.apply), with checkpoints written only on apply
+- A cost ceiling: a per-run max_cost_usd plus a budget-ledger reservation
+  per item, so a backfill stops cleanly instead of overshooting the daily limit
+- Progress lines with throughput, ETA and spend, and a final summary
+
+Costs are whatever the handler logs through log_cost(); the runner meters
+each item with metered_spend() and adds the meters up.
+
+Usage:
+    async def retag(resort: dict, ctx: BackfillContext) -> str | None:
+        tagline = await generate(...)
+        if ctx.apply:
+            await run_db(save, resort["id"], tagline)
+        return tagline  # Shown in the item's progress line
+
+    parser = argparse.ArgumentParser()
+    add_backfill_arguments(parser)
+    args = parser.parse_args()
+
+    resorts = await fetch_published_resorts("id, name, country")
+    report = await BackfillRunner.from_args("taglines", retag, args).run(resorts)
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .budget_ledger import get_budget_ledger, metered_spend
+from .supabase_client import execute_async, get_supabase_client, run_db
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = Path(__file__).resolve().parent.parent / ".backfill_checkpoints"
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 2  # Retries after the first attempt
+RETRY_BASE_DELAY = 2.0  # Seconds; doubles per retry
+RETRY_MAX_DELAY = 60.0
+
+PROGRESS_EVERY_ITEMS = 10
+PROGRESS_EVERY_SECONDS = 30.0
+
+RESORT_PAGE_SIZE = 500
+
+# Checkpointed statuses that a resumed run skips. Failed items are retried.
+FINISHED_STATUSES = ("done", "skipped")
+
+
+class SkipItem(Exception):
+    """Raised by a handler to skip an item without retrying it.
+
+    Skipped items are checkpointed, so a resumed run won't revisit them.
+    """
+
+
+@dataclass
+class BackfillContext:
+    """Per-item context passed to the handler."""
+
+    name: str  # Backfill name
+    apply: bool  # False on dry runs: the handler must not write
+    key: str
+    label: str
+    attempt: int = 1
+
+    def log(self, message: str) -> None:
+        """Print a line tagged with the item, so concurrent output stays readable."""
+        print(f"  [{self.label}] {message}")
+
+
+ItemHandler = Callable[[dict, BackfillContext], Awaitable[Any]]
+
+
+@dataclass
+class ItemResult:
+    """Outcome of one item."""
+
+    key: str
+    label: str
+    status: str  # done, skipped, failed
+    attempts: int
+    elapsed_s: float
+    detail: str | None = None
+
+
+@dataclass
+class BackfillReport:
+    """Summary of a backfill run."""
+
+    name: str
+    apply: bool
+    total: int  # Items passed in
+    resumed: int = 0  # Already finished per the checkpoint
+    results: list[ItemResult] = field(default_factory=list)
+    cost_usd: float = 0.0
+    elapsed_s: float = 0.0
+    stopped_reason: str | None = None  # Set if the run stopped before the end
+
+    def count(self, status: str) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def processed(self) -> int:
+        return len(self.results)
+
+    @property
+    def not_started(self) -> int:
+        return self.total - self.resumed - self.processed
+
+    @property
+    def items_per_minute(self) -> float:
+        if self.elapsed_s <= 0:
+            return 0.0
+        return self.processed / self.elapsed_s * 60
+
+    def failures(self) -> list[ItemResult]:
+        return [r for r in self.results if r.status == "failed"]
+
+    def print_summary(self) -> None:
+        print(f"\n{'=' * 60}")
+        outcome = "STOPPED" if self.stopped_reason else "COMPLETE"
+        print(f"BACKFILL {self.name.upper()} {outcome}")
+        print(f"{'=' * 60}")
+        print(f"Mode: {'APPLY' if self.apply else 'DRY RUN (no saves)'}")
+        print(f"Done: {self.count('done')}")
+        print(f"Skipped: {self.count('skipped')}")
+        print(f"Failed: {self.count('failed')}")
+        if self.resumed:
+            print(f"Already done (checkpoint): {self.resumed}")
+        if self.not_started:
+            print(f"Not started: {self.not_started}")
+        print(f"Cost: ${self.cost_usd:.2f}")
+        print(
+            f"Elapsed: {_format_duration(self.elapsed_s)} "
+            f"({self.items_per_minute:.1f} items/min)"
+        )
+        if self.stopped_reason:
+            print(f"⚠️  Stopped: {self.stopped_reason}")
+        for failure in self.failures():
+            print(f"  ❌ {failure.label}: {failure.detail}")
+        print(f"{'=' * 60}\n")
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+# =============================================================================
+# CHECKPOINTS
+# =============================================================================
+
+
+class Checkpoint:
+    """Append-only JSONL record of finished items for one backfill.
+
+    One line per finished item, flushed immediately, so a crash loses at
+    most the items that were in flight. The last line for a key wins.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._statuses: dict[str, str] = {}
+
+    def load(self) -> dict[str, str]:
+        """Read key -> status from disk."""
+        self._statuses = {}
+        if not self.path.exists():
+            return self._statuses
+
+        with self.path.open() as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn last line from a crash
+                self._statuses[entry["key"]] = entry["status"]
+        return self._statuses
+
+    def is_finished(self, key: str) -> bool:
+        return self._statuses.get(key) in FINISHED_STATUSES
+
+    def record(self, result: ItemResult) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "key": result.key,
+            "label": result.label,
+            "status": result.status,
+            "attempts": result.attempts,
+            "detail": result.detail,
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self.path.open("a") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+        self._statuses[result.key] = result.status
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self._statuses = {}
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+
+class BackfillRunner:
+    """Runs an async per-item handler over many items, resumably."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: ItemHandler,
+        *,
+        apply: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_base_delay: float = RETRY_BASE_DELAY,
+        max_cost_usd: float | None = None,
+        item_cost_estimate_usd: float = 0.0,
+        resume: bool = True,
+        checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR,
+        key: Callable[[dict], str] = lambda item: str(item["id"]),
+        label: Callable[[dict], str] = lambda item: str(item.get("name") or item["id"]),
+    ):
+        """
+        Args:
+            name: Backfill name; also names the checkpoint file
+            handler: async (item, ctx) -> optional detail for the progress line
+            apply: Write changes (False = dry run, no checkpoint written)
+            concurrency: Items in flight at once
+            max_retries: Retries per item after the first attempt
+            retry_base_delay: First retry delay in seconds (doubles each retry)
+            max_cost_usd: Stop starting new items once the run has spent this
+            item_cost_estimate_usd: Budget reserved per item while it runs
+            resume: Skip items the checkpoint already has as finished
+            checkpoint_dir: Where <name>.jsonl checkpoints live
+            key: Stable item key for the checkpoint
+            label: Human-readable item name for output
+        """
+        self.name = name
+        self.handler = handler
+        self.apply = apply
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max(0, max_retries)
+        self.retry_base_delay = retry_base_delay
+        self.max_cost_usd = max_cost_usd
+        self.item_cost_estimate_usd = item_cost_estimate_usd
+        self.resume = resume
+        self.key = key
+        self.label = label
+        self.checkpoint = Checkpoint(checkpoint_dir / f"{name}.jsonl")
+
+        self._ledger = get_budget_ledger()
+        self._spent = 0.0  # Metered cost of finished items
+        self._stop_reason: str | None = None
+        self._last_progress = 0.0
+
+    @classmethod
+    def from_args(
+        cls, name: str, handler: ItemHandler, args: argparse.Namespace, **kwargs: Any
+    ) -> "BackfillRunner":
+        """Build a runner from the flags added by add_backfill_arguments()."""
+        if args.restart:
+            checkpoint_dir = kwargs.get("checkpoint_dir", DEFAULT_CHECKPOINT_DIR)
+            Checkpoint(checkpoint_dir / f"{name}.jsonl").clear()
+        return cls(
+            name,
+            handler,
+            apply=not args.dry_run,
+            concurrency=args.concurrency,
+            max_retries=args.max_retries,
+            max_cost_usd=args.max_cost,
+            resume=not args.restart,
+            **kwargs,
+        )
+
+    def run_cost(self) -> float:
+        """API spend logged by this run's items so far."""
+        return self._spent
+
+    def _budget_stop_reason(self) -> str | None:
+        if self.max_cost_usd is not None and self.run_cost() >= self.max_cost_usd:
+            return f"run cost ceiling ${self.max_cost_usd:.2f} reached"
+        return None
+
+    async def _run_item(self, item: dict) -> ItemResult:
+        key = self.key(item)
+        label = self.label(item)
+        ctx = BackfillContext(name=self.name, apply=self.apply, key=key, label=label)
+        started = time.monotonic()
+
+        while True:
+            try:
+                detail = await self.handler(item, ctx)
+                status = "done"
+                detail = None if detail is None else str(detail)
+                break
+            except SkipItem as e:
+                status, detail = "skipped", str(e) or None
+                break
+            except Exception as e:
+                if ctx.attempt > self.max_retries:
+                    status, detail = "failed", f"{type(e).__name__}: {e}"
+                    break
+                delay = min(RETRY_MAX_DELAY, self.retry_base_delay * 2 ** (ctx.attempt - 1))
+                delay *= random.uniform(0.5, 1.5)
+                ctx.log(f"⚠️  attempt {ctx.attempt} failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                ctx.attempt += 1
+
+        return ItemResult(
+            key=key,
+            label=label,
+            status=status,
+            attempts=ctx.attempt,
+            elapsed_s=time.monotonic() - started,
+            detail=detail,
+        )
+
+    def _report_progress(
+        self, report: BackfillReport, todo: int, started: float, force: bool = False
+    ) -> None:
+        now = time.monotonic()
+        done = report.processed
+        quiet = now - self._last_progress < PROGRESS_EVERY_SECONDS
+        if not force and done % PROGRESS_EVERY_ITEMS and quiet:
+            return
+        self._last_progress = now
+
+        elapsed = now - started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = f", ETA {_format_duration((todo - done) / rate)}" if rate and done < todo else ""
+        pct = done / todo * 100 if todo else 100.0
+        print(
+            f"[{self.name}] {done}/{todo} ({pct:.0f}%), {rate * 60:.1f} items/min{eta}, "
+            f"${self.run_cost():.2f} spent, {report.count('failed')} failed"
+        )
+
+    async def run(self, items: Iterable[dict]) -> BackfillReport:
+        """Process items and return the report (also printed)."""
+        items = list(items)
+        report = BackfillReport(name=self.name, apply=self.apply, total=len(items))
+
+        if self.resume:
+            self.checkpoint.load()
+        pending = [
+            item for item in items
+            if not (self.resume and self.checkpoint.is_finished(self.key(item)))
+        ]
+        report.resumed = len(items) - len(pending)
+
+        print(f"\n{'=' * 60}")
+        print(f"BACKFILL {self.name.upper()}")
+        print(f"{'=' * 60}")
+        print(f"Mode: {'APPLY (will save changes)' if self.apply else 'DRY RUN (no saves)'}")
+        resumed_note = f", {report.resumed} already done" if report.resumed else ""
+        print(f"Items: {len(pending)} to process{resumed_note}")
+        print(f"Concurrency: {self.concurrency}, retries: {self.max_retries}")
+        if self.max_cost_usd is not None:
+            print(f"Cost ceiling: ${self.max_cost_usd:.2f}")
+        print(f"{'=' * 60}\n")
+
+        self._spent = 0.0
+        self._stop_reason = None
+        started = time.monotonic()
+        self._last_progress = started
+
+        queue: asyncio.Queue[dict] = asyncio.Queue()
+        for item in pending:
+            queue.put_nowait(item)
+
+        async def worker():
+            while self._stop_reason is None:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                self._stop_reason = self._budget_stop_reason()
+                if self._stop_reason:
+                    return
+
+                reservation = await run_db(self._ledger.reserve, self.item_cost_estimate_usd)
+                if reservation is None:
+                    self._stop_reason = "daily budget exhausted"
+                    return
+
+                try:
+                    with metered_spend(f"backfill:{self.name}") as meter:
+                        result = await self._run_item(item)
+                finally:
+                    self._ledger.commit(reservation)
+                    self._spent += meter.spent
+
+                report.results.append(result)
+                if self.apply:
+                    self.checkpoint.record(result)
+
+                icon = {"done": "✅", "skipped": "⏭️ ", "failed": "❌"}[result.status]
+                suffix = f": {result.detail}" if result.detail else ""
+                print(f"{icon} {result.label} ({result.elapsed_s:.1f}s){suffix}")
+                self._report_progress(report, len(pending), started)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(pending)))))
+        finally:
+            report.elapsed_s = time.monotonic() - started
+            report.cost_usd = self.run_cost()
+            report.stopped_reason = self._stop_reason
+            self._report_progress(report, len(pending), started, force=True)
+            report.print_summary()
+
+        return report
+
+
+# =============================================================================
+# SCRIPT HELPERS
+# =============================================================================
+
+
+def add_backfill_arguments(
+    parser: argparse.ArgumentParser,
+    write_flag: str | None = None,
+) -> argparse.ArgumentParser:
+    """Add the shared runner flags (--dry-run, --concurrency, --max-cost, ...).
+
+    Args:
+        parser: Script's argument parser
+        write_flag: For scripts that preview by default, the flag that turns
+            saving on (e.g. "--apply"), added in place of --dry-run
+    """
+    if write_flag:
+        parser.add_argument(
+            write_flag, dest="dry_run", action="store_false",
+            help="Save changes (default is a dry run)",
+        )
+    else:
+        parser.add_argument("--dry-run", action="store_true", help="Preview only, don't save")
+    parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"Resorts processed at once (default {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--max-retries", type=int, default=DEFAULT_MAX_RETRIES,
+        help=f"Retries per resort after a failure (default {DEFAULT_MAX_RETRIES})",
+    )
+    parser.add_argument(
+        "--max-cost", type=float, help="Stop once this run has spent this much (USD)"
+    )
+    parser.add_argument(
+        "--restart", action="store_true",
+        help="Ignore and clear the checkpoint, processing every resort again",
+    )
+    return parser
+
+
+async def fetch_published_resorts(
+    columns: str = "id, name, country, slug",
+    name_filter: str | None = None,
+    limit: int | None = None,
+) -> list[dict]:
+    """Fetch published resorts page by page, ordered by name."""
+    client = get_supabase_client()
+    resorts: list[dict] = []
+    offset = 0
+
+    while True:
+        page_size = RESORT_PAGE_SIZE
+        if limit is not None:
+            page_size = min(page_size, limit - len(resorts))
+        query = (
+            client.table("resorts")
+            .select(columns)
+            .eq("status", "published")
+            .order("name")
+        )
+        if name_filter:
+            query = query.ilike("name", f"%{name_filter}%")
+        response = await execute_async(query.range(offset, offset + page_size - 1))
+        page = response.data or []
+        resorts.extend(page)
+        offset += len(page)
+        if len(page) < page_size or (limit is not None and len(resorts) >= limit):
+            return resorts
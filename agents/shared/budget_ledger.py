@@ -0,0 +1,273 @@
+"""Running daily budget ledger.
+
+get_daily_spend() used to fetch every api_cost row for the day and sum them
+in Python, on every budget check. The ledger loads the day's total once
+(one SQL aggregate via the get_api_spend_since RPC) and then keeps it
+current in memory as log_cost() records new costs. It reloads automatically
+when the UTC day rolls over.
+
+It also holds reservations. A concurrent resort run reserves its estimated
+cost before starting, so parallel runs can't collectively overshoot
+daily_budget_limit. When the run finishes, it commits the reservation (its
+real costs have been recorded by then) or releases it.
+
+Other processes (cron jobs, backfill scripts) spend from the same daily
+budget, and their costs only reach this process through the database. So
+reserve() reloads the day's total first whenever it is older than
+SHARED_SPEND_TTL_SECONDS; reserve() may block on that query, so async code
+calls it through run_db().
+
+Usage:
+    ledger = get_budget_ledger()
+    reservation = ledger.reserve(10.0)
+    if reservation is None:
+        ...  # Would exceed today's limit
+    try:
+        ...  # Work that calls log_cost()
+    finally:
+        ledger.commit(reservation)
+
+Spend meters attribute costs to a scope (e.g. one cron job). Costs logged
+anywhere inside metered_spend() - including run_db() and to_thread()
+workers - are added to the meter, so a caller can stop work that runs
+past its own cost budget:
+
+    with metered_spend("guide_generation", limit_usd=5.0) as meter:
+        ...
+        if meter.exceeded: ...
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Iterator
+from uuid import uuid4
+
+from .audit_sink import get_audit_sink
+from .config import settings
+from .supabase_client import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+# reserve() reloads today's total when it is older than this, to see what
+# other processes have spent since
+SHARED_SPEND_TTL_SECONDS = 30.0
+
+
+def _utc_today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def load_spend_since(since_iso: str) -> float:
+    """Sum api_cost amounts in agent_audit_log since a UTC timestamp.
+
+    Uses the get_api_spend_since SQL aggregate. Falls back to summing rows
+    client-side if the RPC isn't deployed yet.
+    """
+    client = get_supabase_client()
+
+    try:
+        response = client.rpc("get_api_spend_since", {"p_since": since_iso}).execute()
+        return float(response.data or 0)
+    except Exception as e:
+        logger.warning(f"get_api_spend_since RPC unavailable, summing rows: {e}")
+
+    response = (
+        client.table("agent_audit_log")
+        .select("input_data")  # Schema uses input_data, not metadata
+        .eq("action", "api_cost")
+        .gte("created_at", since_iso)
+        .execute()
+    )
+
+    total = 0.0
+    for row in response.data or []:
+        input_data = row.get("input_data", {})
+        total += input_data.get("amount_usd", 0)
+    return total
+
+
+class BudgetLedger:
+    """Tracks today's spend and outstanding reservations in memory."""
+
+    def __init__(self, daily_limit: float | None = None):
+        self._daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._day: str | None = None
+        self._spent = 0.0
+        self._refreshed_at = 0.0  # time.monotonic() of the last reload
+        self._reservations: dict[str, float] = {}
+
+    @property
+    def daily_limit(self) -> float:
+        if self._daily_limit is not None:
+            return self._daily_limit
+        return settings.daily_budget_limit
+
+    # =========================================================================
+    # Spend
+    # =========================================================================
+
+    def refresh(self) -> float:
+        """Reload today's total from the database."""
+        today = _utc_today()
+        since = f"{today}T00:00:00+00:00"  # UTC timezone for consistent queries
+
+        total = load_spend_since(since)
+        # Costs logged but still sitting in the audit sink's buffer
+        total += get_audit_sink().pending_cost_usd(since_iso=f"{today}T00:00:00")
+
+        with self._lock:
+            self._day = today
+            self._spent = total
+            self._refreshed_at = time.monotonic()
+        return total
+
+    def _shared_spent(self) -> float:
+        """Today's total, reloaded first if it may be missing others' spend."""
+        if self._day == _utc_today() and (
+            time.monotonic() - self._refreshed_at < SHARED_SPEND_TTL_SECONDS
+        ):
+            with self._lock:
+                return self._spent
+        try:
+            return self.refresh()
+        except Exception as e:
+            if self._day != _utc_today():
+                raise
+            # Fall back to this process's running total; the next call retries
+            logger.warning(f"Could not reload today's spend: {e}")
+            with self._lock:
+                self._refreshed_at = time.monotonic()
+                return self._spent
+
+    def spent(self) -> float:
+        """Total API spend for today (UTC)."""
+        if self._day != _utc_today():
+            return self.refresh()
+        with self._lock:
+            return self._spent
+
+    def record(self, amount_usd: float) -> None:
+        """Add a newly logged cost to today's total (called by log_cost)."""
+        for meter in _active_meters.get():
+            meter.add(amount_usd)
+
+        if self._day != _utc_today():
+            # Not loaded yet (or a new day): the next spent() reload picks this up
+            return
+        with self._lock:
+            self._spent += amount_usd
+
+    # =========================================================================
+    # Reservations
+    # =========================================================================
+
+    def reserved(self) -> float:
+        """Total held by outstanding reservations."""
+        with self._lock:
+            return sum(self._reservations.values(), 0.0)
+
+    def remaining(self) -> float:
+        """Budget left after today's spend and outstanding reservations."""
+        spent = self.spent()
+        with self._lock:
+            return self.daily_limit - spent - sum(self._reservations.values(), 0.0)
+
+    def reserve(self, amount_usd: float) -> str | None:
+        """Atomically hold budget for upcoming work.
+
+        Reloads today's spend first if it is older than
+        SHARED_SPEND_TTL_SECONDS (blocking; use run_db() from async code).
+
+        Returns:
+            Reservation ID, or None if the hold would exceed the daily limit
+        """
+        spent = self._shared_spent()
+        with self._lock:
+            held = sum(self._reservations.values(), 0.0)
+            if spent + held + amount_usd > self.daily_limit:
+                return None
+            reservation_id = str(uuid4())
+            self._reservations[reservation_id] = amount_usd
+            return reservation_id
+
+    def commit(self, reservation_id: str | None, actual_usd: float | None = None) -> None:
+        """Close a reservation whose work has finished.
+
+        Costs logged through log_cost() are already in the total. Pass
+        actual_usd only for spend that was not logged that way.
+        """
+        with self._lock:
+            self._reservations.pop(reservation_id, None)
+            if actual_usd:
+                self._spent += actual_usd
+
+    def release(self, reservation_id: str | None) -> None:
+        """Drop a reservation without spending it (work was skipped)."""
+        with self._lock:
+            self._reservations.pop(reservation_id, None)
+
+
+# =============================================================================
+# Spend Meters
+# =============================================================================
+
+
+class SpendMeter:
+    """Running total of costs logged inside one metered_spend() scope."""
+
+    def __init__(self, name: str, limit_usd: float | None = None):
+        self.name = name
+        self.limit_usd = limit_usd
+        self._lock = threading.Lock()
+        self._spent = 0.0
+
+    def add(self, amount_usd: float) -> None:
+        with self._lock:
+            self._spent += amount_usd
+
+    @property
+    def spent(self) -> float:
+        with self._lock:
+            return self._spent
+
+    @property
+    def exceeded(self) -> bool:
+        """True once spend is past limit_usd (never, without a limit)."""
+        return self.limit_usd is not None and self.spent > self.limit_usd
+
+
+# Meters of the enclosing scopes; nested scopes all see the cost
+_active_meters: ContextVar[tuple[SpendMeter, ...]] = ContextVar("spend_meters", default=())
+
+
+@contextmanager
+def metered_spend(name: str, limit_usd: float | None = None) -> Iterator[SpendMeter]:
+    """Attribute costs logged in this context (and tasks it starts) to a meter."""
+    meter = SpendMeter(name, limit_usd)
+    token = _active_meters.set(_active_meters.get() + (meter,))
+    try:
+        yield meter
+    finally:
+        _active_meters.reset(token)
+
+
+# Module-level ledger shared by every pipeline in the process
+_ledger: BudgetLedger | None = None
+_ledger_lock = threading.Lock()
+
+
+def get_budget_ledger() -> BudgetLedger:
+    """Get the process-wide budget ledger."""
+    global _ledger
+
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = BudgetLedger()
+
+    return _ledger
@@ -29,6 +29,7 @@ class Settings(BaseSettings):
 
     # AI
     anthropic_api_key: str
+    anthropic_base_url: str | None = None  # Point clients at a local stub (scripts/batch_api_stub.py)
 
     # Image Generation (4-tier fallback — Nano Banana Pro is ALWAYS default)
     replicate_api_token: str | None = None  # Tier 1: Nano Banana Pro on Replicate
@@ -61,6 +62,16 @@ class Settings(BaseSettings):
     content_model: str = "claude-opus-4-6"  # Quality content
     max_retries: int = 3
     request_timeout: int = 60
+    pipeline_concurrency: int = 1  # Resorts processed in parallel by the daily pipeline
+    db_max_workers: int = 8  # Threads for blocking Supabase calls made from async code
+
+    # Audit log buffering (log_reasoning / log_cost)
+    audit_batch_size: int = 50  # Rows per bulk insert
+    audit_flush_interval: float = 2.0  # Max seconds a row waits in the buffer
+    audit_spool_path: str | None = None  # JSONL fallback when Supabase is down
+
+    # Responsive image derivatives (WebP always, AVIF optional)
+    image_avif_derivatives: bool = False  # AVIF encodes are several times slower than WebP
 
     # Vercel (for ISR revalidation)
     vercel_url: str | None = None
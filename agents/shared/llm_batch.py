@@ -0,0 +1,417 @@
+"""Offline bulk Claude jobs through the Message Batches API.
+
+Backfills and audits send hundreds of independent Claude requests, and they
+used to go through the same request-at-a-time path as the live pipeline
+(call_claude / messages.create). For work nobody is waiting on, the Message
+Batches API is the better fit: one submission for up to 10,000 requests,
+no per-request rate limiting on our side, and half the per-token price.
+
+MessageBatchJob collects requests under custom IDs, submits them as one or
+more message batches, polls until they end and fans each result back to the
+handler registered for its item. Batch state (which custom ID went into
+which batch, which results were already handled) is saved to a local JSON
+file, so a script that crashes or is stopped while Anthropic is still
+processing can simply be re-run: it re-adds the same requests, finds them
+already submitted and picks up the results instead of paying again.
+
+Only non-interactive scripts use this. The live pipeline keeps call_claude().
+Point settings.anthropic_base_url at scripts/batch_api_stub.py to exercise a
+job without calling the real API.
+
+Usage:
+    job = MessageBatchJob("style-em_dash", cost_per_request_usd=0.002)
+    for resort in resorts:
+        job.add(
+            f"{resort['id']}-quick_take",
+            prompt,
+            model="claude-haiku-4-5-20251001",
+            max_tokens=1000,
+            handler=save_result,  # async (BatchResult) -> None
+        )
+    report = await job.run()
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .budget_ledger import get_budget_ledger
+from .config import settings
+from .llm_client import get_async_claude_client
+from .llm_metering import BATCH_DISCOUNT, record_llm_usage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DIR = Path(__file__).resolve().parent.parent / ".llm_batches"
+
+MAX_BATCH_REQUESTS = 10_000  # API limit is 100,000; smaller batches finish sooner
+
+DEFAULT_POLL_INTERVAL = 30.0  # Seconds between status checks
+SAVE_EVERY_RESULTS = 50  # Flush state while fanning out a large batch
+
+CUSTOM_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+
+
+@dataclass
+class BatchResult:
+    """One request's outcome, as handed to its handler."""
+
+    custom_id: str
+    status: str  # succeeded, errored, canceled, expired
+    text: str | None = None  # First content block, when succeeded
+    error: str | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "succeeded"
+
+
+ResultHandler = Callable[[BatchResult], Awaitable[None]]
+
+
+@dataclass
+class BatchJobReport:
+    """Summary of one MessageBatchJob.run()."""
+
+    name: str
+    requests: int = 0
+    submitted: int = 0  # Sent in this run (the rest were already submitted)
+    delivered: int = 0  # Handed to a handler in this run
+    previously_delivered: int = 0
+    errored: int = 0  # Errored/expired/canceled; resubmitted on the next run
+    handler_failures: int = 0  # Handler raised; redelivered on the next run
+    pending: int = 0  # Still processing when run() returned
+    batch_ids: list[str] = field(default_factory=list)
+    cost_usd: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return self.pending == 0 and self.errored == 0 and self.handler_failures == 0
+
+
+def _params_hash(params: dict[str, Any]) -> str:
+    encoded = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _to_result(entry: Any) -> BatchResult:
+    """Convert an SDK MessageBatchIndividualResponse to a BatchResult."""
+    outcome = entry.result
+    result = BatchResult(custom_id=entry.custom_id, status=outcome.type)
+
+    if outcome.type == "succeeded":
+        message = outcome.message
+        texts = [block.text for block in message.content if getattr(block, "type", "") == "text"]
+        result.text = texts[0] if texts else ""
+        result.input_tokens = message.usage.input_tokens
+        result.output_tokens = message.usage.output_tokens
+    elif outcome.type == "errored":
+        error = getattr(outcome.error, "error", None) or outcome.error
+        result.error = getattr(error, "message", None) or str(error)
+    else:
+        result.error = outcome.type
+
+    return result
+
+
+class MessageBatchJob:
+    """Collects Claude requests and runs them as message batches, resumably."""
+
+    def __init__(
+        self,
+        name: str,
+        cost_per_request_usd: float = 0.0,
+        record_deliveries: bool = True,
+        state_dir: Path = DEFAULT_STATE_DIR,
+    ):
+        """
+        Args:
+            name: Job name; also names the state file
+            cost_per_request_usd: Standard (non-batch) cost estimate per request,
+                used for the budget check before submitting. Actual cost is
+                priced from each succeeded result's token usage.
+            record_deliveries: Mark results handled so a re-run skips them.
+                Dry runs pass False so a later apply run can reuse the batch.
+            state_dir: Where <name>.json state files live
+        """
+        self.name = name
+        self.cost_per_request_usd = cost_per_request_usd
+        self.record_deliveries = record_deliveries
+        self.state_path = state_dir / f"{name}.json"
+
+        self._requests: dict[str, dict[str, Any]] = {}  # custom_id -> params
+        self._handlers: dict[str, ResultHandler] = {}
+        self._state = self._load_state()
+
+    # =========================================================================
+    # State
+    # =========================================================================
+
+    def _load_state(self) -> dict[str, Any]:
+        empty = {"name": self.name, "requests": {}, "batches": {}}
+        if not self.state_path.exists():
+            return empty
+        try:
+            return {**empty, **json.loads(self.state_path.read_text())}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable batch state {self.state_path}: {e}")
+            return empty
+
+    def _save_state(self) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(self._state, indent=2))
+        tmp_path.replace(self.state_path)  # Atomic: a crash never leaves half a file
+
+    def clear_state(self) -> None:
+        """Forget submitted batches (the next run submits everything again)."""
+        self.state_path.unlink(missing_ok=True)
+        self._state = self._load_state()
+
+    # =========================================================================
+    # Collecting
+    # =========================================================================
+
+    def add(
+        self,
+        custom_id: str,
+        prompt: str,
+        handler: ResultHandler,
+        system: str | None = None,
+        model: str | None = None,
+        max_tokens: int = 1500,
+        temperature: float | None = None,
+    ) -> None:
+        """Queue one request (same parameters as call_claude()).
+
+        Args:
+            custom_id: Stable ID for this item, 1-64 chars of [a-zA-Z0-9_-].
+                Re-running the job with the same IDs is what makes it resumable.
+            prompt: User message
+            handler: Called with this request's BatchResult
+            system: Optional system prompt
+            model: Model ID (defaults to settings.default_model)
+            max_tokens: Response token cap
+            temperature: Optional sampling temperature
+        """
+        if not CUSTOM_ID_PATTERN.match(custom_id):
+            raise ValueError(f"Invalid batch custom_id: {custom_id!r}")
+        if custom_id in self._requests:
+            raise ValueError(f"Duplicate batch custom_id: {custom_id!r}")
+
+        params: dict[str, Any] = {
+            "model": model or settings.default_model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system:
+            params["system"] = system
+        if temperature is not None:
+            params["temperature"] = temperature
+
+        self._requests[custom_id] = params
+        self._handlers[custom_id] = handler
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def was_delivered(self, custom_id: str) -> bool:
+        """True if an earlier run already handled this ID (whatever its prompt).
+
+        Lets a script skip items whose result it has applied, even though
+        applying it changed the text the prompt would now be built from.
+        """
+        return bool(self._state["requests"].get(custom_id, {}).get("delivered"))
+
+    def _entry(self, custom_id: str) -> dict[str, Any] | None:
+        """State for a request, if it was submitted with the same parameters."""
+        entry = self._state["requests"].get(custom_id)
+        if entry and entry.get("params_hash") == _params_hash(self._requests[custom_id]):
+            return entry
+        return None
+
+    # =========================================================================
+    # Running
+    # =========================================================================
+
+    async def _submit(self, report: BatchJobReport) -> bool:
+        """Submit every request not already in a batch. False if over budget."""
+        unsent = [cid for cid in self._requests if self._entry(cid) is None]
+        if not unsent:
+            return True
+
+        estimate = len(unsent) * self.cost_per_request_usd * BATCH_DISCOUNT
+        remaining = get_budget_ledger().remaining()
+        if estimate > remaining:
+            print(
+                f"❌ [{self.name}] {len(unsent)} requests (~${estimate:.2f}) would exceed "
+                f"today's remaining budget (${remaining:.2f}); not submitting"
+            )
+            return False
+
+        client = get_async_claude_client()
+        for start in range(0, len(unsent), MAX_BATCH_REQUESTS):
+            chunk = unsent[start:start + MAX_BATCH_REQUESTS]
+            batch = await client.messages.batches.create(
+                requests=[{"custom_id": cid, "params": self._requests[cid]} for cid in chunk]
+            )
+            self._state["batches"][batch.id] = {
+                "status": batch.processing_status,
+                "submitted_at": _utc_now(),
+                "requests": len(chunk),
+            }
+            for cid in chunk:
+                self._state["requests"][cid] = {
+                    "batch_id": batch.id,
+                    "params_hash": _params_hash(self._requests[cid]),
+                }
+            self._save_state()  # Before anything else can fail: this batch is paid for
+            report.submitted += len(chunk)
+            print(f"📤 [{self.name}] Submitted batch {batch.id} ({len(chunk)} requests)")
+
+        return True
+
+    async def _wait(self, batch_ids: list[str], poll_interval: float, deadline: float | None):
+        """Poll until the batches end or the deadline passes. Returns ended IDs."""
+        client = get_async_claude_client()
+        waiting = set(batch_ids)
+        ended: list[str] = []
+
+        while waiting:
+            for batch_id in sorted(waiting):
+                batch = await client.messages.batches.retrieve(batch_id)
+                self._state["batches"].setdefault(batch_id, {})["status"] = batch.processing_status
+                if batch.processing_status == "ended":
+                    waiting.discard(batch_id)
+                    ended.append(batch_id)
+                else:
+                    counts = batch.request_counts
+                    print(
+                        f"⏳ [{self.name}] {batch_id}: {counts.processing} processing, "
+                        f"{counts.succeeded} succeeded, {counts.errored} errored"
+                    )
+            self._save_state()
+
+            if not waiting or (deadline is not None and time.monotonic() >= deadline):
+                break
+            await asyncio.sleep(poll_interval)
+
+        return ended
+
+    async def _deliver(self, batch_id: str, report: BatchJobReport) -> None:
+        """Fan an ended batch's results out to this job's handlers."""
+        client = get_async_claude_client()
+        requests = self._state["requests"]
+        handled = 0
+
+        async for entry in await client.messages.batches.results(batch_id):
+            cid = entry.custom_id
+            state = requests.get(cid)
+            if cid not in self._requests or state is None or state.get("batch_id") != batch_id:
+                continue  # Dropped from this run, or since resubmitted elsewhere
+            if state.get("delivered"):
+                continue
+
+            result = _to_result(entry)
+
+            if result.succeeded and not state.get("costed"):
+                cost = record_llm_usage(
+                    entry.result.message,
+                    call=f"batch:{self.name}",
+                    batch=True,
+                    custom_id=cid,
+                )
+                state["costed"] = True
+                report.cost_usd += cost
+
+            try:
+                await self._handlers[cid](result)
+            except Exception as e:
+                logger.error(f"[{self.name}] Handler failed for {cid}: {e}")
+                report.handler_failures += 1
+                continue
+
+            report.delivered += 1
+            if not result.succeeded:
+                # Forget it so the next run resubmits this request
+                report.errored += 1
+                del requests[cid]
+            elif self.record_deliveries:
+                state["delivered"] = True
+
+            handled += 1
+            if handled % SAVE_EVERY_RESULTS == 0:
+                self._save_state()
+
+        self._save_state()
+
+    async def run(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float | None = None,
+    ) -> BatchJobReport:
+        """Submit, wait and deliver results to handlers.
+
+        Args:
+            poll_interval: Seconds between batch status checks
+            timeout: Stop waiting after this many seconds (None = until done).
+                Unfinished batches stay in the state file for the next run.
+
+        Returns:
+            BatchJobReport
+        """
+        report = BatchJobReport(name=self.name, requests=len(self._requests))
+        if not self._requests:
+            return report
+
+        report.previously_delivered = sum(
+            1 for cid in self._requests if (self._entry(cid) or {}).get("delivered")
+        )
+
+        if not await self._submit(report):
+            report.pending = len(self._requests) - report.previously_delivered
+            return report
+
+        open_batches = sorted({
+            self._entry(cid)["batch_id"]
+            for cid in self._requests
+            if not self._entry(cid).get("delivered")
+        })
+        report.batch_ids = open_batches
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for batch_id in await self._wait(open_batches, poll_interval, deadline):
+            await self._deliver(batch_id, report)
+
+        report.pending = sum(
+            1 for cid in self._requests
+            if self._entry(cid) and self._entry(cid)["batch_id"] not in self._ended_batches()
+        )
+
+        print(
+            f"📦 [{self.name}] {report.delivered} delivered, {report.errored} errored, "
+            f"{report.handler_failures} handler failures, {report.pending} pending "
+            f"(${report.cost_usd:.2f})"
+        )
+        return report
+
+    def _ended_batches(self) -> set[str]:
+        return {
+            batch_id
+            for batch_id, batch in self._state["batches"].items()
+            if batch.get("status") == "ended"
+        }
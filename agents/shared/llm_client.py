@@ -0,0 +1,154 @@
+"""Shared Anthropic clients for all primitives.
+
+Primitives used to build a fresh synchronous anthropic.Anthropic for every
+call. That paid a TLS handshake per request and, worse, blocked the event
+loop inside async functions, so asyncio.gather() over several Claude calls
+(e.g. the approval panel's three evaluators) ran them one after another.
+
+All Claude calls should go through call_claude() (or the underlying
+get_async_claude_client()), which reuses one keep-alive connection pool and
+holds an "anthropic" provider slot so concurrent resorts share a single cap
+on in-flight requests. Calls that need the full Message go through
+create_message(). Both meter the response's token usage (llm_metering.py).
+get_claude_client() / create_message_sync() remain for the few callers that
+are still synchronous.
+
+Usage:
+    text = await call_claude(prompt, system=system, max_tokens=1500)
+    message = await create_message(call="faq", model=..., max_tokens=..., messages=[...])
+"""
+
+import asyncio
+import time
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import anthropic
+import httpx
+
+from .config import settings
+from .llm_metering import record_llm_usage
+from .rate_limits import PROVIDER_LIMITS, provider_slot
+
+
+# Keep enough idle connections for every in-flight slot to reuse one
+_POOL_LIMITS = httpx.Limits(
+    max_connections=PROVIDER_LIMITS["anthropic"] * 2,
+    max_keepalive_connections=PROVIDER_LIMITS["anthropic"],
+    keepalive_expiry=60.0,
+)
+
+# Async clients hold connections bound to the event loop that opened them,
+# and cron.py runs several asyncio.run() calls in one process. Keep one
+# client per loop so a finished loop's pool is never reused.
+_async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, anthropic.AsyncAnthropic]" = (
+    WeakKeyDictionary()
+)
+
+# Module-level sync client for callers that are not async
+_sync_client: anthropic.Anthropic | None = None
+
+
+def get_async_claude_client() -> anthropic.AsyncAnthropic:
+    """Get the pooled AsyncAnthropic client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+
+    if client is None:
+        client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            base_url=settings.anthropic_base_url,
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=_POOL_LIMITS),
+        )
+        _async_clients[loop] = client
+
+    return client
+
+
+def get_claude_client() -> anthropic.Anthropic:
+    """Get the pooled synchronous Anthropic client (for non-async callers)."""
+    global _sync_client
+
+    if _sync_client is None:
+        _sync_client = anthropic.Anthropic(
+            api_key=settings.anthropic_api_key,
+            base_url=settings.anthropic_base_url,
+            http_client=anthropic.DefaultHttpxClient(limits=_POOL_LIMITS),
+        )
+
+    return _sync_client
+
+
+def reset_claude_clients() -> None:
+    """Drop cached clients (useful for testing or after a key rotation)."""
+    global _sync_client
+    _sync_client = None
+    _async_clients.clear()
+
+
+async def create_message(call: str | None = None, **kwargs: Any) -> anthropic.types.Message:
+    """messages.create on the pooled client, holding an "anthropic" slot.
+
+    The response's token usage is priced and logged as a cost.
+
+    Args:
+        call: Name of the call site, recorded with the cost
+        **kwargs: messages.create parameters
+
+    Returns:
+        The Message
+    """
+    client = get_async_claude_client()
+
+    async with provider_slot("anthropic"):
+        started = time.monotonic()
+        response = await client.messages.create(**kwargs)
+        latency_ms = (time.monotonic() - started) * 1000
+
+    record_llm_usage(response, call=call, latency_ms=latency_ms, model=kwargs.get("model"))
+    return response
+
+
+def create_message_sync(call: str | None = None, **kwargs: Any) -> anthropic.types.Message:
+    """Blocking create_message() for callers that are not async."""
+    started = time.monotonic()
+    response = get_claude_client().messages.create(**kwargs)
+    latency_ms = (time.monotonic() - started) * 1000
+
+    record_llm_usage(response, call=call, latency_ms=latency_ms, model=kwargs.get("model"))
+    return response
+
+
+async def call_claude(
+    prompt: str,
+    system: str | None = None,
+    model: str | None = None,
+    max_tokens: int = 1500,
+    temperature: float | None = None,
+    call: str | None = None,
+) -> str:
+    """Make a Claude API call without blocking the event loop.
+
+    Args:
+        prompt: User message
+        system: Optional system prompt
+        model: Model ID (defaults to settings.default_model)
+        max_tokens: Response token cap
+        temperature: Optional sampling temperature
+        call: Name of the call site, recorded with the cost
+
+    Returns:
+        Text of the first content block
+    """
+    kwargs = {
+        "model": model or settings.default_model,
+        "max_tokens": max_tokens,
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    if system:
+        kwargs["system"] = system
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+
+    response = await create_message(call=call, **kwargs)
+    return response.content[0].text
@@ -0,0 +1,199 @@
+"""Token-accurate cost metering for Claude calls.
+
+Claude costs used to be logged as fixed guesses next to each pipeline
+stage (log_cost("anthropic", 0.70, ...) for content, 0.035 for taglines,
+...), while the real response.usage was thrown away. Some stages were
+counted twice (the primitive and the runner both logged a guess), others
+not at all.
+
+Every Claude call made through create_message() / call_claude() is now
+priced from its response.usage (input, output and prompt-cache tokens)
+with MODEL_PRICES and logged via log_cost() with the model, token counts
+and latency. The budget ledger and get_cost_breakdown() therefore work
+from real spend.
+
+Costs are attributed to the run, resort and stage of the code that made
+the call. The pipeline sets these; primitives don't need to know.
+log_cost() adds the same fields to every other API cost (Exa, Tavily, ...):
+
+    with cost_attribution(run_id=run_id, resort=resort_name):
+        set_cost_stage("extraction")
+        await extract_resort_data(...)   # its Claude calls carry the stage
+
+Usage:
+    message = await create_message(model=..., max_tokens=..., messages=[...])
+    cost = usage_cost("claude-sonnet-4-20250514", message.usage)
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# PRICES
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """USD per million tokens."""
+
+    input: float
+    output: float
+
+    @property
+    def cache_write(self) -> float:
+        return self.input * 1.25  # 5-minute cache writes
+
+    @property
+    def cache_read(self) -> float:
+        return self.input * 0.1
+
+
+# Matched by longest prefix, so dated snapshots share their family's price
+MODEL_PRICES: dict[str, ModelPrice] = {
+    "claude-opus-4-6": ModelPrice(5.0, 25.0),
+    "claude-opus-4-5": ModelPrice(5.0, 25.0),
+    "claude-opus-4": ModelPrice(15.0, 75.0),
+    "claude-3-opus": ModelPrice(15.0, 75.0),
+    "claude-sonnet-4": ModelPrice(3.0, 15.0),
+    "claude-3-7-sonnet": ModelPrice(3.0, 15.0),
+    "claude-3-5-sonnet": ModelPrice(3.0, 15.0),
+    "claude-haiku-4-5": ModelPrice(1.0, 5.0),
+    "claude-3-5-haiku": ModelPrice(0.80, 4.0),
+    "claude-3-haiku": ModelPrice(0.25, 1.25),
+}
+
+# Unknown models are priced as Sonnet and flagged in the cost metadata
+FALLBACK_PRICE = ModelPrice(3.0, 15.0)
+
+BATCH_DISCOUNT = 0.5  # Message Batches are billed at half the standard price
+
+_warned_models: set[str] = set()
+
+
+def price_for_model(model: str) -> ModelPrice | None:
+    """Price for a model ID, or None if it isn't in MODEL_PRICES."""
+    matches = [prefix for prefix in MODEL_PRICES if model.startswith(prefix)]
+    if not matches:
+        return None
+    return MODEL_PRICES[max(matches, key=len)]
+
+
+def _tokens(usage: Any, name: str) -> int:
+    if isinstance(usage, dict):
+        return int(usage.get(name) or 0)
+    return int(getattr(usage, name, 0) or 0)
+
+
+def usage_cost(model: str, usage: Any, batch: bool = False) -> float:
+    """USD cost of one response's usage (SDK Usage object or dict)."""
+    price = price_for_model(model)
+    if price is None:
+        if model not in _warned_models:
+            _warned_models.add(model)
+            logger.warning(f"No price for model {model}; using fallback pricing")
+        price = FALLBACK_PRICE
+
+    cost = (
+        _tokens(usage, "input_tokens") * price.input
+        + _tokens(usage, "output_tokens") * price.output
+        + _tokens(usage, "cache_creation_input_tokens") * price.cache_write
+        + _tokens(usage, "cache_read_input_tokens") * price.cache_read
+    ) / 1_000_000
+
+    return cost * BATCH_DISCOUNT if batch else cost
+
+
+# =============================================================================
+# ATTRIBUTION
+# =============================================================================
+
+# run_id, resort, stage, task_id of the code currently incurring costs
+_attribution: ContextVar[dict[str, Any]] = ContextVar("cost_attribution", default={})
+
+
+@contextmanager
+def cost_attribution(**fields: Any) -> Iterator[None]:
+    """Attribute costs in this block (and tasks it starts) to fields."""
+    token = _attribution.set({**_attribution.get(), **fields})
+    try:
+        yield
+    finally:
+        _attribution.reset(token)
+
+
+def set_cost_attribution(**fields: Any) -> None:
+    """Attribute the current task's following costs to fields.
+
+    For sequential pipeline code, where wrapping every stage in
+    cost_attribution() would re-indent the whole function. Lasts until the
+    task ends or the fields are set again.
+    """
+    _attribution.set({**_attribution.get(), **fields})
+
+
+def set_cost_stage(stage: str) -> None:
+    """Attribute the current task's following costs to a pipeline stage."""
+    set_cost_attribution(stage=stage)
+
+
+def current_attribution() -> dict[str, Any]:
+    return dict(_attribution.get())
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+
+def record_llm_usage(
+    response: Any,
+    call: str | None = None,
+    latency_ms: float | None = None,
+    batch: bool = False,
+    model: str | None = None,
+    **metadata: Any,
+) -> float:
+    """Price a Messages API response from its usage and log the cost.
+
+    Args:
+        response: Message (or anything with .model and .usage)
+        call: Name of the call site (used as the stage when none is set)
+        latency_ms: Wall time of the request
+        batch: Priced with the Message Batches discount
+        model: Model ID, if the response doesn't carry one
+        **metadata: Extra fields for the cost row
+
+    Returns:
+        Cost in USD
+    """
+    from .primitives.system import log_cost  # Avoid circular import
+
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return 0.0
+
+    model = getattr(response, "model", None) or model or "unknown"
+    cost = usage_cost(model, usage, batch=batch)
+
+    # log_cost() adds run_id/resort; the call name stands in for a missing stage
+    log_cost("anthropic", cost, None, {
+        "stage": _attribution.get().get("stage") or call or "unattributed",
+        "call": call,
+        "model": model,
+        "priced": price_for_model(model) is not None,
+        "input_tokens": _tokens(usage, "input_tokens"),
+        "output_tokens": _tokens(usage, "output_tokens"),
+        "cache_creation_input_tokens": _tokens(usage, "cache_creation_input_tokens"),
+        "cache_read_input_tokens": _tokens(usage, "cache_read_input_tokens"),
+        "latency_ms": round(latency_ms) if latency_ms is not None else None,
+        "batch": batch,
+        **metadata,
+    })
+    return cost
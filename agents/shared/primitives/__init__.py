@@ -27,6 +27,9 @@ from .research import (
 from .research_cache import (
     get_cached_results,
     cache_results,
+    prefetch_resort_cache,
+    flush_cache_usage,
+    get_process_cache_stats,
     store_resort_sources,
     mark_sources_cited,
     get_cache_stats,
@@ -80,6 +83,16 @@ from .database import (
     get_recent_portfolio_taglines,
 )
 
+# Resort name index (in-memory duplicate detection)
+from .resort_index import (
+    NameIndex,
+    get_resort_index,
+    get_candidate_index,
+    fresh_index,
+    normalize_resort_name,
+    normalize_country,
+)
+
 # Discovery primitives
 from .discovery import (
     check_discovery_candidate_exists,
@@ -101,6 +114,13 @@ from .publishing import (
     request_indexing,
     get_uncrawled_urls,
 )
+from .outbox import (
+    PublishOutbox,
+    OutboxFlushResult,
+    publish_outbox,
+    get_active_outbox,
+    flushes_page_changes,
+)
 
 # System primitives
 from .system import (
@@ -227,6 +247,7 @@ from .quality import (
     queue_quality_improvements,
     # Audit logging
     log_quality_issue,
+    log_quality_issues,
     log_audit_run,
     get_recent_quality_issues,
     # Helpers
@@ -237,6 +258,17 @@ from .quality import (
     OPTIONAL_CONTENT_SECTIONS,
 )
 
+# Set-based quality checks and materialized page scores
+from .quality_engine import (
+    QualityFrame,
+    formula_issues,
+    get_low_scoring_resorts,
+    load_quality_frame,
+    page_check_matrix,
+    refresh_page_scores,
+    resorts_below_threshold,
+)
+
 # Trail map primitives
 from .trail_map import (
     # Data classes
@@ -285,6 +317,29 @@ from .images import (
     upload_image_to_storage,
 )
 
+# Content-addressed image storage (exact + perceptual dedup)
+from .image_store import (
+    ImageFingerprint,
+    DuplicateFilter,
+    StoredImage,
+    fingerprint_image,
+    perceptual_hash,
+    hamming_distance,
+    load_resort_duplicate_filter,
+    store_image,
+    get_image_derivatives,
+    derivative_fields,
+    fingerprint_metadata,
+)
+
+# Responsive image derivatives (WebP/AVIF ladder + blur placeholder)
+from .image_derivatives import (
+    ImageVariant,
+    ImageDerivatives,
+    DERIVATIVE_WIDTHS,
+    render_derivatives,
+)
+
 # UGC Photos primitives (Google Places API)
 from .ugc_photos import (
     # Data classes
@@ -347,6 +402,8 @@ from .external_links import (
     LinkInjectionResult,
     # Cache operations
     clear_expired_cache as clear_entity_cache,
+    prefetch_entity_cache,
+    flush_entity_cache,
     # Google Places
     resolve_google_place,
     # Affiliate URLs
@@ -466,6 +523,18 @@ from .linking import (
     delete_stale_similarities,
 )
 
+# Vectorized all-pairs similarity engine
+from .similarity_engine import (
+    SimilarityFeatures,
+    SimilarityFeatureStore,
+    encode_features,
+    get_feature_store,
+    load_similarity_features,
+    refresh_similarity_matrix,
+    sync_similar_links,
+    update_similarities_for_resort,
+)
+
 __all__ = [
     # Research
     "exa_search",
@@ -514,6 +583,13 @@ __all__ = [
     "find_similar_resorts",
     "count_resorts",
     "get_country_coverage_summary",
+    # Resort name index
+    "NameIndex",
+    "get_resort_index",
+    "get_candidate_index",
+    "fresh_index",
+    "normalize_resort_name",
+    "normalize_country",
     # Discovery
     "check_discovery_candidate_exists",
     # Publishing
@@ -531,6 +607,12 @@ __all__ = [
     # Publishing - Indexing
     "request_indexing",
     "get_uncrawled_urls",
+    # Publishing - Outbox
+    "PublishOutbox",
+    "OutboxFlushResult",
+    "publish_outbox",
+    "get_active_outbox",
+    "flushes_page_changes",
     # System - Cost tracking
     "log_cost",
     "get_daily_spend",
@@ -633,6 +715,7 @@ __all__ = [
     "queue_quality_improvements",
     # Quality - Audit logging
     "log_quality_issue",
+    "log_quality_issues",
     "log_audit_run",
     "get_recent_quality_issues",
     # Quality - Helpers
@@ -641,6 +724,14 @@ __all__ = [
     # Quality - Constants
     "REQUIRED_CONTENT_SECTIONS",
     "OPTIONAL_CONTENT_SECTIONS",
+    # Quality engine
+    "QualityFrame",
+    "formula_issues",
+    "get_low_scoring_resorts",
+    "load_quality_frame",
+    "page_check_matrix",
+    "refresh_page_scores",
+    "resorts_below_threshold",
     # Trail map - Data classes
     "PisteData",
     "LiftData",
@@ -720,6 +811,15 @@ __all__ = [
     # Linking - Utilities
     "get_shared_features",
     "delete_stale_similarities",
+    # Similarity engine
+    "SimilarityFeatures",
+    "SimilarityFeatureStore",
+    "encode_features",
+    "get_feature_store",
+    "load_similarity_features",
+    "refresh_similarity_matrix",
+    "sync_similar_links",
+    "update_similarities_for_resort",
     # Approval Panel - Data classes
     "EvaluationResult",
     "PanelResult",
@@ -750,11 +850,30 @@ __all__ = [
     # Official Images - Cleanup
     "delete_ai_generated_images",
     "count_ai_generated_images",
+    # Image Store - Content-addressed storage + dedup
+    "ImageFingerprint",
+    "DuplicateFilter",
+    "StoredImage",
+    "fingerprint_image",
+    "perceptual_hash",
+    "hamming_distance",
+    "load_resort_duplicate_filter",
+    "store_image",
+    "get_image_derivatives",
+    "derivative_fields",
+    "fingerprint_metadata",
+    # Image Derivatives - Responsive variants
+    "ImageVariant",
+    "ImageDerivatives",
+    "DERIVATIVE_WIDTHS",
+    "render_derivatives",
     # External Links - Data classes
     "ResolvedEntity",
     "AffiliateConfig",
     # External Links - Cache operations
     "clear_entity_cache",
+    "prefetch_entity_cache",
+    "flush_entity_cache",
     # External Links - Google Places
     "resolve_google_place",
     # External Links - Affiliate URLs
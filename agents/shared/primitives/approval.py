@@ -23,9 +23,8 @@ import json
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
-import anthropic
-
 from ..config import settings
+from ..llm_client import call_claude
 from ..voice_profiles import get_voice_profile
 
 
@@ -166,35 +165,14 @@ def apply_voice_post_processing(content: dict[str, Any]) -> dict[str, Any]:
 # =============================================================================
 
 
-def _get_client() -> anthropic.Anthropic:
-    """Get Anthropic client instance."""
-    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-
-def _call_claude(
+async def _call_claude(
     prompt: str,
     system: str | None = None,
     model: str | None = None,
     max_tokens: int = 1500,
 ) -> str:
     """Make a Claude API call and return the text response."""
-    client = _get_client()
-
-    # Use default_model for evaluations (fast, cheap)
-    model = model or settings.default_model
-
-    messages = [{"role": "user", "content": prompt}]
-
-    kwargs = {
-        "model": model,
-        "max_tokens": max_tokens,
-        "messages": messages,
-    }
-    if system:
-        kwargs["system"] = system
-
-    response = client.messages.create(**kwargs)
-    return response.content[0].text
+    return await call_claude(prompt, system=system, model=model, max_tokens=max_tokens)
 
 
 def _parse_json_response(response: str) -> dict[str, Any]:
@@ -318,7 +296,7 @@ Your standards are high because families are making expensive decisions based on
 When in doubt, flag for improvement rather than approve.
 Focus on verifiable facts, not style or tone (that's VoiceCoach's job)."""
 
-    response = _call_claude(prompt, system=system)
+    response = await _call_claude(prompt, system=system)
 
     try:
         parsed = _parse_json_response(response)
@@ -426,7 +404,7 @@ Your bar is high: content must be USEFUL, not just informative.
 Missing sections or vague content = improvement needed.
 If families can't plan their trip from this guide, it's not ready."""
 
-    response = _call_claude(prompt, system=system)
+    response = await _call_claude(prompt, system=system)
 
     try:
         parsed = _parse_json_response(response)
@@ -542,7 +520,7 @@ language, neutral option-presenting without stances, monotonous rhythm.
 Approve: personality-forward writing, varied openings, strong opinions backed by
 evidence, rhythm contrast, emotional moments that put the reader in the scene."""
 
-    response = _call_claude(prompt, system=system)
+    response = await _call_claude(prompt, system=system)
 
     try:
         parsed = _parse_json_response(response)
@@ -729,7 +707,7 @@ Be surgical: fix the issues without rewriting content that's already good.
 Preserve all accurate factual information."""
 
     # Use content model for better quality improvements
-    response = _call_claude(
+    response = await _call_claude(
         prompt, system=system, model=settings.content_model, max_tokens=4000
     )
 
@@ -17,11 +17,9 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-import anthropic
-
 from ..config import settings
+from ..llm_client import create_message
 from .database import update_resort_calendar
-from .system import log_cost
 
 logger = logging.getLogger(__name__)
 
@@ -106,8 +104,6 @@ async def generate_ski_calendar(
     months_str = ", ".join(month_names[m] for m in season_months)
 
     try:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
         prompt = f"""Generate ski quality calendar data for {resort_name}, {country}.
 
 Months to cover: {months_str}
@@ -143,17 +139,13 @@ Return ONLY a JSON array:
   ...
 ]"""
 
-        response = client.messages.create(
+        response = await create_message(
+            call="ski_calendar",
             model="claude-haiku-4-5-20251001",
             max_tokens=800,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        log_cost("anthropic", 0.003, None, {
-            "stage": "calendar_generation",
-            "resort": resort_name,
-        })
-
         response_text = response.content[0].text.strip()
 
         # Extract JSON array
@@ -2,17 +2,11 @@
 
 from typing import Any
 
-import anthropic
-
 from ..config import settings
+from ..llm_client import create_message
 from ..voice_profiles import VoiceProfile, get_voice_profile
 
 
-def get_claude_client() -> anthropic.Anthropic:
-    """Get Anthropic client instance."""
-    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-
 async def write_section(
     section_name: str,
     context: dict[str, Any],
@@ -32,7 +26,6 @@ async def write_section(
         Generated content as HTML string
     """
     profile = get_voice_profile(voice_profile)
-    client = get_claude_client()
 
     section_prompts = {
         "quick_take": """Write a single flowing paragraph of 50-90 words about {resort_name} for families.
@@ -207,7 +200,8 @@ NEVER:
 - Never write a section shorter than 200 words. If data is thin, provide regional context.
 """
 
-    message = client.messages.create(
+    message = await create_message(
+        call="section",
         model=settings.content_model,
         max_tokens=max_tokens,
         system=system_prompt,
@@ -235,7 +229,6 @@ async def generate_faq(
     Returns list of {"question": "...", "answer": "..."} dicts.
     """
     profile = get_voice_profile(voice_profile)
-    client = get_claude_client()
 
     system_prompt = f"""You are writing FAQs for Snowthere, a family ski resort guide.
 
@@ -260,7 +253,8 @@ Answers should be concise (2-4 sentences) but helpful. Use the {profile.name} vo
 CRITICAL: Use exact numbers, never hedge. Say "$85" not "roughly $85" or "around $85" or "approximately $85". If you don't know the exact number, give a specific realistic estimate without hedging qualifiers.
 """
 
-    message = client.messages.create(
+    message = await create_message(
+        call="faq",
         model=settings.content_model,
         max_tokens=2000,
         system=system_prompt,
@@ -301,7 +295,6 @@ async def apply_voice(
     Use this to adjust tone of externally sourced or AI-generated content.
     """
     profile = get_voice_profile(voice_profile)
-    client = get_claude_client()
 
     system_prompt = f"""Rewrite the following content to match this voice profile:
 
@@ -316,7 +309,8 @@ Keep all factual information but adjust the tone and phrasing.
 Output HTML formatted content.
 """
 
-    message = client.messages.create(
+    message = await create_message(
+        call="apply_voice",
         model=settings.content_model,
         max_tokens=2000,
         system=system_prompt,
@@ -341,9 +335,9 @@ async def generate_seo_meta(
 
     Returns {"title": "...", "description": "..."}.
     """
-    client = get_claude_client()
 
-    message = client.messages.create(
+    message = await create_message(
+        call="seo_meta",
         model=settings.default_model,
         max_tokens=300,
         system="Generate SEO metadata. Be concise and include key terms families search for.",
@@ -352,13 +346,13 @@ async def generate_seo_meta(
                 "role": "user",
                 "content": f"""Generate SEO title and meta description for this ski resort page:
 
-Resort: {resort_name}, {country}
-Quick Take: {quick_take[:500]}
+    Resort: {resort_name}, {country}
+    Quick Take: {quick_take[:500]}
 
-Format as JSON: {{"title": "...", "description": "..."}}
+    Format as JSON: {{"title": "...", "description": "..."}}
 
-Title: 50-60 chars, format "Family Ski Guide: [Resort] with Kids" (do NOT include "| Snowthere" — it's added by the frontend)
-Description: 150-160 chars, focus on family value prop""",
+    Title: 50-60 chars, format "Family Ski Guide: [Resort] with Kids" (do NOT include "| Snowthere" — it's added by the frontend)
+    Description: 150-160 chars, focus on family value prop""",
             }
         ],
     )
@@ -409,7 +403,7 @@ def _format_context(context: dict[str, Any]) -> str:
 # =============================================================================
 
 
-def generate_country_intro(
+async def generate_country_intro(
     country_name: str,
     resort_data: list[dict[str, Any]],
     voice_profile: str = "snowthere_guide",
@@ -429,7 +423,6 @@ def generate_country_intro(
         200-300 word intro as plain text (not HTML)
     """
     profile = get_voice_profile(voice_profile)
-    client = get_claude_client()
 
     # Build resort summary for context
     resort_summaries = []
@@ -482,7 +475,8 @@ REQUIREMENTS:
 5. End with an encouraging, actionable sentence
 6. Do NOT be generic — reference specific data from the resort list"""
 
-    message = client.messages.create(
+    message = await create_message(
+        call="country_intro",
         model=settings.default_model,
         max_tokens=500,
         system=system_prompt,
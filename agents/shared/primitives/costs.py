@@ -27,9 +27,9 @@ from urllib.parse import urlparse
 
 import httpx
 from bs4 import BeautifulSoup
-import anthropic
 
 from ..config import settings
+from ..llm_client import create_message
 from ..supabase_client import get_supabase_client
 from .system import log_cost
 
@@ -478,7 +478,6 @@ async def scrape_and_interpret_pricing(
         return CostResult(success=False, error="Anthropic API key not configured")
 
     try:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
         currency = get_currency_for_country(country)
 
         prompt = f"""Extract lift ticket pricing from this {resort_name} ({country}) page content.
@@ -501,14 +500,13 @@ Return ONLY a JSON object:
 
 Be conservative. Only extract prices you're confident about. If the page shows ranges, use the high-season price."""
 
-        response = client.messages.create(
+        response = await create_message(
+            call="pricing_interpretation",
             model="claude-haiku-4-5-20251001",
             max_tokens=300,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        log_cost("anthropic", 0.003, None, {"stage": "pricing_interpretation", "resort": resort_name})
-
         response_text = response.content[0].text
         json_match = re.search(r"\{[^{}]+\}", response_text, re.DOTALL)
         if not json_match:
@@ -606,7 +604,6 @@ async def corroborate_pricing(
         if not settings.anthropic_api_key:
             return CostResult(success=False, error="Anthropic API key not configured")
 
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
         currency = get_currency_for_country(country)
 
         corroboration_note = ""
@@ -630,14 +627,13 @@ Return ONLY a JSON object:
 
 Extract the STANDARD ADULT 1-DAY WINDOW PRICE. Not multi-day, not promo, not online-only."""
 
-        resp = client.messages.create(
+        resp = await create_message(
+            call="pricing_corroboration",
             model="claude-haiku-4-5-20251001",
             max_tokens=200,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        log_cost("anthropic", 0.002, None, {"stage": "pricing_corroboration_llm"})
-
         response_text = resp.content[0].text
         json_match = re.search(r"\{[^{}]+\}", response_text, re.DOTALL)
         if not json_match:
@@ -691,7 +687,6 @@ async def extract_pricing_with_claude(
         return CostResult(success=False, error="Anthropic API key not configured")
 
     try:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
         combined_text = "\n\n".join(research_snippets[:10])
         currency = get_currency_for_country(country)
 
@@ -712,14 +707,13 @@ Return ONLY a JSON object with these fields (use null if not found):
 Extract the STANDARD ADULT 1-DAY WINDOW PRICE. Not multi-day, not promo, not online-only.
 Be conservative - only extract prices you're confident about."""
 
-        response = client.messages.create(
+        response = await create_message(
+            call="pricing_extraction",
             model=settings.default_model,
             max_tokens=500,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        log_cost("anthropic", 0.01, None, {"stage": "pricing_extraction"})
-
         response_text = response.content[0].text
         json_match = re.search(r"\{[^{}]+\}", response_text, re.DOTALL)
         if not json_match:
@@ -852,8 +846,8 @@ async def discover_lodging_costs(
         combined = "\n\n".join(snippets)
         currency = get_currency_for_country(country)
 
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-        response = client.messages.create(
+        response = await create_message(
+            call="lodging_interpretation",
             model="claude-haiku-4-5-20251001",
             max_tokens=200,
             messages=[{"role": "user", "content": f"""Extract nightly hotel/accommodation prices for {resort_name}, {country} from these search results.
@@ -877,8 +871,6 @@ Return ONLY JSON:
 Be conservative — only extract prices you're confident about."""}],
         )
 
-        log_cost("anthropic", 0.003, None, {"stage": "lodging_interpretation", "resort": resort_name})
-
         json_match = re.search(r"\{[^{}]+\}", response.content[0].text, re.DOTALL)
         if not json_match:
             return None
@@ -10,6 +10,7 @@ from typing import Any
 from uuid import uuid4
 
 from ..supabase_client import get_supabase_client
+from .resort_index import get_resort_index, index_resort
 
 
 # =============================================================================
@@ -283,7 +284,9 @@ def create_resort(
         data["longitude"] = longitude
 
     response = client.table("resorts").insert(data).execute()
-    return response.data[0] if response.data else data
+    created = response.data[0] if response.data else data
+    index_resort(created)
+    return created
 
 
 def update_resort(resort_id: str, updates: dict[str, Any]) -> dict:
@@ -307,7 +310,9 @@ def update_resort(resort_id: str, updates: dict[str, Any]) -> dict:
         .eq("id", resort_id)
         .execute()
     )
-    return response.data[0] if response.data else {}
+    updated = response.data[0] if response.data else {}
+    index_resort(updated)
+    return updated
 
 
 def delete_resort(resort_id: str, hard_delete: bool = False) -> bool:
@@ -344,6 +349,11 @@ def delete_resort(resort_id: str, hard_delete: bool = False) -> bool:
             .execute()
         )
 
+    if hard_delete:
+        get_resort_index().remove(resort_id)
+    elif response.data:
+        index_resort(response.data[0])
+
     return bool(response.data)
 
 
@@ -793,82 +803,13 @@ def get_resort_full(resort_id: str) -> dict | None:
 # =============================================================================
 
 
-def _slugify(name: str) -> str:
-    """Convert resort name to URL-safe ASCII slug.
-
-    Uses unidecode to transliterate Unicode to ASCII (e.g., Kitzbühel → kitzbuhel).
-    This must match runner.py's slugify for consistent duplicate detection.
-    """
-    try:
-        from unidecode import unidecode
-        ascii_name = unidecode(name)
-    except ImportError:
-        ascii_name = name
-    return ascii_name.lower().replace(" ", "-").replace("'", "").replace(".", "")
-
-
-def _generate_name_variants(name: str) -> list[str]:
-    """
-    Generate common name variants for fuzzy matching.
-
-    Handles:
-    - St./Sankt/Saint variants
-    - Core name extraction (Whistler Blackcomb -> Whistler)
-    """
-    variants = [name]
-    name_lower = name.lower()
-
-    # St./Sankt/Saint variants
-    if name_lower.startswith("st. "):
-        base = name[4:].strip()
-        variants.extend([f"Sankt {base}", f"Saint {base}", f"St {base}"])
-    elif name_lower.startswith("st "):
-        base = name[3:].strip()
-        variants.extend([f"Sankt {base}", f"Saint {base}", f"St. {base}"])
-    elif name_lower.startswith("sankt "):
-        base = name[6:].strip()
-        variants.extend([f"St. {base}", f"St {base}", f"Saint {base}"])
-    elif name_lower.startswith("saint "):
-        base = name[6:].strip()
-        variants.extend([f"St. {base}", f"St {base}", f"Sankt {base}"])
-
-    # Core name extraction ("Whistler Blackcomb" -> "Whistler")
-    if " " in name:
-        core = name.split()[0]
-        if core.lower() != name_lower:
-            variants.append(core)
-
-    return list(set(variants))
-
-
-def _calculate_name_similarity(name1: str, name2: str) -> float:
-    """
-    Calculate token overlap similarity (Jaccard index).
-
-    Returns value 0-1, where 1 = exact match.
-    """
-    # Normalize: lowercase, remove punctuation
-    tokens1 = set(name1.lower().replace(".", "").replace("-", " ").split())
-    tokens2 = set(name2.lower().replace(".", "").replace("-", " ").split())
-
-    if not tokens1 or not tokens2:
-        return 0.0
-
-    intersection = tokens1 & tokens2
-    union = tokens1 | tokens2
-
-    return len(intersection) / len(union)
-
-
 def check_resort_exists(name: str, country: str) -> dict[str, Any] | None:
     """
-    Check if a resort already exists (exact or case-insensitive match).
+    Check if a resort already exists (normalized name, slug or alias match).
 
     This is the agent-native way to check for duplicates before creating.
-
-    Strategies:
-    1. Exact slug match: slugify(name) + country
-    2. Case-insensitive name match: ilike query
+    Answered from the in-process resort name index, so "St. Anton",
+    "Sankt Anton" and "st-anton" all find the same resort without a query.
 
     Args:
         name: Resort name (any casing/format)
@@ -877,36 +818,10 @@ def check_resort_exists(name: str, country: str) -> dict[str, Any] | None:
     Returns:
         Resort dict if found, None if not exists
     """
-    client = get_supabase_client()
-
-    # Strategy 1: Exact slug match
-    slug = _slugify(name)
-    response = (
-        client.table("resorts")
-        .select("id, name, country, slug, status")
-        .eq("slug", slug)
-        .ilike("country", country)
-        .limit(1)
-        .execute()
-    )
-
-    if response.data:
-        return response.data[0]
-
-    # Strategy 2: Case-insensitive name match
-    response = (
-        client.table("resorts")
-        .select("id, name, country, slug, status")
-        .ilike("name", name)
-        .ilike("country", country)
-        .limit(1)
-        .execute()
-    )
-
-    if response.data:
-        return response.data[0]
-
-    return None
+    row = get_resort_index().find_exact(name, country)
+    if not row:
+        return None
+    return {k: row.get(k) for k in ("id", "name", "country", "slug", "status")}
 
 
 def find_similar_resorts(
@@ -920,7 +835,7 @@ def find_similar_resorts(
     Catches name variants like:
     - "St. Anton" vs "Sankt Anton" vs "Saint Anton"
     - "Zermatt" vs "Zermatt-Matterhorn"
-    - "Whistler" vs "Whistler Blackcomb"
+    - "Kitzbuhl" vs "Kitzbühel" (typos, via trigram similarity)
 
     Args:
         name: Resort name to search for
@@ -930,35 +845,13 @@ def find_similar_resorts(
     Returns:
         List of similar resorts with similarity_score, sorted by score descending
     """
-    client = get_supabase_client()
-
-    # Generate name variants to search
-    variants = _generate_name_variants(name)
-
-    results = []
-    seen_ids: set[str] = set()
-
-    for variant in variants:
-        query = (
-            client.table("resorts")
-            .select("id, name, country, slug, status")
-            .ilike("name", f"%{variant}%")
-        )
-
-        if country:
-            query = query.ilike("country", country)
-
-        response = query.limit(10).execute()
-
-        for r in response.data or []:
-            if r["id"] not in seen_ids:
-                seen_ids.add(r["id"])
-                score = _calculate_name_similarity(name, r["name"])
-                if score >= threshold:
-                    results.append({**r, "similarity_score": round(score, 3)})
-
-    # Sort by similarity score descending
-    return sorted(results, key=lambda x: x["similarity_score"], reverse=True)
+    return [
+        {
+            **{k: r.get(k) for k in ("id", "name", "country", "slug", "status")},
+            "similarity_score": r["similarity_score"],
+        }
+        for r in get_resort_index().find_similar(name, country, threshold=threshold)
+    ]
 
 
 def count_resorts(status: str | None = None) -> int:
@@ -21,8 +21,11 @@ from typing import Any, Optional
 import httpx
 
 from shared.config import settings
+from shared.llm_client import create_message
 from shared.supabase_client import get_supabase_client
 
+from .resort_index import fresh_index, get_candidate_index, get_resort_index, index_candidate
+
 
 class DiscoverySource(str, Enum):
     """Source of the discovery signal."""
@@ -300,17 +303,14 @@ async def extract_resort_mentions(
         return []
 
     try:
-        import anthropic
-
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
         # Build content summary
         content_text = "\n".join([
             f"- {r.get('title', '')} ({r.get('url', '')})"
             for r in content_results[:20]
         ])
 
-        response = client.messages.create(
+        response = await create_message(
+            call="discovery_mentions",
             model="claude-haiku-4-5-20251001",
             max_tokens=500,
             messages=[{
@@ -344,18 +344,19 @@ async def get_covered_resorts() -> set[str]:
     """
     Get set of resorts we already have content for.
 
+    Prefer get_resort_index().contains(name, country), which also matches
+    name variants; this exact-lowercase set is kept for existing callers.
+
     Returns:
         Set of (resort_name, country) tuples
     """
     try:
-        supabase = get_supabase_client()
-        result = supabase.table("resorts").select("name, country").execute()
-
-        covered = set()
-        for r in result.data:
-            covered.add((r["name"].lower(), r["country"].lower()))
-
-        return covered
+        index = await fresh_index(get_resort_index())
+        return {
+            (r["name"].lower(), r["country"].lower())
+            for r in index.rows()
+            if r.get("name") and r.get("country")
+        }
 
     except Exception as e:
         print(f"Error getting covered resorts: {e}")
@@ -558,15 +559,14 @@ async def find_pass_coverage_gaps() -> list[DiscoveryCandidate]:
     Returns:
         List of discovery candidates from pass gaps
     """
-    covered = await get_covered_resorts()
+    index = await fresh_index(get_resort_index())
     candidates = []
 
     for pass_name in ["epic", "ikon", "mountain_collective", "indy"]:
         resorts = await get_pass_network_resorts(pass_name)
 
         for resort in resorts:
-            key = (resort["name"].lower(), resort["country"].lower())
-            if key not in covered:
+            if not index.contains(resort["name"], resort["country"]):
                 candidate = DiscoveryCandidate(
                     resort_name=resort["name"],
                     country=resort["country"],
@@ -774,6 +774,7 @@ async def save_discovery_candidate(candidate: DiscoveryCandidate) -> Optional[st
         }).execute()
 
         if result.data:
+            index_candidate(result.data[0])
             return result.data[0].get("id")
         return None
 
@@ -831,6 +832,8 @@ async def update_candidate_status(
             .eq("id", candidate_id)\
             .execute()
 
+        if result.data:
+            index_candidate(result.data[0])
         return bool(result.data)
 
     except Exception as e:
@@ -846,7 +849,8 @@ def check_discovery_candidate_exists(
     Check if a resort is already in discovery_candidates queue.
 
     This is the agent-native way to check if a resort is already
-    being processed, avoiding duplicate work.
+    being processed, avoiding duplicate work. Answered from the
+    in-process candidate name index (normalized names, no query).
 
     The UNIQUE(resort_name, country) constraint is our gatekeeper.
 
@@ -858,16 +862,7 @@ def check_discovery_candidate_exists(
         Candidate dict if exists, None otherwise
     """
     try:
-        supabase = get_supabase_client()
-
-        result = supabase.table("discovery_candidates")\
-            .select("*")\
-            .ilike("resort_name", resort_name)\
-            .ilike("country", country)\
-            .limit(1)\
-            .execute()
-
-        return result.data[0] if result.data else None
+        return get_candidate_index().find_exact(resort_name, country)
 
     except Exception as e:
         print(f"Error checking discovery candidate: {e}")
@@ -919,7 +914,7 @@ async def run_keyword_discovery(
         ]
 
         # Get our current coverage
-        covered = await get_covered_resorts()
+        index = await fresh_index(get_resort_index())
 
         # Build candidates from keyword data
         candidates = []
@@ -941,10 +936,9 @@ async def run_keyword_discovery(
             resort_name = " ".join(parts).title()
             seen.add(keyword.lower())
 
-            # Check if we cover this
-            for country in ["USA", "Canada", "Austria", "Switzerland", "France", "Italy", "Japan"]:
-                if (resort_name.lower(), country.lower()) in covered:
-                    continue
+            # Check if we cover this (country unknown from a keyword)
+            if index.contains(resort_name):
+                continue
 
             candidate = DiscoveryCandidate(
                 resort_name=resort_name,
@@ -1057,19 +1051,13 @@ async def run_trending_discovery(days_back: int = 7) -> DiscoveryResult:
         cost += 0.01  # Claude Haiku cost
 
         # Get our coverage
-        covered = await get_covered_resorts()
+        index = await fresh_index(get_resort_index())
 
         # Build candidates
         candidates = []
         for name in set(resort_names):
-            # Check all likely countries
-            is_covered = False
-            for country in ["USA", "Canada", "Austria", "Switzerland", "France", "Italy", "Japan"]:
-                if (name.lower(), country.lower()) in covered:
-                    is_covered = True
-                    break
-
-            if is_covered:
+            # Country is unknown for a trending mention: match any country
+            if index.contains(name):
                 continue
 
             candidate = DiscoveryCandidate(
@@ -1190,12 +1178,12 @@ async def run_exploration_discovery(count: int = 5) -> DiscoveryResult:
 
     try:
         # Get our coverage
-        covered = await get_covered_resorts()
+        index = await fresh_index(get_resort_index())
 
         # Filter to uncovered
         uncovered = [
             r for r in EXPLORATION_POOL
-            if (r["name"].lower(), r["country"].lower()) not in covered
+            if not index.contains(r["name"], r["country"])
         ]
 
         # Random sample
@@ -336,7 +336,7 @@ Output JSON:
 Standards: "approve" means ready to publish. "improve" means good but needs fixes.
 "reject" means fundamentally flawed."""
 
-    response = _call_claude(prompt, system=expert.system_prompt)
+    response = await _call_claude(prompt, system=expert.system_prompt)
 
     try:
         parsed = _parse_json_response(response)
@@ -625,7 +625,7 @@ Fix specific issues while maintaining quality and voice.
 Voice: {profile.name} - {', '.join(profile.tone[:3])}
 Avoid: {', '.join(profile.avoid[:3])}"""
 
-    response = _call_claude(prompt, system=system)
+    response = await _call_claude(prompt, system=system)
 
     try:
         improved = _parse_json_response(response)
@@ -24,18 +24,28 @@ Resolution Tiers:
 3. Maps search fallback → search URL (always safe, rel=nofollow)
 """
 
+import asyncio
+import atexit
 import html
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, NamedTuple
+from typing import Any, AsyncIterator, NamedTuple
 from urllib.parse import quote_plus, urlparse
 
 import httpx
+from postgrest.types import ReturnMethod
 
 from ..config import get_settings
-from ..supabase_client import get_supabase_client
+from ..http_client import get_http_client
+from ..rate_limits import provider_slot
+from ..supabase_client import execute_async, get_supabase_client, run_db
+from .resort_index import get_resort_index
 
 logger = logging.getLogger(__name__)
 
@@ -47,40 +57,19 @@ _NON_GEOGRAPHIC_TYPES = frozenset({"product", "event"})
 # INTERNAL RESORT LINK LOOKUP (for cross-link priority)
 # ============================================================================
 
-_published_resorts_cache: dict[str, dict[str, str]] | None = None
-
-
-def _get_published_resorts() -> dict[str, dict[str, str]]:
-    """Load published resort names → {slug, country} mapping. Cached per process."""
-    global _published_resorts_cache
-    if _published_resorts_cache is not None:
-        return _published_resorts_cache
+def _match_published_resort(entity_name: str) -> dict[str, str] | None:
+    """Check if entity name matches a published resort. Returns {slug, country} or None.
 
+    Uses the shared resort name index, so "St. Anton" matches "Sankt Anton".
+    """
     try:
-        client = get_supabase_client()
-        response = (
-            client.table("resorts")
-            .select("name, slug, country")
-            .eq("status", "published")
-            .execute()
-        )
-
-        _published_resorts_cache = {}
-        for r in response.data or []:
-            _published_resorts_cache[r["name"].lower()] = {
-                "slug": r["slug"],
-                "country": r["country"],
-            }
+        row = get_resort_index().find_exact(entity_name, status="published")
     except Exception as e:
-        logger.warning(f"[external_links] Failed to load published resorts: {e}")
-        _published_resorts_cache = {}
-    return _published_resorts_cache
-
-
-def _match_published_resort(entity_name: str) -> dict[str, str] | None:
-    """Check if entity name matches a published resort. Returns {slug, country} or None."""
-    resorts = _get_published_resorts()
-    return resorts.get(entity_name.lower())
+        logger.warning(f"[external_links] Resort name index unavailable: {e}")
+        return None
+    if not row:
+        return None
+    return {"slug": row["slug"], "country": row["country"]}
 
 
 # ============================================================================
@@ -426,6 +415,30 @@ def _build_maps_search_url(name: str, location_context: str) -> str:
 # ============================================================================
 # CACHE OPERATIONS
 # ============================================================================
+#
+# Two tiers, like research_cache:
+# - In-process LRU keyed by (name_normalized, entity_type, location_context).
+#   prefetch_entity_cache() loads every row for a location in one query, so
+#   the 30-60 entities on a resort page don't each make a round trip, and
+#   rows stay warm across resorts in the same run.
+# - Supabase entity_link_cache. New rows are buffered and written in one
+#   batched upsert by flush_entity_cache() (end of each section, and at exit).
+
+ENTITY_CACHE_MAX_ENTRIES = 4096
+
+# Within this window after a prefetch, a key missing from memory is a miss
+# without a DB query
+ENTITY_PREFETCH_FRESH_SECONDS = 15 * 60
+
+# Flush buffered cache rows early once this many are pending
+ENTITY_FLUSH_THRESHOLD = 50
+
+EntityKey = tuple[str, str, str]  # (name_normalized, entity_type, location_context)
+
+_entity_lock = threading.Lock()
+_entity_memory: "OrderedDict[EntityKey, dict[str, Any]]" = OrderedDict()
+_entity_prefetched: dict[str, float] = {}  # location_context -> monotonic load time
+_pending_entity_rows: dict[EntityKey, dict[str, Any]] = {}
 
 
 def _normalize_entity_name(name: str) -> str:
@@ -436,42 +449,157 @@ def _normalize_entity_name(name: str) -> str:
     return normalized
 
 
-def _get_cached_entity(
+def _is_entity_fresh(row: dict[str, Any]) -> bool:
+    """Check if a cached row is unexpired (rows without expires_at never expire)."""
+    if not row.get("expires_at"):
+        return True
+    expires_at = datetime.fromisoformat(row["expires_at"].replace("Z", "+00:00"))
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at >= datetime.now(timezone.utc)
+
+
+def _remember_entity(key: EntityKey, row: dict[str, Any]) -> None:
+    """Store a row in the LRU (caller holds _entity_lock)."""
+    _entity_memory[key] = row
+    _entity_memory.move_to_end(key)
+    while len(_entity_memory) > ENTITY_CACHE_MAX_ENTRIES:
+        _entity_memory.popitem(last=False)
+
+
+def prefetch_entity_cache(location_context: str) -> int:
+    """Load every cached entity for a location into memory in one query.
+
+    Returns:
+        Number of rows loaded
+    """
+    try:
+        supabase = get_supabase_client()
+
+        result = (
+            supabase.table("entity_link_cache")
+            .select("*")
+            .eq("location_context", location_context)
+            .execute()
+        )
+
+        rows = [row for row in (result.data or []) if _is_entity_fresh(row)]
+        with _entity_lock:
+            for row in rows:
+                key = (row["name_normalized"], row["entity_type"], location_context)
+                if key not in _pending_entity_rows:  # Don't clobber unflushed writes
+                    _remember_entity(key, row)
+            _entity_prefetched[location_context] = time.monotonic()
+
+        logger.info(f"[external_links] Entity cache prefetch: {location_context} ({len(rows)} rows)")
+        return len(rows)
+
+    except Exception as e:
+        # Lookups fall back to per-entity queries
+        logger.warning(f"[external_links] Entity cache prefetch failed for {location_context}: {e}")
+        return 0
+
+
+def flush_entity_cache() -> int:
+    """Write buffered cache rows in one batched upsert.
+
+    If the write fails the rows go back in the buffer for the next flush
+    (unless a newer row for the same key arrived meanwhile).
+
+    Returns:
+        Number of rows written
+    """
+    with _entity_lock:
+        rows = list(_pending_entity_rows.values())
+        _pending_entity_rows.clear()
+
+    if not rows:
+        return 0
+
+    try:
+        supabase = get_supabase_client()
+        supabase.table("entity_link_cache").upsert(
+            rows,
+            on_conflict="name_normalized,entity_type,location_context",
+            returning=ReturnMethod.minimal,
+        ).execute()
+        return len(rows)
+    except Exception as e:
+        print(f"Cache write failed ({len(rows)} rows, kept for the next flush): {e}")
+        with _entity_lock:
+            for row in rows:
+                key = (row["name_normalized"], row["entity_type"], row["location_context"])
+                _pending_entity_rows.setdefault(key, row)
+        return 0
+
+
+atexit.register(flush_entity_cache)
+
+
+async def ensure_entity_prefetch(location_context: str) -> None:
+    """Prefetch a location's cached entities unless that happened recently."""
+    with _entity_lock:
+        prefetched_at = _entity_prefetched.get(location_context)
+    if prefetched_at is None or time.monotonic() - prefetched_at >= ENTITY_PREFETCH_FRESH_SECONDS:
+        await run_db(prefetch_entity_cache, location_context)
+
+
+def clear_entity_memory_cache() -> None:
+    """Drop the in-process tier (useful for testing)."""
+    with _entity_lock:
+        _entity_memory.clear()
+        _entity_prefetched.clear()
+
+
+async def _get_cached_entity(
     name_normalized: str,
     entity_type: str,
     location_context: str,
 ) -> dict[str, Any] | None:
-    """Look up entity in cache."""
+    """Look up entity in cache (memory first, then Supabase unless prefetched)."""
+    key = (name_normalized, entity_type, location_context)
+
+    with _entity_lock:
+        cached = _entity_memory.get(key)
+        if cached is not None:
+            _entity_memory.move_to_end(key)
+        prefetched_at = _entity_prefetched.get(location_context)
+        prefetch_fresh = (
+            prefetched_at is not None
+            and time.monotonic() - prefetched_at < ENTITY_PREFETCH_FRESH_SECONDS
+        )
+
+    if cached is not None:
+        # Check if expired (for non-place_id data)
+        return cached if _is_entity_fresh(cached) else None
+    if prefetch_fresh:
+        return None
+
     try:
         supabase = get_supabase_client()
 
-        result = (
+        result = await execute_async(
             supabase.table("entity_link_cache")
             .select("*")
             .eq("name_normalized", name_normalized)
             .eq("entity_type", entity_type)
             .eq("location_context", location_context)
             .limit(1)
-            .execute()
         )
 
         if result.data:
             cached = result.data[0]
+            with _entity_lock:
+                _remember_entity(key, cached)
             # Check if expired (for non-place_id data)
-            if cached.get("expires_at"):
-                expires_at = datetime.fromisoformat(
-                    cached["expires_at"].replace("Z", "+00:00")
-                )
-                if expires_at < datetime.now(expires_at.tzinfo):
-                    return None  # Expired
-            return cached
+            return cached if _is_entity_fresh(cached) else None
         return None
     except Exception as e:
         print(f"Cache lookup failed: {e}")
         return None
 
 
-def _cache_entity(
+async def _cache_entity(
     name_normalized: str,
     entity_type: str,
     location_context: str,
@@ -485,38 +613,43 @@ def _cache_entity(
     confidence: float = 0.0,
     expires_days: int = 90,
 ) -> bool:
-    """Cache entity resolution result."""
-    try:
-        supabase = get_supabase_client()
+    """Cache entity resolution result.
 
-        # Set expiration for volatile data (not place_id)
-        expires_at = None
-        if direct_url or affiliate_url:
-            expires_at = (datetime.now(timezone.utc) + timedelta(days=expires_days)).isoformat()
+    The row is visible to lookups immediately and written to Supabase by
+    the next flush_entity_cache(), which runs on the DB pool here once
+    enough rows are buffered.
+    """
+    # Set expiration for volatile data (not place_id)
+    expires_at = None
+    if direct_url or affiliate_url:
+        expires_at = (datetime.now(timezone.utc) + timedelta(days=expires_days)).isoformat()
+
+    data = {
+        "name_normalized": name_normalized,
+        "entity_type": entity_type,
+        "location_context": location_context,
+        "google_place_id": google_place_id,
+        "resolved_name": resolved_name,
+        "direct_url": direct_url,
+        "maps_url": maps_url,
+        "affiliate_url": affiliate_url,
+        "affiliate_program": affiliate_program,
+        "resolution_source": resolution_source,
+        "confidence": confidence,
+        "expires_at": expires_at,
+    }
 
-        data = {
-            "name_normalized": name_normalized,
-            "entity_type": entity_type,
-            "location_context": location_context,
-            "google_place_id": google_place_id,
-            "resolved_name": resolved_name,
-            "direct_url": direct_url,
-            "maps_url": maps_url,
-            "affiliate_url": affiliate_url,
-            "affiliate_program": affiliate_program,
-            "resolution_source": resolution_source,
-            "confidence": confidence,
-            "expires_at": expires_at,
-        }
+    key = (name_normalized, entity_type, location_context)
+    with _entity_lock:
+        _remember_entity(key, data)
+        # Later writes for the same key replace earlier ones (one row per key per batch)
+        _pending_entity_rows[key] = data
+        flush_due = len(_pending_entity_rows) >= ENTITY_FLUSH_THRESHOLD
 
-        supabase.table("entity_link_cache").upsert(
-            data, on_conflict="name_normalized,entity_type,location_context"
-        ).execute()
+    if flush_due:
+        await run_db(flush_entity_cache)
 
-        return True
-    except Exception as e:
-        print(f"Cache write failed: {e}")
-        return False
+    return True
 
 
 # ============================================================================
@@ -557,7 +690,7 @@ async def resolve_google_place(
     name_normalized = _normalize_entity_name(name)
 
     # Check cache first
-    cached = _get_cached_entity(name_normalized, entity_type, location_context)
+    cached = await _get_cached_entity(name_normalized, entity_type, location_context)
     if cached:
         return ResolvedEntity(
             name=name,
@@ -597,83 +730,85 @@ async def resolve_google_place(
     search_query = f"{name} {location_context}"
 
     try:
-        async with httpx.AsyncClient() as client:
-            # Use Text Search (New) API
-            # Include places.types in FieldMask for type cross-validation (zero extra API cost)
-            url = "https://places.googleapis.com/v1/places:searchText"
-            headers = {
-                "Content-Type": "application/json",
-                "X-Goog-Api-Key": api_key,
-                "X-Goog-FieldMask": "places.id,places.displayName,places.websiteUri,places.formattedAddress,places.types",
-            }
-            body = {
-                "textQuery": search_query,
-                "maxResultCount": 1,
-            }
-            if included_type:
-                body["includedType"] = included_type
+        client = get_http_client("google_places")
+
+        # Use Text Search (New) API
+        # Include places.types in FieldMask for type cross-validation (zero extra API cost)
+        url = "https://places.googleapis.com/v1/places:searchText"
+        headers = {
+            "Content-Type": "application/json",
+            "X-Goog-Api-Key": api_key,
+            "X-Goog-FieldMask": "places.id,places.displayName,places.websiteUri,places.formattedAddress,places.types",
+        }
+        body = {
+            "textQuery": search_query,
+            "maxResultCount": 1,
+        }
+        if included_type:
+            body["includedType"] = included_type
 
+        async with provider_slot("google_places"):
             response = await client.post(url, headers=headers, json=body, timeout=10)
 
-            if response.status_code != 200:
-                print(f"Google Places API error: {response.status_code} - {response.text[:500]}")
-                return None
+        if response.status_code != 200:
+            print(f"Google Places API error: {response.status_code} - {response.text[:500]}")
+            return None
 
-            data = response.json()
-            places = data.get("places", [])
+        data = response.json()
+        places = data.get("places", [])
 
-            if not places:
-                # Cache negative result to avoid repeated lookups
-                _cache_entity(
-                    name_normalized,
-                    entity_type,
-                    location_context,
-                    resolution_source="google_places",
-                    confidence=0.0,
-                    expires_days=7,  # Shorter TTL for negative results
-                )
-                return None
-
-            place = places[0]
-            place_id = place.get("id")
-            resolved_name = place.get("displayName", {}).get("text")
-            website_url = place.get("websiteUri")
-            # Validate URL scheme — only accept http/https
-            if website_url:
-                parsed_url = urlparse(website_url)
-                if parsed_url.scheme not in ("http", "https"):
-                    website_url = None
-            places_types = place.get("types", [])
-            maps_url = _build_maps_url(place_id) if place_id else None
-
-            # Calculate confidence: name similarity + type cross-validation
-            name_confidence = _calculate_name_confidence(name, resolved_name, entity_type)
-            type_penalty = _validate_places_types(entity_type, places_types)
-            confidence = max(0.0, name_confidence - type_penalty)
-
-            # Cache the result
-            _cache_entity(
+        if not places:
+            # Cache negative result to avoid repeated lookups
+            await _cache_entity(
                 name_normalized,
                 entity_type,
                 location_context,
-                google_place_id=place_id,
-                resolved_name=resolved_name,
-                direct_url=website_url,
-                maps_url=maps_url,
                 resolution_source="google_places",
-                confidence=confidence,
+                confidence=0.0,
+                expires_days=7,  # Shorter TTL for negative results
             )
+            return None
+
+        place = places[0]
+        place_id = place.get("id")
+        resolved_name = place.get("displayName", {}).get("text")
+        website_url = place.get("websiteUri")
+        # Validate URL scheme — only accept http/https
+        if website_url:
+            parsed_url = urlparse(website_url)
+            if parsed_url.scheme not in ("http", "https"):
+                website_url = None
+        places_types = place.get("types", [])
+        maps_url = _build_maps_url(place_id) if place_id else None
+
+        # Calculate confidence: name similarity + type cross-validation
+        name_confidence = _calculate_name_confidence(name, resolved_name, entity_type)
+        type_penalty = _validate_places_types(entity_type, places_types)
+        confidence = max(0.0, name_confidence - type_penalty)
+
+        # Cache the result
+        await _cache_entity(
+            name_normalized,
+            entity_type,
+            location_context,
+            google_place_id=place_id,
+            resolved_name=resolved_name,
+            direct_url=website_url,
+            maps_url=maps_url,
+            resolution_source="google_places",
+            confidence=confidence,
+        )
 
-            return ResolvedEntity(
-                name=name,
-                entity_type=entity_type,
-                google_place_id=place_id,
-                resolved_name=resolved_name,
-                direct_url=website_url,
-                maps_url=maps_url,
-                confidence=confidence,
-                from_cache=False,
-            )
+        return ResolvedEntity(
+            name=name,
+            entity_type=entity_type,
+            google_place_id=place_id,
+            resolved_name=resolved_name,
+            direct_url=website_url,
+            maps_url=maps_url,
+            confidence=confidence,
+            from_cache=False,
+        )
 
     except Exception as e:
         print(f"Google Places lookup failed: {e}")
@@ -804,7 +939,7 @@ async def resolve_entity_link(
 
                 # Update cache with affiliate data
                 name_normalized = _normalize_entity_name(name)
-                _cache_entity(
+                await _cache_entity(
                     name_normalized,
                     entity_type,
                     location_context,
@@ -1105,236 +1240,436 @@ class LinkInjectionResult:
     error: str | None = None
 
 
-async def inject_external_links(
+# Entity resolutions in flight at once (each may hit Supabase + Google Places)
+RESOLVE_CONCURRENCY = 8
+
+
+@dataclass
+class _LinkTarget:
+    """Where an entity should link, decided before the HTML is touched."""
+
+    entity_name: str
+    entity_type: str
+    url: str  # Final href (UTM params already applied)
+    is_affiliate: bool = False
+    affiliate_program: str | None = None
+    rel_attribute: str = ""
+    is_maps_search_fallback: bool = False
+    is_resort_crosslink: bool = False
+
+    def anchor(self, original_text: str, strong: bool) -> str:
+        safe_url = html.escape(self.url, quote=True)
+        inner = f"<strong>{original_text}</strong>" if strong else original_text
+        if self.is_resort_crosslink:
+            return f'<a href="{safe_url}" class="resort-link">{inner}</a>'
+        return f'<a href="{safe_url}" rel="{self.rel_attribute}" target="_blank">{inner}</a>'
+
+
+@dataclass
+class _SectionPlan:
+    """Extracted candidates and resolved targets for one section."""
+
+    entities: list[Any]  # ExtractedEntity, sorted by first mention
+    targets: dict[str, _LinkTarget | None]  # Keyed by entity.name.lower()
+
+
+class _Occurrence(NamedTuple):
+    """A place in the HTML where an entity name could be linked."""
+
+    start: int  # Span replaced by the link
+    end: int
+    text_start: int  # The entity text inside the span
+    text_end: int
+
+
+async def _extract_link_candidates(
     html_content: str,
     resort_name: str,
     country: str,
-    section_name: str | None = None,
-    already_linked: set[str] | None = None,
-    max_links_per_section: int | None = None,
-    resort_slug: str | None = None,
-) -> LinkInjectionResult:
-    """Inject external links into HTML content.
+    section_name: str | None,
+) -> list[Any]:
+    """Extract linkable entities, in order of first mention."""
+    from .intelligence import extract_linkable_entities
 
-    Extracts linkable entities, resolves them via brand registry / Google
-    Places / Maps search fallback, and injects links into the first mention.
+    extraction_result = await extract_linkable_entities(
+        content=html_content,
+        resort_name=resort_name,
+        country=country,
+        section_name=section_name,
+    )
+    return sorted(extraction_result.entities, key=lambda e: e.first_mention_offset)
 
-    Args:
-        html_content: HTML content to inject links into
-        resort_name: Name of the resort for context
-        country: Country for context/disambiguation
-        section_name: Optional section name for logging and per-section caps
-        already_linked: Set of entity names already linked (to avoid duplicates)
-        max_links_per_section: Override for section link cap
-        resort_slug: Resort slug for UTM tracking (optional)
+
+async def _resolve_link_targets(
+    entities: list[Any],
+    location_context: str,
+    resort_slug: str | None,
+    skip: set[str],
+    resolutions: dict[tuple[str, str], asyncio.Task],
+    slots: asyncio.Semaphore,
+) -> dict[str, _LinkTarget | None]:
+    """Resolve candidate entities concurrently.
+
+    Entities sharing a normalized name and type are resolved once, including
+    across sections that share the same `resolutions` dict.
 
     Returns:
-        LinkInjectionResult with modified content and injection details
+        Link target (or None if unresolved) keyed by entity.name.lower()
     """
-    from .intelligence import extract_linkable_entities
     from .links import add_utm_params
 
-    if already_linked is None:
-        already_linked = set()
-
-    # Use per-section caps if no override provided
-    if max_links_per_section is None:
-        max_links_per_section = SECTION_LINK_CAPS.get(section_name or "", 5)
-
-    injected_links: list[InjectedLink] = []
-    not_resolved: list[str] = []
-    modified_content = html_content
-    location_context = f"{resort_name}, {country}"
+    async def _resolve(name: str, entity_type: str) -> ResolvedEntity | None:
+        async with slots:
+            return await resolve_entity_link(
+                name=name,
+                entity_type=entity_type,
+                location_context=location_context,
+                include_affiliate=True,
+            )
 
-    try:
-        # Extract entities from content
-        extraction_result = await extract_linkable_entities(
-            content=html_content,
-            resort_name=resort_name,
-            country=country,
-            section_name=section_name,
-        )
+    candidates = []
+    for entity in entities:
+        key = entity.name.lower()
+        if key in skip or entity.confidence < 0.5:
+            continue
+        if any(key == c.name.lower() for c in candidates):
+            continue
+        candidates.append(entity)
+
+    targets: dict[str, _LinkTarget | None] = {}
+    pending: dict[str, asyncio.Task] = {}
+
+    for entity in candidates:
+        key = entity.name.lower()
+
+        # Published resorts get an internal link instead of an external one
+        resort_match = _match_published_resort(entity.name)
+        if resort_match and resort_match["slug"] != resort_slug:
+            country_slug = resort_match["country"].lower().replace(" ", "-")
+            targets[key] = _LinkTarget(
+                entity_name=entity.name,
+                entity_type="resort_crosslink",
+                url=f"/resorts/{country_slug}/{resort_match['slug']}",
+                is_resort_crosslink=True,
+            )
+            continue
 
-        if not extraction_result.entities:
-            return LinkInjectionResult(
-                modified_content=html_content,
-                links_injected=[],
-                injection_count=0,
-                entities_not_resolved=[],
-                success=True,
+        resolution_key = (_normalize_entity_name(entity.name), entity.entity_type)
+        if resolution_key not in resolutions:
+            resolutions[resolution_key] = asyncio.ensure_future(
+                _resolve(entity.name, entity.entity_type)
             )
+        pending[key] = resolutions[resolution_key]
 
-        # Process entities in order of first mention
-        entities_sorted = sorted(
-            extraction_result.entities,
-            key=lambda e: e.first_mention_offset,
-        )
+    await asyncio.gather(*pending.values(), return_exceptions=True)
 
-        links_added = 0
-
-        for entity in entities_sorted:
-            # Skip if already linked or max reached
-            if entity.name.lower() in {name.lower() for name in already_linked}:
-                continue
-            if links_added >= max_links_per_section:
-                break
-
-            # Skip low confidence extractions (lowered threshold for wider net)
-            if entity.confidence < 0.5:
-                continue
-
-            # Check if entity matches a published resort → internal link priority
-            resort_match = _match_published_resort(entity.name)
-            if resort_match and resort_match["slug"] != resort_slug:
-                country_slug = resort_match["country"].lower().replace(" ", "-")
-                internal_href = f"/resorts/{country_slug}/{resort_match['slug']}"
-                safe_url = html.escape(internal_href, quote=True)
-                escaped_name = re.escape(entity.name)
-
-                # Try to inject the internal link
-                strong_pattern = rf'<strong>({escaped_name})</strong>(?![^<]*</a>)'
-                match = re.search(strong_pattern, modified_content, re.IGNORECASE)
-                if match:
-                    original_text = match.group(1)
-                    modified_content = (
-                        modified_content[:match.start()]
-                        + f'<a href="{safe_url}" class="resort-link"><strong>{original_text}</strong></a>'
-                        + modified_content[match.end():]
-                    )
-                else:
-                    plain_pattern = rf'(?<!["\'/])(?<!<)\b({escaped_name})\b(?![^<]*</a>)'
-                    match = re.search(plain_pattern, modified_content, re.IGNORECASE)
-                    if match:
-                        original_text = match.group(1)
-                        modified_content = (
-                            modified_content[:match.start(1)]
-                            + f'<a href="{safe_url}" class="resort-link">{original_text}</a>'
-                            + modified_content[match.end(1):]
-                        )
-
-                if match:
-                    injected_links.append(
-                        InjectedLink(
-                            entity_name=entity.name,
-                            entity_type="resort_crosslink",
-                            original_text=match.group(1) if match.lastindex else entity.name,
-                            url=internal_href,
-                            is_affiliate=False,
-                            rel_attribute="",
-                        )
-                    )
-                    already_linked.add(entity.name)
-                    links_added += 1
-                continue
-
-            # Resolve entity to links (3-tier: brand → Places → Maps search)
-            resolved = await resolve_entity_link(
-                name=entity.name,
-                entity_type=entity.entity_type,
-                location_context=location_context,
-                include_affiliate=True,
-            )
+    # One batched write for every cache row this section produced
+    await run_db(flush_entity_cache)
 
-            if not resolved:
-                not_resolved.append(entity.name)
-                continue
+    for entity in candidates:
+        key = entity.name.lower()
+        if key not in pending:
+            continue
 
-            # Context-aware destination logic
-            choice = _choose_link_url(resolved)
+        try:
+            resolved = pending[key].result()
+        except Exception as e:
+            logger.warning(f"[external_links] Failed to resolve {entity.name}: {e}")
+            resolved = None
 
-            if not choice.url:
-                not_resolved.append(entity.name)
-                continue
+        # Context-aware destination logic
+        choice = _choose_link_url(resolved) if resolved else None
+        if not choice or not choice.url:
+            targets[key] = None
+            continue
 
-            link_url = choice.url
+        link_url = choice.url
 
-            # Add UTM params to non-affiliate, non-Maps-search links
-            if not choice.is_affiliate and not choice.is_maps_search_fallback and resort_slug:
-                link_url = add_utm_params(
-                    url=link_url,
-                    resort_slug=resort_slug,
-                    category=entity.entity_type,
-                    campaign="in_content",
-                )
+        # Add UTM params to non-affiliate, non-Maps-search links
+        if not choice.is_affiliate and not choice.is_maps_search_fallback and resort_slug:
+            link_url = add_utm_params(
+                url=link_url,
+                resort_slug=resort_slug,
+                category=entity.entity_type,
+                campaign="in_content",
+            )
 
-            # Build the link HTML
-            rel_attr = get_rel_attribute(
+        targets[key] = _LinkTarget(
+            entity_name=entity.name,
+            entity_type=entity.entity_type,
+            url=link_url,
+            is_affiliate=choice.is_affiliate,
+            affiliate_program=resolved.affiliate_program,
+            rel_attribute=get_rel_attribute(
                 is_affiliate=choice.is_affiliate,
                 is_maps_place_link=choice.is_maps_place_link,
                 is_maps_search_fallback=choice.is_maps_search_fallback,
-            )
+            ),
+            is_maps_search_fallback=choice.is_maps_search_fallback,
+        )
 
-            # Inject link at first mention (case-insensitive)
-            # Two-pass strategy: most entities are inside <strong> tags (Round 20+),
-            # but some appear as plain text.
-            safe_url = html.escape(link_url, quote=True)
-            escaped_name = re.escape(entity.name)
-            injected = False
-
-            # Pass 1: Match entity wrapped in <strong> tags
-            strong_pattern = rf'<strong>({escaped_name})</strong>(?![^<]*</a>)'
-            match = re.search(strong_pattern, modified_content, re.IGNORECASE)
-
-            if match:
-                original_text = match.group(1)
-                link_html_with_original = f'<a href="{safe_url}" rel="{rel_attr}" target="_blank"><strong>{original_text}</strong></a>'
-                # Replace the full <strong>...</strong> span
-                modified_content = (
-                    modified_content[:match.start()]
-                    + link_html_with_original
-                    + modified_content[match.end():]
-                )
-                injected = True
-
-            # Pass 2: Fall back to plain text match (not inside tags or attributes)
-            if not injected:
-                plain_pattern = rf'(?<!["\'/])(?<!<)\b({escaped_name})\b(?![^<]*</a>)'
-                match = re.search(plain_pattern, modified_content, re.IGNORECASE)
-
-                if match:
-                    original_text = match.group(1)
-                    link_html_with_original = f'<a href="{safe_url}" rel="{rel_attr}" target="_blank">{original_text}</a>'
-                    modified_content = (
-                        modified_content[:match.start(1)]
-                        + link_html_with_original
-                        + modified_content[match.end(1):]
-                    )
-                    injected = True
-
-            if injected:
-                injected_links.append(
-                    InjectedLink(
-                        entity_name=entity.name,
-                        entity_type=entity.entity_type,
-                        original_text=original_text,
-                        url=link_url,
-                        is_affiliate=choice.is_affiliate,
-                        affiliate_program=resolved.affiliate_program,
-                        rel_attribute=rel_attr,
-                        is_maps_search_fallback=choice.is_maps_search_fallback,
-                    )
-                )
+    return targets
 
-                already_linked.add(entity.name)
-                links_added += 1
 
-        return LinkInjectionResult(
-            modified_content=modified_content,
-            links_injected=injected_links,
-            injection_count=len(injected_links),
-            entities_not_resolved=not_resolved,
-            success=True,
+# Same match rules as the original per-entity regexes:
+# - strong: the whole <strong>name</strong> span, not already inside a link
+# - plain: a whole-word mention, not in an attribute/tag and not inside a link
+_STRONG_MENTION = r'<strong>({names})</strong>(?![^<]*</a>)'
+_PLAIN_MENTION = r'(?<!["\'/])(?<!<)\b({names})\b(?![^<]*</a>)'
+
+
+def _find_occurrences(
+    html_content: str,
+    names: list[str],
+) -> dict[str, tuple[list[_Occurrence], list[_Occurrence]]]:
+    """Find every strong and plain mention of every name in one scan.
+
+    All names are compiled into one alternation (longest first) inside a
+    zero-width lookahead, so mentions are found at every position. A name
+    that is a prefix of a longer name can be shadowed by it at the same
+    position; those few are scanned separately.
+
+    Returns:
+        {name.lower(): (strong occurrences, plain occurrences)} in document order
+    """
+    found: dict[str, tuple[list[_Occurrence], list[_Occurrence]]] = {
+        name.lower(): ([], []) for name in names
+    }
+    if not names:
+        return found
+
+    ordered = sorted({name.lower(): name for name in names}.values(), key=len, reverse=True)
+
+    def _scan(scan_names: list[str]) -> None:
+        alternation = "|".join(re.escape(name) for name in scan_names)
+        matcher = re.compile(
+            rf"(?=(?P<strong>{_STRONG_MENTION.format(names=alternation)}))"
+            rf"|(?=(?P<plain>{_PLAIN_MENTION.format(names=alternation)}))",
+            re.IGNORECASE,
         )
+        for match in matcher.finditer(html_content):
+            # Groups: 1 = strong span, 2 = its name, 3 = plain span, 4 = its name
+            is_strong = match.group("strong") is not None
+            span, name_group = (1, 2) if is_strong else (3, 4)
+            key = match.group(name_group).lower()
+            if key in found:
+                found[key][0 if is_strong else 1].append(_Occurrence(
+                    match.start(span), match.end(span),
+                    match.start(name_group), match.end(name_group),
+                ))
+
+    _scan(ordered)
+
+    lowered = [name.lower() for name in ordered]
+    shadowed = [
+        name for name in ordered
+        if any(other != name.lower() and other.startswith(name.lower()) for other in lowered)
+    ]
+    if shadowed:
+        for name in shadowed:
+            found[name.lower()] = ([], [])
+            _scan([name])
 
-    except Exception as e:
+    return found
+
+
+def _apply_link_targets(
+    html_content: str,
+    plan: _SectionPlan,
+    already_linked: set[str],
+    max_links: int,
+) -> tuple[str, list[InjectedLink], list[str]]:
+    """Inject links for a section in a single pass over its HTML.
+
+    Entities are taken in first-mention order. Each links its first
+    <strong> mention if it has one, otherwise its first plain mention,
+    skipping spans already claimed by an earlier entity. Stops at max_links.
+
+    Returns:
+        (modified HTML, injected links, names that could not be resolved)
+    """
+    linked_lower = {name.lower() for name in already_linked}
+    resolvable = [target.entity_name for target in plan.targets.values() if target]
+    occurrences = _find_occurrences(html_content, resolvable)
+
+    chosen: list[tuple[_Occurrence, bool, _LinkTarget]] = []
+    injected: list[InjectedLink] = []
+    not_resolved: list[str] = []
+
+    def _free(occurrence: _Occurrence) -> bool:
+        return all(
+            occurrence.end <= other.start or occurrence.start >= other.end
+            for other, _, _ in chosen
+        )
+
+    for entity in plan.entities:
+        key = entity.name.lower()
+        if key in linked_lower:
+            continue
+        if len(injected) >= max_links:
+            break
+        if entity.confidence < 0.5:
+            continue
+
+        target = plan.targets.get(key)
+        if target is None:
+            not_resolved.append(entity.name)
+            continue
+
+        strong_hits, plain_hits = occurrences.get(key, ([], []))
+        pick = next((o for o in strong_hits if _free(o)), None)
+        is_strong = pick is not None
+        if pick is None:
+            pick = next((o for o in plain_hits if _free(o)), None)
+        if pick is None:
+            continue
+
+        chosen.append((pick, is_strong, target))
+        original_text = html_content[pick.text_start:pick.text_end]
+        injected.append(
+            InjectedLink(
+                entity_name=entity.name,
+                entity_type=target.entity_type,
+                original_text=original_text,
+                url=target.url,
+                is_affiliate=target.is_affiliate,
+                affiliate_program=target.affiliate_program,
+                rel_attribute=target.rel_attribute,
+                is_maps_search_fallback=target.is_maps_search_fallback,
+            )
+        )
+        already_linked.add(entity.name)
+        linked_lower.add(key)
+
+    # Rewrite the HTML once, left to right
+    parts: list[str] = []
+    cursor = 0
+    for occurrence, is_strong, target in sorted(chosen, key=lambda c: c[0].start):
+        original_text = html_content[occurrence.text_start:occurrence.text_end]
+        parts.append(html_content[cursor:occurrence.start])
+        parts.append(target.anchor(original_text, strong=is_strong))
+        cursor = occurrence.end
+    parts.append(html_content[cursor:])
+
+    return "".join(parts), injected, not_resolved
+
+
+async def _plan_section(
+    html_content: str,
+    resort_name: str,
+    country: str,
+    section_name: str | None,
+    resort_slug: str | None,
+    skip: set[str],
+    resolutions: dict[tuple[str, str], asyncio.Task],
+    slots: asyncio.Semaphore,
+) -> _SectionPlan:
+    """Extract and resolve a section's entities (no HTML changes yet)."""
+    entities = await _extract_link_candidates(html_content, resort_name, country, section_name)
+    targets = await _resolve_link_targets(
+        entities,
+        location_context=f"{resort_name}, {country}",
+        resort_slug=resort_slug,
+        skip=skip,
+        resolutions=resolutions,
+        slots=slots,
+    )
+    return _SectionPlan(entities=entities, targets=targets)
+
+
+def _finish_section(
+    html_content: str,
+    plan: _SectionPlan,
+    section_name: str | None,
+    already_linked: set[str],
+    max_links_per_section: int | None = None,
+) -> LinkInjectionResult:
+    """Apply a section's resolved plan and package the result."""
+    # Use per-section caps if no override provided
+    if max_links_per_section is None:
+        max_links_per_section = SECTION_LINK_CAPS.get(section_name or "", 5)
+
+    if not plan.entities:
         return LinkInjectionResult(
             modified_content=html_content,
             links_injected=[],
             injection_count=0,
             entities_not_resolved=[],
-            success=False,
-            error=str(e),
+            success=True,
+        )
+
+    modified_content, injected_links, not_resolved = _apply_link_targets(
+        html_content, plan, already_linked, max_links_per_section
+    )
+    return LinkInjectionResult(
+        modified_content=modified_content,
+        links_injected=injected_links,
+        injection_count=len(injected_links),
+        entities_not_resolved=not_resolved,
+        success=True,
+    )
+
+
+def _failed_section(html_content: str, error: Exception) -> LinkInjectionResult:
+    """Leave the section untouched and report the error."""
+    return LinkInjectionResult(
+        modified_content=html_content,
+        links_injected=[],
+        injection_count=0,
+        entities_not_resolved=[],
+        success=False,
+        error=str(error),
+    )
+
+
+async def inject_external_links(
+    html_content: str,
+    resort_name: str,
+    country: str,
+    section_name: str | None = None,
+    already_linked: set[str] | None = None,
+    max_links_per_section: int | None = None,
+    resort_slug: str | None = None,
+) -> LinkInjectionResult:
+    """Inject external links into HTML content.
+
+    Extracts linkable entities, resolves them via brand registry / Google
+    Places / Maps search fallback, and injects links into the first mention.
+    Entities are resolved concurrently; links are then injected in a single
+    pass over the HTML.
+
+    Args:
+        html_content: HTML content to inject links into
+        resort_name: Name of the resort for context
+        country: Country for context/disambiguation
+        section_name: Optional section name for logging and per-section caps
+        already_linked: Set of entity names already linked (to avoid duplicates)
+        max_links_per_section: Override for section link cap
+        resort_slug: Resort slug for UTM tracking (optional)
+
+    Returns:
+        LinkInjectionResult with modified content and injection details
+    """
+    if already_linked is None:
+        already_linked = set()
+
+    try:
+        await ensure_entity_prefetch(f"{resort_name}, {country}")
+        plan = await _plan_section(
+            html_content,
+            resort_name,
+            country,
+            section_name,
+            resort_slug,
+            skip={name.lower() for name in already_linked},
+            resolutions={},
+            slots=asyncio.Semaphore(RESOLVE_CONCURRENCY),
         )
+        return _finish_section(
+            html_content, plan, section_name, already_linked, max_links_per_section
+        )
+    except Exception as e:
+        return _failed_section(html_content, e)
 
 
 async def inject_links_in_content_sections(
@@ -1345,9 +1680,12 @@ async def inject_links_in_content_sections(
 ) -> tuple[dict[str, str], list[InjectedLink]]:
     """Inject external links across multiple content sections.
 
-    Processes sections in order, tracking already-linked entities to avoid
-    redundant links across sections. Uses context-aware destination logic,
-    variable per-section caps, and adds UTM params to non-affiliate links.
+    Extraction and resolution run for all sections concurrently (an entity
+    mentioned in several sections is resolved once). Injection then runs
+    section by section in order, tracking already-linked entities so earlier
+    sections keep priority for first-mention links. Uses context-aware
+    destination logic, variable per-section caps, and adds UTM params to
+    non-affiliate links.
 
     Args:
         content: Dict of section_name -> HTML content
@@ -1370,26 +1708,46 @@ async def inject_links_in_content_sections(
         "parent_reviews_summary",
     ]
 
+    sections = [
+        name for name in section_order
+        if name in content and content[name] and isinstance(content[name], str)
+    ]
+
+    # One query loads every cached entity for this resort
+    await ensure_entity_prefetch(f"{resort_name}, {country}")
+
+    resolutions: dict[tuple[str, str], asyncio.Task] = {}
+    slots = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+    plans = await asyncio.gather(
+        *[
+            _plan_section(
+                content[name],
+                resort_name,
+                country,
+                name,
+                resort_slug,
+                skip=set(),  # Earlier sections' links aren't known yet
+                resolutions=resolutions,
+                slots=slots,
+            )
+            for name in sections
+        ],
+        return_exceptions=True,
+    )
+
     already_linked: set[str] = set()
     all_injected_links: list[InjectedLink] = []
     modified_content = dict(content)
 
-    for section_name in section_order:
-        if section_name not in content:
-            continue
-
+    for section_name, plan in zip(sections, plans):
         html_content = content[section_name]
-        if not html_content or not isinstance(html_content, str):
-            continue
-
-        result = await inject_external_links(
-            html_content=html_content,
-            resort_name=resort_name,
-            country=country,
-            section_name=section_name,
-            already_linked=already_linked,
-            resort_slug=resort_slug,
-        )
+        if isinstance(plan, Exception):
+            result = _failed_section(html_content, plan)
+        else:
+            try:
+                result = _finish_section(html_content, plan, section_name, already_linked)
+            except Exception as e:
+                result = _failed_section(html_content, e)
 
         if result.success:
             modified_content[section_name] = result.modified_content
@@ -1403,6 +1761,14 @@ async def inject_links_in_content_sections(
 # =============================================================================
 
 
+# Politeness defaults: the cache holds many links per booking/brand domain
+VALIDATION_CONCURRENCY = 20          # In-flight checks across all hosts
+VALIDATION_PER_HOST = 2              # In-flight checks per host
+VALIDATION_HOST_INTERVAL = 0.5       # Min seconds between request starts per host
+VALIDATION_WRITE_CHUNK = 200         # Row ids per bulk status update
+VALIDATION_MAX_RETRIES = 2           # Runs a transient failure is retried before it's recorded
+
+
 @dataclass
 class LinkValidationResult:
     """Result of validating external links."""
@@ -1414,11 +1780,116 @@ class LinkValidationResult:
     skipped_count: int
     broken_links: list[dict]  # List of {url, name, entity_type, error}
     error: str | None = None
+    unique_urls: int = 0
+
+
+class _UrlCheck(NamedTuple):
+    """Outcome of checking one URL."""
+
+    status: str  # ok, broken, rate_limited, error
+    status_code: int | None = None
+    error: str | None = None
+    transient: bool = False  # Timeout, connection failure or 429: worth retrying soon
+
+
+class _HostThrottle:
+    """Per-host concurrency cap plus a minimum gap between request starts."""
+
+    def __init__(self, per_host: int, min_interval: float):
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._last_start: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        semaphore = self._slots.setdefault(host, asyncio.Semaphore(self.per_host))
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with semaphore:
+            async with lock:
+                loop = asyncio.get_running_loop()
+                wait = self._last_start.get(host, 0.0) + self.min_interval - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_start[host] = loop.time()
+            yield
+
+
+async def _check_url(
+    http_client: httpx.AsyncClient,
+    url: str,
+    throttle: _HostThrottle,
+    slots: asyncio.Semaphore,
+) -> _UrlCheck:
+    """HEAD a URL (falling back to GET when HEAD isn't allowed)."""
+    host = urlparse(url).netloc.lower()
+
+    # Global slot first: host spacing is measured from when a request can
+    # actually start, not from before a wait on the global cap
+    async with slots, throttle.slot(host):
+        try:
+            # HEAD request is faster and sufficient for validation
+            resp = await http_client.head(url)
+
+            if resp.status_code == 405:
+                # Some servers don't allow HEAD, try GET
+                resp = await http_client.get(url)
+
+            if resp.status_code < 400:
+                return _UrlCheck("ok", resp.status_code)
+            if resp.status_code == 429:
+                # Host is throttling us, not a broken link: retry next run
+                return _UrlCheck("rate_limited", 429, "HTTP 429", transient=True)
+            return _UrlCheck("broken", resp.status_code, f"HTTP {resp.status_code}")
+
+        except httpx.TimeoutException:
+            return _UrlCheck("broken", None, "Timeout", transient=True)
+        except httpx.NetworkError:
+            return _UrlCheck("broken", None, "Connection failed", transient=True)
+        except Exception as e:
+            # Redirect loops, invalid URLs, protocol errors: won't fix themselves
+            return _UrlCheck("error", None, str(e)[:200])
+
+
+def _write_link_checks(
+    client: Any,
+    checks_by_row: dict[str, tuple[_UrlCheck, int | None]],
+    checked_at: str,
+) -> None:
+    """Write check results back, one update per distinct outcome per chunk.
+
+    Args:
+        checks_by_row: row id -> (outcome, retry attempt). Rows with a retry
+            attempt keep their old last_checked_at so the cursor picks them
+            up again next run; the rest are stamped and their attempts reset.
+        checked_at: ISO timestamp to stamp
+    """
+    rows_by_outcome: dict[tuple[_UrlCheck, int | None], list[str]] = {}
+    for row_id, outcome in checks_by_row.items():
+        rows_by_outcome.setdefault(outcome, []).append(row_id)
+
+    for (check, retry_attempt), row_ids in rows_by_outcome.items():
+        for start in range(0, len(row_ids), VALIDATION_WRITE_CHUNK):
+            chunk = row_ids[start:start + VALIDATION_WRITE_CHUNK]
+            update = {
+                "link_status": check.status,
+                "last_status_code": check.status_code,
+                "last_check_error": check.error,
+                "check_attempts": retry_attempt or 0,
+            }
+            if retry_attempt is None:
+                update["last_checked_at"] = checked_at
+            try:
+                client.table("entity_link_cache").update(update).in_("id", chunk).execute()
+            except Exception as e:
+                logger.warning(f"[link_validation] Failed to record {len(chunk)} results: {e}")
 
 
 async def validate_external_links(
-    max_links: int = 100,
+    max_links: int = 500,
     timeout_seconds: float = 10.0,
+    max_concurrency: int = VALIDATION_CONCURRENCY,
 ) -> LinkValidationResult:
     """
     Validate external links in entity_link_cache.
@@ -1426,22 +1897,34 @@ async def validate_external_links(
     Checks if direct_url links return 200 OK.
     Run weekly to detect broken links that hurt SEO trust signals.
 
+    Each run takes the max_links rows with the oldest last_checked_at
+    (never-checked first) and records the outcome on them, so consecutive
+    runs walk the whole cache. Transient failures (timeouts, connection
+    errors, HTTP 429) keep their place and are retried on the next
+    VALIDATION_MAX_RETRIES runs before being recorded like any other
+    outcome, so they can't hold the front of the cursor for good. Rows
+    sharing a URL are checked once. Checks
+    run concurrently over one pooled client, with a per-host cap and
+    spacing so no single site gets hammered.
+
     Args:
         max_links: Maximum number of links to check per run
         timeout_seconds: Timeout for each HTTP request
+        max_concurrency: Maximum checks in flight across all hosts
 
     Returns:
         LinkValidationResult with counts and broken links list
     """
     client = get_supabase_client()
 
-    # Get links to validate (direct_url not null)
-    response = (
+    # Next slice of the cache: least recently checked first
+    response = await execute_async(
         client.table("entity_link_cache")
-        .select("id, name_normalized, entity_type, location_context, direct_url")
+        .select("id, name_normalized, entity_type, location_context, direct_url, check_attempts")
         .not_.is_("direct_url", "null")
+        .order("last_checked_at", nullsfirst=True)
+        .order("id")
         .limit(max_links)
-        .execute()
     )
 
     links = response.data or []
@@ -1456,63 +1939,67 @@ async def validate_external_links(
             broken_links=[],
         )
 
-    valid = 0
-    invalid = 0
-    skipped = 0
-    broken: list[dict] = []
+    # Duplicate URLs (chains, shared booking pages) are checked once
+    rows_by_url: dict[str, list[dict]] = {}
+    for link in links:
+        url = (link.get("direct_url") or "").strip()
+        rows_by_url.setdefault(url, []).append(link)
+
+    throttle = _HostThrottle(VALIDATION_PER_HOST, VALIDATION_HOST_INTERVAL)
+    slots = asyncio.Semaphore(max(1, max_concurrency))
+    checked_urls = [url for url in rows_by_url if url]
 
     async with httpx.AsyncClient(
         timeout=timeout_seconds,
         follow_redirects=True,
         headers={"User-Agent": "Snowthere-LinkChecker/1.0"},
+        limits=httpx.Limits(
+            max_connections=max_concurrency,
+            max_keepalive_connections=max_concurrency,
+        ),
     ) as http_client:
-        for link in links:
-            url = link.get("direct_url")
-            if not url:
-                skipped += 1
-                continue
+        results = await asyncio.gather(*[
+            _check_url(http_client, url, throttle, slots) for url in checked_urls
+        ])
+    checks_by_url = dict(zip(checked_urls, results))
 
-            try:
-                # HEAD request is faster and sufficient for validation
-                resp = await http_client.head(url)
-
-                if resp.status_code == 405:
-                    # Some servers don't allow HEAD, try GET
-                    resp = await http_client.get(url)
-
-                if resp.status_code < 400:
-                    valid += 1
-                else:
-                    invalid += 1
-                    broken.append({
-                        "url": url,
-                        "name": link.get("name_normalized"),
-                        "entity_type": link.get("entity_type"),
-                        "location": link.get("location_context"),
-                        "status_code": resp.status_code,
-                        "error": f"HTTP {resp.status_code}",
-                    })
-
-            except httpx.TimeoutException:
-                invalid += 1
-                broken.append({
-                    "url": url,
-                    "name": link.get("name_normalized"),
-                    "entity_type": link.get("entity_type"),
-                    "location": link.get("location_context"),
-                    "error": "Timeout",
-                })
-            except httpx.ConnectError:
+    valid = 0
+    invalid = 0
+    skipped = 0
+    broken: list[dict] = []
+    checks_by_row: dict[str, tuple[_UrlCheck, int | None]] = {}
+
+    for url, rows in rows_by_url.items():
+        check = checks_by_url.get(url, _UrlCheck("broken", None, "Empty URL"))
+        for link in rows:
+            retry_attempt = None
+            if check.transient:
+                attempt = (link.get("check_attempts") or 0) + 1
+                if attempt <= VALIDATION_MAX_RETRIES:
+                    retry_attempt = attempt
+            checks_by_row[link["id"]] = (check, retry_attempt)
+            if retry_attempt is not None:
+                skipped += 1  # Retried next run
+            elif check.status == "ok":
+                valid += 1
+            elif check.status == "broken":
                 invalid += 1
-                broken.append({
+                entry = {
                     "url": url,
                     "name": link.get("name_normalized"),
                     "entity_type": link.get("entity_type"),
                     "location": link.get("location_context"),
-                    "error": "Connection failed",
-                })
-            except Exception:
-                skipped += 1  # Count as skipped for unexpected errors
+                    "error": check.error,
+                }
+                if check.status_code is not None:
+                    entry["status_code"] = check.status_code
+                broken.append(entry)
+            else:
+                skipped += 1  # Still rate limited, or an unexpected error
+
+    await run_db(
+        _write_link_checks, client, checks_by_row, datetime.now(timezone.utc).isoformat()
+    )
 
     return LinkValidationResult(
         success=True,
@@ -1521,4 +2008,5 @@ async def validate_external_links(
         invalid_count=invalid,
         skipped_count=skipped,
         broken_links=broken,
+        unique_urls=len(checked_urls),
     )
@@ -29,9 +29,7 @@ from datetime import datetime, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
 
-import anthropic
-
-from ..config import settings
+from ..llm_client import call_claude
 from ..supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
@@ -315,25 +313,14 @@ def get_guide_resorts(guide_id: str) -> list[dict[str, Any]]:
 # =============================================================================
 
 
-def _get_client() -> anthropic.Anthropic:
-    """Get Anthropic client instance."""
-    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-
-def _call_claude(
+async def _call_claude(
     prompt: str,
     system: str | None = None,
-    model: str = "claude-sonnet-4-20250514",
+    model: str | None = None,
     max_tokens: int = 2000,
 ) -> str:
     """Make a Claude API call and return the text response."""
-    client = _get_client()
-    messages = [{"role": "user", "content": prompt}]
-    kwargs = {"model": model, "max_tokens": max_tokens, "messages": messages}
-    if system:
-        kwargs["system"] = system
-    response = client.messages.create(**kwargs)
-    return response.content[0].text
+    return await call_claude(prompt, system=system, model=model, max_tokens=max_tokens)
 
 
 def _parse_json_response(response: str) -> dict[str, Any]:
@@ -594,7 +581,7 @@ Prioritize topics that:
 4. Fill genuine content gaps"""
 
     try:
-        response = _call_claude(prompt, system=system, max_tokens=2000)
+        response = await _call_claude(prompt, system=system, max_tokens=2000)
         parsed = _parse_json_response(response)
 
         # Merge prioritized candidates
@@ -743,7 +730,7 @@ Plan practical, actionable guides that help parents make decisions.
 Keep sections focused - don't try to cover everything in one guide."""
 
     try:
-        response = _call_claude(prompt, system=system, max_tokens=1500)
+        response = await _call_claude(prompt, system=system, max_tokens=1500)
         parsed = _parse_json_response(response)
 
         return GuideOutline(
@@ -906,7 +893,7 @@ FORMAT REQUIREMENTS FOR {section_type.upper()}:
     system = "You are writing content for Snowthere. Be smart, practical, and specific. Lead with your take, not a description. Return valid JSON only."
 
     try:
-        response = _call_claude(prompt, system=system, max_tokens=1500)
+        response = await _call_claude(prompt, system=system, max_tokens=1500)
         return _parse_json_response(response)
     except Exception as e:
         logger.error(f"Section generation failed: {e}")
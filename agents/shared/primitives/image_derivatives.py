@@ -0,0 +1,187 @@
+"""Responsive image derivatives rendered at ingest.
+
+Official, UGC and generated images used to be stored exactly as they came
+in (often multi-megabyte PNG/JPEG) and the site served that one file at
+every viewport. render_derivatives() turns one source image into a fixed
+ladder of width-bucketed WebP files (plus AVIF when enabled) and a tiny
+blurred placeholder that the web app inlines as next/image's blurDataURL.
+
+Rendering is pure CPU work on bytes. image_store.store_image() uploads the
+results next to the content-addressed original and records them so the
+resort_images row can carry their URLs and dimensions.
+
+Usage:
+    rendered = render_derivatives(image_bytes)
+    for variant in rendered.variants:
+        ...  # variant.data, variant.width, variant.content_type
+"""
+
+import base64
+import io
+import logging
+from dataclasses import dataclass, field
+
+from ..config import settings
+
+try:
+    from PIL import Image, ImageFilter, ImageOps
+except ImportError:  # Without Pillow images are stored as-is
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Width buckets (px). Sources narrower than a bucket skip it; every source
+# also gets one full-width re-encode (capped at the widest bucket).
+DERIVATIVE_WIDTHS = (480, 960, 1440, 1920)
+
+WEBP_QUALITY = 80
+AVIF_QUALITY = 55  # AVIF holds up at lower quality settings than WebP
+
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_QUALITY = 40
+
+CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+
+@dataclass
+class RenderedVariant:
+    """One encoded derivative, before upload."""
+
+    format: str  # "webp" or "avif"
+    width: int
+    height: int
+    data: bytes
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self.format]
+
+
+@dataclass
+class RenderedDerivatives:
+    """All derivatives of one source image."""
+
+    width: int  # Source dimensions (after EXIF rotation)
+    height: int
+    variants: list[RenderedVariant] = field(default_factory=list)
+    placeholder: str | None = None  # data: URI
+
+
+@dataclass
+class ImageVariant:
+    """A stored derivative."""
+
+    url: str
+    format: str
+    width: int
+    height: int
+    size: int  # bytes
+
+    def as_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "format": self.format,
+            "width": self.width,
+            "height": self.height,
+            "size": self.size,
+        }
+
+
+@dataclass
+class ImageDerivatives:
+    """Stored derivatives of one image, ready to attach to its row."""
+
+    width: int
+    height: int
+    variants: list[ImageVariant] = field(default_factory=list)
+    placeholder: str | None = None
+
+    def as_row(self) -> dict:
+        """resort_images columns (width, height, variants, placeholder)."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "variants": [v.as_dict() for v in self.variants],
+            "placeholder": self.placeholder,
+        }
+
+
+def derivative_formats() -> tuple[str, ...]:
+    """Formats to render, per settings."""
+    if settings.image_avif_derivatives:
+        return ("webp", "avif")
+    return ("webp",)
+
+
+def target_widths(source_width: int) -> list[int]:
+    """Width buckets to render for a source of the given width."""
+    widths = {w for w in DERIVATIVE_WIDTHS if w < source_width}
+    widths.add(min(source_width, DERIVATIVE_WIDTHS[-1]))
+    return sorted(widths)
+
+
+def _encode(img, fmt: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "webp":
+        img.save(buffer, format="WEBP", quality=quality, method=4)
+    else:
+        img.save(buffer, format="AVIF", quality=quality)
+    return buffer.getvalue()
+
+
+def render_derivatives(
+    data: bytes,
+    formats: tuple[str, ...] | None = None,
+) -> RenderedDerivatives | None:
+    """Render width-bucketed derivatives and a blur placeholder.
+
+    Args:
+        data: Source image bytes (any format Pillow can read)
+        formats: Output formats (defaults to derivative_formats())
+
+    Returns:
+        RenderedDerivatives, or None if Pillow is missing or the image
+        can't be decoded
+    """
+    if Image is None:
+        return None
+
+    formats = formats or derivative_formats()
+
+    try:
+        with Image.open(io.BytesIO(data)) as opened:
+            img = ImageOps.exif_transpose(opened)
+            has_alpha = img.mode in ("RGBA", "LA") or (
+                img.mode == "P" and "transparency" in img.info
+            )
+            img = img.convert("RGBA" if has_alpha else "RGB")
+    except Exception as e:
+        logger.warning(f"Could not decode image for derivatives: {e}")
+        return None
+
+    rendered = RenderedDerivatives(width=img.width, height=img.height)
+
+    for width in target_widths(img.width):
+        height = max(1, round(img.height * width / img.width))
+        resized = (
+            img if width == img.width else img.resize((width, height), Image.Resampling.LANCZOS)
+        )
+        for fmt in formats:
+            quality = AVIF_QUALITY if fmt == "avif" else WEBP_QUALITY
+            try:
+                encoded = _encode(resized, fmt, quality)
+            except Exception as e:
+                # e.g. Pillow built without AVIF support
+                logger.warning(f"Could not encode {fmt} derivative: {e}")
+                continue
+            rendered.variants.append(
+                RenderedVariant(format=fmt, width=width, height=height, data=encoded)
+            )
+
+    placeholder_height = max(1, round(img.height * PLACEHOLDER_WIDTH / img.width))
+    tiny = img.resize((PLACEHOLDER_WIDTH, placeholder_height), Image.Resampling.BILINEAR)
+    tiny = tiny.filter(ImageFilter.GaussianBlur(1))
+    encoded = base64.b64encode(_encode(tiny, "webp", PLACEHOLDER_QUALITY)).decode("ascii")
+    rendered.placeholder = f"data:image/webp;base64,{encoded}"
+
+    return rendered
@@ -0,0 +1,390 @@
+"""Content-addressed image storage with perceptual-hash dedup.
+
+Every upload path used to invent its own filename (uuid4 for generated
+images, an index + short md5 for UGC and official photos), so re-running
+fetch_resort_images_with_fallback, fetch_and_store_ugc_photos or the hero
+backfill re-uploaded the same pictures under new names.
+
+Uploads now go through store_image(), which names the object after the
+SHA-256 of its bytes and skips the upload when that object already exists.
+Each image also gets a 64-bit difference hash (dHash) so near-duplicates
+(the same view re-encoded, resized or lightly cropped) can be collapsed
+before they are stored or sent to vision classification.
+
+Both hashes are saved in resort_images.metadata so later runs can seed a
+DuplicateFilter from what a resort already has.
+
+With derivatives=True, store_image() also uploads the responsive WebP/AVIF
+ladder from image_derivatives.py beside the original. derivative_fields(url)
+returns the matching resort_images columns for whoever writes the row, and
+fingerprint_metadata(url) the hashes for its metadata.
+
+Usage:
+    fingerprint = fingerprint_image(photo_bytes)
+    if dedupe.seen(fingerprint):
+        ...  # Skip: same or near-identical image already kept
+    dedupe.add(fingerprint)
+    stored = store_image(photo_bytes, f"ugc/{resort_id}", "image/jpeg", derivatives=True)
+    row = {"image_url": stored.url, **derivative_fields(stored.url)}
+"""
+
+import hashlib
+import io
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from ..supabase_client import get_supabase_client
+from .image_derivatives import ImageDerivatives, ImageVariant, render_derivatives
+
+try:
+    from PIL import Image
+except ImportError:  # Without Pillow only exact (content hash) dedup applies
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+IMAGE_BUCKET = "resort-images"
+
+# Hex chars of the SHA-256 used in object names (128 bits)
+CONTENT_KEY_LENGTH = 32
+
+# dHash bits that may differ for two images to count as the same view
+NEAR_DUPLICATE_DISTANCE = 6
+
+EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+    "image/avif": "avif",
+    "image/gif": "gif",
+}
+
+
+# =============================================================================
+# FINGERPRINTS
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ImageFingerprint:
+    """Exact and perceptual hashes of one image."""
+
+    content_hash: str  # SHA-256 hex
+    perceptual_hash: str | None = None  # 64-bit dHash hex, None if undecodable
+
+    def as_metadata(self) -> dict[str, str]:
+        """Fields to merge into resort_images.metadata."""
+        metadata = {"content_hash": self.content_hash}
+        if self.perceptual_hash:
+            metadata["perceptual_hash"] = self.perceptual_hash
+        return metadata
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest of image bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def perceptual_hash(data: bytes) -> str | None:
+    """64-bit difference hash (dHash) of an image.
+
+    The image is shrunk to 9x8 grayscale and each bit records whether a
+    pixel is brighter than its right-hand neighbour, so the hash survives
+    re-encoding, resizing and small crops.
+
+    Returns:
+        16-char hex string, or None if Pillow is missing or the bytes
+        can't be decoded
+    """
+    if Image is None:
+        return None
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            img.draft("L", (64, 64))  # Let the JPEG decoder downscale for us
+            pixels = list(
+                img.convert("L").resize((9, 8), Image.Resampling.BILINEAR).getdata()
+            )
+    except Exception as e:
+        logger.debug(f"Could not decode image for perceptual hash: {e}")
+        return None
+
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            bits = (bits << 1) | (1 if left > right else 0)
+
+    return f"{bits:016x}"
+
+
+def fingerprint_image(data: bytes) -> ImageFingerprint:
+    """Compute both hashes for an image."""
+    return ImageFingerprint(content_hash=content_hash(data), perceptual_hash=perceptual_hash(data))
+
+
+def hamming_distance(hash_a: str, hash_b: str) -> int:
+    """Number of differing bits between two hex perceptual hashes."""
+    return (int(hash_a, 16) ^ int(hash_b, 16)).bit_count()
+
+
+@dataclass
+class DuplicateFilter:
+    """Tracks images already kept so exact and near duplicates can be skipped.
+
+    Linear scan over perceptual hashes: a resort has tens of images, not
+    thousands.
+    """
+
+    max_distance: int = NEAR_DUPLICATE_DISTANCE
+    content_hashes: set[str] = field(default_factory=set)
+    perceptual_hashes: list[str] = field(default_factory=list)
+
+    def seen(self, fingerprint: ImageFingerprint) -> bool:
+        """True if this image (or a near-identical one) was already added."""
+        if fingerprint.content_hash in self.content_hashes:
+            return True
+        if fingerprint.perceptual_hash:
+            for known in self.perceptual_hashes:
+                if hamming_distance(fingerprint.perceptual_hash, known) <= self.max_distance:
+                    return True
+        return False
+
+    def add(self, fingerprint: ImageFingerprint) -> None:
+        self.content_hashes.add(fingerprint.content_hash)
+        if fingerprint.perceptual_hash:
+            self.perceptual_hashes.append(fingerprint.perceptual_hash)
+
+    def discard(self, fingerprint: ImageFingerprint) -> None:
+        """Undo add() for an image that ended up not being kept."""
+        self.content_hashes.discard(fingerprint.content_hash)
+        if fingerprint.perceptual_hash in self.perceptual_hashes:
+            self.perceptual_hashes.remove(fingerprint.perceptual_hash)
+
+    def add_metadata(self, metadata: dict | None) -> None:
+        """Seed from a resort_images.metadata dict written by an earlier run."""
+        if not metadata:
+            return
+        if metadata.get("content_hash"):
+            self.content_hashes.add(metadata["content_hash"])
+        if metadata.get("perceptual_hash"):
+            self.perceptual_hashes.append(metadata["perceptual_hash"])
+
+
+def load_resort_duplicate_filter(resort_id: str) -> DuplicateFilter:
+    """Build a DuplicateFilter from the images a resort already has."""
+    dedupe = DuplicateFilter()
+
+    try:
+        client = get_supabase_client()
+        response = (
+            client.table("resort_images")
+            .select("metadata")
+            .eq("resort_id", resort_id)
+            .execute()
+        )
+        for row in response.data or []:
+            dedupe.add_metadata(row.get("metadata"))
+    except Exception as e:
+        logger.warning(f"Could not load image hashes for resort {resort_id}: {e}")
+
+    return dedupe
+
+
+# =============================================================================
+# STORAGE
+# =============================================================================
+
+
+@dataclass
+class StoredImage:
+    """Result of a content-addressed upload."""
+
+    url: str
+    path: str
+    fingerprint: ImageFingerprint
+    uploaded: bool  # False when the object already existed
+    derivatives: ImageDerivatives | None = None
+
+
+# Object paths known to exist in the bucket (saves an exists() round trip)
+_known_paths: set[str] = set()
+_known_paths_lock = threading.Lock()
+
+# Derivatives and fingerprints of recently stored images, by public URL.
+# Upload helpers only return the URL, so row writers look them up here.
+DERIVATIVE_MEMORY_MAX_ENTRIES = 512
+_derivatives_by_url: "OrderedDict[str, ImageDerivatives]" = OrderedDict()
+_fingerprints_by_url: "OrderedDict[str, ImageFingerprint]" = OrderedDict()
+
+
+def extension_for(content_type: str) -> str:
+    """File extension for an image MIME type (defaults to jpg)."""
+    return EXTENSIONS.get(content_type.split(";")[0].strip().lower(), "jpg")
+
+
+def content_address(namespace: str, digest: str, content_type: str) -> str:
+    """Storage path for an image: <namespace>/<sha256 prefix>.<ext>."""
+    key = digest[:CONTENT_KEY_LENGTH]
+    return f"{namespace.strip('/')}/{key}.{extension_for(content_type)}"
+
+
+def _object_exists(bucket, path: str) -> bool:
+    with _known_paths_lock:
+        if path in _known_paths:
+            return True
+    try:
+        return bool(bucket.exists(path))
+    except Exception:
+        return False  # Can't tell: upload (upsert) is still safe
+
+
+def _put_object(bucket, path: str, data: bytes, content_type: str) -> bool:
+    """Upload unless the object exists. Returns True if it was uploaded."""
+    uploaded = False
+    if not _object_exists(bucket, path):
+        # upsert: a concurrent run may have written the same bytes meanwhile
+        bucket.upload(
+            path=path,
+            file=data,
+            file_options={"content-type": content_type, "upsert": "true"},
+        )
+        uploaded = True
+
+    with _known_paths_lock:
+        _known_paths.add(path)
+    return uploaded
+
+
+def _store_derivatives(bucket, path: str, data: bytes) -> ImageDerivatives | None:
+    """Render and upload derivatives under <path without extension>/w<width>.<fmt>."""
+    rendered = render_derivatives(data)
+    if rendered is None:
+        return None
+
+    base = path.rsplit(".", 1)[0]
+    derivatives = ImageDerivatives(
+        width=rendered.width,
+        height=rendered.height,
+        placeholder=rendered.placeholder,
+    )
+    for variant in rendered.variants:
+        variant_path = f"{base}/w{variant.width}.{variant.format}"
+        _put_object(bucket, variant_path, variant.data, variant.content_type)
+        derivatives.variants.append(
+            ImageVariant(
+                url=bucket.get_public_url(variant_path),
+                format=variant.format,
+                width=variant.width,
+                height=variant.height,
+                size=len(variant.data),
+            )
+        )
+    return derivatives
+
+
+def get_image_derivatives(image_url: str) -> ImageDerivatives | None:
+    """Derivatives recorded for an image stored by this process."""
+    with _known_paths_lock:
+        return _derivatives_by_url.get(image_url)
+
+
+def derivative_fields(image_url: str) -> dict:
+    """resort_images columns for an image's derivatives.
+
+    Always returns every column, empty when there are no derivatives (render
+    failed or evicted from memory): bulk upserts send the union of columns
+    across rows, and a missing variants key would go in as NULL.
+    """
+    derivatives = get_image_derivatives(image_url)
+    if derivatives is None:
+        return {"width": None, "height": None, "variants": [], "placeholder": None}
+    return derivatives.as_row()
+
+
+def _remember_derivatives(image_url: str, derivatives: ImageDerivatives) -> None:
+    with _known_paths_lock:
+        _derivatives_by_url[image_url] = derivatives
+        _derivatives_by_url.move_to_end(image_url)
+        while len(_derivatives_by_url) > DERIVATIVE_MEMORY_MAX_ENTRIES:
+            _derivatives_by_url.popitem(last=False)
+
+
+def fingerprint_metadata(image_url: str) -> dict[str, str]:
+    """resort_images.metadata fields for an image stored by this process.
+
+    Empty when the image was not stored here (or was evicted from memory),
+    in which case load_resort_duplicate_filter() can't dedupe against it.
+    """
+    with _known_paths_lock:
+        fingerprint = _fingerprints_by_url.get(image_url)
+    return fingerprint.as_metadata() if fingerprint is not None else {}
+
+
+def _remember_fingerprint(image_url: str, fingerprint: ImageFingerprint) -> None:
+    with _known_paths_lock:
+        _fingerprints_by_url[image_url] = fingerprint
+        _fingerprints_by_url.move_to_end(image_url)
+        while len(_fingerprints_by_url) > DERIVATIVE_MEMORY_MAX_ENTRIES:
+            _fingerprints_by_url.popitem(last=False)
+
+
+def store_image(
+    data: bytes,
+    namespace: str,
+    content_type: str = "image/jpeg",
+    fingerprint: ImageFingerprint | None = None,
+    derivatives: bool = False,
+) -> StoredImage:
+    """Upload image bytes under a content-addressed path, skipping if present.
+
+    Blocking (storage client is synchronous); call through run_db() from
+    async code.
+
+    Args:
+        data: Image bytes
+        namespace: Path prefix, e.g. "ugc/<resort_id>" or "gemini"
+        content_type: MIME type of the bytes
+        fingerprint: Precomputed fingerprint, if the caller already has one
+        derivatives: Also render and upload responsive WebP/AVIF variants
+
+    Returns:
+        StoredImage with the public URL
+
+    Raises:
+        Exception: Whatever the storage client raises on upload failure
+    """
+    client = get_supabase_client()
+    bucket = client.storage.from_(IMAGE_BUCKET)
+
+    if fingerprint is None:
+        fingerprint = fingerprint_image(data)
+    path = content_address(namespace, fingerprint.content_hash, content_type)
+
+    uploaded = _put_object(bucket, path, data, content_type)
+    url = bucket.get_public_url(path)
+    _remember_fingerprint(url, fingerprint)
+
+    stored_derivatives = None
+    if derivatives:
+        stored_derivatives = get_image_derivatives(url)
+        if stored_derivatives is None:
+            try:
+                stored_derivatives = _store_derivatives(bucket, path, data)
+            except Exception as e:
+                # The original is stored; the site falls back to it
+                logger.warning(f"Could not store derivatives for {path}: {e}")
+            if stored_derivatives is not None:
+                _remember_derivatives(url, stored_derivatives)
+
+    return StoredImage(
+        url=url,
+        path=path,
+        fingerprint=fingerprint,
+        uploaded=uploaded,
+        derivatives=stored_derivatives,
+    )
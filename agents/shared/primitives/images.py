@@ -21,7 +21,6 @@ All prompts explicitly avoid faces to prevent AI uncanny valley:
 
 import base64
 import io
-import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -30,7 +29,8 @@ from typing import Any
 import httpx
 
 from ..config import settings
-from ..supabase_client import get_supabase_client
+from ..supabase_client import get_supabase_client, run_db
+from .image_store import derivative_fields, fingerprint_metadata, store_image
 from .system import log_cost, log_reasoning
 
 
@@ -608,6 +608,10 @@ async def upload_image_to_storage(
 ) -> str | None:
     """Upload image to Supabase Storage.
 
+    Objects are named by content hash, so identical bytes are stored once.
+    Responsive WebP derivatives are stored too; save_resort_image() picks
+    them and the image's fingerprint up by URL.
+
     Args:
         image_data: Raw image bytes
         mime_type: MIME type (e.g., 'image/png')
@@ -617,22 +621,10 @@ async def upload_image_to_storage(
         Public URL of uploaded image, or None if failed
     """
     try:
-        client = get_supabase_client()
-
-        # Generate unique filename
-        ext = "png" if "png" in mime_type else "jpg"
-        filename = f"{provider.value}/{uuid.uuid4()}.{ext}"
-
-        # Upload to resort-images bucket
-        result = client.storage.from_("resort-images").upload(
-            filename,
-            image_data,
-            file_options={"content-type": mime_type},
+        stored = await run_db(
+            store_image, image_data, provider.value, mime_type, derivatives=True
         )
-
-        # Get public URL
-        url = client.storage.from_("resort-images").get_public_url(filename)
-        return url
+        return stored.url
 
     except Exception as e:
         # Storage upload failed - return None, caller will use original URL
@@ -863,6 +855,9 @@ def save_resort_image(
                 "prompt": prompt,
                 "alt_text": alt_text,
                 "created_at": datetime.utcnow().isoformat(),
+                # Hashes let load_resort_duplicate_filter() skip this image later
+                "metadata": fingerprint_metadata(image_url),
+                **derivative_fields(image_url),
             })
             .execute()
         )
@@ -12,9 +12,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-import anthropic
-
-from ..config import settings
+from ..llm_client import call_claude
 
 
 @dataclass
@@ -71,35 +69,17 @@ class LearningOutcome:
     recommendation: str = ""
 
 
-def _get_client() -> anthropic.Anthropic:
-    """Get Anthropic client instance."""
-    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-
-def _call_claude(
+async def _call_claude(
     prompt: str,
     system: str | None = None,
-    model: str = "claude-sonnet-4-20250514",
+    model: str | None = None,
     max_tokens: int = 1000,
     temperature: float | None = None,
 ) -> str:
     """Make a Claude API call and return the text response."""
-    client = _get_client()
-
-    messages = [{"role": "user", "content": prompt}]
-
-    kwargs = {
-        "model": model,
-        "max_tokens": max_tokens,
-        "messages": messages,
-    }
-    if system:
-        kwargs["system"] = system
-    if temperature is not None:
-        kwargs["temperature"] = temperature
-
-    response = client.messages.create(**kwargs)
-    return response.content[0].text
+    return await call_claude(
+        prompt, system=system, model=model, max_tokens=max_tokens, temperature=temperature
+    )
 
 
 def _parse_json_response(response: str) -> dict[str, Any]:
@@ -167,7 +147,7 @@ Return JSON:
 Be calibrated: 0.8+ means very reliable, 0.5-0.7 means usable with caveats, <0.5 means significant concerns.
 Focus on what matters for the stated context."""
 
-    response = _call_claude(prompt, system=system)
+    response = await _call_claude(prompt, system=system)
 
     try:
         parsed = _parse_json_response(response)
@@ -236,7 +216,7 @@ Return JSON matching the target schema exactly."""
 When converting currencies, use approximate rates (1 EUR ≈ 1.10 USD, 1 CHF ≈ 1.15 USD).
 Never fabricate data - use null when information isn't available."""
 
-    response = _call_claude(prompt, system=system, max_tokens=2000)
+    response = await _call_claude(prompt, system=system, max_tokens=2000)
 
     try:
         return _parse_json_response(response)
@@ -303,7 +283,7 @@ Return JSON:
 Always choose one option - don't hedge. Explain your reasoning concisely.
 Confidence reflects how clear-cut the decision is, not certainty about outcomes."""
 
-    response = _call_claude(prompt, system=system)
+    response = await _call_claude(prompt, system=system)
 
     try:
         parsed = _parse_json_response(response)
@@ -364,7 +344,7 @@ Sort by priority_score descending (highest priority first)."""
     system = """You are a prioritization expert. Rank items thoughtfully.
 Consider all aspects of the criteria. Spread scores across the range - don't cluster."""
 
-    response = _call_claude(prompt, system=system, max_tokens=3000)
+    response = await _call_claude(prompt, system=system, max_tokens=3000)
 
     try:
         parsed = _parse_json_response(response)
@@ -441,7 +421,7 @@ Return JSON:
 - escalate: When human judgment is needed
 - fallback: When we have a reasonable default value"""
 
-    response = _call_claude(prompt, system=system)
+    response = await _call_claude(prompt, system=system)
 
     try:
         parsed = _parse_json_response(response)
@@ -511,7 +491,7 @@ Return JSON:
 Focus on patterns that would generalize to similar situations.
 Be specific enough to be useful, but general enough to apply broadly."""
 
-    response = _call_claude(prompt, system=system)
+    response = await _call_claude(prompt, system=system)
 
     try:
         parsed = _parse_json_response(response)
@@ -570,6 +550,11 @@ async def validate_resort_selection(
     # Import atomic primitives
     from .database import check_resort_exists, find_similar_resorts
     from .discovery import check_discovery_candidate_exists
+    from .resort_index import fresh_index, get_candidate_index, get_resort_index
+
+    # The checks below are in-memory index lookups once both are loaded
+    await fresh_index(get_resort_index())
+    await fresh_index(get_candidate_index())
 
     results = []
 
@@ -682,7 +667,7 @@ Write punchy, memorable taglines that make families want to visit.
 Be specific to each resort - generic phrases are a failure."""
 
     try:
-        response = _call_claude(prompt, system=system, max_tokens=100)
+        response = await _call_claude(prompt, system=system, max_tokens=100)
         # Clean up the response
         tagline = response.strip().strip('"').strip("'")
         # Ensure it's not too long
@@ -910,7 +895,7 @@ Never fabricate data - use null when information isn't available.
 But DON'T be lazy - search thoroughly before reporting null.
 These metrics directly affect family vacation decisions and our scoring algorithm."""
 
-    response = _call_claude(
+    response = await _call_claude(
         prompt,
         system=system,
         model="claude-sonnet-4-20250514",
@@ -978,7 +963,7 @@ If you don't know, return "Unknown"."""
     system = "You are a geography expert. Return only the region/state/province name, nothing else."
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-3-5-haiku-20241022",  # Fast and cheap for simple lookups
@@ -1102,7 +1087,7 @@ Prioritize official sources and well-known brands over unknown sites.
 Skip paywalled, login-required, or spam sites."""
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-sonnet-4-20250514",
@@ -1540,7 +1525,7 @@ Named mentions like "NISS ski school" or "Coop supermarket" SHOULD always be ext
 NEVER extract major cities, metro areas, or regions as entities. "Salt Lake City", "Vancouver", "Denver", "Kamloops", "Sandy", "Draper" are geographic references, NOT linkable businesses."""
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-sonnet-4-20250514",
@@ -1701,7 +1686,7 @@ Rules:
 Generic output is a failure. Specific, memorable output is success."""
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-sonnet-4-20250514",
@@ -1937,7 +1922,7 @@ Your output becomes the building blocks of memorable taglines.
 Generic output is failure. Specific output is success."""
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-3-5-haiku-20241022",
@@ -2067,7 +2052,7 @@ State facts. Be specific. No brochure-speak.
 BANNED: "where X meets Y", "paradise", "magic", "hidden gem", "adventure awaits", "dream come true"."""
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-sonnet-4-20250514",
@@ -2179,7 +2164,7 @@ Be honest and specific in your assessment.
 Overused patterns like "X meets Y" score LOW on structure_novelty."""
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-3-5-haiku-20241022",
@@ -2365,7 +2350,7 @@ Score based ONLY on what's in the content. Don't assume — if not mentioned, sc
 Use the full 1-10 range. Be calibrated: 9+ is exceptional, 5 is mediocre, 3 is poor."""
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-sonnet-4-20250514",
@@ -2447,7 +2432,7 @@ Return ONLY the number, nothing else."""
     system = "You score parent sentiment from review content. Return only a number 1.0-10.0."
 
     try:
-        response = _call_claude(
+        response = await _call_claude(
             prompt,
             system=system,
             model="claude-3-5-haiku-20241022",
@@ -785,45 +785,37 @@ def generate_links_for_resort(resort_id: str) -> int:
 
 
 def refresh_all_similarities(
-    batch_size: int = 10,
-    max_resorts: int = 100,
+    batch_size: int = 500,
+    top_k: int | None = None,
+    generate_links: bool = True,
 ) -> dict[str, int]:
     """Refresh similarities for all published resorts.
 
+    Scores the full resort matrix in one pass with the vectorized engine
+    (see similarity_engine.py) instead of querying per resort pair.
+
+    Args:
+        batch_size: Rows per resort_similarities upsert
+        top_k: Optionally keep only each resort's top_k most similar resorts
+        generate_links: Also regenerate internal links for every resort
+
     Returns statistics about the refresh operation.
     """
-    try:
-        supabase = get_supabase_client()
+    from .similarity_engine import get_feature_store, refresh_similarity_matrix
 
-        # Get all published resorts
-        resorts_result = supabase.table("resorts")\
-            .select("id, name")\
-            .eq("status", "published")\
-            .limit(max_resorts)\
-            .execute()
+    try:
+        # Full reload also primes the cache used by update_similarities_for_resort()
+        features = get_feature_store().reload()
+        stats = refresh_similarity_matrix(features, top_k=top_k, batch_size=batch_size)
 
-        resorts = resorts_result.data or []
-        total_similarities = 0
         total_links = 0
-        processed = 0
-
-        for resort in resorts:
-            # Calculate similarities
-            sim_count = calculate_similarities_for_resort(
-                resort["id"],
-                limit=batch_size,
-            )
-            total_similarities += sim_count
-
-            # Generate links
-            link_count = generate_links_for_resort(resort["id"])
-            total_links += link_count
-
-            processed += 1
+        if generate_links:
+            for resort_id in features.resort_ids:
+                total_links += generate_links_for_resort(resort_id)
 
         return {
-            "resorts_processed": processed,
-            "similarities_calculated": total_similarities,
+            "resorts_processed": stats["resorts_processed"],
+            "similarities_calculated": stats["similarities_calculated"],
             "links_generated": total_links,
         }
     except Exception as e:
@@ -15,6 +15,7 @@ Usage:
             await send_newsletter(result.issue_id)
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
@@ -22,9 +23,7 @@ from datetime import datetime, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
 
-import anthropic
-
-from ..config import settings
+from ..llm_client import call_claude
 from ..supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
@@ -237,25 +236,14 @@ def query_ugc_photo() -> dict[str, Any] | None:
 # =============================================================================
 
 
-def _get_client() -> anthropic.Anthropic:
-    """Get Anthropic client instance."""
-    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-
-def _call_claude(
+async def _call_claude(
     prompt: str,
     system: str | None = None,
-    model: str = "claude-sonnet-4-20250514",
+    model: str | None = None,
     max_tokens: int = 2000,
 ) -> str:
     """Make a Claude API call and return the text response."""
-    client = _get_client()
-    messages = [{"role": "user", "content": prompt}]
-    kwargs = {"model": model, "max_tokens": max_tokens, "messages": messages}
-    if system:
-        kwargs["system"] = system
-    response = client.messages.create(**kwargs)
-    return response.content[0].text
+    return await call_claude(prompt, system=system, model=model, max_tokens=max_tokens)
 
 
 def _parse_json_response(response: str) -> dict[str, Any]:
@@ -268,7 +256,7 @@ def _parse_json_response(response: str) -> dict[str, Any]:
     return json.loads(text.strip())
 
 
-def generate_cold_open(
+async def generate_cold_open(
     week_number: int,
     current_date: datetime,
     new_resorts: list[dict],
@@ -306,14 +294,14 @@ Return ONLY the cold open text, no quotes or labels."""
     system = "You write for Snowthere, a family ski resort guide. Sound like a smart, well-traveled friend who respects the reader's time. Expert with dry wit and honest takes. Use 'you/your', not first-person 'I'. No em-dashes."
 
     try:
-        response = _call_claude(prompt, system=system, max_tokens=200)
+        response = await _call_claude(prompt, system=system, max_tokens=200)
         return response.strip().strip('"')
     except Exception as e:
         logger.error(f"Cold open generation failed: {e}")
         return f"New family ski intel this {month}. Here's what the Snowthere team has been researching."
 
 
-def generate_trending_section(
+async def generate_trending_section(
     candidates: list[dict],
     new_resorts: list[dict],
 ) -> str:
@@ -344,14 +332,14 @@ VOICE: Smart friend sharing what's coming next. Confident, specific, not breathl
 Return ONLY the section text."""
 
     try:
-        response = _call_claude(prompt, max_tokens=300)
+        response = await _call_claude(prompt, max_tokens=300)
         return response.strip()
     except Exception as e:
         logger.error(f"Trending section generation failed: {e}")
         return "More resort guides are in the works. New ones drop weekly."
 
 
-def generate_parent_hack(recent_guides: list[dict]) -> str:
+async def generate_parent_hack(recent_guides: list[dict]) -> str:
     """
     Generate the parent hack of the week (75 words).
 
@@ -377,7 +365,7 @@ GOOD EXAMPLES:
 Return ONLY the hack text."""
 
     try:
-        response = _call_claude(prompt, max_tokens=200)
+        response = await _call_claude(prompt, max_tokens=200)
         return response.strip()
     except Exception as e:
         logger.error(f"Parent hack generation failed: {e}")
@@ -471,8 +459,14 @@ async def generate_newsletter() -> NewsletterGenerationResult:
         # Generate sections
         sections = []
 
+        # The three Claude-written sections are independent, so draft them together
+        cold_open, trending_content, parent_hack = await asyncio.gather(
+            generate_cold_open(issue_number, now, new_resorts),
+            generate_trending_section(trending, new_resorts),
+            generate_parent_hack(new_resorts),
+        )
+
         # 1. Cold Open
-        cold_open = generate_cold_open(issue_number, now, new_resorts)
         sections.append(NewsletterSection(
             section_type="cold_open",
             content_html=f"<p>{cold_open}</p>",
@@ -490,7 +484,6 @@ async def generate_newsletter() -> NewsletterGenerationResult:
             ))
 
         # 3. Trending / Coming Soon
-        trending_content = generate_trending_section(trending, new_resorts)
         sections.append(NewsletterSection(
             section_type="trending",
             title="Coming Soon",
@@ -498,7 +491,6 @@ async def generate_newsletter() -> NewsletterGenerationResult:
         ))
 
         # 4. Parent Hack
-        parent_hack = generate_parent_hack(new_resorts)
         sections.append(NewsletterSection(
             section_type="parent_hack",
             title="Parent Hack of the Week",
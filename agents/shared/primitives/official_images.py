@@ -15,7 +15,6 @@ Cost: Free (scraping) + ~$0.06 for UGC fallback
 """
 
 import asyncio
-import hashlib
 import re
 import uuid
 from dataclasses import dataclass
@@ -26,7 +25,14 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..config import settings
-from ..supabase_client import get_supabase_client
+from ..supabase_client import get_supabase_client, run_db
+from .image_store import (
+    ImageFingerprint,
+    StoredImage,
+    fingerprint_image,
+    load_resort_duplicate_filter,
+    store_image,
+)
 from .system import log_reasoning
 
 
@@ -301,18 +307,32 @@ async def extract_images_from_page(
 async def download_and_store_image(
     image_url: str,
     resort_id: str,
-    image_type: str = "hero",
 ) -> str | None:
     """Download an image and store it in Supabase Storage.
 
     Args:
         image_url: URL of the image to download
         resort_id: Resort UUID for storage path
-        image_type: Type of image (hero, atmosphere, etc.)
 
     Returns:
         Public URL of stored image or None
     """
+    stored = await _download_and_store(image_url, resort_id)
+    return stored.url if stored else None
+
+
+async def _download_and_store(image_url: str, resort_id: str) -> StoredImage | None:
+    """Download an image and store it content-addressed (skips existing objects)."""
+    downloaded = await _download_image(image_url)
+    if downloaded is None:
+        return None
+
+    image_data, content_type = downloaded
+    return await _store_official_image(image_data, content_type, resort_id)
+
+
+async def _download_image(image_url: str) -> tuple[bytes, str] | None:
+    """Download an image, returning its bytes and normalized MIME type."""
     async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
         try:
             response = await client.get(
@@ -342,24 +362,26 @@ async def download_and_store_image(
             print(f"Failed to download image: {e}")
             return None
 
-    try:
-        supabase = get_supabase_client()
+    return image_data, f"image/{ext}"
 
-        # Generate unique filename
-        content_hash = hashlib.md5(image_data).hexdigest()[:8]
-        filename = f"official/{resort_id}/{image_type}_{content_hash}.{ext}"
 
-        # Upload to storage
-        supabase.storage.from_("resort-images").upload(
-            path=filename,
-            file=image_data,
-            file_options={"content-type": f"image/{ext}", "upsert": "true"},
+async def _store_official_image(
+    image_data: bytes,
+    content_type: str,
+    resort_id: str,
+    fingerprint: ImageFingerprint | None = None,
+) -> StoredImage | None:
+    """Store downloaded official image bytes, returning None on failure."""
+    try:
+        return await run_db(
+            store_image,
+            image_data,
+            f"official/{resort_id}",
+            content_type,
+            fingerprint=fingerprint,
+            derivatives=True,
         )
 
-        # Get public URL
-        public_url = supabase.storage.from_("resort-images").get_public_url(filename)
-        return public_url
-
     except Exception as e:
         print(f"Failed to store image: {e}")
         return None
@@ -429,17 +451,37 @@ async def fetch_official_resort_image(
             error="No suitable images found on official website",
         )
 
+    # Images this resort already has, so a re-run doesn't add the same hero again
+    dedupe = await run_db(load_resort_duplicate_filter, resort_id)
+
     # Step 3: Try to download and store the best image
     for img_info in images:
         img_url = img_info["url"]
 
-        stored_url = await download_and_store_image(
-            image_url=img_url,
-            resort_id=resort_id,
-            image_type="hero",
-        )
+        downloaded = await _download_image(img_url)
+        if downloaded is None:
+            continue
+        image_data, content_type = downloaded
+
+        # Check the bytes before uploading, so a re-run doesn't write the
+        # same (or a near-identical) image to storage again
+        fingerprint = await asyncio.to_thread(fingerprint_image, image_data)
+        if dedupe.seen(fingerprint):
+            print(f"Official image for {resort_name} already stored, not uploading")
+            return OfficialImageResult(
+                success=True,
+                source_url=img_url,
+                source="official",
+                alt_text=img_info.get("alt"),
+                attribution=f"Image from {official_website}",
+            )
+
+        stored = await _store_official_image(image_data, content_type, resort_id, fingerprint)
+        image_data = None  # Release before trying the next candidate
+
+        if stored:
+            stored_url = stored.url
 
-        if stored_url:
             # Success! Save to database
             try:
                 supabase = get_supabase_client()
@@ -454,7 +496,9 @@ async def fetch_official_resort_image(
                         "original_url": img_url,
                         "source_type": img_info.get("source"),
                         "official_website": official_website,
+                        **stored.fingerprint.as_metadata(),
                     },
+                    **(stored.derivatives.as_row() if stored.derivatives else {}),
                 }).execute()
             except Exception as e:
                 print(f"Failed to save image record: {e}")
@@ -0,0 +1,575 @@
+"""Run-scoped outbox for page revalidation and IndexNow pings.
+
+Every publish used to revalidate its resort page, /resorts and / with a
+blocking POST each, plus an IndexNow GET, all inside the async pipeline
+and on that resort's critical path. A run of eight resorts revalidated the
+homepage eight times, one request after another.
+
+Inside publish_outbox(), publish_resort(), unpublish_resort() and
+revalidate_page() record "page changed" events instead of calling out.
+When the run finishes the outbox:
+
+1. Expands resort events to every page that shows the resort: its own
+   page, its country listing, guides featuring it, and on publish or
+   unpublish the listings (/resorts, /).
+2. Deduplicates the paths across the whole run, adding any left pending by
+   earlier runs.
+3. Writes them to pending_revalidations, so a run killed mid-flush doesn't
+   lose them.
+4. Revalidates them over one pooled connection, paced by a token bucket
+   under the endpoint's 10 requests/minute per IP (a 429 pauses sending
+   for Retry-After). Paths not sent by the deadline stay pending.
+5. Submits every revalidated page URL in one ping_indexnow_batch(), then
+   deletes the finished paths from pending_revalidations.
+
+Outside an outbox (MCP tools, scripts) the primitives behave as before and
+call out immediately.
+
+Usage:
+    async with publish_outbox():
+        await run_pipeline_for_resorts(...)  # publish_resort() etc. enqueue
+
+    @flushes_page_changes
+    async def run_daily_pipeline(...): ...
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+from ..config import settings
+from ..http_client import get_http_client
+from ..rate_limits import provider_slot
+from ..supabase_client import get_supabase_client
+from .alerts import alert_pipeline_error
+from .publishing import (
+    country_path,
+    ping_indexnow_batch,
+    resort_path,
+    revalidation_request,
+    revalidation_result,
+)
+from .system import log_reasoning
+
+REVALIDATE_PROVIDER = "vercel_revalidate"
+REVALIDATE_TIMEOUT = 30.0
+MAX_RETRY_AFTER_SECONDS = 65.0
+
+# /api/revalidate allows 10 requests/minute per IP on a fixed window. One
+# request every 60/9 s never puts more than 9 in any minute, leaving room for
+# revalidate_page() calls made outside the outbox.
+REVALIDATE_PER_MINUTE = 9
+
+# Stop sending after this long; the rest stay pending for the next run
+REVALIDATE_DEADLINE_SECONDS = 15 * 60
+
+PENDING_TABLE = "pending_revalidations"
+PENDING_LOAD_LIMIT = 500
+PENDING_DELETE_CHUNK = 100  # Paths per delete (keeps the query string short)
+
+LISTING_PATHS = ("/resorts", "/")
+
+
+# =============================================================================
+# EVENTS
+# =============================================================================
+
+
+@dataclass
+class ResortChange:
+    """A resort whose pages need refreshing when the outbox flushes."""
+
+    resort_id: str
+    slug: str | None = None
+    country: str | None = None
+    reasons: set[str] = field(default_factory=set)
+    listings: bool = False  # Also revalidate /resorts and / (publish status changed)
+    revalidate: bool = False
+    indexnow: bool = False
+
+
+@dataclass
+class OutboxFlushResult:
+    """What one flush sent."""
+
+    paths: list[str] = field(default_factory=list)
+    revalidated: list[str] = field(default_factory=list)
+    failed: list[dict[str, Any]] = field(default_factory=list)
+    unsent: list[str] = field(default_factory=list)  # Left pending for the next run
+    carried_over: int = 0  # Paths left pending by earlier runs
+    indexnow_urls: list[str] = field(default_factory=list)
+    indexnow: dict[str, Any] = field(default_factory=dict)
+    events: int = 0  # Events recorded before deduplication
+    duration_seconds: float = 0.0
+
+
+class PublishOutbox:
+    """Collects page-changed events for one run and sends them in one pass."""
+
+    def __init__(self):
+        self._lock = threading.Lock()  # Events can arrive from run_db() threads
+        self._paths: dict[str, set[str]] = {}  # path -> reasons (insertion-ordered)
+        self._indexnow_paths: set[str] = set()
+        self._resorts: dict[str, ResortChange] = {}
+        self._events = 0
+
+    def add_path(self, path: str, reason: str = "", indexnow: bool = False) -> None:
+        """Queue a page path for revalidation (and optionally IndexNow)."""
+        if not path.startswith("/"):
+            path = "/" + path
+        with self._lock:
+            self._events += 1
+            reasons = self._paths.setdefault(path, set())
+            if reason:
+                reasons.add(reason)
+            if indexnow:
+                self._indexnow_paths.add(path)
+
+    def add_resort(
+        self,
+        resort_id: str,
+        slug: str | None = None,
+        country: str | None = None,
+        reason: str = "",
+        listings: bool = False,
+        revalidate: bool = True,
+        indexnow: bool = False,
+    ) -> None:
+        """Queue a resort's pages (slug/country are looked up if not given)."""
+        with self._lock:
+            self._events += 1
+            change = self._resorts.setdefault(resort_id, ResortChange(resort_id))
+            change.slug = slug or change.slug
+            change.country = country or change.country
+            if reason:
+                change.reasons.add(reason)
+            change.listings |= listings
+            change.revalidate |= revalidate
+            change.indexnow |= indexnow
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._paths) + len(self._resorts)
+
+    def _drain(self) -> tuple[dict[str, set[str]], set[str], dict[str, ResortChange], int]:
+        with self._lock:
+            drained = (self._paths, self._indexnow_paths, self._resorts, self._events)
+            self._paths, self._indexnow_paths, self._resorts, self._events = {}, set(), {}, 0
+        return drained
+
+    # =========================================================================
+    # Flushing
+    # =========================================================================
+
+    async def flush(
+        self,
+        deadline_seconds: float = REVALIDATE_DEADLINE_SECONDS,
+        send: bool = True,
+    ) -> OutboxFlushResult:
+        """Revalidate every queued path once, then batch-submit IndexNow URLs.
+
+        Args:
+            deadline_seconds: Stop sending after this long; the rest stay pending
+            send: False only records the paths in pending_revalidations for
+                the next run's flush (used when the run is being cancelled)
+        """
+        started = time.monotonic()
+        paths, indexnow_paths, resorts, events = self._drain()
+        result = OutboxFlushResult(events=events)
+
+        if resorts:
+            try:
+                await asyncio.to_thread(_expand_resort_changes, resorts, paths, indexnow_paths)
+            except Exception as e:
+                # Fall back to the pages we can build without the lookups
+                print(f"⚠️  Outbox: resort page lookup failed, sending known paths only: {e}")
+                _add_resort_paths(resorts.values(), paths, indexnow_paths)
+
+        request = revalidation_request("/")
+        revalidation_configured = not isinstance(request, dict)
+        if not revalidation_configured:
+            # Nothing to revalidate with here: report the paths without
+            # sending or keeping them, but still submit the IndexNow URLs
+            result.paths = list(paths)
+            result.failed = [{**request, "path": path} for path in result.paths]
+            paths = {}
+
+        try:
+            result.carried_over = await asyncio.to_thread(
+                _sync_pending, paths, indexnow_paths
+            )
+        except Exception as e:
+            print(f"⚠️  Outbox: could not record pending paths, sending without a backup: {e}")
+        if not revalidation_configured:
+            paths.clear()  # Carried-over revalidations wait for a run that can send them
+        if not paths and not indexnow_paths:
+            if result.failed:
+                _report(result)
+            return result
+
+        if not send:
+            result.paths.extend(paths)
+            result.unsent = sorted(set(paths) | indexnow_paths)
+            result.duration_seconds = time.monotonic() - started
+            _report(result)
+            return result
+
+        result.paths.extend(paths)
+        outcomes, result.unsent = await _send_paced(list(paths), started + deadline_seconds)
+        done: set[str] = set()
+        for outcome in outcomes:
+            if outcome.get("success"):
+                result.revalidated.append(outcome["path"])
+            else:
+                result.failed.append(outcome)
+            if not outcome.get("retry"):
+                done.add(outcome["path"])
+
+        # IndexNow only for pages that are live: revalidated, or not revalidated at all
+        revalidated = set(result.revalidated)
+        ping_paths = sorted(p for p in indexnow_paths if p not in paths or p in revalidated)
+        vercel_url = getattr(settings, "vercel_url", None)
+        if vercel_url and ping_paths:
+            base = vercel_url.rstrip("/")
+            result.indexnow_urls = [f"{base}{path}" for path in ping_paths]
+            result.indexnow = await asyncio.to_thread(ping_indexnow_batch, result.indexnow_urls)
+        # Without a key configured, IndexNow never succeeds: don't keep retrying
+        indexnow_done = bool(result.indexnow.get("success")) or not settings.indexnow_key
+
+        # Finished: revalidation done (or not needed) and IndexNow sent (or not due)
+        pinged = set(ping_paths)
+        finished = [
+            path for path in set(paths) | indexnow_paths
+            if (path not in paths or path in done)
+            and (path not in pinged or indexnow_done)
+        ]
+        try:
+            await asyncio.to_thread(_clear_pending, finished)
+        except Exception as e:
+            print(f"⚠️  Outbox: could not clear sent paths (they will be resent): {e}")
+
+        result.duration_seconds = time.monotonic() - started
+        _report(result)
+        return result
+
+
+# =============================================================================
+# RESORT EXPANSION
+# =============================================================================
+
+
+def _add_resort_paths(
+    changes: Any,
+    paths: dict[str, set[str]],
+    indexnow_paths: set[str],
+) -> None:
+    """Add each resort's own page, country listing and (if flagged) listings."""
+    for change in changes:
+        reasons = change.reasons or {"resort_changed"}
+        if not (change.slug and change.country):
+            continue
+        page = resort_path(change.slug, change.country)
+        if change.revalidate:
+            for path in (page, country_path(change.country)):
+                paths.setdefault(path, set()).update(reasons)
+            if change.listings:
+                for path in LISTING_PATHS:
+                    paths.setdefault(path, set()).update(reasons)
+        if change.indexnow:
+            indexnow_paths.add(page)
+
+
+def _expand_resort_changes(
+    resorts: dict[str, ResortChange],
+    paths: dict[str, set[str]],
+    indexnow_paths: set[str],
+) -> None:
+    """Resolve missing slugs and add resort, country and guide pages (two queries)."""
+    client = get_supabase_client()
+    ids = list(resorts)
+
+    missing = [rid for rid, change in resorts.items() if not (change.slug and change.country)]
+    if missing:
+        rows = (
+            client.table("resorts")
+            .select("id, slug, country")
+            .in_("id", missing)
+            .execute()
+        ).data or []
+        for row in rows:
+            change = resorts[row["id"]]
+            change.slug = change.slug or row.get("slug")
+            change.country = change.country or row.get("country")
+
+    _add_resort_paths(resorts.values(), paths, indexnow_paths)
+
+    # Published guides that feature any changed resort
+    revalidated_ids = [rid for rid in ids if resorts[rid].revalidate]
+    if revalidated_ids:
+        rows = (
+            client.table("guide_resorts")
+            .select("resort_id, guides!inner(slug, status)")
+            .in_("resort_id", revalidated_ids)
+            .eq("guides.status", "published")
+            .execute()
+        ).data or []
+        for row in rows:
+            guide = row.get("guides") or {}
+            if guide.get("slug") and guide.get("status") == "published":
+                paths.setdefault(f"/guides/{guide['slug']}", set()).add("featured_resort_changed")
+
+
+# =============================================================================
+# PENDING PATHS
+# =============================================================================
+
+
+def _sync_pending(paths: dict[str, set[str]], indexnow_paths: set[str]) -> int:
+    """Merge paths left pending by earlier runs in, then record this run's.
+
+    Returns:
+        Number of paths carried over from earlier runs
+    """
+    client = get_supabase_client()
+    rows = (
+        client.table(PENDING_TABLE)
+        .select("path, reasons, revalidate, indexnow")
+        .order("queued_at")
+        .limit(PENDING_LOAD_LIMIT)
+        .execute()
+    ).data or []
+
+    current = set(paths) | indexnow_paths
+    carried = sum(1 for row in rows if row["path"] not in current)
+
+    # Earlier runs' paths go first; they've waited longest
+    merged: dict[str, set[str]] = {}
+    for row in rows:
+        if row.get("revalidate", True):
+            merged[row["path"]] = set(row.get("reasons") or []) | {"carried_over"}
+        if row.get("indexnow"):
+            indexnow_paths.add(row["path"])
+    for path, reasons in paths.items():
+        merged[path] = merged.get(path, set()) | reasons
+    paths.clear()
+    paths.update(merged)
+
+    new_rows = [
+        {
+            "path": path,
+            "reasons": sorted(paths.get(path, ())),
+            "revalidate": path in paths,
+            "indexnow": path in indexnow_paths,
+        }
+        for path in set(paths) | indexnow_paths
+    ]
+    if new_rows:
+        client.table(PENDING_TABLE).upsert(new_rows, on_conflict="path").execute()
+    return carried
+
+
+def _clear_pending(paths: list[str]) -> None:
+    """Delete finished paths from pending_revalidations."""
+    client = get_supabase_client()
+    for i in range(0, len(paths), PENDING_DELETE_CHUNK):
+        client.table(PENDING_TABLE).delete().in_(
+            "path", paths[i : i + PENDING_DELETE_CHUNK]
+        ).execute()
+
+
+# =============================================================================
+# SENDING
+# =============================================================================
+
+
+class _TokenBucket:
+    """Paces requests to rate_per_minute, allowing up to `burst` back to back."""
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.interval = 60.0 / rate_per_minute
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) / self.interval)
+        self._updated = now
+
+    def wait_seconds(self) -> float:
+        """Time until a token is available."""
+        self._refill()
+        return max(0.0, (1.0 - self._tokens) * self.interval)
+
+    def take(self) -> None:
+        self._refill()
+        self._tokens -= 1.0
+
+    def empty(self) -> None:
+        """Drop saved-up tokens (after the server asked us to back off)."""
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+
+
+def _retry_after(response: Any) -> float:
+    try:
+        return min(float(response.headers.get("Retry-After", 60)), MAX_RETRY_AFTER_SECONDS)
+    except (TypeError, ValueError):
+        return MAX_RETRY_AFTER_SECONDS
+
+
+async def _send_paced(
+    paths: list[str],
+    deadline: float,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Revalidate paths in order under the rate limit until the deadline.
+
+    Returns:
+        (one outcome per path sent, paths not sent by the deadline)
+    """
+    client = get_http_client(REVALIDATE_PROVIDER, timeout=REVALIDATE_TIMEOUT)
+    bucket = _TokenBucket(REVALIDATE_PER_MINUTE)
+    queue = deque(paths)
+    outcomes: list[dict[str, Any]] = []
+
+    while queue:
+        wait = bucket.wait_seconds()
+        if time.monotonic() + wait > deadline:
+            break
+        await asyncio.sleep(wait)
+        bucket.take()
+
+        outcome, retry_after = await _revalidate(client, queue[0])
+        if retry_after is not None:
+            # Rate limited anyway (other callers share the IP): back off, same path next
+            if time.monotonic() + retry_after > deadline:
+                break
+            await asyncio.sleep(retry_after)
+            bucket.empty()
+            continue
+        outcomes.append(outcome)
+        queue.popleft()
+
+    return outcomes, list(queue)
+
+
+async def _revalidate(client: Any, path: str) -> tuple[dict[str, Any], float | None]:
+    """Revalidate one path. Returns (outcome, Retry-After seconds if rate limited).
+
+    Outcomes marked "retry" (network errors, 5xx) stay pending for the next run.
+    """
+    request = revalidation_request(path)
+    if isinstance(request, dict):
+        return request, None
+    revalidate_url, body = request
+
+    try:
+        async with provider_slot(REVALIDATE_PROVIDER):
+            response = await client.post(revalidate_url, json=body)
+    except Exception as e:
+        alert_pipeline_error(
+            error_type="RevalidationFailed",
+            error_message=f"Failed to revalidate {path}: {str(e)}",
+        )
+        return {"success": False, "path": path, "error": str(e), "retry": True}, None
+
+    if response.status_code == 429:
+        return {}, _retry_after(response)
+    outcome = revalidation_result(path, response)
+    if response.status_code >= 500:
+        outcome["retry"] = True
+    return outcome, None
+
+
+def _report(result: OutboxFlushResult) -> None:
+    indexnow_note = ""
+    if result.indexnow_urls:
+        submitted = result.indexnow.get("urls_submitted", 0)
+        indexnow_note = f", IndexNow {submitted}/{len(result.indexnow_urls)} URLs"
+    print(
+        f"🔄 Outbox: {result.events} page events -> {len(result.paths)} paths, "
+        f"{len(result.revalidated)} revalidated, {len(result.failed)} failed"
+        f"{indexnow_note} ({result.duration_seconds:.1f}s)"
+    )
+    if result.unsent:
+        print(f"⚠️  Outbox: {len(result.unsent)} paths not sent, left pending for the next run")
+
+    log_reasoning(
+        task_id=None,
+        agent_name="publisher",
+        action="publish_outbox_flushed",
+        reasoning=(
+            f"Revalidated {len(result.revalidated)}/{len(result.paths)} paths "
+            f"from {result.events} page events"
+            + (f"; {len(result.unsent)} left pending" if result.unsent else "")
+        ),
+        metadata={
+            "paths": result.paths,
+            "failed": result.failed[:20],
+            "unsent": result.unsent,
+            "carried_over": result.carried_over,
+            "indexnow_urls": len(result.indexnow_urls),
+            "indexnow": result.indexnow,
+            "duration_seconds": round(result.duration_seconds, 2),
+        },
+    )
+
+
+# =============================================================================
+# ACTIVATION
+# =============================================================================
+
+_active_outbox: ContextVar[PublishOutbox | None] = ContextVar("publish_outbox", default=None)
+
+
+def get_active_outbox() -> PublishOutbox | None:
+    """The outbox of the enclosing publish_outbox() block, if any."""
+    return _active_outbox.get()
+
+
+@asynccontextmanager
+async def publish_outbox() -> AsyncIterator[PublishOutbox]:
+    """Defer page revalidation and IndexNow pings to the end of the block.
+
+    The outbox flushes on exit, including when the block raises: pages
+    already changed should still go live. If the block is cancelled (e.g. a
+    cron job over its time budget), the paths are only recorded as pending
+    for the next run, since a paced send would outlast the cancel grace
+    period. Nested blocks share the outermost outbox and only it flushes.
+    """
+    outer = _active_outbox.get()
+    if outer is not None:
+        yield outer
+        return
+
+    outbox = PublishOutbox()
+    token = _active_outbox.set(outbox)
+    cancelled = False
+    try:
+        yield outbox
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
+    finally:
+        _active_outbox.reset(token)
+        try:
+            await outbox.flush(send=not cancelled)
+        except Exception as e:
+            print(f"⚠️  Outbox flush failed: {e}")
+
+
+def flushes_page_changes(fn):
+    """Decorator: run an async entry point inside publish_outbox()."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        async with publish_outbox():
+            return await fn(*args, **kwargs)
+
+    return wrapper
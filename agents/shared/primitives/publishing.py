@@ -63,6 +63,22 @@ def publish_resort(
             metadata={"resort_id": resort_id, "status": "published"},
         )
 
+    # Inside a pipeline run, page updates are coalesced and sent when the run ends
+    from .outbox import get_active_outbox
+
+    outbox = get_active_outbox()
+    if outbox is not None and resort:
+        outbox.add_resort(
+            resort_id,
+            slug=resort.get("slug"),
+            country=resort.get("country"),
+            reason="publish",
+            listings=True,
+            revalidate=trigger_revalidation,
+            indexnow=trigger_indexnow,
+        )
+        return resort
+
     # Trigger revalidation
     if trigger_revalidation and resort:
         revalidate_resort_page(resort["slug"], resort["country"])
@@ -74,8 +90,7 @@ def publish_resort(
     if trigger_indexnow and resort:
         vercel_url = getattr(settings, "vercel_url", None)
         if vercel_url:
-            country_slug = resort["country"].lower().replace(" ", "-")
-            page_url = f"{vercel_url.rstrip('/')}/resorts/{country_slug}/{resort['slug']}"
+            page_url = f"{vercel_url.rstrip('/')}{resort_path(resort['slug'], resort['country'])}"
             indexnow_result = ping_indexnow(page_url)
             if indexnow_result.get("success"):
                 print(f"  IndexNow: Pinged {page_url}")
@@ -125,7 +140,19 @@ def unpublish_resort(
 
     # Trigger revalidation to remove from live site
     if trigger_revalidation and resort:
-        revalidate_resort_page(resort["slug"], resort["country"])
+        from .outbox import get_active_outbox
+
+        outbox = get_active_outbox()
+        if outbox is not None:
+            outbox.add_resort(
+                resort_id,
+                slug=resort.get("slug"),
+                country=resort.get("country"),
+                reason="unpublish",
+                listings=True,
+            )
+        else:
+            revalidate_resort_page(resort["slug"], resort["country"])
 
     return resort
 
@@ -238,22 +265,29 @@ def revalidate_resort_page(slug: str, country: str) -> dict[str, Any]:
     Returns:
         Revalidation result
     """
-    # Construct the page path
-    country_slug = country.lower().replace(" ", "-")
-    path = f"/resorts/{country_slug}/{slug}"
+    return revalidate_page(resort_path(slug, country))
 
-    return revalidate_page(path)
 
+def country_path(country: str) -> str:
+    """Site path of a country's resort listing (e.g. '/resorts/united-states')."""
+    return f"/resorts/{country.lower().replace(' ', '-')}"
 
-def revalidate_page(path: str) -> dict[str, Any]:
+
+def resort_path(slug: str, country: str) -> str:
+    """Site path of a resort page (e.g. '/resorts/usa/park-city')."""
+    return f"{country_path(country)}/{slug}"
+
+
+def revalidation_request(path: str) -> tuple[str, dict[str, Any]] | dict[str, Any]:
     """
-    Trigger Vercel ISR revalidation for any page.
+    Build the Vercel ISR revalidation request for a path.
 
     Args:
-        path: Page path to revalidate (e.g., '/resorts/usa/park-city')
+        path: Page path (leading slash optional)
 
     Returns:
-        Revalidation result with status
+        (endpoint URL, JSON body), or a failure result dict if Vercel
+        revalidation isn't configured
     """
     # Get Vercel revalidation settings
     vercel_url = getattr(settings, "vercel_url", None)
@@ -277,31 +311,41 @@ def revalidate_page(path: str) -> dict[str, Any]:
     if not path.startswith("/"):
         path = "/" + path
 
-    # Construct revalidation URL
+    # Send JSON body (endpoint expects body, not query params)
     revalidate_url = f"{vercel_url.rstrip('/')}/api/revalidate"
+    return revalidate_url, {"secret": revalidate_token, "path": path}
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            # Send JSON body (endpoint expects body, not query params)
-            response = client.post(
-                revalidate_url,
-                json={"secret": revalidate_token, "path": path},
-                headers={"Content-Type": "application/json"},
-            )
 
-            if response.status_code == 200:
-                return {
-                    "success": True,
-                    "path": path,
-                    "revalidated": True,
-                }
-            else:
-                return {
-                    "success": False,
-                    "path": path,
-                    "error": f"Revalidation failed: {response.status_code}",
-                    "response": response.text[:500],
-                }
+def revalidation_result(path: str, response: httpx.Response) -> dict[str, Any]:
+    """Convert a revalidation endpoint response into a result dict."""
+    if response.status_code == 200:
+        return {
+            "success": True,
+            "path": path,
+            "revalidated": True,
+        }
+    return {
+        "success": False,
+        "path": path,
+        "error": f"Revalidation failed: {response.status_code}",
+        "response": response.text[:500],
+    }
+
+
+def _revalidate_with(client: httpx.Client, path: str) -> dict[str, Any]:
+    request = revalidation_request(path)
+    if isinstance(request, dict):
+        return request
+    revalidate_url, body = request
+    path = body["path"]
+
+    try:
+        response = client.post(
+            revalidate_url,
+            json=body,
+            headers={"Content-Type": "application/json"},
+        )
+        return revalidation_result(path, response)
 
     except Exception as e:
         # Send alert for revalidation failure
@@ -316,21 +360,52 @@ def revalidate_page(path: str) -> dict[str, Any]:
         }
 
 
+def revalidate_page(path: str) -> dict[str, Any]:
+    """
+    Trigger Vercel ISR revalidation for any page.
+
+    Inside a publish_outbox() (pipeline runs), the path is queued and
+    revalidated once when the run's outbox flushes.
+
+    Args:
+        path: Page path to revalidate (e.g., '/resorts/usa/park-city')
+
+    Returns:
+        Revalidation result with status ("queued": True if deferred)
+    """
+    from .outbox import get_active_outbox
+
+    outbox = get_active_outbox()
+    if outbox is not None:
+        outbox.add_path(path)
+        return {"success": True, "path": path, "queued": True}
+
+    with httpx.Client(timeout=30.0) as client:
+        return _revalidate_with(client, path)
+
+
 def revalidate_multiple_pages(paths: list[str]) -> list[dict[str, Any]]:
     """
     Trigger revalidation for multiple pages.
 
+    Duplicate paths are revalidated once, over one pooled connection.
+
     Args:
         paths: List of page paths to revalidate
 
     Returns:
-        List of revalidation results
+        List of revalidation results (one per distinct path)
     """
-    results = []
-    for path in paths:
-        result = revalidate_page(path)
-        results.append(result)
-    return results
+    unique_paths = list(dict.fromkeys(paths))
+
+    from .outbox import get_active_outbox
+
+    outbox = get_active_outbox()
+    if outbox is not None:
+        return [revalidate_page(path) for path in unique_paths]
+
+    with httpx.Client(timeout=30.0) as client:
+        return [_revalidate_with(client, path) for path in unique_paths]
 
 
 # =============================================================================
@@ -629,6 +704,13 @@ def mark_resort_refreshed(resort_id: str) -> dict:
         .execute()
     )
 
+    # Refreshed costs, links and images change the live page
+    from .outbox import get_active_outbox
+
+    outbox = get_active_outbox()
+    if outbox is not None:
+        outbox.add_resort(resort_id, reason="refresh", indexnow=True)
+
     return response.data[0] if response.data else {}
 
 
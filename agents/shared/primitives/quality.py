@@ -165,6 +165,140 @@ OPTIONAL_CONTENT_SECTIONS = [
     "faqs",
 ]
 
+REQUIRED_SECTION_MIN_LENGTH = 50
+OPTIONAL_SECTION_MIN_LENGTH = 20
+
+
+# Issue builders shared by the per-resort checks below and the set-based
+# engine in quality_engine.py, so both report identical issues.
+
+
+def _stale_issue(
+    resort_id: str,
+    resort_name: str,
+    days_since: int | None,
+    last_refreshed: str | None,
+    threshold_days: int,
+) -> QualityIssue:
+    """Staleness issue; days_since None means the resort was never refreshed."""
+    if days_since is None:
+        return QualityIssue(
+            resort_id=resort_id,
+            resort_name=resort_name,
+            issue_type=IssueType.STALE,
+            severity=IssueSeverity.HIGH,
+            description="Resort has never been refreshed",
+            evidence={"last_refreshed": None},
+            recommended_action="re_research",
+            estimated_fix_cost=1.0,
+            auto_fixable=True,
+        )
+
+    severity = IssueSeverity.CRITICAL if days_since > 60 else IssueSeverity.HIGH if days_since > 45 else IssueSeverity.MEDIUM
+
+    return QualityIssue(
+        resort_id=resort_id,
+        resort_name=resort_name,
+        issue_type=IssueType.STALE,
+        severity=severity,
+        description=f"Content is {days_since} days old (threshold: {threshold_days})",
+        evidence={"days_since_refresh": days_since, "last_refreshed": last_refreshed},
+        recommended_action="re_research",
+        estimated_fix_cost=1.0,
+        auto_fixable=True,
+    )
+
+
+def _low_confidence_issue(
+    resort_id: str,
+    resort_name: str,
+    confidence: float,
+    status: str,
+    threshold: float,
+) -> QualityIssue:
+    """Low-confidence issue for a resort already known to be below threshold."""
+    # Critical if published with very low confidence
+    if status == "published" and confidence < 0.5:
+        severity = IssueSeverity.CRITICAL
+    elif status == "published":
+        severity = IssueSeverity.HIGH
+    else:
+        severity = IssueSeverity.MEDIUM
+
+    return QualityIssue(
+        resort_id=resort_id,
+        resort_name=resort_name,
+        issue_type=IssueType.LOW_CONFIDENCE,
+        severity=severity,
+        description=f"Confidence score {confidence:.2f} is below threshold {threshold}",
+        evidence={"confidence_score": confidence, "threshold": threshold, "status": status},
+        recommended_action="re_research" if confidence < 0.5 else "review",
+        estimated_fix_cost=1.0 if confidence < 0.5 else 0.5,
+        auto_fixable=confidence < 0.5,
+    )
+
+
+def _section_too_short(value: Any, min_length: int) -> bool:
+    """True if a content section is missing or its text is under min_length."""
+    return not value or (isinstance(value, str) and len(value.strip()) < min_length)
+
+
+def _completeness_issues(
+    resort_id: str,
+    resort_name: str,
+    content: dict[str, Any] | None,
+) -> list[QualityIssue]:
+    """Missing-content issues for one resort's resort_content row (None if absent)."""
+    issues = []
+
+    if not content:
+        issues.append(QualityIssue(
+            resort_id=resort_id,
+            resort_name=resort_name,
+            issue_type=IssueType.INCOMPLETE,
+            severity=IssueSeverity.CRITICAL,
+            description="No content record exists",
+            evidence={"missing": "entire content record"},
+            recommended_action="generate_content",
+            estimated_fix_cost=2.0,
+            auto_fixable=True,
+        ))
+        return issues
+
+    # Check required sections
+    for section in REQUIRED_CONTENT_SECTIONS:
+        value = content.get(section)
+        if _section_too_short(value, REQUIRED_SECTION_MIN_LENGTH):
+            issues.append(QualityIssue(
+                resort_id=resort_id,
+                resort_name=resort_name,
+                issue_type=IssueType.MISSING_SECTION,
+                severity=IssueSeverity.HIGH,
+                description=f"Required section '{section}' is missing or too short",
+                evidence={"section": section, "current_length": len(value) if value else 0},
+                recommended_action="regenerate_section",
+                estimated_fix_cost=0.3,
+                auto_fixable=True,
+            ))
+
+    # Check optional sections (lower severity)
+    for section in OPTIONAL_CONTENT_SECTIONS:
+        value = content.get(section)
+        if _section_too_short(value, OPTIONAL_SECTION_MIN_LENGTH):
+            issues.append(QualityIssue(
+                resort_id=resort_id,
+                resort_name=resort_name,
+                issue_type=IssueType.MISSING_SECTION,
+                severity=IssueSeverity.LOW,
+                description=f"Optional section '{section}' is missing",
+                evidence={"section": section},
+                recommended_action="regenerate_section",
+                estimated_fix_cost=0.2,
+                auto_fixable=True,
+            ))
+
+    return issues
+
 
 def check_staleness(
     resort_id: str,
@@ -197,35 +331,13 @@ def check_staleness(
     last_refreshed = resort.get("last_refreshed") or resort.get("updated_at")
 
     if not last_refreshed:
-        return QualityIssue(
-            resort_id=resort_id,
-            resort_name=resort["name"],
-            issue_type=IssueType.STALE,
-            severity=IssueSeverity.HIGH,
-            description="Resort has never been refreshed",
-            evidence={"last_refreshed": None},
-            recommended_action="re_research",
-            estimated_fix_cost=1.0,
-            auto_fixable=True,
-        )
+        return _stale_issue(resort_id, resort["name"], None, None, threshold_days)
 
     last_date = datetime.fromisoformat(last_refreshed.replace("Z", "+00:00"))
     days_since = (datetime.now(last_date.tzinfo) - last_date).days
 
     if days_since > threshold_days:
-        severity = IssueSeverity.CRITICAL if days_since > 60 else IssueSeverity.HIGH if days_since > 45 else IssueSeverity.MEDIUM
-
-        return QualityIssue(
-            resort_id=resort_id,
-            resort_name=resort["name"],
-            issue_type=IssueType.STALE,
-            severity=severity,
-            description=f"Content is {days_since} days old (threshold: {threshold_days})",
-            evidence={"days_since_refresh": days_since, "last_refreshed": last_refreshed},
-            recommended_action="re_research",
-            estimated_fix_cost=1.0,
-            auto_fixable=True,
-        )
+        return _stale_issue(resort_id, resort["name"], days_since, last_refreshed, threshold_days)
 
     return None
 
@@ -262,25 +374,7 @@ def check_low_confidence(
     status = resort.get("status", "draft")
 
     if confidence < threshold:
-        # Critical if published with very low confidence
-        if status == "published" and confidence < 0.5:
-            severity = IssueSeverity.CRITICAL
-        elif status == "published":
-            severity = IssueSeverity.HIGH
-        else:
-            severity = IssueSeverity.MEDIUM
-
-        return QualityIssue(
-            resort_id=resort_id,
-            resort_name=resort["name"],
-            issue_type=IssueType.LOW_CONFIDENCE,
-            severity=severity,
-            description=f"Confidence score {confidence:.2f} is below threshold {threshold}",
-            evidence={"confidence_score": confidence, "threshold": threshold, "status": status},
-            recommended_action="re_research" if confidence < 0.5 else "review",
-            estimated_fix_cost=1.0 if confidence < 0.5 else 0.5,
-            auto_fixable=confidence < 0.5,
-        )
+        return _low_confidence_issue(resort_id, resort["name"], confidence, status, threshold)
 
     return None
 
@@ -322,57 +416,7 @@ def check_completeness(
         .execute()
     )
 
-    issues = []
-
-    if not content_response.data:
-        issues.append(QualityIssue(
-            resort_id=resort_id,
-            resort_name=resort_name,
-            issue_type=IssueType.INCOMPLETE,
-            severity=IssueSeverity.CRITICAL,
-            description="No content record exists",
-            evidence={"missing": "entire content record"},
-            recommended_action="generate_content",
-            estimated_fix_cost=2.0,
-            auto_fixable=True,
-        ))
-        return issues
-
-    content = content_response.data
-
-    # Check required sections
-    for section in REQUIRED_CONTENT_SECTIONS:
-        value = content.get(section)
-        if not value or (isinstance(value, str) and len(value.strip()) < 50):
-            issues.append(QualityIssue(
-                resort_id=resort_id,
-                resort_name=resort_name,
-                issue_type=IssueType.MISSING_SECTION,
-                severity=IssueSeverity.HIGH,
-                description=f"Required section '{section}' is missing or too short",
-                evidence={"section": section, "current_length": len(value) if value else 0},
-                recommended_action="regenerate_section",
-                estimated_fix_cost=0.3,
-                auto_fixable=True,
-            ))
-
-    # Check optional sections (lower severity)
-    for section in OPTIONAL_CONTENT_SECTIONS:
-        value = content.get(section)
-        if not value or (isinstance(value, str) and len(value.strip()) < 20):
-            issues.append(QualityIssue(
-                resort_id=resort_id,
-                resort_name=resort_name,
-                issue_type=IssueType.MISSING_SECTION,
-                severity=IssueSeverity.LOW,
-                description=f"Optional section '{section}' is missing",
-                evidence={"section": section},
-                recommended_action="regenerate_section",
-                estimated_fix_cost=0.2,
-                auto_fixable=True,
-            ))
-
-    return issues
+    return _completeness_issues(resort_id, resort_name, content_response.data)
 
 
 def get_resorts_needing_audit(
@@ -462,6 +506,21 @@ def get_stale_resorts_count(
 # =============================================================================
 
 
+ISSUE_INSERT_BATCH_SIZE = 500  # agent_audit_log rows per insert
+
+
+def _issue_audit_row(issue: QualityIssue, issue_id: str) -> dict[str, Any]:
+    """agent_audit_log row for a quality issue."""
+    return {
+        "id": issue_id,
+        "task_id": f"quality_issue_{issue.resort_id}",
+        "agent_name": "quality",
+        "action": f"issue_detected:{issue.issue_type.value}",
+        "reasoning": issue.description,
+        "metadata": issue.to_dict(),
+    }
+
+
 def log_quality_issue(issue: QualityIssue) -> str | None:
     """
     Log a quality issue to the database for tracking.
@@ -478,20 +537,48 @@ def log_quality_issue(issue: QualityIssue) -> str | None:
     issue_id = str(uuid4())
 
     try:
-        client.table("agent_audit_log").insert({
-            "id": issue_id,
-            "task_id": f"quality_issue_{issue.resort_id}",
-            "agent_name": "quality",
-            "action": f"issue_detected:{issue.issue_type.value}",
-            "reasoning": issue.description,
-            "metadata": issue.to_dict(),
-        }).execute()
+        client.table("agent_audit_log").insert(_issue_audit_row(issue, issue_id)).execute()
         return issue_id
     except Exception as e:
         print(f"Warning: Failed to log quality issue: {e}")
         return None
 
 
+def log_quality_issues(
+    issues: list[QualityIssue],
+    batch_size: int = ISSUE_INSERT_BATCH_SIZE,
+) -> int:
+    """
+    Log many quality issues with batched inserts.
+
+    Same rows as log_quality_issue(), but one round trip per batch_size
+    issues instead of one per issue. A failed batch is reported and
+    skipped so one bad batch doesn't lose the rest.
+
+    Args:
+        issues: QualityIssues to log
+        batch_size: Rows per insert
+
+    Returns:
+        Number of issues logged
+    """
+    client = get_supabase_client()
+
+    from uuid import uuid4
+
+    logged = 0
+    for start in range(0, len(issues), batch_size):
+        batch = issues[start:start + batch_size]
+        rows = [_issue_audit_row(issue, str(uuid4())) for issue in batch]
+        try:
+            client.table("agent_audit_log").insert(rows).execute()
+            logged += len(rows)
+        except Exception as e:
+            print(f"Warning: Failed to log {len(rows)} quality issues: {e}")
+
+    return logged
+
+
 def log_audit_run(result: AuditResult) -> str | None:
     """
     Log an audit run to the database.
@@ -839,7 +926,7 @@ def score_resort_page(resort_id: str) -> PageQualityScore | None:
     content_results = []
 
     # quick_take_length
-    quick_take = content.get("quick_take", "")
+    quick_take = content.get("quick_take") or ""
     word_count = _count_words(quick_take)
     passed = 50 <= word_count <= 95
     content_results.append(CheckResult(
@@ -864,11 +951,11 @@ def score_resort_page(resort_id: str) -> PageQualityScore | None:
 
     # no_em_dashes - check all content fields
     all_content = " ".join([
-        content.get("quick_take", ""),
-        content.get("getting_there", ""),
-        content.get("where_to_stay", ""),
-        content.get("on_mountain", ""),
-        content.get("off_mountain", ""),
+        content.get("quick_take") or "",
+        content.get("getting_there") or "",
+        content.get("where_to_stay") or "",
+        content.get("on_mountain") or "",
+        content.get("off_mountain") or "",
     ])
     has_dashes = _check_for_dashes(all_content)
     content_results.append(CheckResult(
@@ -932,7 +1019,7 @@ def score_resort_page(resort_id: str) -> PageQualityScore | None:
     ))
 
     # has_terrain_data (difficulty breakdown from trail_map_data)
-    difficulty = trail_map.get("difficulty_breakdown", {})
+    difficulty = trail_map.get("difficulty_breakdown") or {}
     has_terrain = bool(difficulty.get("easy") or difficulty.get("intermediate") or difficulty.get("advanced"))
     terrain_details = ""
     if has_terrain:
@@ -1086,41 +1173,32 @@ def get_resorts_below_quality_threshold(
     """
     Get resorts that score below the quality threshold.
 
+    Reads the materialized resort_page_scores table, which the daily
+    pipeline keeps current with refresh_page_scores(); stale rows are left
+    out until then. Falls back to scoring every resort in memory if the
+    table isn't available.
+
     Args:
         threshold_pct: Minimum acceptable quality percentage
         status: Filter by resort status
-        limit: Maximum results
+        limit: Maximum results (the worst `limit` resorts overall)
 
     Returns:
-        List of resort dicts with quality scores
+        List of resort dicts with quality scores, worst first
     """
-    client = get_supabase_client()
-
-    # Get all resorts
-    response = (
-        client.table("resorts")
-        .select("id, name, slug, status")
-        .eq("status", status)
-        .limit(limit)
-        .execute()
+    from .quality_engine import (
+        get_low_scoring_resorts,
+        load_quality_frame,
+        resorts_below_threshold,
     )
 
-    results = []
-    for resort in (response.data or []):
-        score = score_resort_page(resort["id"])
-        if score and score.score_pct < threshold_pct:
-            results.append({
-                **resort,
-                "quality_score": score.score_pct,
-                "failing_checks": [r.check_id for r in score.failing_checks],
-                "passed": score.passed_checks,
-                "total": score.total_checks,
-            })
-
-    # Sort by quality score (worst first)
-    results.sort(key=lambda x: x["quality_score"])
+    try:
+        return get_low_scoring_resorts(threshold_pct=threshold_pct, status=status, limit=limit)
+    except Exception as e:
+        print(f"Warning: Page score table unavailable, scoring in memory: {e}")
 
-    return results
+    frame = load_quality_frame(status=status)
+    return resorts_below_threshold(frame, threshold_pct=threshold_pct, limit=limit)
 
 
 async def queue_quality_improvements(
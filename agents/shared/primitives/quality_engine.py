@@ -0,0 +1,721 @@
+"""Set-based quality checks over the whole catalogue.
+
+The Quick Scan used to call check_staleness(), check_low_confidence() and
+check_completeness() for every published resort, each with its own single()
+query, then insert each issue on its own: thousands of round trips per
+scan. get_resorts_below_quality_threshold() did the same with
+score_resort_page(), six queries per resort.
+
+This engine loads resorts, content, metrics, costs, images and links in a
+few paginated, column-projected queries, lays them out as per-resort
+columns, and evaluates every check as an array predicate. Only the rows
+that fail are turned into QualityIssue objects, using the same issue
+builders as the per-resort checks in quality.py, so both paths report
+identical issues. The Perfect Page checks mirror score_resort_page(),
+which stays the single-resort path (it also returns per-check details).
+
+Page scores are also materialized in resort_page_scores, keyed by a hash
+of their inputs and invalidated by triggers on the input tables, so
+routine reads (the orchestrator's quality queue) are one indexed query
+and refresh_page_scores() only re-scores resorts whose inputs changed.
+
+Usage:
+    frame = load_quality_frame()
+    issues = formula_issues(frame)
+    log_quality_issues(issues)
+
+    below = resorts_below_threshold(frame, threshold_pct=80.0)
+
+    refresh_page_scores()
+    worst = get_low_scoring_resorts(threshold_pct=70.0, limit=10)
+"""
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+from postgrest.types import ReturnMethod
+
+from ..supabase_client import get_supabase_client
+from .quality import (
+    LLM_MARKERS,
+    OPTIONAL_CONTENT_SECTIONS,
+    OPTIONAL_SECTION_MIN_LENGTH,
+    PERFECT_PAGE_CHECKLIST,
+    REQUIRED_CONTENT_SECTIONS,
+    REQUIRED_SECTION_MIN_LENGTH,
+    QualityIssue,
+    _completeness_issues,
+    _low_confidence_issue,
+    _stale_issue,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+PAGE_SIZE = 1000           # PostgREST max rows per request
+CONTENT_PAGE_SIZE = 200    # resort_content rows carry full section text
+ID_CHUNK_SIZE = 200        # Resort IDs per in_() filter (keeps URLs short)
+
+RESORT_COLUMNS = "id, name, slug, status, last_refreshed, updated_at, trail_map_data"
+CONFIDENCE_COLUMN = "confidence_score"
+
+# Text the checks read; the other resort_content columns are never fetched
+PAGE_TEXT_SECTIONS = ("quick_take", "getting_there", "where_to_stay", "on_mountain", "off_mountain")
+CONTENT_SECTIONS = tuple(dict.fromkeys(
+    [*REQUIRED_CONTENT_SECTIONS, *OPTIONAL_CONTENT_SECTIONS, *PAGE_TEXT_SECTIONS]
+))
+CONTENT_COLUMNS = ", ".join(["resort_id", "tagline", *CONTENT_SECTIONS])
+
+METRIC_COLUMNS = "resort_id, family_overall_score, best_age_min, best_age_max, perfect_if, skip_if"
+COST_COLUMNS = "resort_id, lift_adult_daily, lift_child_daily, lodging_mid_nightly"
+IMAGE_COLUMNS = "resort_id, image_type"
+LINK_COLUMNS = "resort_id, category"
+
+HERO_IMAGE_TYPES = ("hero", "atmosphere")
+
+PAGE_CHECK_IDS = tuple(
+    check_id for checks in PERFECT_PAGE_CHECKLIST.values() for check_id, _, _ in checks
+)
+
+# Length recorded for non-text sections that are present (e.g. a non-empty faqs list)
+PRESENT_NON_TEXT = np.iinfo(np.int32).max
+
+
+# ============================================================================
+# FRAME
+# ============================================================================
+
+@dataclass
+class QualityFrame:
+    """Everything the checks read, one row per resort (aligned with resort_ids)."""
+    resort_ids: list[str]
+    resorts: list[dict[str, Any]]
+    content: list[dict[str, Any] | None]      # None if no resort_content row
+    metrics: list[dict[str, Any]]             # {} if missing
+    costs: list[dict[str, Any]]               # {} if missing
+    hero_images: np.ndarray                   # int, hero/atmosphere image count
+    official_links: np.ndarray                # int, links with category "official"
+    link_counts: np.ndarray                   # int, all links
+    has_confidence: bool = True               # False if resorts.confidence_score is absent
+    page_data: bool = True                    # False if loaded for formula checks only
+    index: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.index:
+            self.index = {rid: i for i, rid in enumerate(self.resort_ids)}
+
+    def __len__(self) -> int:
+        return len(self.resort_ids)
+
+
+def _fetch_rows(
+    table: str,
+    columns: str,
+    order_by: tuple[str, ...],
+    page_size: int = PAGE_SIZE,
+    resort_ids: list[str] | None = None,
+    id_column: str = "resort_id",
+    **filters: Any,
+) -> list[dict[str, Any]]:
+    """Read every matching row of a table, a page at a time.
+
+    With resort_ids, reads only those resorts' rows (in_() chunks of
+    ID_CHUNK_SIZE). order_by must cover the table's key so pages don't
+    overlap or skip rows.
+    """
+    supabase = get_supabase_client()
+    chunks = (
+        [resort_ids[i:i + ID_CHUNK_SIZE] for i in range(0, len(resort_ids), ID_CHUNK_SIZE)]
+        if resort_ids is not None else [None]
+    )
+    rows: list[dict[str, Any]] = []
+
+    for chunk in chunks:
+        offset = 0
+        while True:
+            query = supabase.table(table).select(columns)
+            if chunk is not None:
+                query = query.in_(id_column, chunk)
+            for column, value in filters.items():
+                query = query.eq(column, value)
+            for column in order_by:
+                query = query.order(column)
+            page = query.range(offset, offset + page_size - 1).execute().data or []
+            rows.extend(page)
+            if len(page) < page_size:
+                break
+            offset += page_size
+
+    return rows
+
+
+def _fetch_resorts(
+    status: str | None,
+    resort_ids: list[str] | None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Resort rows, plus whether confidence_score could be read."""
+    filters = {"status": status} if status else {}
+    try:
+        rows = _fetch_rows(
+            "resorts", f"{RESORT_COLUMNS}, {CONFIDENCE_COLUMN}", ("id",),
+            resort_ids=resort_ids, id_column="id", **filters,
+        )
+        return rows, True
+    except Exception as e:
+        # Older schemas have no confidence_score; skip that check, not the scan
+        logger.warning(f"Loading resorts without {CONFIDENCE_COLUMN}: {e}")
+        rows = _fetch_rows(
+            "resorts", RESORT_COLUMNS, ("id",),
+            resort_ids=resort_ids, id_column="id", **filters,
+        )
+        return rows, False
+
+
+def _first_by_resort(rows: list[dict[str, Any]], wanted: set[str]) -> dict[str, dict[str, Any]]:
+    by_resort: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        if row["resort_id"] in wanted:
+            by_resort.setdefault(row["resort_id"], row)
+    return by_resort
+
+
+def _count_by_resort(rows: list[dict[str, Any]], index: dict[str, int], keep=None) -> np.ndarray:
+    counts = np.zeros(len(index), dtype=np.int32)
+    for row in rows:
+        i = index.get(row["resort_id"])
+        if i is not None and (keep is None or keep(row)):
+            counts[i] += 1
+    return counts
+
+
+def load_quality_frame(
+    status: str | None = "published",
+    resort_ids: list[str] | None = None,
+    page_data: bool = True,
+) -> QualityFrame:
+    """Bulk-load everything the quality checks need.
+
+    Two paginated queries for the formula checks (resorts, content), six
+    with the Perfect Page data, regardless of resort count.
+
+    Args:
+        status: Only include resorts with this status (None for all)
+        resort_ids: Only include these resorts (None for all)
+        page_data: Also load metrics, costs, images and links for
+            the Perfect Page checks
+
+    Returns:
+        QualityFrame
+    """
+    resorts, has_confidence = _fetch_resorts(status, resort_ids)
+    ids = [r["id"] for r in resorts]
+    index = {rid: i for i, rid in enumerate(ids)}
+    wanted = set(ids)
+    # Related tables are read whole unless the resort set is small
+    related_ids = ids if resort_ids is not None else None
+
+    content_rows = _fetch_rows(
+        "resort_content", CONTENT_COLUMNS, ("resort_id",),
+        page_size=CONTENT_PAGE_SIZE, resort_ids=related_ids,
+    ) if ids else []
+    content_by_resort = _first_by_resort(content_rows, wanted)
+
+    metrics_by_resort: dict[str, dict[str, Any]] = {}
+    costs_by_resort: dict[str, dict[str, Any]] = {}
+    hero_images = np.zeros(len(ids), dtype=np.int32)
+    official_links = np.zeros(len(ids), dtype=np.int32)
+    link_counts = np.zeros(len(ids), dtype=np.int32)
+
+    if page_data and ids:
+        metrics_by_resort = _first_by_resort(
+            _fetch_rows("resort_family_metrics", METRIC_COLUMNS, ("resort_id",),
+                        resort_ids=related_ids),
+            wanted,
+        )
+        costs_by_resort = _first_by_resort(
+            _fetch_rows("resort_costs", COST_COLUMNS, ("resort_id",), resort_ids=related_ids),
+            wanted,
+        )
+
+        images = _fetch_rows(
+            "resort_images", IMAGE_COLUMNS, ("resort_id", "image_type", "id"),
+            resort_ids=related_ids,
+        )
+        hero_images = _count_by_resort(
+            images, index, keep=lambda r: r.get("image_type") in HERO_IMAGE_TYPES
+        )
+
+        links = _fetch_rows(
+            "resort_links", LINK_COLUMNS, ("resort_id", "id"), resort_ids=related_ids
+        )
+        link_counts = _count_by_resort(links, index)
+        official_links = _count_by_resort(
+            links, index, keep=lambda r: r.get("category") == "official"
+        )
+
+    return QualityFrame(
+        resort_ids=ids,
+        resorts=resorts,
+        content=[content_by_resort.get(rid) for rid in ids],
+        metrics=[metrics_by_resort.get(rid) or {} for rid in ids],
+        costs=[costs_by_resort.get(rid) or {} for rid in ids],
+        hero_images=hero_images,
+        official_links=official_links,
+        link_counts=link_counts,
+        has_confidence=has_confidence,
+        page_data=page_data,
+        index=index,
+    )
+
+
+# ============================================================================
+# COLUMNS
+# ============================================================================
+
+def _column(rows: list[dict[str, Any] | None], key: str) -> list[Any]:
+    return [(row or {}).get(key) for row in rows]
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def _section_lengths(values: list[Any]) -> np.ndarray:
+    """Stripped text length per row; PRESENT_NON_TEXT for present non-text values."""
+    return np.array([
+        0 if not v else len(v.strip()) if isinstance(v, str) else PRESENT_NON_TEXT
+        for v in values
+    ], dtype=np.int64)
+
+
+def _timestamps(values: list[Any]) -> np.ndarray:
+    """Epoch seconds per row (NaN if missing). Naive timestamps are taken as UTC."""
+    out = np.full(len(values), np.nan)
+    for i, value in enumerate(values):
+        if not value:
+            continue
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        out[i] = parsed.timestamp()
+    return out
+
+
+def _json_list(value: Any) -> list:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            return []
+    return value or []
+
+
+def _word_count(text: str) -> int:
+    # Same as quality._count_words: strip HTML tags, split on whitespace
+    return len(re.sub(r"<[^>]+>", " ", text).split()) if text else 0
+
+
+# ============================================================================
+# FORMULA CHECKS (Quick Scan)
+# ============================================================================
+
+def formula_issues(
+    frame: QualityFrame,
+    staleness_threshold_days: int = 30,
+    confidence_threshold: float = 0.7,
+    now: datetime | None = None,
+) -> list[QualityIssue]:
+    """Staleness, low-confidence and completeness issues for every resort.
+
+    Equivalent to calling check_staleness(), check_low_confidence() and
+    check_completeness() per resort, in that order, without the queries.
+
+    Args:
+        frame: Loaded QualityFrame
+        staleness_threshold_days: Days after which content is stale
+        confidence_threshold: Confidence score below which is considered low
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+        Issues grouped by resort, in frame order
+    """
+    n = len(frame)
+    if n == 0:
+        return []
+
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    names = _column(frame.resorts, "name")
+    found: list[tuple[int, int, QualityIssue]] = []  # (row, check order, issue)
+
+    # Staleness
+    refreshed = [
+        r.get("last_refreshed") or r.get("updated_at") for r in frame.resorts
+    ]
+    refreshed_ts = _timestamps(refreshed)
+    never = np.isnan(refreshed_ts)
+    days_since = np.floor((now_ts - np.where(never, now_ts, refreshed_ts)) / 86400)
+    stale = ~never & (days_since > staleness_threshold_days)
+
+    for i in np.flatnonzero(never | stale):
+        days = None if never[i] else int(days_since[i])
+        found.append((i, 0, _stale_issue(
+            frame.resort_ids[i], names[i], days, refreshed[i], staleness_threshold_days
+        )))
+
+    # Confidence
+    if frame.has_confidence:
+        confidence = np.array(
+            [r.get("confidence_score", 0.0) or 0.0 for r in frame.resorts], dtype=np.float64
+        )
+        for i in np.flatnonzero(confidence < confidence_threshold):
+            found.append((i, 1, _low_confidence_issue(
+                frame.resort_ids[i], names[i], float(confidence[i]),
+                frame.resorts[i].get("status", "draft"), confidence_threshold,
+            )))
+
+    # Completeness: flag rows missing content or with any short section,
+    # then build the issues for just those rows
+    incomplete = np.array([c is None for c in frame.content])
+    for sections, min_length in (
+        (REQUIRED_CONTENT_SECTIONS, REQUIRED_SECTION_MIN_LENGTH),
+        (OPTIONAL_CONTENT_SECTIONS, OPTIONAL_SECTION_MIN_LENGTH),
+    ):
+        for section in sections:
+            incomplete |= _section_lengths(_column(frame.content, section)) < min_length
+
+    for i in np.flatnonzero(incomplete):
+        for issue in _completeness_issues(frame.resort_ids[i], names[i], frame.content[i]):
+            found.append((i, 2, issue))
+
+    found.sort(key=lambda item: (item[0], item[1]))  # Stable: keeps section order
+    return [issue for _, _, issue in found]
+
+
+# ============================================================================
+# PERFECT PAGE CHECKS
+# ============================================================================
+
+def page_check_matrix(frame: QualityFrame) -> np.ndarray:
+    """Pass/fail for every Perfect Page check, shape (resorts, len(PAGE_CHECK_IDS)).
+
+    Column order is PAGE_CHECK_IDS; the predicates match score_resort_page().
+    """
+    if not frame.page_data:
+        raise ValueError("QualityFrame was loaded without page data")
+
+    content = frame.content
+    all_text = [
+        " ".join(_text((c or {}).get(s)) for s in PAGE_TEXT_SECTIONS) for c in content
+    ]
+    lowered = [t.lower() for t in all_text]
+
+    words = np.array([_word_count(_text(q)) for q in _column(content, "quick_take")])
+    tagline_len = np.array([len(_text(t).strip()) for t in _column(content, "tagline")])
+
+    trail_maps = [r.get("trail_map_data") or {} for r in frame.resorts]
+    difficulty = [t.get("difficulty_breakdown") or {} for t in trail_maps]
+
+    def present(rows: list[dict[str, Any]], *keys: str) -> np.ndarray:
+        return np.array([all(row.get(k) is not None for k in keys) for row in rows], dtype=bool)
+
+    columns = {
+        # Content
+        "quick_take_length": (words >= 50) & (words <= 95),
+        "tagline_exists": tagline_len >= 20,
+        "no_em_dashes": np.array(["—" not in t and "–" not in t for t in all_text], dtype=bool),
+        "no_llm_markers": np.array(
+            [not any(m in t for m in LLM_MARKERS) for t in lowered], dtype=bool
+        ),
+        "has_pro_tips": np.array(["pro tip" in t or "pro-tip" in t for t in lowered], dtype=bool),
+        # Media
+        "has_hero_image": frame.hero_images > 0,
+        "has_trail_map": np.array(
+            [bool(t.get("piste_count")) or bool(t.get("official_map_url")) for t in trail_maps],
+            dtype=bool,
+        ),
+        "has_terrain_data": np.array(
+            [bool(d.get("easy") or d.get("intermediate") or d.get("advanced")) for d in difficulty],
+            dtype=bool,
+        ),
+        # Data
+        "has_lift_prices": present(frame.costs, "lift_adult_daily", "lift_child_daily"),
+        "has_family_score": present(frame.metrics, "family_overall_score"),
+        "has_best_age_range": present(frame.metrics, "best_age_min", "best_age_max"),
+        "has_lodging_prices": present(frame.costs, "lodging_mid_nightly"),
+        "has_perfect_if": np.array(
+            [len(_json_list(m.get("perfect_if"))) >= 3 for m in frame.metrics], dtype=bool
+        ),
+        "has_skip_if": np.array(
+            [len(_json_list(m.get("skip_if"))) >= 1 for m in frame.metrics], dtype=bool
+        ),
+        # Links
+        "has_official_link": frame.official_links > 0,
+        "has_outbound_links": frame.link_counts >= 3,
+    }
+
+    matrix = np.zeros((len(frame), len(PAGE_CHECK_IDS)), dtype=bool)
+    for col, check_id in enumerate(PAGE_CHECK_IDS):
+        matrix[:, col] = columns[check_id]
+    return matrix
+
+
+def page_scores(frame: QualityFrame, matrix: np.ndarray | None = None) -> np.ndarray:
+    """Perfect Page score percentage per resort (same as PageQualityScore.score_pct)."""
+    if matrix is None:
+        matrix = page_check_matrix(frame)
+    if not PAGE_CHECK_IDS:
+        return np.zeros(len(frame))
+    return matrix.sum(axis=1) / len(PAGE_CHECK_IDS) * 100
+
+
+def resorts_below_threshold(
+    frame: QualityFrame,
+    threshold_pct: float = 80.0,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Resorts scoring below threshold_pct, worst first.
+
+    Args:
+        frame: QualityFrame loaded with page data
+        threshold_pct: Minimum acceptable quality percentage
+        limit: Maximum results (None for all)
+
+    Returns:
+        Resort dicts (id, name, slug, status) with quality_score,
+        failing_checks, passed and total
+    """
+    matrix = page_check_matrix(frame)
+    scores = page_scores(frame, matrix)
+    passed = matrix.sum(axis=1)
+
+    below = np.flatnonzero(scores < threshold_pct)
+    below = below[np.argsort(scores[below], kind="stable")]
+    if limit is not None:
+        below = below[:limit]
+
+    results = []
+    for i in below:
+        resort = frame.resorts[i]
+        results.append({
+            "id": resort["id"],
+            "name": resort.get("name"),
+            "slug": resort.get("slug"),
+            "status": resort.get("status"),
+            "quality_score": float(scores[i]),
+            "failing_checks": [PAGE_CHECK_IDS[c] for c in np.flatnonzero(~matrix[i])],
+            "passed": int(passed[i]),
+            "total": len(PAGE_CHECK_IDS),
+        })
+    return results
+
+
+# ============================================================================
+# MATERIALIZED SCORES
+# ============================================================================
+# resort_page_scores (migration 053) stores each resort's score with a hash
+# of the inputs it was computed from. Triggers on the input tables bump an
+# invalidation counter; refresh_page_scores() re-scores only stale rows and
+# rewrites a score only when its input hash changed.
+
+PAGE_SCORES_TABLE = "resort_page_scores"
+PAGE_SCORE_VERSION = 1     # Bump when a check's predicate changes (forces re-scoring)
+REFRESH_BATCH_SIZE = 200   # Resorts loaded and scored per chunk
+UPSERT_BATCH_SIZE = 500    # Score rows per upsert
+
+SCORE_ROW_COLUMNS = (
+    "resort_id, score_pct, passed_checks, total_checks, failing_checks, "
+    "resorts!inner(name, slug, country, status)"
+)
+
+
+def _without_resort_id(row: dict[str, Any] | None) -> dict[str, Any]:
+    return {k: v for k, v in (row or {}).items() if k != "resort_id"}
+
+
+def page_input_hash(frame: QualityFrame, i: int) -> str:
+    """Hash of exactly the inputs the Perfect Page checks read for row i."""
+    resort = frame.resorts[i]
+    trail_map = resort.get("trail_map_data") or {}
+    payload = {
+        "v": PAGE_SCORE_VERSION,
+        "checks": PAGE_CHECK_IDS,
+        "resort": [resort.get("name"), resort.get("status")],
+        "trail_map": [
+            trail_map.get("piste_count"),
+            trail_map.get("official_map_url"),
+            trail_map.get("difficulty_breakdown"),
+        ],
+        "content": _without_resort_id(frame.content[i]) if frame.content[i] is not None else None,
+        "metrics": _without_resort_id(frame.metrics[i]),
+        "costs": _without_resort_id(frame.costs[i]),
+        "counts": [
+            int(frame.hero_images[i]), int(frame.official_links[i]), int(frame.link_counts[i])
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _stored_scores(
+    resort_ids: list[str] | None,
+    stale_only: bool,
+) -> dict[str, dict[str, Any]]:
+    """resort_id -> {invalidations, scored_version, input_hash} for the rows to refresh."""
+    filters = {"stale": True} if stale_only else {}
+    rows = _fetch_rows(
+        PAGE_SCORES_TABLE, "resort_id, invalidations, scored_version, input_hash", ("resort_id",),
+        resort_ids=resort_ids, **filters,
+    )
+    return {row["resort_id"]: row for row in rows}
+
+
+def _upsert_score_rows(rows: list[dict[str, Any]], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+    """Upsert resort_page_scores rows in batches; a failed batch is reported and skipped."""
+    supabase = get_supabase_client()
+    written = 0
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        try:
+            supabase.table(PAGE_SCORES_TABLE).upsert(
+                batch, on_conflict="resort_id", returning=ReturnMethod.minimal
+            ).execute()
+            written += len(batch)
+        except Exception as e:
+            print(f"Failed to store page score batch at row {start}: {e}")
+    return written
+
+
+def refresh_page_scores(
+    resort_ids: list[str] | None = None,
+    force: bool = False,
+    batch_size: int = REFRESH_BATCH_SIZE,
+) -> dict[str, int]:
+    """Re-score stale resort_page_scores rows, streaming resorts in chunks.
+
+    Each chunk of batch_size resorts is loaded with load_quality_frame()
+    and scored with page_check_matrix(). Rows whose input hash is unchanged
+    only have their version bumped; the rest get a new score.
+
+    Args:
+        resort_ids: Only consider these resorts (None for all)
+        force: Re-check every row, not just stale ones (rows whose hash
+            is unchanged are still not rewritten)
+        batch_size: Resorts per chunk
+
+    Returns:
+        Statistics: checked, rescored, unchanged, missing (resort gone), written
+    """
+    # Triggers create a row for every resort, so the table is the worklist
+    stored = _stored_scores(resort_ids, stale_only=not force)
+    targets = sorted(stored)
+    stats = {"checked": 0, "rescored": 0, "unchanged": 0, "missing": 0, "written": 0}
+
+    for start in range(0, len(targets), batch_size):
+        chunk = targets[start:start + batch_size]
+        frame = load_quality_frame(status=None, resort_ids=chunk)
+        matrix = page_check_matrix(frame)
+        scores = page_scores(frame, matrix)
+        scored_at = datetime.now(timezone.utc).isoformat()
+
+        changed: list[dict[str, Any]] = []
+        unchanged: list[dict[str, Any]] = []
+        for i, resort_id in enumerate(frame.resort_ids):
+            previous = stored.get(resort_id) or {}
+            version = {
+                "resort_id": resort_id,
+                # The counter read before loading: a change made since keeps the row stale
+                "scored_version": previous.get("invalidations", 0),
+                "scored_at": scored_at,
+            }
+            input_hash = page_input_hash(frame, i)
+            if input_hash == previous.get("input_hash"):
+                if previous.get("scored_version") != previous.get("invalidations"):
+                    unchanged.append(version)  # Stale, but nothing the checks read changed
+                stats["unchanged"] += 1
+                continue
+
+            changed.append({
+                **version,
+                "input_hash": input_hash,
+                "score_pct": float(scores[i]),
+                "passed_checks": int(matrix[i].sum()),
+                "total_checks": len(PAGE_CHECK_IDS),
+                "failing_checks": [PAGE_CHECK_IDS[c] for c in np.flatnonzero(~matrix[i])],
+                "check_results": {
+                    check_id: bool(matrix[i, c]) for c, check_id in enumerate(PAGE_CHECK_IDS)
+                },
+                "resort_status": frame.resorts[i].get("status"),
+            })
+
+        # Two upserts: a batch must share one column set, and version-only
+        # rows must not null out the stored score
+        stats["written"] += _upsert_score_rows(changed) + _upsert_score_rows(unchanged)
+        stats["checked"] += len(frame)
+        stats["rescored"] += len(changed)
+        stats["missing"] += len(chunk) - len(frame)
+
+    return stats
+
+
+def get_low_scoring_resorts(
+    threshold_pct: float = 80.0,
+    status: str = "published",
+    limit: int = 50,
+    refreshed_before: str | None = None,
+) -> list[dict[str, Any]]:
+    """Lowest materialized page scores, worst first (one indexed query).
+
+    Stale rows are excluded; run refresh_page_scores() first for
+    up-to-date results.
+
+    Args:
+        threshold_pct: Only scores below this percentage
+        status: Resort status
+        limit: Maximum results
+        refreshed_before: Only resorts last refreshed before this ISO timestamp
+                          (or never refreshed)
+
+    Returns:
+        Resort dicts in the resorts_below_threshold() shape, plus country
+    """
+    query = (
+        get_supabase_client()
+        .table(PAGE_SCORES_TABLE)
+        .select(SCORE_ROW_COLUMNS)
+        .eq("resort_status", status)
+        .eq("stale", False)
+        .lt("score_pct", threshold_pct)
+    )
+    if refreshed_before:
+        # Never-refreshed resorts (NULL) qualify too; a plain lt() drops them
+        query = query.or_(
+            f'last_refreshed.is.null,last_refreshed.lt."{refreshed_before}"',
+            reference_table="resorts",
+        )
+    response = query.order("score_pct").limit(limit).execute()
+
+    results = []
+    for row in response.data or []:
+        resort = row.get("resorts") or {}
+        results.append({
+            "id": row["resort_id"],
+            "name": resort.get("name"),
+            "slug": resort.get("slug"),
+            "status": resort.get("status"),
+            "country": resort.get("country"),
+            "quality_score": row["score_pct"],
+            "failing_checks": row.get("failing_checks") or [],
+            "passed": row["passed_checks"],
+            "total": row["total_checks"],
+        })
+    return results
@@ -25,9 +25,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-import anthropic
-
 from ..config import settings
+from ..llm_client import create_message
 
 
 # =============================================================================
@@ -126,11 +125,6 @@ class QuickTakeResult:
     generation_reasoning: str = ""
 
 
-def _get_client() -> anthropic.Anthropic:
-    """Get Anthropic client instance."""
-    return anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-
 def check_forbidden_phrases(text: str) -> list[str]:
     """Check text for forbidden phrases.
 
@@ -307,7 +301,6 @@ async def generate_quick_take(
     Returns:
         QuickTakeResult with generated content and quality metrics
     """
-    client = _get_client()
 
     # Build the prompt with all available context
     context_section = f"""
@@ -396,7 +389,8 @@ Your Quick Takes should make parents feel confident they understand what they're
 """
 
     try:
-        message = client.messages.create(
+        message = await create_message(
+            call="quick_take",
             model=settings.content_model,  # Use Opus for quality
             max_tokens=1500,
             system=system,
@@ -31,8 +31,16 @@ from exa_py import Exa
 from tavily import TavilyClient
 
 from ..config import settings
+from ..llm_client import create_message
+from ..rate_limits import provider_slot
+from ..supabase_client import run_db
 from .system import log_cost
-from .research_cache import get_cached_results, cache_results
+from .research_cache import (
+    cache_results,
+    flush_cache_usage,
+    get_cached_results,
+    prefetch_resort_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -108,14 +116,12 @@ async def generate_local_queries(
         Dict with query_type -> local-language query string
     """
     import json
-    import anthropic
 
-    start_time = time.time()
     valid_keys = {"official", "ski_school", "lodging"}
 
-    def _call_haiku() -> str:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-        message = client.messages.create(
+    async def _call_haiku() -> str:
+        message = await create_message(
+            call="research_haiku",
             model="claude-haiku-4-5-20251001",
             max_tokens=300,
             system="You generate search queries in the specified language for ski resort research. Return ONLY valid JSON, no markdown.",
@@ -135,7 +141,7 @@ Return as JSON:
         return message.content[0].text
 
     try:
-        response_text = await asyncio.to_thread(_call_haiku)
+        response_text = await _call_haiku()
 
         if "```" in response_text:
             response_text = response_text.split("```json")[-1].split("```")[0] if "```json" in response_text else response_text.split("```")[1].split("```")[0]
@@ -152,14 +158,6 @@ Return as JSON:
     except Exception as e:
         logger.warning(f"Failed to generate local queries for {resort_name} in {language}: {e}")
         return {}
-    finally:
-        latency_ms = int((time.time() - start_time) * 1000)
-        log_cost("anthropic_haiku", 0.001, None, {
-            "purpose": "local_query_generation",
-            "resort": resort_name,
-            "language": language,
-            "latency_ms": latency_ms,
-        })
 
 
 def merge_multilingual_results(
@@ -222,7 +220,7 @@ async def exa_search(
 
     # Check cache if resort context provided
     if resort_name and country and query_type:
-        cached = get_cached_results(resort_name, country, query_type, "exa")
+        cached = await run_db(get_cached_results, resort_name, country, query_type, "exa")
         if cached:
             logger.info(f"[exa] Cache HIT for {resort_name} {query_type}")
             return [
@@ -254,7 +252,8 @@ async def exa_search(
 
     try:
         loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(None, _search)
+        async with provider_slot("exa"):
+            response = await loop.run_in_executor(None, _search)
     except Exception as e:
         error_msg = str(e)
         logger.error(f"[exa] Search error: {e}")
@@ -287,7 +286,8 @@ async def exa_search(
 
     # Cache results if resort context provided
     if resort_name and country and query_type:
-        cache_results(
+        await run_db(
+            cache_results,
             resort_name=resort_name,
             country=country,
             query_type=query_type,
@@ -335,7 +335,7 @@ async def brave_search(
 
     # Check cache if resort context provided
     if resort_name and resort_country and query_type:
-        cached = get_cached_results(resort_name, resort_country, query_type, "brave")
+        cached = await run_db(get_cached_results, resort_name, resort_country, query_type, "brave")
         if cached:
             logger.info(f"[brave] Cache HIT for {resort_name} {query_type}")
             return [
@@ -369,12 +369,13 @@ async def brave_search(
     async with httpx.AsyncClient() as client:
         for attempt in range(max_retries):
             try:
-                response = await client.get(
-                    BRAVE_SEARCH_URL,
-                    headers=headers,
-                    params=params,
-                    timeout=30,
-                )
+                async with provider_slot("brave"):
+                    response = await client.get(
+                        BRAVE_SEARCH_URL,
+                        headers=headers,
+                        params=params,
+                        timeout=30,
+                    )
                 response.raise_for_status()
                 data = response.json()
                 break  # Success, exit retry loop
@@ -421,7 +422,8 @@ async def brave_search(
 
     # Cache results if resort context provided
     if resort_name and resort_country and query_type:
-        cache_results(
+        await run_db(
+            cache_results,
             resort_name=resort_name,
             country=resort_country,
             query_type=query_type,
@@ -469,7 +471,7 @@ async def tavily_search(
 
     # Check cache if resort context provided
     if resort_name and country and query_type:
-        cached = get_cached_results(resort_name, country, query_type, "tavily")
+        cached = await run_db(get_cached_results, resort_name, country, query_type, "tavily")
         if cached:
             logger.info(f"[tavily] Cache HIT for {resort_name} {query_type}")
             return {
@@ -501,7 +503,8 @@ async def tavily_search(
 
     try:
         loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(None, _search)
+        async with provider_slot("tavily"):
+            response = await loop.run_in_executor(None, _search)
     except Exception as e:
         error_msg = str(e)
         logger.error(f"[tavily] Search error: {e}")
@@ -535,7 +538,8 @@ async def tavily_search(
 
     # Cache results if resort context provided
     if resort_name and country and query_type:
-        cache_results(
+        await run_db(
+            cache_results,
             resort_name=resort_name,
             country=country,
             query_type=query_type,
@@ -586,6 +590,10 @@ async def search_resort_info(
         "ski_school_cost": f"{resort_name} ski school lesson prices children cost",
     }
 
+    # Load this resort's cache rows in one query so the per-search lookups
+    # below are answered from memory
+    await run_db(prefetch_resort_cache, resort_name, country)
+
     # Run all searches in parallel with resort context for caching
     # API routing optimized based on Round 5.7 comparison (2026-01-23):
     # - Tavily for ALL pricing queries (2x better at finding prices, +0.76 margin on lift_prices)
@@ -668,6 +676,9 @@ async def search_resort_info(
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
+    # Write back this resort's cache hit counts in one batched call
+    await run_db(flush_cache_usage)
+
     # Organize results
     # Note: Exa/Brave return list[SearchResult], Tavily returns {"results": list, "answer": str}
     organized = {
@@ -4,12 +4,26 @@ Enables:
 - Avoiding redundant API calls (cost savings)
 - Tracking which sources were used per resort
 - Foundation for citation tracking
+
+Two tiers:
+- In-process LRU of cache rows, honouring each row's expires_at (set
+  from CACHE_TTL). prefetch_resort_cache() loads every valid row for a
+  resort in one query, so the 7-10 lookups in search_resort_info don't
+  each make a round trip.
+- Supabase research_cache table (shared across runs and processes).
+
+Hits bump use_count/last_used_at in memory. The counts are written back
+in one batched RPC by flush_cache_usage(), not one UPDATE per hit.
 """
 
+import atexit
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import asdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from ..supabase_client import get_supabase_client
@@ -35,6 +49,146 @@ def get_cache_ttl(query_type: str) -> int:
     return CACHE_TTL.get(query_type, CACHE_TTL["default"])
 
 
+# =============================================================================
+# In-process tier
+# =============================================================================
+
+MEMORY_CACHE_MAX_ENTRIES = 512
+
+# How long a prefetch counts as authoritative for misses. Within this
+# window, a key missing from memory is a miss without a DB query.
+PREFETCH_FRESH_SECONDS = 15 * 60
+
+# Flush deferred use_count updates once this many rows have hits pending
+USAGE_FLUSH_THRESHOLD = 25
+
+CacheKey = tuple[str, str, str, str]  # (resort_name, country, query_type, api_source)
+
+_lock = threading.Lock()
+_memory: "OrderedDict[CacheKey, dict[str, Any]]" = OrderedDict()
+_prefetched: dict[tuple[str, str], float] = {}  # (resort, country) -> monotonic load time
+_pending_uses: dict[str, int] = {}  # cache row id -> hits not yet written
+_stats = {
+    "memory_hits": 0,
+    "db_hits": 0,
+    "misses": 0,
+    "prefetches": 0,
+    "prefetched_rows": 0,
+    "lookups": 0,
+    "lookup_ms_total": 0.0,
+    "usage_flushes": 0,
+}
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def _is_fresh(row: dict[str, Any]) -> bool:
+    expires_at = _parse_ts(row.get("expires_at"))
+    return expires_at is None or expires_at > datetime.now(timezone.utc)
+
+
+def _remember(key: CacheKey, row: dict[str, Any]) -> None:
+    """Store a row in the LRU (caller holds _lock)."""
+    _memory[key] = row
+    _memory.move_to_end(key)
+    while len(_memory) > MEMORY_CACHE_MAX_ENTRIES:
+        _memory.popitem(last=False)
+
+
+def _record_use(row: dict[str, Any]) -> bool:
+    """Count a hit for deferred write-back. Returns True if a flush is due."""
+    row_id = row.get("id")
+    if not row_id:
+        return False
+    with _lock:
+        _pending_uses[row_id] = _pending_uses.get(row_id, 0) + 1
+        row["use_count"] = (row.get("use_count") or 0) + 1
+        row["last_used_at"] = datetime.now(timezone.utc).isoformat()
+        return len(_pending_uses) >= USAGE_FLUSH_THRESHOLD
+
+
+def prefetch_resort_cache(resort_name: str, country: str) -> int:
+    """Load every valid cache row for a resort into memory in one query.
+
+    Call before fanning out a resort's searches. Afterwards,
+    get_cached_results() answers hits and misses for this resort from memory.
+
+    Returns:
+        Number of rows loaded
+    """
+    try:
+        supabase = get_supabase_client()
+
+        result = supabase.table("research_cache")\
+            .select("*")\
+            .eq("resort_name", resort_name)\
+            .eq("country", country)\
+            .gt("expires_at", datetime.utcnow().isoformat())\
+            .execute()
+
+        rows = result.data or []
+        with _lock:
+            for row in rows:
+                key = (resort_name, country, row["query_type"], row["api_source"])
+                _remember(key, row)
+            _prefetched[(resort_name, country)] = time.monotonic()
+            _stats["prefetches"] += 1
+            _stats["prefetched_rows"] += len(rows)
+
+        logger.info(f"Cache prefetch: {resort_name} ({len(rows)} valid entries)")
+        return len(rows)
+
+    except Exception as e:
+        # Lookups fall back to per-key queries
+        logger.debug(f"Cache prefetch failed for {resort_name}: {e}")
+        return 0
+
+
+def flush_cache_usage() -> int:
+    """Write deferred use_count/last_used_at updates in one batched call.
+
+    Returns:
+        Number of cache rows updated
+    """
+    with _lock:
+        pending = dict(_pending_uses)
+        _pending_uses.clear()
+
+    if not pending:
+        return 0
+
+    try:
+        supabase = get_supabase_client()
+        supabase.rpc("increment_research_cache_usage", {
+            "p_ids": list(pending.keys()),
+            "p_counts": list(pending.values()),
+            "p_last_used_at": datetime.now(timezone.utc).isoformat(),
+        }).execute()
+        with _lock:
+            _stats["usage_flushes"] += 1
+        return len(pending)
+
+    except Exception as e:
+        # Usage counts are advisory - never fail a search over them
+        logger.debug(f"Cache usage flush failed ({len(pending)} rows dropped): {e}")
+        return 0
+
+
+atexit.register(flush_cache_usage)
+
+
+def clear_memory_cache() -> None:
+    """Drop the in-process tier (useful for testing)."""
+    with _lock:
+        _memory.clear()
+        _prefetched.clear()
+
+
 def get_cached_results(
     resort_name: str,
     country: str,
@@ -43,6 +197,10 @@ def get_cached_results(
 ) -> dict[str, Any] | None:
     """Get cached search results if valid.
 
+    Checks the in-process tier first. If the resort was prefetched
+    recently, a key missing from memory is a miss and Supabase is not
+    queried.
+
     Args:
         resort_name: Name of the resort
         country: Country of the resort
@@ -52,37 +210,62 @@ def get_cached_results(
     Returns:
         Cached entry dict if valid, None if not found or expired
     """
-    try:
-        supabase = get_supabase_client()
+    start = time.monotonic()
+    key = (resort_name, country, query_type, api_source)
+    source = "miss"
+    row = None
+
+    with _lock:
+        cached = _memory.get(key)
+        if cached is not None and not _is_fresh(cached):
+            del _memory[key]
+            cached = None
+        if cached is not None:
+            _memory.move_to_end(key)
+        prefetched_at = _prefetched.get((resort_name, country))
+        prefetch_fresh = (
+            prefetched_at is not None
+            and time.monotonic() - prefetched_at < PREFETCH_FRESH_SECONDS
+        )
+
+    if cached is not None:
+        row, source = cached, "memory"
+    elif not prefetch_fresh:
+        try:
+            supabase = get_supabase_client()
+
+            result = supabase.table("research_cache")\
+                .select("*")\
+                .eq("resort_name", resort_name)\
+                .eq("country", country)\
+                .eq("query_type", query_type)\
+                .eq("api_source", api_source)\
+                .gt("expires_at", datetime.utcnow().isoformat())\
+                .single()\
+                .execute()
 
-        result = supabase.table("research_cache")\
-            .select("*")\
-            .eq("resort_name", resort_name)\
-            .eq("country", country)\
-            .eq("query_type", query_type)\
-            .eq("api_source", api_source)\
-            .gt("expires_at", datetime.utcnow().isoformat())\
-            .single()\
-            .execute()
+            if result.data:
+                row, source = result.data, "db"
+                with _lock:
+                    _remember(key, row)
 
-        if result.data:
-            # Update use count
-            supabase.table("research_cache")\
-                .update({
-                    "use_count": result.data["use_count"] + 1,
-                    "last_used_at": datetime.utcnow().isoformat(),
-                })\
-                .eq("id", result.data["id"])\
-                .execute()
+        except Exception as e:
+            # Log but don't fail - cache misses are fine
+            logger.debug(f"Cache lookup failed (will fetch fresh): {e}")
 
-            logger.info(f"Cache HIT: {resort_name} {query_type} {api_source}")
-            return result.data
+    flush_due = _record_use(row) if row else False
 
-    except Exception as e:
-        # Log but don't fail - cache misses are fine
-        logger.debug(f"Cache lookup failed (will fetch fresh): {e}")
+    with _lock:
+        _stats[{"memory": "memory_hits", "db": "db_hits"}.get(source, "misses")] += 1
+        _stats["lookups"] += 1
+        _stats["lookup_ms_total"] += (time.monotonic() - start) * 1000
+
+    if flush_due:
+        flush_cache_usage()
 
-    return None
+    if row:
+        logger.info(f"Cache HIT ({source}): {resort_name} {query_type} {api_source}")
+    return row
 
 
 def cache_results(
@@ -96,7 +279,7 @@ def cache_results(
     ai_answer: str | None = None,
     error: str | None = None,
 ) -> bool:
-    """Store search results in cache.
+    """Store search results in cache (both tiers).
 
     Args:
         resort_name: Name of the resort
@@ -135,10 +318,14 @@ def cache_results(
         }
 
         # Upsert (update if exists, insert if not)
-        supabase.table("research_cache")\
+        response = supabase.table("research_cache")\
             .upsert(data, on_conflict="resort_name,country,query_type,api_source")\
             .execute()
 
+        stored = response.data[0] if response.data else data
+        with _lock:
+            _remember((resort_name, country, query_type, api_source), stored)
+
         logger.info(f"Cached: {resort_name} {query_type} {api_source} ({len(results)} results, expires {expires_at.date()})")
         return True
 
@@ -248,11 +435,27 @@ def mark_sources_cited(
         return 0
 
 
+def get_process_cache_stats() -> dict[str, Any]:
+    """Hit/miss/latency counters for the in-process tier since startup."""
+    with _lock:
+        stats = dict(_stats)
+        stats["memory_entries"] = len(_memory)
+        stats["pending_usage_rows"] = len(_pending_uses)
+
+    lookups = stats["lookups"]
+    lookup_ms_total = stats.pop("lookup_ms_total")
+    hits = stats["memory_hits"] + stats["db_hits"]
+    stats["hit_rate"] = round(hits / lookups, 3) if lookups else 0.0
+    stats["avg_lookup_ms"] = round(lookup_ms_total / lookups, 2) if lookups else 0.0
+    return stats
+
+
 def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics.
 
     Returns:
-        Dict with cache stats by API and query type
+        Dict with cache stats by API and query type, plus in-process
+        hit/miss/latency counters under "process"
     """
     try:
         supabase = get_supabase_client()
@@ -281,11 +484,12 @@ def get_cache_stats() -> dict[str, Any]:
             "total_entries": total_result.count or 0,
             "valid_entries": valid_result.count or 0,
             "by_api": by_api,
+            "process": get_process_cache_stats(),
         }
 
     except Exception as e:
         logger.warning(f"Failed to get cache stats: {e}")
-        return {"error": str(e)}
+        return {"error": str(e), "process": get_process_cache_stats()}
 
 
 def clear_expired_cache() -> int:
@@ -0,0 +1,494 @@
+"""In-process resort name index for duplicate detection.
+
+Duplicate checks used to be a round trip each: check_resort_exists ran two
+queries, find_similar_resorts one ilike query per name variant,
+check_discovery_candidate_exists one per candidate, and discovery and
+external_links each kept their own exact-lowercase name set. Validating a
+few thousand discovery candidates meant thousands of queries, and "St.
+Anton" never matched "Sankt Anton".
+
+NameIndex loads a table's names once per process and answers lookups from
+memory:
+- Exact: names are normalized (unidecode, punctuation, St./Sankt/Saint,
+  Mt./Mount, trailing "ski resort"), and slugs and aliases are indexed
+  under the same normalized keys
+- Fuzzy: trigram postings narrow the candidates, then each is scored as
+  max(token Jaccard, trigram Dice), so both word-order/extra-word variants
+  and typos match
+
+The index stays current incrementally. create_resort/update_resort and
+save_discovery_candidate feed their rows in directly, and a lookup made more
+than DELTA_REFRESH_SECONDS after the last sync pulls only rows changed since
+then. A full reload every FULL_RELOAD_SECONDS picks up deletions. Rows fed
+in locally don't move the delta watermark, so rows other processes wrote
+before them are still pulled.
+
+Async code should await fresh_index() first, so a (re)load runs on the DB
+pool rather than inside the lookup on the event loop.
+
+Usage:
+    index = get_resort_index()
+    existing = index.find_exact("Sankt Anton", "Austria")
+    similar = index.find_similar("Kitzbuhl", "Austria", threshold=0.6)
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from ..supabase_client import get_supabase_client, run_db
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 1000
+
+# Pull rows changed since the last sync at most this often
+DELTA_REFRESH_SECONDS = 60
+
+# Full reload (also drops deleted rows)
+FULL_RELOAD_SECONDS = 6 * 3600
+
+# Token rewrites applied after transliteration
+TOKEN_CANONICAL = {
+    "st": "saint",
+    "sankt": "saint",
+    "mt": "mount",
+}
+
+# Trailing words that don't distinguish one resort from another
+GENERIC_SUFFIXES = (
+    ("ski", "resort"),
+    ("ski", "area"),
+    ("mountain", "resort"),
+    ("resort",),
+)
+
+COUNTRY_ALIASES = {
+    "usa": "united states",
+    "us": "united states",
+    "united states of america": "united states",
+    "uk": "united kingdom",
+    "great britain": "united kingdom",
+    "czechia": "czech republic",
+    "korea": "south korea",
+    "republic of korea": "south korea",
+}
+
+_PUNCT_DROP = re.compile(r"['’`.,()]")
+_PUNCT_SPACE = re.compile(r"[-_/&+]")
+
+
+# =============================================================================
+# NORMALIZATION
+# =============================================================================
+
+
+def _transliterate(text: str) -> str:
+    try:
+        from unidecode import unidecode
+        return unidecode(text)
+    except ImportError:
+        return text
+
+
+def normalize_resort_name(name: str) -> str:
+    """Canonical form of a resort name for matching.
+
+    "St. Anton am Arlberg" and "Sankt Anton am Arlberg" both become
+    "saint anton am arlberg"; "Kitzbühel" becomes "kitzbuhel".
+    """
+    text = _transliterate(name or "").lower()
+    text = _PUNCT_DROP.sub("", text)
+    text = _PUNCT_SPACE.sub(" ", text)
+    tokens = [TOKEN_CANONICAL.get(t, t) for t in text.split()]
+    return " ".join(tokens)
+
+
+def normalize_country(country: str | None) -> str:
+    """Canonical form of a country name ("USA" -> "united states")."""
+    text = " ".join(_transliterate(country or "").lower().replace(".", "").split())
+    return COUNTRY_ALIASES.get(text, text)
+
+
+def name_keys(name: str) -> set[str]:
+    """Exact-match keys for a name: normalized, and without a generic suffix."""
+    normalized = normalize_resort_name(name)
+    if not normalized:
+        return set()
+
+    keys = {normalized}
+    tokens = normalized.split()
+    for suffix in GENERIC_SUFFIXES:
+        if len(tokens) > len(suffix) and tuple(tokens[-len(suffix):]) == suffix:
+            keys.add(" ".join(tokens[: -len(suffix)]))
+            break
+    return keys
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _dice(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class IndexSource:
+    """Where a NameIndex loads its rows from."""
+
+    table: str
+    columns: str
+    name_field: str
+    changed_field: str  # Monotonic timestamp used for delta pulls
+    alias_field: str | None = None
+
+
+RESORT_SOURCE = IndexSource(
+    table="resorts",
+    columns="id, name, country, slug, status, updated_at",
+    name_field="name",
+    changed_field="updated_at",
+    alias_field="aliases",
+)
+
+# discovery_candidates has no updated timestamp, so deltas only pick up new
+# candidates; status changes made elsewhere show up on the next full reload.
+# Duplicate checks (find_exact/contains) don't filter candidates by status.
+CANDIDATE_SOURCE = IndexSource(
+    table="discovery_candidates",
+    columns="id, resort_name, country, status, discovered_at",
+    name_field="resort_name",
+    changed_field="discovered_at",
+)
+
+
+class NameIndex:
+    """Normalized exact + fuzzy name lookup over one table's rows."""
+
+    def __init__(self, source: IndexSource):
+        self.source = source
+        self._lock = threading.RLock()
+        self._rows: dict[str, dict[str, Any]] = {}
+        self._keys: dict[str, set[str]] = {}  # name key -> ids
+        self._entry_keys: dict[str, set[str]] = {}  # id -> its name keys
+        self._entry_grams: dict[str, set[str]] = {}  # id -> trigrams of its keys
+        self._postings: dict[str, set[str]] = {}  # trigram -> ids
+        self._aliases: dict[str, set[str]] = {}  # id -> extra aliases added at runtime
+        self._loaded_at: float | None = None
+        self._synced_at: float = 0.0
+        self._watermark: str | None = None
+        self._has_alias_column = source.alias_field is not None
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def _select_columns(self) -> str:
+        if self._has_alias_column:
+            return f"{self.source.columns}, {self.source.alias_field}"
+        return self.source.columns
+
+    def _fetch(self, since: str | None = None) -> list[dict[str, Any]]:
+        client = get_supabase_client()
+        rows: list[dict[str, Any]] = []
+        offset = 0
+        while True:
+            query = client.table(self.source.table).select(self._select_columns())
+            if since:
+                query = query.gt(self.source.changed_field, since)
+            response = query.order("id").range(offset, offset + PAGE_SIZE - 1).execute()
+            batch = response.data or []
+            rows.extend(batch)
+            if len(batch) < PAGE_SIZE:
+                return rows
+            offset += PAGE_SIZE
+
+    def _fetch_with_fallback(self, since: str | None = None) -> list[dict[str, Any]]:
+        try:
+            return self._fetch(since)
+        except Exception as e:
+            if not self._has_alias_column:
+                raise
+            # Alias column not migrated yet: index without it
+            logger.warning(f"{self.source.table}.{self.source.alias_field} unavailable: {e}")
+            self._has_alias_column = False
+            try:
+                return self._fetch(since)
+            except Exception:
+                # Failed without it too: the database is down, not the column
+                self._has_alias_column = True
+                raise
+
+    def load(self) -> int:
+        """Full (re)load from the database. Returns the number of rows indexed."""
+        rows = self._fetch_with_fallback()
+        with self._lock:
+            self._rows.clear()
+            self._keys.clear()
+            self._entry_keys.clear()
+            self._entry_grams.clear()
+            self._postings.clear()
+            self._watermark = None
+            for row in rows:
+                self._index_row(row)
+            self._advance_watermark(rows)
+            now = time.monotonic()
+            self._loaded_at = now
+            self._synced_at = now
+        return len(rows)
+
+    def refresh(self) -> int:
+        """Pull rows changed since the last sync. Returns the number applied."""
+        if not self.loaded:
+            return self.load()
+        rows = self._fetch_with_fallback(since=self._watermark)
+        with self._lock:
+            for row in rows:
+                self._index_row(row)
+            self._advance_watermark(rows)
+            self._synced_at = time.monotonic()
+        return len(rows)
+
+    def _advance_watermark(self, rows: list[dict[str, Any]]) -> None:
+        # Only rows pulled from the database move the watermark: a locally
+        # upserted row can be newer than rows other processes wrote meanwhile
+        for row in rows:
+            changed = row.get(self.source.changed_field)
+            if changed and (self._watermark is None or str(changed) > self._watermark):
+                self._watermark = str(changed)
+
+    def ensure_fresh(self) -> None:
+        """Load on first use, then delta-sync or fully reload as they fall due."""
+        now = time.monotonic()
+        try:
+            if self._loaded_at is None or now - self._loaded_at > FULL_RELOAD_SECONDS:
+                self.load()
+            elif now - self._synced_at > DELTA_REFRESH_SECONDS:
+                self.refresh()
+        except Exception as e:
+            if self._loaded_at is None:
+                # Never loaded: an empty index would report every name as new
+                raise
+            # Serve what we have; the next lookup retries
+            logger.warning(f"Name index refresh for {self.source.table} failed: {e}")
+            self._synced_at = now
+
+    # =========================================================================
+    # Incremental updates
+    # =========================================================================
+
+    def upsert(self, row: dict[str, Any]) -> None:
+        """Add or re-index one row (e.g. right after it was created)."""
+        if not row or not row.get("id"):
+            return
+        with self._lock:
+            merged = {**self._rows.get(row["id"], {}), **row}
+            self._index_row(merged)
+
+    def remove(self, entry_id: str) -> None:
+        with self._lock:
+            self._unindex(entry_id)
+            self._rows.pop(entry_id, None)
+            self._aliases.pop(entry_id, None)
+
+    def add_alias(self, entry_id: str, alias: str) -> None:
+        """Register another name for an indexed row (kept across re-indexing)."""
+        with self._lock:
+            self._aliases.setdefault(entry_id, set()).add(alias)
+            if entry_id in self._rows:
+                self._index_row(self._rows[entry_id])
+
+    def _names_for(self, row: dict[str, Any]) -> list[str]:
+        names = [row.get(self.source.name_field) or ""]
+        if row.get("slug"):
+            names.append(row["slug"])
+        if self.source.alias_field:
+            names.extend(row.get(self.source.alias_field) or [])
+        names.extend(self._aliases.get(row["id"], ()))
+        return names
+
+    def _index_row(self, row: dict[str, Any]) -> None:
+        entry_id = row["id"]
+        self._unindex(entry_id)
+        self._rows[entry_id] = row
+
+        keys: set[str] = set()
+        for name in self._names_for(row):
+            keys |= name_keys(name)
+        grams: set[str] = set()
+        for key in keys:
+            self._keys.setdefault(key, set()).add(entry_id)
+            grams |= _trigrams(key)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(entry_id)
+        self._entry_keys[entry_id] = keys
+        self._entry_grams[entry_id] = grams
+
+    def _unindex(self, entry_id: str) -> None:
+        for key in self._entry_keys.pop(entry_id, ()):
+            ids = self._keys.get(key)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self._keys[key]
+        for gram in self._entry_grams.pop(entry_id, ()):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self._postings[gram]
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def _matches(self, row: dict[str, Any], country: str | None, status: str | None) -> bool:
+        if country and normalize_country(row.get("country")) != normalize_country(country):
+            return False
+        if status and row.get("status") != status:
+            return False
+        return True
+
+    def find_exact(
+        self,
+        name: str,
+        country: str | None = None,
+        status: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Row whose name, slug or alias normalizes to the same key, or None."""
+        self.ensure_fresh()
+        with self._lock:
+            for key in name_keys(name):
+                for entry_id in sorted(self._keys.get(key, ())):
+                    row = self._rows[entry_id]
+                    if self._matches(row, country, status):
+                        return dict(row)
+        return None
+
+    def contains(self, name: str, country: str | None = None) -> bool:
+        return self.find_exact(name, country) is not None
+
+    def find_similar(
+        self,
+        name: str,
+        country: str | None = None,
+        threshold: float = 0.6,
+        limit: int = 10,
+        status: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Rows with similar names, each with a similarity_score (0-1), best first."""
+        self.ensure_fresh()
+        query_keys = name_keys(name)
+        if not query_keys:
+            return []
+        query_forms = [(set(key.split()), _trigrams(key)) for key in query_keys]
+
+        with self._lock:
+            # Only rows sharing at least one trigram can score above zero
+            candidate_ids: set[str] = set()
+            for _, grams in query_forms:
+                for gram in grams:
+                    candidate_ids |= self._postings.get(gram, set())
+
+            results = []
+            for entry_id in candidate_ids:
+                row = self._rows[entry_id]
+                if not self._matches(row, country, status):
+                    continue
+                score = 0.0
+                for key in self._entry_keys[entry_id]:
+                    key_tokens, key_grams = set(key.split()), _trigrams(key)
+                    for tokens, grams in query_forms:
+                        score = max(score, _jaccard(tokens, key_tokens), _dice(grams, key_grams))
+                if score >= threshold:
+                    results.append({**row, "similarity_score": round(score, 3)})
+
+        results.sort(key=lambda r: (-r["similarity_score"], r.get(self.source.name_field) or ""))
+        return results[:limit]
+
+    def rows(self, status: str | None = None) -> list[dict[str, Any]]:
+        """Snapshot of indexed rows (optionally filtered by status)."""
+        self.ensure_fresh()
+        with self._lock:
+            return [dict(r) for r in self._rows.values() if not status or r.get("status") == status]
+
+
+# =============================================================================
+# Process-wide indexes
+# =============================================================================
+
+_indexes: dict[str, NameIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _get_index(source: IndexSource) -> NameIndex:
+    index = _indexes.get(source.table)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(source.table)
+            if index is None:
+                index = NameIndex(source)
+                _indexes[source.table] = index
+    return index
+
+
+def get_resort_index() -> NameIndex:
+    """Process-wide index over resorts (loaded lazily on first lookup)."""
+    return _get_index(RESORT_SOURCE)
+
+
+def get_candidate_index() -> NameIndex:
+    """Process-wide index over discovery_candidates."""
+    return _get_index(CANDIDATE_SOURCE)
+
+
+async def fresh_index(index: NameIndex) -> NameIndex:
+    """Bring an index up to date on the DB pool, for async callers.
+
+    Lookups call ensure_fresh() themselves, which blocks the event loop
+    while it (re)loads; awaiting this first leaves them only in-memory work.
+    """
+    await run_db(index.ensure_fresh)
+    return index
+
+
+def index_resort(row: dict[str, Any] | None) -> None:
+    """Feed a created/updated resort row into the index if it's loaded."""
+    index = _indexes.get(RESORT_SOURCE.table)
+    if row and index is not None and index.loaded:
+        index.upsert(row)
+
+
+def index_candidate(row: dict[str, Any] | None) -> None:
+    """Feed a saved discovery candidate into the index if it's loaded."""
+    index = _indexes.get(CANDIDATE_SOURCE.table)
+    if row and index is not None and index.loaded:
+        index.upsert(row)
+
+
+def reset_name_indexes() -> None:
+    """Drop the process-wide indexes (useful for testing)."""
+    with _indexes_lock:
+        _indexes.clear()
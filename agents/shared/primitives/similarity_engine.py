@@ -0,0 +1,826 @@
+"""Vectorized all-pairs resort similarity.
+
+calculate_similarities_for_resort() fetches metrics, costs and passes for
+every other resort one query at a time, so refreshing the whole catalogue
+was O(N²) round trips and had to be capped at 100 resorts. This engine
+loads everything in a few paginated queries, encodes each similarity
+component as a NumPy feature array, and scores the full matrix in row
+blocks. The component formulas and weights are the same as
+linking.calculate_similarity(); results are written back with batched
+upserts.
+
+Usage:
+    features = load_similarity_features()
+    stats = refresh_similarity_matrix(features)
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+from postgrest.types import ReturnMethod
+
+from shared.supabase_client import get_supabase_client
+
+from .linking import (
+    PRICE_TIERS,
+    SIMILARITY_WEIGHTS,
+    _get_price_tier,
+    _get_region_group,
+)
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+PAGE_SIZE = 1000           # PostgREST max rows per request
+UPSERT_BATCH_SIZE = 500    # Rows per resort_similarities upsert
+BLOCK_ROWS = 256           # Matrix rows scored at once (bounds memory at ~3000 resorts)
+MIN_STORED_SCORE = 0.2     # Same threshold calculate_similarities_for_resort uses
+
+RESORT_COLUMNS = "id, name, country, region, status"
+METRIC_COLUMNS = (
+    "resort_id, family_overall_score, best_age_min, best_age_max, "
+    "beginner_terrain_pct, intermediate_terrain_pct, advanced_terrain_pct"
+)
+COST_COLUMNS = "resort_id, estimated_family_daily"
+
+MAJOR_PASSES = ("epic", "ikon", "mountain collective", "indy pass")
+TIER_ORDER = list(PRICE_TIERS)
+
+COMPONENT_COLUMNS = (
+    "family_score_similarity",
+    "price_tier_similarity",
+    "region_similarity",
+    "age_range_similarity",
+    "pass_network_similarity",
+    "terrain_mix_similarity",
+)
+
+
+# ============================================================================
+# FEATURE ENCODING
+# ============================================================================
+
+@dataclass
+class SimilarityFeatures:
+    """Per-resort feature arrays, one row per resort (aligned with resort_ids)."""
+    resort_ids: list[str]
+    family_score: np.ndarray      # float, normalized 0-1 (0.5 if missing)
+    price_tier: np.ndarray        # int, index into TIER_ORDER (-1 if unknown)
+    country: np.ndarray           # int code (same code = same country)
+    region: np.ndarray            # int code (-1 if missing)
+    region_group: np.ndarray      # int code from REGION_GROUPS ("other" included)
+    alps: np.ndarray              # bool, region group is alps_west/alps_east
+    us: np.ndarray                # bool, region group is a US group
+    age_min: np.ndarray           # float
+    age_max: np.ndarray           # float
+    terrain: np.ndarray           # float (N, 3) beginner/intermediate/advanced shares
+    pass_bits: np.ndarray         # uint64 (N, words) pass membership bitsets
+    major_mask: np.ndarray        # uint64 (words,) bits for the major pass networks
+    index: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.index:
+            self.index = {rid: i for i, rid in enumerate(self.resort_ids)}
+
+    def __len__(self) -> int:
+        return len(self.resort_ids)
+
+
+def _codes(values: list[Any], missing_code: bool = False) -> np.ndarray:
+    """Map values to small ints; equal values share a code."""
+    lookup: dict[Any, int] = {}
+    codes = []
+    for value in values:
+        if missing_code and not value:
+            codes.append(-1)
+            continue
+        codes.append(lookup.setdefault(value, len(lookup)))
+    return np.array(codes, dtype=np.int32)
+
+
+def _terrain_shares(metrics: dict[str, Any]) -> tuple[float, float, float]:
+    """Same defaults as linking._calculate_terrain_similarity (0 or None = default)."""
+    b = metrics.get("beginner_terrain_pct") or 33
+    i = metrics.get("intermediate_terrain_pct") or 34
+    a = metrics.get("advanced_terrain_pct") or 33
+    total = b + i + a
+    if total == 0:
+        return 33, 34, 33
+    return b / total, i / total, a / total
+
+
+def encode_features(
+    resorts: list[dict[str, Any]],
+    metrics_by_resort: dict[str, dict[str, Any]] | None = None,
+    costs_by_resort: dict[str, dict[str, Any]] | None = None,
+    passes_by_resort: dict[str, list[str]] | None = None,
+) -> SimilarityFeatures:
+    """Encode resorts and their related rows into feature arrays."""
+    metrics_by_resort = metrics_by_resort or {}
+    costs_by_resort = costs_by_resort or {}
+    passes_by_resort = passes_by_resort or {}
+
+    ids = [r["id"] for r in resorts]
+    metrics = [metrics_by_resort.get(rid) or {} for rid in ids]
+    costs = [costs_by_resort.get(rid) or {} for rid in ids]
+
+    family = []
+    for m in metrics:
+        score = m.get("family_overall_score")
+        family.append(0.5 if score is None else min(max(score / 10.0, 0.0), 1.0))
+
+    tiers = []
+    for c in costs:
+        tier = _get_price_tier(c.get("estimated_family_daily"))
+        tiers.append(TIER_ORDER.index(tier) if tier in TIER_ORDER else -1)
+
+    countries = [r.get("country", "") for r in resorts]
+    regions = [r.get("region") for r in resorts]
+    groups = [_get_region_group(c, rg) for c, rg in zip(countries, regions)]
+
+    age_min = [m.get("best_age_min") if m.get("best_age_min") is not None else 0 for m in metrics]
+    age_max = [m.get("best_age_max") if m.get("best_age_max") is not None else 18 for m in metrics]
+
+    # Pass membership as bitsets: one bit per distinct (lowercased) pass name
+    pass_sets = [{p.lower() for p in passes_by_resort.get(rid, [])} for rid in ids]
+    vocabulary = {name: bit for bit, name in enumerate(
+        sorted(set(MAJOR_PASSES).union(*pass_sets))
+    )}
+    words = max(1, math.ceil(len(vocabulary) / 64))
+    pass_bits = np.zeros((len(ids), words), dtype=np.uint64)
+    for row, names in enumerate(pass_sets):
+        for name in names:
+            bit = vocabulary[name]
+            pass_bits[row, bit // 64] |= np.uint64(1 << (bit % 64))
+    major_mask = np.zeros(words, dtype=np.uint64)
+    for name in MAJOR_PASSES:
+        bit = vocabulary[name]
+        major_mask[bit // 64] |= np.uint64(1 << (bit % 64))
+
+    return SimilarityFeatures(
+        resort_ids=ids,
+        family_score=np.array(family, dtype=np.float64),
+        price_tier=np.array(tiers, dtype=np.int32),
+        country=_codes(countries),
+        region=_codes(regions, missing_code=True),
+        region_group=_codes(groups),
+        alps=np.array([g in ("alps_west", "alps_east") for g in groups], dtype=bool),
+        us=np.array([g in ("rockies", "pacific_west", "northeast_us") for g in groups], dtype=bool),
+        age_min=np.array(age_min, dtype=np.float64),
+        age_max=np.array(age_max, dtype=np.float64),
+        terrain=np.array([_terrain_shares(m) for m in metrics], dtype=np.float64).reshape(-1, 3),
+        pass_bits=pass_bits,
+        major_mask=major_mask,
+    )
+
+
+# ============================================================================
+# BULK LOADING
+# ============================================================================
+
+def _fetch_all(
+    table: str,
+    columns: str,
+    order_by: tuple[str, ...],
+    **filters: Any,
+) -> list[dict[str, Any]]:
+    """Read every row of a table, a page at a time.
+
+    order_by must cover the table's key so pages don't overlap or skip rows.
+    """
+    supabase = get_supabase_client()
+    rows: list[dict[str, Any]] = []
+    offset = 0
+
+    while True:
+        query = supabase.table(table).select(columns)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        for column in order_by:
+            query = query.order(column)
+        page = query.range(offset, offset + PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        offset += PAGE_SIZE
+
+
+def _load_similarity_inputs(
+    status: str | None,
+) -> tuple[
+    list[dict[str, Any]],
+    dict[str, dict[str, Any]],
+    dict[str, dict[str, Any]],
+    dict[str, list[str]],
+]:
+    """Bulk-load the raw rows encode_features() needs."""
+    filters = {"status": status} if status else {}
+    resorts = _fetch_all("resorts", RESORT_COLUMNS, ("id",), **filters)
+    wanted = {r["id"] for r in resorts}
+
+    metrics_by_resort: dict[str, dict[str, Any]] = {}
+    for row in _fetch_all("resort_family_metrics", METRIC_COLUMNS, ("resort_id",)):
+        if row["resort_id"] in wanted:
+            metrics_by_resort.setdefault(row["resort_id"], row)
+
+    costs_by_resort: dict[str, dict[str, Any]] = {}
+    for row in _fetch_all("resort_costs", COST_COLUMNS, ("resort_id",)):
+        if row["resort_id"] in wanted:
+            costs_by_resort.setdefault(row["resort_id"], row)
+
+    passes_by_resort: dict[str, list[str]] = {}
+    pass_rows = _fetch_all(
+        "resort_passes", "resort_id, pass_id, ski_passes(name)", ("resort_id", "pass_id")
+    )
+    for row in pass_rows:
+        if row["resort_id"] in wanted and row.get("ski_passes"):
+            passes_by_resort.setdefault(row["resort_id"], []).append(row["ski_passes"]["name"])
+
+    return resorts, metrics_by_resort, costs_by_resort, passes_by_resort
+
+
+def load_similarity_features(status: str | None = "published") -> SimilarityFeatures:
+    """Load all resorts with metrics, costs and passes, and encode them.
+
+    Four paginated queries in total, regardless of resort count.
+
+    Args:
+        status: Only include resorts with this status (None for all)
+    """
+    return encode_features(*_load_similarity_inputs(status))
+
+
+# ============================================================================
+# VECTORIZED SCORING
+# ============================================================================
+
+def pair_components(
+    features: SimilarityFeatures,
+    rows: np.ndarray,
+    cols: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Score component similarities for broadcastable index arrays.
+
+    rows[:, None] with cols[None, :] scores a block of the matrix; two
+    equal-length arrays score a list of pairs.
+
+    Returns:
+        Component arrays keyed like SIMILARITY_WEIGHTS, plus "overall"
+    """
+    f = features
+
+    family = 1.0 - np.abs(f.family_score[rows] - f.family_score[cols])
+
+    tier_a, tier_b = f.price_tier[rows], f.price_tier[cols]
+    price = np.where(
+        (tier_a < 0) | (tier_b < 0),
+        0.5,
+        np.maximum(1.0 - np.abs(tier_a - tier_b) * 0.25, 0.0),
+    )
+
+    same_country = f.country[rows] == f.country[cols]
+    same_region = (f.region[rows] >= 0) & (f.region[rows] == f.region[cols])
+    region = np.select(
+        [
+            same_country & same_region,
+            same_country,
+            f.region_group[rows] == f.region_group[cols],
+            f.alps[rows] & f.alps[cols],
+            f.us[rows] & f.us[cols],
+        ],
+        [1.0, 0.9, 0.7, 0.6, 0.5],
+        default=0.3,
+    )
+
+    min_a, max_a = f.age_min[rows], f.age_max[rows]
+    min_b, max_b = f.age_min[cols], f.age_max[cols]
+    overlap = np.minimum(max_a, max_b) - np.maximum(min_a, min_b)
+    max_range = np.maximum(np.maximum(max_a - min_a, max_b - min_b), 1.0)
+    age = np.where(overlap < 0, 0.2, np.minimum(overlap / max_range, 1.0))
+
+    bits_a, bits_b = f.pass_bits[rows], f.pass_bits[cols]
+    shared = bits_a & bits_b
+    has_a, has_b = bits_a.any(axis=-1), bits_b.any(axis=-1)
+    major_a = (bits_a & f.major_mask).any(axis=-1)
+    major_b = (bits_b & f.major_mask).any(axis=-1)
+    passes = np.select(
+        [
+            ~(has_a & has_b),
+            (shared & f.major_mask).any(axis=-1),
+            shared.any(axis=-1),
+            major_a & major_b,
+        ],
+        [0.5, 1.0, 0.7, 0.4],
+        default=0.3,
+    )
+
+    diff = f.terrain[rows] - f.terrain[cols]
+    terrain = 1.0 - np.sqrt((diff ** 2).sum(axis=-1)) / math.sqrt(2)
+
+    components = {
+        "family_score": family,
+        "price_tier": price,
+        "region": region,
+        "age_range": age,
+        "pass_network": passes,
+        "terrain_mix": terrain,
+    }
+    components["overall"] = sum(
+        components[name] * weight for name, weight in SIMILARITY_WEIGHTS.items()
+    )
+    return components
+
+
+def score_block(features: SimilarityFeatures, start: int, stop: int) -> np.ndarray:
+    """Overall similarity for matrix rows [start, stop) against every resort."""
+    rows = np.arange(start, stop)[:, None]
+    cols = np.arange(len(features))[None, :]
+    return pair_components(features, rows, cols)["overall"]
+
+
+def select_pairs(
+    features: SimilarityFeatures,
+    min_score: float = MIN_STORED_SCORE,
+    top_k: int | None = None,
+    block_rows: int = BLOCK_ROWS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the resort pairs worth storing.
+
+    Args:
+        min_score: Minimum overall score to keep a pair
+        top_k: If set, keep only each resort's top_k neighbours (a pair is
+            kept if it is in the top_k of either resort)
+        block_rows: Matrix rows to score at once
+
+    Returns:
+        (rows, cols) index arrays with rows < cols, each pair once
+    """
+    n = len(features)
+    kept_rows: list[np.ndarray] = []
+    kept_cols: list[np.ndarray] = []
+
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        overall = score_block(features, start, stop)
+        row_idx = np.arange(start, stop)
+        overall[np.arange(stop - start), row_idx] = -1.0  # Never pair a resort with itself
+
+        if top_k is not None and top_k < n - 1:
+            # Neighbours outside each row's top_k are dropped
+            cutoff = np.partition(overall, n - top_k, axis=1)[:, n - top_k][:, None]
+            overall = np.where(overall >= cutoff, overall, -1.0)
+
+        block_r, cols = np.nonzero(np.round(overall, 4) >= min_score)
+        rows = row_idx[block_r]
+        kept_rows.append(np.minimum(rows, cols))
+        kept_cols.append(np.maximum(rows, cols))
+
+    if not kept_rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    pairs = np.unique(
+        np.stack([np.concatenate(kept_rows), np.concatenate(kept_cols)], axis=1), axis=0
+    )
+    return pairs[:, 0], pairs[:, 1]
+
+
+def build_similarity_rows(
+    features: SimilarityFeatures,
+    rows: np.ndarray,
+    cols: np.ndarray,
+) -> list[dict[str, Any]]:
+    """Turn scored pairs into resort_similarities rows (resort_a_id < resort_b_id)."""
+    if len(rows) == 0:
+        return []
+
+    components = pair_components(features, rows, cols)
+    rounded = {name: np.round(values, 4).tolist() for name, values in components.items()}
+    calculated_at = datetime.now(timezone.utc).isoformat()
+
+    records = []
+    for k, (i, j) in enumerate(zip(rows.tolist(), cols.tolist())):
+        a_id, b_id = features.resort_ids[i], features.resort_ids[j]
+        if a_id > b_id:
+            a_id, b_id = b_id, a_id
+        record = {
+            "resort_a_id": a_id,
+            "resort_b_id": b_id,
+            "similarity_score": rounded["overall"][k],
+            "calculated_at": calculated_at,
+        }
+        for name, column in zip(SIMILARITY_WEIGHTS, COMPONENT_COLUMNS):
+            record[column] = rounded[name][k]
+        records.append(record)
+    return records
+
+
+# ============================================================================
+# WRITE-BACK
+# ============================================================================
+
+def upsert_similarity_rows(
+    records: list[dict[str, Any]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> int:
+    """Upsert resort_similarities rows in batches.
+
+    Returns the number of rows written. A failed batch is reported and
+    skipped so one bad batch doesn't lose the rest.
+    """
+    supabase = get_supabase_client()
+    written = 0
+
+    for start in range(0, len(records), batch_size):
+        batch = records[start:start + batch_size]
+        try:
+            supabase.table("resort_similarities").upsert(
+                batch,
+                on_conflict="resort_a_id,resort_b_id",
+                returning=ReturnMethod.minimal,
+            ).execute()
+            written += len(batch)
+        except Exception as e:
+            print(f"Failed to store similarity batch at row {start}: {e}")
+
+    return written
+
+
+def refresh_similarity_matrix(
+    features: SimilarityFeatures | None = None,
+    min_score: float = MIN_STORED_SCORE,
+    top_k: int | None = None,
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> dict[str, int]:
+    """Score every resort pair and store the ones above min_score.
+
+    Args:
+        features: Pre-loaded features (loads published resorts if None)
+        min_score: Minimum overall score to store
+        top_k: Optionally keep only each resort's top_k neighbours
+        batch_size: Rows per upsert
+
+    Returns:
+        Statistics about the refresh
+    """
+    if features is None:
+        features = load_similarity_features()
+
+    rows, cols = select_pairs(features, min_score=min_score, top_k=top_k)
+    records = build_similarity_rows(features, rows, cols)
+    written = upsert_similarity_rows(records, batch_size=batch_size)
+
+    return {
+        "resorts_processed": len(features),
+        "pairs_scored": len(features) * (len(features) - 1) // 2,
+        "similarities_calculated": written,
+    }
+
+
+# ============================================================================
+# CACHED FEATURE STORE
+# ============================================================================
+
+FEATURE_STORE_TTL_SECONDS = 6 * 3600  # Full reload at most this often
+SCORE_TOLERANCE = 0.005                # Skip writes for smaller score changes
+DELETE_CHUNK_SIZE = 200                # Ids per in_() filter (keeps URLs short)
+SIMILAR_LINK_LIMIT = 5                 # Same as generate_links_for_resort
+SIMILAR_LINK_MIN_SCORE = 0.5
+
+
+class SimilarityFeatureStore:
+    """Process-wide cache of the raw rows and encoded features.
+
+    A full load is four paginated queries. After that, refresh_resort()
+    re-reads a single resort (four small queries) and re-encodes, so one
+    changed resort doesn't reload the whole catalogue.
+    """
+
+    def __init__(
+        self,
+        status: str | None = "published",
+        ttl_seconds: float = FEATURE_STORE_TTL_SECONDS,
+    ):
+        self.status = status
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._resorts: dict[str, dict[str, Any]] = {}
+        self._metrics: dict[str, dict[str, Any]] = {}
+        self._costs: dict[str, dict[str, Any]] = {}
+        self._passes: dict[str, list[str]] = {}
+        self._features: SimilarityFeatures | None = None
+        self._loaded_at = 0.0
+
+    def features(self) -> SimilarityFeatures:
+        """Current features, reloading everything if the cache has expired."""
+        with self._lock:
+            if self._features is None or time.monotonic() - self._loaded_at > self.ttl_seconds:
+                self._reload()
+            return self._features
+
+    def reload(self) -> SimilarityFeatures:
+        """Force a full reload from the database."""
+        with self._lock:
+            self._reload()
+            return self._features
+
+    def refresh_resort(self, resort_id: str) -> SimilarityFeatures:
+        """Re-read one resort and re-encode. Drops it if no longer in scope."""
+        supabase = get_supabase_client()
+        self.features()  # Make sure there is something to patch
+
+        resort = supabase.table("resorts").select(RESORT_COLUMNS)\
+            .eq("id", resort_id).limit(1).execute().data
+        metrics = supabase.table("resort_family_metrics").select(METRIC_COLUMNS)\
+            .eq("resort_id", resort_id).limit(1).execute().data
+        costs = supabase.table("resort_costs").select(COST_COLUMNS)\
+            .eq("resort_id", resort_id).limit(1).execute().data
+        passes = supabase.table("resort_passes").select("ski_passes(name)")\
+            .eq("resort_id", resort_id).execute().data
+
+        with self._lock:
+            in_scope = bool(resort) and (
+                self.status is None or resort[0].get("status") == self.status
+            )
+            if in_scope:
+                self._resorts[resort_id] = resort[0]
+                self._metrics[resort_id] = metrics[0] if metrics else {}
+                self._costs[resort_id] = costs[0] if costs else {}
+                self._passes[resort_id] = [
+                    p["ski_passes"]["name"] for p in (passes or []) if p.get("ski_passes")
+                ]
+            else:
+                self._resorts.pop(resort_id, None)
+                self._metrics.pop(resort_id, None)
+                self._costs.pop(resort_id, None)
+                self._passes.pop(resort_id, None)
+            self._encode()
+            return self._features
+
+    def resort(self, resort_id: str) -> dict[str, Any] | None:
+        """Cached resort row (id, name, country, region, status)."""
+        return self._resorts.get(resort_id)
+
+    def invalidate(self) -> None:
+        """Drop the cache; the next features() call reloads."""
+        with self._lock:
+            self._features = None
+
+    def _reload(self) -> None:
+        resorts, self._metrics, self._costs, self._passes = _load_similarity_inputs(self.status)
+        self._resorts = {r["id"]: r for r in resorts}
+        self._encode()
+        self._loaded_at = time.monotonic()
+
+    def _encode(self) -> None:
+        self._features = encode_features(
+            list(self._resorts.values()), self._metrics, self._costs, self._passes
+        )
+
+
+_feature_store: SimilarityFeatureStore | None = None
+_feature_store_lock = threading.Lock()
+
+
+def get_feature_store() -> SimilarityFeatureStore:
+    """Get the process-wide similarity feature store."""
+    global _feature_store
+
+    if _feature_store is None:
+        with _feature_store_lock:
+            if _feature_store is None:
+                _feature_store = SimilarityFeatureStore()
+
+    return _feature_store
+
+
+# ============================================================================
+# INCREMENTAL MAINTENANCE
+# ============================================================================
+
+def _chunks(items: list[Any], size: int = DELETE_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _existing_similarities(resort_id: str) -> dict[str, float]:
+    """Stored scores for every pair involving resort_id, keyed by the other resort."""
+    existing: dict[str, float] = {}
+    for row in _fetch_all(
+        "resort_similarities",
+        "resort_b_id, similarity_score",
+        ("resort_b_id",),
+        resort_a_id=resort_id,
+    ):
+        existing[row["resort_b_id"]] = row["similarity_score"]
+    for row in _fetch_all(
+        "resort_similarities",
+        "resort_a_id, similarity_score",
+        ("resort_a_id",),
+        resort_b_id=resort_id,
+    ):
+        existing[row["resort_a_id"]] = row["similarity_score"]
+    return existing
+
+
+def _delete_similarities(resort_id: str, other_ids: list[str]) -> int:
+    """Delete the stored pairs between resort_id and other_ids."""
+    supabase = get_supabase_client()
+    as_a = sorted(o for o in other_ids if resort_id < o)
+    as_b = sorted(o for o in other_ids if resort_id > o)
+    deleted = 0
+
+    for own_column, other_column, ids in (
+        ("resort_a_id", "resort_b_id", as_a),
+        ("resort_b_id", "resort_a_id", as_b),
+    ):
+        for chunk in _chunks(ids):
+            try:
+                supabase.table("resort_similarities")\
+                    .delete(returning=ReturnMethod.minimal)\
+                    .eq(own_column, resort_id)\
+                    .in_(other_column, chunk)\
+                    .execute()
+                deleted += len(chunk)
+            except Exception as e:
+                print(f"Failed to delete similarities for {resort_id}: {e}")
+
+    return deleted
+
+
+def _top_similar(
+    features: SimilarityFeatures,
+    sources: list[int],
+) -> dict[int, dict[int, float]]:
+    """Each source's "similar" link targets: top SIMILAR_LINK_LIMIT above the minimum."""
+    if not sources or len(features) < 2:
+        return {i: {} for i in sources}
+
+    src = np.array(sources)
+    overall = np.round(
+        pair_components(features, src[:, None], np.arange(len(features))[None, :])["overall"], 4
+    )
+    overall[np.arange(len(src)), src] = -1.0
+
+    targets: dict[int, dict[int, float]] = {}
+    for k, i in enumerate(sources):
+        order = np.argsort(-overall[k], kind="stable")[:SIMILAR_LINK_LIMIT]
+        targets[i] = {
+            int(j): float(overall[k, j]) for j in order if overall[k, j] >= SIMILAR_LINK_MIN_SCORE
+        }
+    return targets
+
+
+def sync_similar_links(
+    store: SimilarityFeatureStore,
+    features: SimilarityFeatures,
+    source_ids: list[str],
+    tolerance: float = SCORE_TOLERANCE,
+) -> tuple[int, int]:
+    """Diff "similar" internal links for source resorts against the current scores.
+
+    Sources that are no longer in the feature set lose all their similar links.
+
+    Returns:
+        (links upserted, links deleted)
+    """
+    from .linking import LinkType, generate_anchor_text
+
+    supabase = get_supabase_client()
+    source_ids = sorted(set(source_ids))
+    in_scope = [features.index[s] for s in source_ids if s in features.index]
+    desired = {
+        features.resort_ids[i]: {features.resort_ids[j]: score for j, score in targets.items()}
+        for i, targets in _top_similar(features, in_scope).items()
+    }
+
+    existing: dict[str, dict[str, float]] = {s: {} for s in source_ids}
+    for chunk in _chunks(source_ids):
+        rows = supabase.table("resort_internal_links")\
+            .select("source_resort_id, target_resort_id, relevance_score")\
+            .eq("link_type", LinkType.SIMILAR.value)\
+            .in_("source_resort_id", chunk)\
+            .execute().data or []
+        for row in rows:
+            existing[row["source_resort_id"]][row["target_resort_id"]] = row["relevance_score"]
+
+    upserts: list[dict[str, Any]] = []
+    deleted = 0
+    for source_id in source_ids:
+        want = desired.get(source_id, {})
+        have = existing[source_id]
+
+        for target_id, score in want.items():
+            old = have.get(target_id)
+            if old is not None and abs(old - score) < tolerance:
+                continue
+            target = store.resort(target_id) or {}
+            upserts.append({
+                "source_resort_id": source_id,
+                "target_resort_id": target_id,
+                "link_type": LinkType.SIMILAR.value,
+                "anchor_text": generate_anchor_text(
+                    target.get("name", ""), target.get("country", ""), LinkType.SIMILAR
+                ),
+                "relevance_score": score,
+            })
+
+        stale = sorted(set(have) - set(want))
+        for chunk in _chunks(stale):
+            try:
+                supabase.table("resort_internal_links")\
+                    .delete(returning=ReturnMethod.minimal)\
+                    .eq("source_resort_id", source_id)\
+                    .eq("link_type", LinkType.SIMILAR.value)\
+                    .in_("target_resort_id", chunk)\
+                    .execute()
+                deleted += len(chunk)
+            except Exception as e:
+                print(f"Failed to delete similar links for {source_id}: {e}")
+
+    upserted = 0
+    for batch in _chunks(upserts, UPSERT_BATCH_SIZE):
+        try:
+            supabase.table("resort_internal_links").upsert(
+                batch,
+                on_conflict="source_resort_id,target_resort_id,link_type",
+                returning=ReturnMethod.minimal,
+            ).execute()
+            upserted += len(batch)
+        except Exception as e:
+            print(f"Failed to store similar links: {e}")
+
+    return upserted, deleted
+
+
+def update_similarities_for_resort(
+    resort_id: str,
+    tolerance: float = SCORE_TOLERANCE,
+    min_score: float = MIN_STORED_SCORE,
+    update_links: bool = True,
+) -> dict[str, int]:
+    """Recompute one resort's row/column of the similarity matrix.
+
+    Call after a resort is published or refreshed. Only pairs whose score
+    is new or moved by at least `tolerance` are upserted; pairs that fell
+    below min_score (or whose other resort is no longer published) are
+    deleted. "Similar" internal links are then diffed for this resort and
+    for every resort whose neighbour list it could have entered or left.
+
+    Returns:
+        Counts of upserted/deleted/unchanged similarities and links
+    """
+    stats = {
+        "similarities_upserted": 0,
+        "similarities_deleted": 0,
+        "similarities_unchanged": 0,
+        "links_upserted": 0,
+        "links_deleted": 0,
+    }
+
+    store = get_feature_store()
+    features = store.refresh_resort(resort_id)
+    existing = _existing_similarities(resort_id)
+
+    desired: dict[str, float] = {}
+    i = features.index.get(resort_id)
+    if i is not None:
+        n = len(features)
+        overall = np.round(pair_components(features, np.array([i]), np.arange(n))["overall"], 4)
+        for j in np.nonzero(overall >= min_score)[0].tolist():
+            if j != i:
+                desired[features.resort_ids[j]] = float(overall[j])
+
+    changed = [
+        other for other, score in desired.items()
+        if other not in existing or abs(existing[other] - score) >= tolerance
+    ]
+    removed = sorted(set(existing) - set(desired))
+    stats["similarities_unchanged"] = len(desired) - len(changed)
+
+    if changed:
+        rows = np.full(len(changed), i)
+        cols = np.array([features.index[other] for other in changed])
+        stats["similarities_upserted"] = upsert_similarity_rows(
+            build_similarity_rows(features, rows, cols)
+        )
+    if removed:
+        stats["similarities_deleted"] = _delete_similarities(resort_id, removed)
+
+    if update_links:
+        # Resorts whose top-N similar list this resort may have entered or left
+        affected = {resort_id}
+        for other in changed + removed:
+            if max(desired.get(other, 0.0), existing.get(other) or 0.0) >= SIMILAR_LINK_MIN_SCORE:
+                affected.add(other)
+        upserted, deleted = sync_similar_links(store, features, list(affected), tolerance)
+        stats["links_upserted"] = upserted
+        stats["links_deleted"] = deleted
+
+    return stats
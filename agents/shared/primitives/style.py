@@ -17,11 +17,9 @@ import logging
 import re
 from typing import Any
 
-import anthropic
-
 from ..config import settings
+from ..llm_client import create_message
 from ..style_profiles import StyleProfile, get_style_profile
-from .system import log_cost
 
 logger = logging.getLogger(__name__)
 
@@ -187,6 +185,32 @@ def apply_deterministic_style(
 # =============================================================================
 
 
+EM_DASH_MODEL = "claude-haiku-4-5-20251001"
+
+
+def build_em_dash_prompt(text: str) -> str:
+    """Prompt for Layer 2 (shared by the live path and batch jobs)."""
+    return f"""Replace ALL em-dashes (—) in this text with appropriate alternatives.
+
+Rules:
+- Independent clauses separated by em-dash → period or semicolon
+- Parenthetical aside set off by em-dashes → commas
+- Amplifying/explaining clause → colon
+- Trailing thought → period
+
+IMPORTANT: Preserve ALL other content exactly. Only change em-dashes.
+Do NOT add or remove any other words, links, HTML tags, or formatting.
+
+Text:
+{text}
+
+Return ONLY the corrected text, nothing else."""
+
+
+def em_dash_max_tokens(text: str) -> int:
+    return len(text) + 200
+
+
 async def replace_em_dashes_contextually(
     text: str,
     section_name: str = "",
@@ -216,36 +240,13 @@ async def replace_em_dashes_contextually(
         return text.replace(" — ", " - ").replace("—", " - ")
 
     try:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-        prompt = f"""Replace ALL em-dashes (—) in this text with appropriate alternatives.
-
-Rules:
-- Independent clauses separated by em-dash → period or semicolon
-- Parenthetical aside set off by em-dashes → commas
-- Amplifying/explaining clause → colon
-- Trailing thought → period
-
-IMPORTANT: Preserve ALL other content exactly. Only change em-dashes.
-Do NOT add or remove any other words, links, HTML tags, or formatting.
-
-Text:
-{text}
-
-Return ONLY the corrected text, nothing else."""
-
-        response = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=len(text) + 200,
-            messages=[{"role": "user", "content": prompt}],
+        response = await create_message(
+            call="em_dash_rewrite",
+            model=EM_DASH_MODEL,
+            max_tokens=em_dash_max_tokens(text),
+            messages=[{"role": "user", "content": build_em_dash_prompt(text)}],
         )
 
-        log_cost("anthropic", 0.002, None, {
-            "stage": "em_dash_replacement",
-            "section": section_name,
-            "em_dash_count": em_dash_count,
-        })
-
         result = response.content[0].text.strip()
 
         # Verify no em-dashes remain (safety check)
@@ -278,34 +279,12 @@ async def apply_em_dash_fix(content: dict[str, Any]) -> dict[str, Any]:
 # =============================================================================
 
 
-async def apply_style_edit(
-    text: str,
-    section_name: str,
-    profile: StyleProfile | None = None,
-) -> str:
-    """Layer 3: Full Opus prose rewrite for reading delight.
+STYLE_EDIT_MODEL = "claude-opus-4-6"
 
-    Preserves all facts, links, HTML, proper nouns. Only rewrites
-    for rhythm, personality, and reading experience.
 
-    Args:
-        text: Content text to style-edit
-        section_name: Section context for the editor
-        profile: Style profile with knobs
-
-    Returns:
-        Style-edited text
-    """
-    if not settings.anthropic_api_key:
-        return text
-
-    if profile is None:
-        profile = get_style_profile("spielplatz")
-
-    try:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-        knob_desc = f"""Style knobs (0.0-1.0 scale):
+def build_style_edit_prompt(text: str, section_name: str, profile: StyleProfile) -> str:
+    """Prompt for Layer 3 (shared by the live path and batch jobs)."""
+    knob_desc = f"""Style knobs (0.0-1.0 scale):
 - Sentence variety: {profile.sentence_variety} (mix long/short/fragment)
 - Paragraph hooks: {profile.paragraph_hooks} (strong opening lines)
 - Fragment tolerance: {profile.fragment_tolerance} (sentence fragments OK)
@@ -317,7 +296,7 @@ async def apply_style_edit(
 - Confidence level: {profile.confidence_level}
 - Max {profile.max_paragraph_sentences} sentences per paragraph"""
 
-        prompt = f"""You are a style editor for Snowthere, a family ski trip guide.
+    return f"""You are a style editor for Snowthere, a family ski trip guide.
 
 Rewrite this {section_name} section for READING DELIGHT while preserving every fact.
 
@@ -337,17 +316,45 @@ Text to edit:
 
 Return ONLY the edited text, nothing else."""
 
-        response = client.messages.create(
-            model="claude-opus-4-6",
-            max_tokens=len(text) + 500,
-            messages=[{"role": "user", "content": prompt}],
-        )
 
-        log_cost("anthropic", 0.40, None, {
-            "stage": "style_edit",
-            "section": section_name,
-            "profile": profile.name,
-        })
+def style_edit_max_tokens(text: str) -> int:
+    return len(text) + 500
+
+
+async def apply_style_edit(
+    text: str,
+    section_name: str,
+    profile: StyleProfile | None = None,
+) -> str:
+    """Layer 3: Full Opus prose rewrite for reading delight.
+
+    Preserves all facts, links, HTML, proper nouns. Only rewrites
+    for rhythm, personality, and reading experience.
+
+    Args:
+        text: Content text to style-edit
+        section_name: Section context for the editor
+        profile: Style profile with knobs
+
+    Returns:
+        Style-edited text
+    """
+    if not settings.anthropic_api_key:
+        return text
+
+    if profile is None:
+        profile = get_style_profile("spielplatz")
+
+    try:
+        response = await create_message(
+            call="style_edit",
+            model=STYLE_EDIT_MODEL,
+            max_tokens=style_edit_max_tokens(text),
+            messages=[{
+                "role": "user",
+                "content": build_style_edit_prompt(text, section_name, profile),
+            }],
+        )
 
         return response.content[0].text.strip()
 
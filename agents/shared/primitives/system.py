@@ -1,12 +1,17 @@
 """System primitives for agent operations."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
+from ..audit_sink import get_audit_sink
+from ..budget_ledger import get_budget_ledger
+from ..llm_metering import current_attribution
 from ..supabase_client import get_supabase_client
 
+COST_PAGE_SIZE = 1000  # PostgREST's default max rows per request
+
 
 def log_cost(
     api_name: str,
@@ -22,15 +27,21 @@ def log_cost(
         amount_usd: Cost in USD
         task_id: Optional task ID for correlation
         metadata: Additional context
+
+    The row is buffered and written in a bulk insert (see shared/audit_sink.py).
+    Fields set with cost_attribution() (run_id, resort, stage, task_id) are
+    added to the metadata; explicit metadata wins.
     """
-    client = get_supabase_client()
+    attribution = current_attribution()
+    attributed_task_id = attribution.pop("task_id", None)
+    task_id = task_id or attributed_task_id
 
     data = {
         "id": str(uuid4()),
         "api_name": api_name,
         "amount_usd": amount_usd,
         "task_id": task_id,
-        "metadata": metadata or {},
+        "metadata": {**attribution, **(metadata or {})},
         "created_at": datetime.utcnow().isoformat(),
     }
 
@@ -43,10 +54,12 @@ def log_cost(
         "action": "api_cost",
         "reasoning": f"API call to {api_name} cost ${amount_usd:.4f}",
         "input_data": data,  # Use input_data to match schema
+        "created_at": data["created_at"],
     }
 
-    response = client.table("agent_audit_log").insert(audit_data).execute()
-    return response.data
+    get_audit_sink().enqueue(audit_data)
+    get_budget_ledger().record(amount_usd)
+    return audit_data
 
 
 def log_reasoning(
@@ -59,10 +72,9 @@ def log_reasoning(
     """
     Log agent reasoning for observability.
 
-    Creates an audit trail of why decisions were made.
+    Creates an audit trail of why decisions were made. Like log_cost, the
+    row is buffered and written in a bulk insert.
     """
-    client = get_supabase_client()
-
     # Serialize metadata to handle dataclasses and other non-JSON types
     safe_metadata = json.loads(json.dumps(metadata or {}, default=str))
 
@@ -78,8 +90,8 @@ def log_reasoning(
         "input_data": safe_metadata,
     }
 
-    response = client.table("agent_audit_log").insert(data).execute()
-    return response.data
+    get_audit_sink().enqueue(data)
+    return data
 
 
 def queue_task(
@@ -181,26 +193,10 @@ def get_daily_spend() -> float:
     """
     Get total API spend for today.
 
-    Used for budget enforcement.
+    Used for budget enforcement. Served from the in-process budget ledger,
+    which loads the day's total once and then tracks log_cost() calls.
     """
-    client = get_supabase_client()
-
-    today = datetime.utcnow().date().isoformat()
-
-    response = (
-        client.table("agent_audit_log")
-        .select("input_data")  # Schema uses input_data, not metadata
-        .eq("action", "api_cost")
-        .gte("created_at", f"{today}T00:00:00+00:00")  # UTC timezone for consistent queries
-        .execute()
-    )
-
-    total = 0.0
-    for row in response.data or []:
-        input_data = row.get("input_data", {})
-        total += input_data.get("amount_usd", 0)
-
-    return total
+    return get_budget_ledger().spent()
 
 
 def check_budget(required_usd: float, daily_limit: float | None = None) -> bool:
@@ -209,6 +205,10 @@ def check_budget(required_usd: float, daily_limit: float | None = None) -> bool:
 
     Returns True if we can proceed, False if we'd exceed budget.
     Uses settings.daily_budget_limit if no limit specified.
+
+    Only counts actual spend, not ledger reservations: a resort run checks
+    this while holding its own reservation. Use get_budget_ledger().reserve()
+    to share the budget between concurrent runs.
     """
     from ..config import settings
 
@@ -411,42 +411,67 @@ def get_cost_breakdown(days: int = 7) -> dict[str, Any]:
     """
     Get API cost breakdown for the specified period.
 
+    Claude costs are metered from response usage (see shared/llm_metering.py),
+    so their rows also carry model, stage and token counts.
+
     Args:
         days: Number of days to analyze
 
     Returns:
-        Cost breakdown by API and day
+        Cost breakdown by API, model, stage and day, plus Claude token totals
     """
     client = get_supabase_client()
-
-    response = (
-        client.table("agent_audit_log")
-        .select("input_data, created_at")  # Schema uses input_data, not metadata
-        .eq("action", "api_cost")
-        .order("created_at", desc=True)
-        .execute()
-    )
+    since = (datetime.utcnow() - timedelta(days=days)).isoformat()
 
     breakdown = {
         "total_usd": 0.0,
         "by_api": {},
+        "by_model": {},
+        "by_stage": {},
         "daily": {},
+        "tokens": {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        },
+        "llm_calls": 0,
     }
 
-    for row in response.data or []:
-        input_data = row.get("input_data", {})
-        amount = input_data.get("amount_usd", 0)
-        api_name = input_data.get("api_name", "unknown")
-        date = row.get("created_at", "")[:10]  # Extract date portion
-
-        breakdown["total_usd"] += amount
-
-        if api_name not in breakdown["by_api"]:
-            breakdown["by_api"][api_name] = 0.0
-        breakdown["by_api"][api_name] += amount
-
-        if date not in breakdown["daily"]:
-            breakdown["daily"][date] = 0.0
-        breakdown["daily"][date] += amount
+    def _add(bucket: dict[str, float], key: str, amount: float) -> None:
+        bucket[key] = bucket.get(key, 0.0) + amount
+
+    offset = 0
+    while True:
+        response = (
+            client.table("agent_audit_log")
+            .select("input_data, created_at")  # Schema uses input_data, not metadata
+            .eq("action", "api_cost")
+            .gte("created_at", since)
+            .order("created_at", desc=True)
+            .range(offset, offset + COST_PAGE_SIZE - 1)
+            .execute()
+        )
+        rows = response.data or []
+
+        for row in rows:
+            input_data = row.get("input_data") or {}
+            metadata = input_data.get("metadata") or {}
+            amount = input_data.get("amount_usd", 0)
+
+            breakdown["total_usd"] += amount
+            _add(breakdown["by_api"], input_data.get("api_name", "unknown"), amount)
+            _add(breakdown["by_stage"], metadata.get("stage") or "unattributed", amount)
+            _add(breakdown["daily"], row.get("created_at", "")[:10], amount)
+
+            if metadata.get("model"):
+                _add(breakdown["by_model"], metadata["model"], amount)
+                breakdown["llm_calls"] += 1
+                for field in breakdown["tokens"]:
+                    breakdown["tokens"][field] += metadata.get(field) or 0
+
+        if len(rows) < COST_PAGE_SIZE:
+            break
+        offset += COST_PAGE_SIZE
 
     return breakdown
@@ -15,20 +15,40 @@ Fallback Strategy:
 - Tier C: Minimal data (satellite + markers + official link)
 - Tier D: No coordinates (link to official map only)
 
+Caching and payload size:
+- Parsed pistes and lifts are cached in trail_map_cache (plus a small
+  in-process tier), keyed by the query bbox snapped outward to a 0.01° grid,
+  with a long TTL. Refreshes skip the Overpass query entirely.
+- Overpass nodes are parsed into flat coordinate arrays rather than one
+  tuple per node, and every piste/lift line is simplified with
+  Douglas-Peucker to a bounded number of points before it is cached or
+  returned.
+
 Resources:
 - OpenSkiMap.org - Uses this same data
 - OpenSnowMap.org - Additional snow/ski layers
 """
 
 import asyncio
+import logging
 import math
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any
 
 import httpx
 
 from ..config import settings
+from ..http_client import get_http_client
+from ..rate_limits import provider_slot
+from ..supabase_client import get_supabase_client, run_db
+
+logger = logging.getLogger(__name__)
 
 
 # Overpass API endpoint (public, rate-limited)
@@ -41,6 +61,19 @@ OVERPASS_ENDPOINTS = [
     "https://maps.mail.ru/osm/tools/overpass/api/interpreter",
 ]
 
+# Trail map cache
+TRAIL_MAP_CACHE_TTL_DAYS = 90  # Piste networks change a few times a season at most
+TRAIL_MAP_EMPTY_TTL_DAYS = 7  # Where OSM had nothing, look again sooner
+BBOX_GRID_DEGREES = 0.01  # ~1.1km: nearby coordinates share one cache entry
+TRAIL_MAP_MEMORY_MAX_ENTRIES = 64
+CACHE_FORMAT_VERSION = 1
+
+# Geometry simplification (Douglas-Peucker)
+SIMPLIFY_TOLERANCE_M = 5.0  # Starting tolerance; doubled until under the point cap
+MAX_PISTE_POINTS = 64
+MAX_LIFT_POINTS = 16  # Lifts are near-straight lines
+COORD_DECIMALS = 5  # ~1m
+
 
 class TrailDifficulty(str, Enum):
     """Standard piste difficulty ratings."""
@@ -140,6 +173,303 @@ class TrailMapResult:
         }
 
 
+# =============================================================================
+# GEOMETRY
+# =============================================================================
+
+
+def _douglas_peucker(xs: Sequence[float], ys: Sequence[float], tolerance: float) -> list[int]:
+    """Indices of the points Douglas-Peucker keeps (iterative, no recursion)."""
+    n = len(xs)
+    keep = [False] * n
+    keep[0] = keep[n - 1] = True
+    stack = [(0, n - 1)]
+    tolerance_sq = tolerance * tolerance
+
+    while stack:
+        start, end = stack.pop()
+        ax, ay = xs[start], ys[start]
+        dx, dy = xs[end] - ax, ys[end] - ay
+        segment_sq = dx * dx + dy * dy
+
+        farthest, farthest_sq = -1, tolerance_sq
+        for i in range(start + 1, end):
+            px, py = xs[i] - ax, ys[i] - ay
+            if segment_sq:
+                t = max(0.0, min(1.0, (px * dx + py * dy) / segment_sq))
+                px, py = px - t * dx, py - t * dy
+            distance_sq = px * px + py * py
+            if distance_sq > farthest_sq:
+                farthest, farthest_sq = i, distance_sq
+
+        if farthest != -1:
+            keep[farthest] = True
+            stack.append((start, farthest))
+            stack.append((farthest, end))
+
+    return [i for i in range(n) if keep[i]]
+
+
+def simplify_line(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    max_points: int,
+    tolerance_m: float = SIMPLIFY_TOLERANCE_M,
+) -> list[tuple[float, float]]:
+    """Simplify a polyline to at most max_points (lat, lon) points.
+
+    Douglas-Peucker on a local equirectangular projection, doubling the
+    tolerance until the line fits. Coordinates are rounded to ~1m.
+    """
+    n = len(lats)
+    if n <= 2:
+        return [
+            (round(lat, COORD_DECIMALS), round(lon, COORD_DECIMALS))
+            for lat, lon in zip(lats, lons)
+        ]
+
+    # Metres per degree around this line
+    y_scale = 110_540.0
+    x_scale = 111_320.0 * math.cos(math.radians(lats[0]))
+    xs = [lon * x_scale for lon in lons]
+    ys = [lat * y_scale for lat in lats]
+
+    tolerance = tolerance_m
+    kept = _douglas_peucker(xs, ys, tolerance)
+    while len(kept) > max_points:
+        tolerance *= 2
+        kept = _douglas_peucker(xs, ys, tolerance)
+
+    return [(round(lats[i], COORD_DECIMALS), round(lons[i], COORD_DECIMALS)) for i in kept]
+
+
+def _flatten(geometry: list[tuple[float, float]]) -> list[float]:
+    return [coord for point in geometry for coord in point]
+
+
+def _unflatten(flat: list[float]) -> list[tuple[float, float]]:
+    return list(zip(flat[0::2], flat[1::2]))
+
+
+def parse_overpass_elements(
+    elements: list[dict[str, Any]],
+) -> tuple[list["PisteData"], list["LiftData"]]:
+    """Parse Overpass elements into simplified pistes and lifts.
+
+    Node coordinates go into two flat float arrays (plus an id -> index map)
+    instead of a tuple per node; only the simplified points of each way
+    become tuples.
+    """
+    node_index: dict[int, int] = {}
+    lats = array("d")
+    lons = array("d")
+    for el in elements:
+        if el.get("type") == "node":
+            node_index[el["id"]] = len(lats)
+            lats.append(el["lat"])
+            lons.append(el["lon"])
+
+    def way_geometry(el: dict[str, Any], max_points: int) -> list[tuple[float, float]]:
+        indices = [node_index[n] for n in el.get("nodes", []) if n in node_index]
+        if not indices:
+            return []
+        return simplify_line([lats[i] for i in indices], [lons[i] for i in indices], max_points)
+
+    pistes: list[PisteData] = []
+    lifts: list[LiftData] = []
+
+    for el in elements:
+        el_type = el.get("type")
+        if el_type not in ("way", "relation"):
+            continue
+        tags = el.get("tags", {})
+
+        piste_type = tags.get("piste:type")
+        if piste_type:
+            geometry = way_geometry(el, MAX_PISTE_POINTS)
+            if geometry:
+                pistes.append(PisteData(
+                    osm_id=el["id"],
+                    name=tags.get("name"),
+                    difficulty=parse_difficulty(tags),
+                    piste_type=piste_type,
+                    groomed=tags.get("piste:grooming") == "classic",
+                    lit=tags.get("piste:lit") == "yes",
+                    geometry=geometry,
+                ))
+
+        lift_type = tags.get("aerialway")
+        if lift_type and el_type == "way":
+            geometry = way_geometry(el, MAX_LIFT_POINTS)
+            if geometry:
+                lifts.append(LiftData(
+                    osm_id=el["id"],
+                    name=tags.get("name"),
+                    lift_type=lift_type,
+                    capacity=int(tags["aerialway:capacity"])
+                    if tags.get("aerialway:capacity", "").isdigit()
+                    else None,
+                    geometry=geometry,
+                ))
+
+    return pistes, lifts
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+def snap_bbox(bbox: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+    """Expand a (south, west, north, east) bbox outward to the cache grid."""
+    south, west, north, east = bbox
+    grid = BBOX_GRID_DEGREES
+    return (
+        round(math.floor(south / grid) * grid, 4),
+        round(math.floor(west / grid) * grid, 4),
+        round(math.ceil(north / grid) * grid, 4),
+        round(math.ceil(east / grid) * grid, 4),
+    )
+
+
+def bbox_cache_key(bbox: tuple[float, float, float, float]) -> str:
+    """trail_map_cache key for a snapped bbox."""
+    return ",".join(f"{v:.2f}" for v in bbox)
+
+
+def _encode_payload(pistes: list["PisteData"], lifts: list["LiftData"]) -> dict[str, Any]:
+    """Compact, positional JSON for the cache row."""
+    return {
+        "v": CACHE_FORMAT_VERSION,
+        "pistes": [
+            [
+                p.osm_id,
+                p.name,
+                p.difficulty.value if p.difficulty else None,
+                p.piste_type,
+                p.groomed,
+                p.lit,
+                _flatten(p.geometry),
+            ]
+            for p in pistes
+        ],
+        "lifts": [
+            [l.osm_id, l.name, l.lift_type, l.capacity, _flatten(l.geometry)]
+            for l in lifts
+        ],
+    }
+
+
+def _decode_payload(payload: dict[str, Any]) -> tuple[list["PisteData"], list["LiftData"]] | None:
+    if not payload or payload.get("v") != CACHE_FORMAT_VERSION:
+        return None
+    pistes = [
+        PisteData(
+            osm_id=osm_id,
+            name=name,
+            difficulty=TrailDifficulty(difficulty) if difficulty else None,
+            piste_type=piste_type,
+            groomed=groomed,
+            lit=lit,
+            geometry=_unflatten(flat),
+        )
+        for osm_id, name, difficulty, piste_type, groomed, lit, flat in payload.get("pistes", [])
+    ]
+    lifts = [
+        LiftData(
+            osm_id=osm_id,
+            name=name,
+            lift_type=lift_type,
+            capacity=capacity,
+            geometry=_unflatten(flat),
+        )
+        for osm_id, name, lift_type, capacity, flat in payload.get("lifts", [])
+    ]
+    return pistes, lifts
+
+
+_cache_lock = threading.Lock()
+# bbox key -> (expires_at, pistes, lifts)
+_memory_cache: "OrderedDict[str, tuple[datetime, list[PisteData], list[LiftData]]]" = OrderedDict()
+
+
+def _remember(key: str, expires_at: datetime, pistes: list["PisteData"], lifts: list["LiftData"]):
+    with _cache_lock:
+        _memory_cache[key] = (expires_at, pistes, lifts)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > TRAIL_MAP_MEMORY_MAX_ENTRIES:
+            _memory_cache.popitem(last=False)
+
+
+def load_cached_trail_map(key: str) -> tuple[list["PisteData"], list["LiftData"]] | None:
+    """Cached pistes and lifts for a bbox key, if fresh (blocking)."""
+    now = datetime.now(timezone.utc)
+    with _cache_lock:
+        entry = _memory_cache.get(key)
+    if entry and entry[0] > now:
+        return list(entry[1]), list(entry[2])
+
+    try:
+        response = (
+            get_supabase_client()
+            .table("trail_map_cache")
+            .select("payload, expires_at")
+            .eq("bbox_key", key)
+            .gt("expires_at", now.isoformat())
+            .limit(1)
+            .execute()
+        )
+    except Exception as e:
+        logger.debug(f"Trail map cache lookup failed for {key}: {e}")
+        return None
+
+    if not response.data:
+        return None
+
+    decoded = _decode_payload(response.data[0]["payload"])
+    if decoded is None:
+        return None
+
+    expires_at = datetime.fromisoformat(response.data[0]["expires_at"].replace("Z", "+00:00"))
+    _remember(key, expires_at, *decoded)
+    return list(decoded[0]), list(decoded[1])
+
+
+def save_cached_trail_map(key: str, pistes: list["PisteData"], lifts: list["LiftData"]) -> None:
+    """Store parsed pistes and lifts for a bbox key (blocking)."""
+    now = datetime.now(timezone.utc)
+    ttl_days = TRAIL_MAP_CACHE_TTL_DAYS if (pistes or lifts) else TRAIL_MAP_EMPTY_TTL_DAYS
+    expires_at = now + timedelta(days=ttl_days)
+    _remember(key, expires_at, pistes, lifts)
+
+    try:
+        get_supabase_client().table("trail_map_cache").upsert(
+            {
+                "bbox_key": key,
+                "payload": _encode_payload(pistes, lifts),
+                "piste_count": len(pistes),
+                "lift_count": len(lifts),
+                "fetched_at": now.isoformat(),
+                "expires_at": expires_at.isoformat(),
+            },
+            on_conflict="bbox_key",
+        ).execute()
+    except Exception as e:
+        # The in-process tier still has it; next process re-queries Overpass
+        logger.warning(f"Could not store trail map cache for {key}: {e}")
+
+
+def clear_trail_map_memory_cache() -> None:
+    """Drop the in-process tier (useful for testing)."""
+    with _cache_lock:
+        _memory_cache.clear()
+
+
+# =============================================================================
+# OVERPASS
+# =============================================================================
+
+
 def calculate_bbox(
     lat: float, lon: float, radius_km: float = 5.0
 ) -> tuple[float, float, float, float]:
@@ -196,19 +526,21 @@ async def query_overpass(query: str, timeout: int = 60) -> dict[str, Any] | None
     Returns:
         JSON response or None on failure
     """
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        for endpoint in OVERPASS_ENDPOINTS:
-            try:
+    client = get_http_client("overpass", timeout=timeout)
+    for endpoint in OVERPASS_ENDPOINTS:
+        try:
+            async with provider_slot("overpass"):
                 response = await client.post(
                     endpoint,
                     data={"data": query},
                     headers={"Content-Type": "application/x-www-form-urlencoded"},
+                    timeout=timeout,
                 )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                print(f"Overpass query failed at {endpoint}: {e}")
-                continue
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            print(f"Overpass query failed at {endpoint}: {e}")
+            continue
 
     return None
 
@@ -219,12 +551,14 @@ async def get_trail_map(
     latitude: float | None = None,
     longitude: float | None = None,
     radius_km: float = 8.0,
+    use_cache: bool = True,
 ) -> TrailMapResult:
     """
     Fetch ski trail map data from OpenStreetMap.
 
     This is the main entry point for trail map data. It queries the Overpass API
-    for ski pistes and lifts within a bounding box around the resort coordinates.
+    for ski pistes and lifts within a bounding box around the resort coordinates,
+    or reuses the cached result for that (grid-snapped) bounding box.
 
     Args:
         resort_name: Name of the ski resort
@@ -232,6 +566,7 @@ async def get_trail_map(
         latitude: Resort center latitude (optional if using search)
         longitude: Resort center longitude (optional if using search)
         radius_km: Search radius in kilometers (default 8km for larger resorts)
+        use_cache: Read and write trail_map_cache (False forces a fresh query)
 
     Returns:
         TrailMapResult with piste data, lift data, and quality assessment
@@ -252,91 +587,50 @@ async def get_trail_map(
             return result
 
     result.center_coords = (latitude, longitude)
-    bbox = calculate_bbox(latitude, longitude, radius_km)
+    bbox = snap_bbox(calculate_bbox(latitude, longitude, radius_km))
     result.bbox = bbox
+    cache_key = bbox_cache_key(bbox)
 
-    # Build Overpass query for ski pistes and lifts
-    # Query includes: pistes (downhill, nordic), lifts (all types), ski area boundaries
-    query = f"""
-    [out:json][timeout:45];
-    (
-      // Ski pistes
-      way["piste:type"~"downhill|nordic|skitour"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-      relation["piste:type"~"downhill|nordic|skitour"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-
-      // Ski lifts
-      way["aerialway"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-
-      // Ski area boundaries (for context)
-      relation["landuse"="winter_sports"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
-    );
-    out body;
-    >;
-    out skel qt;
-    """
-
-    data = await query_overpass(query)
-
-    if not data:
-        result.error = "Overpass API query failed"
-        return result
-
-    elements = data.get("elements", [])
+    cached = await run_db(load_cached_trail_map, cache_key) if use_cache else None
+    if cached is not None:
+        result.pistes, result.lifts = cached
+    else:
+        # Build Overpass query for ski pistes and lifts
+        # Query includes: pistes (downhill, nordic), lifts (all types), ski area boundaries
+        query = f"""
+        [out:json][timeout:45];
+        (
+          // Ski pistes
+          way["piste:type"~"downhill|nordic|skitour"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
+          relation["piste:type"~"downhill|nordic|skitour"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
+
+          // Ski lifts
+          way["aerialway"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
+
+          // Ski area boundaries (for context)
+          relation["landuse"="winter_sports"]({bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]});
+        );
+        out body;
+        >;
+        out skel qt;
+        """
+
+        data = await query_overpass(query)
+
+        if not data:
+            result.error = "Overpass API query failed"
+            return result
 
-    # Build node lookup for resolving way geometries
-    nodes: dict[int, tuple[float, float]] = {}
-    for el in elements:
-        if el.get("type") == "node":
-            nodes[el["id"]] = (el["lat"], el["lon"])
+        # A 200 with a remark means the query hit a runtime error or timeout,
+        # so missing elements don't mean the area is empty: don't cache it
+        remark = data.get("remark")
+        result.pistes, result.lifts = parse_overpass_elements(data.get("elements", []))
+        del data  # Raw response can be tens of MB for big ski areas
 
-    # Parse pistes
-    for el in elements:
-        if el.get("type") in ("way", "relation"):
-            tags = el.get("tags", {})
-            piste_type = tags.get("piste:type")
-
-            if piste_type:
-                # Get geometry from way nodes
-                geometry = []
-                for node_id in el.get("nodes", []):
-                    if node_id in nodes:
-                        geometry.append(nodes[node_id])
-
-                if geometry:
-                    piste = PisteData(
-                        osm_id=el["id"],
-                        name=tags.get("name"),
-                        difficulty=parse_difficulty(tags),
-                        piste_type=piste_type,
-                        groomed=tags.get("piste:grooming") == "classic",
-                        lit=tags.get("piste:lit") == "yes",
-                        geometry=geometry,
-                    )
-                    result.pistes.append(piste)
-
-    # Parse lifts
-    for el in elements:
-        if el.get("type") == "way":
-            tags = el.get("tags", {})
-            lift_type = tags.get("aerialway")
-
-            if lift_type:
-                geometry = []
-                for node_id in el.get("nodes", []):
-                    if node_id in nodes:
-                        geometry.append(nodes[node_id])
-
-                if geometry:
-                    lift = LiftData(
-                        osm_id=el["id"],
-                        name=tags.get("name"),
-                        lift_type=lift_type,
-                        capacity=int(tags["aerialway:capacity"])
-                        if tags.get("aerialway:capacity", "").isdigit()
-                        else None,
-                        geometry=geometry,
-                    )
-                    result.lifts.append(lift)
+        if remark:
+            logger.warning(f"Overpass returned a remark, not caching trail map: {remark}")
+        elif use_cache:
+            await run_db(save_cached_trail_map, cache_key, result.pistes, result.lifts)
 
     # Assess quality based on data completeness
     piste_count = len(result.pistes)
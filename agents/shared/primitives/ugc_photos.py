@@ -11,20 +11,45 @@ Cost: ~$0.06 per resort (first lookup)
 - Photo fetches: $0.007 each (5 photos = $0.035)
 - Optional vision filtering: ~$0.01
 
+Photos stream through fetch -> classify -> upload a few at a time and
+fetching stops once enough relevant photos are accepted, so a resort never
+pays for (or holds in memory) photos it won't use. Photos that match (or
+nearly match) one the resort already has are dropped before classification.
+
 With place_id caching, subsequent lookups save $0.003 per resort.
 """
 
 import asyncio
-import base64
-import hashlib
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 import httpx
 
 from shared.config import settings
-from shared.supabase_client import get_supabase_client
+from shared.http_client import get_http_client
+from shared.rate_limits import provider_slot
+from shared.supabase_client import get_supabase_client, run_db
+
+from .image_store import (
+    DuplicateFilter,
+    ImageFingerprint,
+    derivative_fields,
+    fingerprint_image,
+    load_resort_duplicate_filter,
+    store_image,
+)
+
+
+# Photos in flight at once through fetch -> classify -> upload. Each worker
+# holds at most one photo's bytes, so this also bounds peak memory.
+UGC_PIPELINE_CONCURRENCY = 3
+
+# Per-call API costs (USD)
+FIND_PLACE_COST = 0.003
+PLACE_DETAILS_COST = 0.017
+PHOTO_FETCH_COST = 0.007
+VISION_COST = 0.002  # Gemini Flash is cheap
 
 
 # Country name variants for better Google Places matching
@@ -141,6 +166,7 @@ class UGCPhoto:
     attributions: list[str] = field(default_factory=list)
     category: PhotoCategory = PhotoCategory.UNKNOWN
     relevance_score: float = 0.0  # 0-1, higher = more family-relevant
+    fingerprint: Optional[ImageFingerprint] = None  # Content + perceptual hash
 
 
 @dataclass
@@ -152,6 +178,7 @@ class UGCPhotoResult:
     place_name: Optional[str] = None
     total_found: int = 0
     filtered_count: int = 0
+    duplicates_skipped: int = 0
     cost: float = 0.0
     error: Optional[str] = None
 
@@ -328,27 +355,28 @@ async def get_place_details(place_id: str) -> Optional[dict]:
     if not api_key:
         return None
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        params = {
-            "place_id": place_id,
-            "fields": "name,photos,rating,user_ratings_total,editorial_summary",
-            "key": api_key,
-        }
+    client = get_http_client("google_places")
+    params = {
+        "place_id": place_id,
+        "fields": "name,photos,rating,user_ratings_total,editorial_summary",
+        "key": api_key,
+    }
 
+    async with provider_slot("google_places"):
         response = await client.get(
             "https://maps.googleapis.com/maps/api/place/details/json",
             params=params,
         )
 
-        if response.status_code != 200:
-            return None
+    if response.status_code != 200:
+        return None
 
-        data = response.json()
+    data = response.json()
 
-        if data.get("status") == "OK":
-            return data.get("result")
+    if data.get("status") == "OK":
+        return data.get("result")
 
-        return None
+    return None
 
 
 async def fetch_place_photo(
@@ -372,58 +400,65 @@ async def fetch_place_photo(
     if not api_key:
         return None
 
-    async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-        params = {
-            "photo_reference": photo_reference,
-            "maxwidth": max_width,
-            "maxheight": max_height,
-            "key": api_key,
-        }
+    client = get_http_client("google_places")
+    params = {
+        "photo_reference": photo_reference,
+        "maxwidth": max_width,
+        "maxheight": max_height,
+        "key": api_key,
+    }
 
-        response = await client.get(
-            "https://maps.googleapis.com/maps/api/place/photo",
-            params=params,
-        )
+    try:
+        async with provider_slot("google_places"):
+            # The photo endpoint answers with a redirect to the image CDN
+            response = await client.get(
+                "https://maps.googleapis.com/maps/api/place/photo",
+                params=params,
+                follow_redirects=True,
+                timeout=60.0,
+            )
+    except httpx.HTTPError as e:
+        print(f"Failed to fetch place photo: {e}")
+        return None
 
-        if response.status_code == 200:
-            return response.content
+    if response.status_code == 200:
+        return response.content
 
-        return None
+    return None
 
 
 async def upload_ugc_photo_to_storage(
     photo_data: bytes,
     resort_id: str,
-    photo_index: int,
+    photo_index: int = 0,
+    fingerprint: Optional[ImageFingerprint] = None,
 ) -> Optional[str]:
     """
     Upload a UGC photo to Supabase Storage.
 
+    The object is named by content hash, so re-uploading a photo the
+    resort already has is skipped. Responsive WebP derivatives are stored
+    alongside (see derivative_fields()).
+
     Args:
         photo_data: Photo bytes
         resort_id: Resort UUID
-        photo_index: Index for naming
+        photo_index: Unused (object names are content-addressed now)
+        fingerprint: Precomputed fingerprint, if the caller has one
 
     Returns:
         Public URL or None
     """
     try:
-        supabase = get_supabase_client()
-
-        # Generate unique filename based on content hash
-        content_hash = hashlib.md5(photo_data).hexdigest()[:8]
-        filename = f"ugc/{resort_id}/ugc_{photo_index}_{content_hash}.jpg"
-
-        # Upload to storage
-        result = supabase.storage.from_("resort-images").upload(
-            path=filename,
-            file=photo_data,
-            file_options={"content-type": "image/jpeg", "upsert": "true"},
+        stored = await run_db(
+            store_image,
+            photo_data,
+            f"ugc/{resort_id}",
+            "image/jpeg",
+            fingerprint,
+            derivatives=True,
         )
-
-        # Get public URL
-        public_url = supabase.storage.from_("resort-images").get_public_url(filename)
-        return public_url
+        return stored.url
 
     except Exception as e:
         print(f"Failed to upload UGC photo: {e}")
@@ -451,9 +486,6 @@ async def classify_photo_with_vision(
 
         client = genai.Client(api_key=settings.google_api_key)
 
-        # Encode image to base64
-        image_b64 = base64.b64encode(photo_data).decode("utf-8")
-
         prompt = """Analyze this ski resort photo and classify it.
 
 Return a JSON object with:
@@ -481,22 +513,24 @@ Lower family_relevance for:
 - Parking lots
 """
 
-        response = client.models.generate_content(
-            model="gemini-2.0-flash",
-            contents=[
-                types.Content(
-                    parts=[
-                        types.Part(text=prompt),
-                        types.Part(
-                            inline_data=types.Blob(
-                                mime_type="image/jpeg",
-                                data=photo_data,
-                            )
-                        ),
-                    ]
-                )
-            ],
-        )
+        # Async client so several photos can be classified at once
+        async with provider_slot("gemini"):
+            response = await client.aio.models.generate_content(
+                model="gemini-2.0-flash",
+                contents=[
+                    types.Content(
+                        parts=[
+                            types.Part(text=prompt),
+                            types.Part(
+                                inline_data=types.Blob(
+                                    mime_type="image/jpeg",
+                                    data=photo_data,
+                                )
+                            ),
+                        ]
+                    )
+                ],
+            )
 
         # Parse response
         import json
@@ -529,6 +563,129 @@ Lower family_relevance for:
         return PhotoCategory.UNKNOWN, 0.5
 
 
+# Stores one accepted photo's bytes and returns its public URL (or None)
+PhotoStore = Callable[[UGCPhoto, bytes, int], Awaitable[Optional[str]]]
+
+
+async def _run_photo_pipeline(
+    photo_refs: list[dict],
+    max_photos: int,
+    filter_with_vision: bool,
+    min_relevance: float,
+    store: Optional[PhotoStore] = None,
+    dedupe: Optional[DuplicateFilter] = None,
+    concurrency: int = UGC_PIPELINE_CONCURRENCY,
+) -> tuple[list[UGCPhoto], float, int]:
+    """Stream photo references through fetch -> classify -> store.
+
+    A few workers pull references in Places order. A worker only starts a
+    new photo while accepted + in-flight photos are below max_photos, so
+    nothing is fetched once the quota can be met. When a photo is rejected
+    (or its upload fails) the same worker moves on to the next reference.
+    With a dedupe filter, photos matching one already kept (exactly or by
+    perceptual hash) are dropped right after download, before the vision
+    call. A photo's fingerprint is reserved in the filter as soon as it
+    passes that check, so a near-duplicate being processed at the same time
+    is dropped too, and released again if the photo is rejected or its
+    upload fails.
+
+    With a store, each photo's bytes are handed over and dropped as soon as
+    the store returns. Without one, accepted photos keep their bytes on
+    photo._bytes for the caller.
+
+    Returns:
+        (accepted photos in reference order, API cost, duplicates skipped)
+    """
+    refs = iter(enumerate(photo_refs))
+    accepted: dict[int, UGCPhoto] = {}
+    cost = 0.0
+    claimed = 0  # Accepted photos, including ones still uploading
+    in_flight = 0  # Pulled but not yet accepted or rejected
+    duplicates = 0
+
+    async def worker() -> None:
+        nonlocal cost, claimed, in_flight, duplicates
+
+        while claimed + in_flight < max_photos:
+            try:
+                index, ref_data = next(refs)
+            except StopIteration:
+                return
+
+            photo_ref = ref_data.get("photo_reference")
+            if not photo_ref:
+                continue
+
+            in_flight += 1
+            fingerprint = None
+            kept = False
+            try:
+                try:
+                    photo_bytes = await fetch_place_photo(photo_ref)
+                    cost += PHOTO_FETCH_COST
+                    if not photo_bytes:
+                        continue
+
+                    # Decoding for the perceptual hash is CPU work: keep it off the loop
+                    fingerprint = await asyncio.to_thread(fingerprint_image, photo_bytes)
+                    if dedupe is not None:
+                        if dedupe.seen(fingerprint):
+                            fingerprint = None  # Not ours to release
+                            duplicates += 1
+                            continue
+                        dedupe.add(fingerprint)  # Reserve before the slow steps
+
+                    category = PhotoCategory.UNKNOWN
+                    relevance = 0.5
+
+                    if filter_with_vision:
+                        category, relevance = await classify_photo_with_vision(photo_bytes)
+                        cost += VISION_COST
+
+                        # Skip low-relevance photos
+                        if relevance < min_relevance:
+                            continue
+                finally:
+                    in_flight -= 1
+
+                photo = UGCPhoto(
+                    url="",  # Set after upload
+                    photo_reference=photo_ref,
+                    width=ref_data.get("width", 0),
+                    height=ref_data.get("height", 0),
+                    attributions=ref_data.get("html_attributions", []),
+                    category=category,
+                    relevance_score=relevance,
+                    fingerprint=fingerprint,
+                )
+
+                if store is None:
+                    photo._bytes = photo_bytes  # type: ignore
+                    accepted[index] = photo
+                    claimed += 1
+                    kept = True
+                    continue
+
+                claimed += 1
+                url = await store(photo, photo_bytes, index)
+                photo_bytes = None  # Release before fetching the next photo
+
+                if url:
+                    photo.url = url
+                    accepted[index] = photo
+                    kept = True
+                else:
+                    claimed -= 1  # Free the slot for the next reference
+            finally:
+                if dedupe is not None and fingerprint is not None and not kept:
+                    dedupe.discard(fingerprint)
+
+    workers = max(1, min(concurrency, max_photos))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    return [accepted[i] for i in sorted(accepted)], cost, duplicates
+
+
 async def fetch_ugc_photos(
     resort_name: str,
     country: str,
@@ -537,10 +694,16 @@ async def fetch_ugc_photos(
     max_photos: int = 10,
     filter_with_vision: bool = True,
     min_relevance: float = 0.4,
+    store: Optional[PhotoStore] = None,
+    dedupe: Optional[DuplicateFilter] = None,
 ) -> UGCPhotoResult:
     """
     Fetch user-generated photos for a ski resort from Google Places.
 
+    Photos are fetched and classified concurrently from the first
+    max_photos references, and fetching stops once max_photos relevant
+    photos have been accepted.
+
     Args:
         resort_name: Name of the ski resort
         country: Country where resort is located
@@ -549,6 +712,11 @@ async def fetch_ugc_photos(
         max_photos: Maximum photos to return
         filter_with_vision: Use Gemini to filter for family-relevant photos
         min_relevance: Minimum relevance score to keep (0-1)
+        store: Optional async callback (photo, bytes, index) -> URL. When
+            given, photos are uploaded as they are accepted and their bytes
+            are not kept; otherwise each photo carries photo._bytes.
+        dedupe: Optional filter of images already kept; exact and near
+            duplicates are skipped before vision classification
 
     Returns:
         UGCPhotoResult with photos and metadata
@@ -557,7 +725,7 @@ async def fetch_ugc_photos(
 
     # Step 1: Find Place ID
     place_id = await find_place_id(resort_name, country, latitude, longitude)
-    cost += 0.003  # Find Place API cost
+    cost += FIND_PLACE_COST
 
     if not place_id:
         return UGCPhotoResult(
@@ -568,7 +736,7 @@ async def fetch_ugc_photos(
 
     # Step 2: Get Place Details with photo references
     details = await get_place_details(place_id)
-    cost += 0.017  # Place Details API cost
+    cost += PLACE_DETAILS_COST
 
     if not details:
         return UGCPhotoResult(
@@ -591,47 +759,16 @@ async def fetch_ugc_photos(
             cost=cost,
         )
 
-    # Step 3: Fetch photos (limit to save costs)
-    photos_to_fetch = photo_refs[:max_photos]
-    photos: list[UGCPhoto] = []
-
-    for ref_data in photos_to_fetch:
-        photo_ref = ref_data.get("photo_reference")
-        if not photo_ref:
-            continue
-
-        photo_bytes = await fetch_place_photo(photo_ref)
-        cost += 0.007  # Photo API cost
-
-        if not photo_bytes:
-            continue
-
-        # Classify with vision if enabled
-        category = PhotoCategory.UNKNOWN
-        relevance = 0.5
-
-        if filter_with_vision:
-            category, relevance = await classify_photo_with_vision(photo_bytes)
-            cost += 0.002  # Vision API cost (Gemini Flash is cheap)
-
-            # Skip low-relevance photos
-            if relevance < min_relevance:
-                continue
-
-        # Create photo object (URL will be set after storage upload)
-        photo = UGCPhoto(
-            url="",  # Will be set after upload
-            photo_reference=photo_ref,
-            width=ref_data.get("width", 0),
-            height=ref_data.get("height", 0),
-            attributions=ref_data.get("html_attributions", []),
-            category=category,
-            relevance_score=relevance,
-        )
-
-        # Store photo bytes temporarily for upload
-        photo._bytes = photo_bytes  # type: ignore
-        photos.append(photo)
+    # Step 3: Stream photos through fetch -> classify (-> store)
+    photos, pipeline_cost, duplicates = await _run_photo_pipeline(
+        photo_refs[:max_photos],
+        max_photos=max_photos,
+        filter_with_vision=filter_with_vision,
+        min_relevance=min_relevance,
+        store=store,
+        dedupe=dedupe,
+    )
+    cost += pipeline_cost
 
     # Sort by relevance
     photos.sort(key=lambda p: p.relevance_score, reverse=True)
@@ -643,6 +780,7 @@ async def fetch_ugc_photos(
         place_name=details.get("name"),
         total_found=total_found,
         filtered_count=len(photos),
+        duplicates_skipped=duplicates,
         cost=cost,
     )
 
@@ -659,7 +797,10 @@ async def fetch_and_store_ugc_photos(
     """
     Fetch UGC photos and store them in Supabase.
 
-    This is the main entry point for the pipeline.
+    This is the main entry point for the pipeline. Each photo is uploaded
+    as soon as it passes classification, so only the photos in flight are
+    ever held in memory. Photos the resort already has (same bytes or the
+    same view) are skipped, and uploads are content-addressed.
 
     Args:
         resort_id: Resort UUID for storage path
@@ -673,7 +814,17 @@ async def fetch_and_store_ugc_photos(
     Returns:
         UGCPhotoResult with stored photos
     """
-    # Fetch photos
+
+    async def store(photo: UGCPhoto, photo_data: bytes, index: int) -> Optional[str]:
+        return await upload_ugc_photo_to_storage(
+            photo_data=photo_data,
+            resort_id=resort_id,
+            photo_index=index,
+            fingerprint=photo.fingerprint,
+        )
+
+    dedupe = await run_db(load_resort_duplicate_filter, resort_id)
+
     result = await fetch_ugc_photos(
         resort_name=resort_name,
         country=country,
@@ -681,51 +832,39 @@ async def fetch_and_store_ugc_photos(
         longitude=longitude,
         max_photos=max_photos,
         filter_with_vision=filter_with_vision,
+        store=store,
+        dedupe=dedupe,
     )
 
     if not result.success or not result.photos:
         return result
 
-    # Upload to storage and update URLs
-    stored_photos: list[UGCPhoto] = []
-
-    for i, photo in enumerate(result.photos):
-        if not hasattr(photo, "_bytes") or not photo._bytes:  # type: ignore
-            continue
+    # Store references in database (one bulk write)
+    rows = [
+        {
+            "resort_id": resort_id,
+            "image_type": "ugc",
+            "image_url": photo.url,  # Fixed: was "url", schema has "image_url"
+            "source": "google_places",
+            "alt_text": f"User photo of {resort_name} - {photo.category.value}",
+            "attribution": "; ".join(photo.attributions) if photo.attributions else None,
+            "metadata": {
+                "category": photo.category.value,
+                "relevance_score": photo.relevance_score,
+                "place_id": result.place_id,
+                **(photo.fingerprint.as_metadata() if photo.fingerprint else {}),
+            },
+            **derivative_fields(photo.url),
+        }
+        for photo in result.photos
+    ]
 
-        url = await upload_ugc_photo_to_storage(
-            photo_data=photo._bytes,  # type: ignore
-            resort_id=resort_id,
-            photo_index=i,
-        )
+    try:
+        supabase = get_supabase_client()
+        await run_db(supabase.table("resort_images").upsert(rows).execute)
+    except Exception as e:
+        print(f"Failed to store UGC photo references: {e}")
 
-        if url:
-            photo.url = url
-            stored_photos.append(photo)
-
-    # Store references in database
-    if stored_photos:
-        try:
-            supabase = get_supabase_client()
-
-            for photo in stored_photos:
-                supabase.table("resort_images").upsert({
-                    "resort_id": resort_id,
-                    "image_type": "ugc",
-                    "image_url": photo.url,  # Fixed: was "url", schema has "image_url"
-                    "source": "google_places",
-                    "alt_text": f"User photo of {resort_name} - {photo.category.value}",
-                    "attribution": "; ".join(photo.attributions) if photo.attributions else None,
-                    "metadata": {
-                        "category": photo.category.value,
-                        "relevance_score": photo.relevance_score,
-                        "place_id": result.place_id,
-                    },
-                }).execute()
-        except Exception as e:
-            print(f"Failed to store UGC photo references: {e}")
-
-    result.photos = stored_photos
     return result
 
 
@@ -0,0 +1,61 @@
+"""Per-provider concurrency limits for external APIs.
+
+When several resorts run through the pipeline at once, each one fans out
+7-10 research queries plus Places and LLM calls. Without a shared cap,
+4 concurrent resorts would hit Tavily with ~28 simultaneous requests and
+trip its rate limiter. Every outbound call to a rate-limited provider
+should go through provider_slot() so the whole process shares one budget
+of in-flight requests per provider.
+
+Usage:
+    async with provider_slot("tavily"):
+        response = await loop.run_in_executor(None, _search)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from weakref import WeakKeyDictionary
+
+
+# Max in-flight requests per provider (across all concurrent resorts)
+PROVIDER_LIMITS: dict[str, int] = {
+    "exa": 4,
+    "brave": 2,  # Brave free/basic tiers are the strictest (1-20 req/s)
+    "tavily": 5,
+    "google_places": 6,
+    "anthropic": 8,
+    "gemini": 4,  # UGC photo vision classification
+    "overpass": 2,  # Public Overpass instances allow ~2 concurrent queries per IP
+    "vercel_revalidate": 3,  # /api/revalidate allows 10 requests/minute per IP
+}
+
+# Fallback for providers not listed above
+DEFAULT_PROVIDER_LIMIT = 4
+
+
+# Semaphores are bound to the event loop they are first awaited on, and
+# cron.py runs several asyncio.run() calls in one process. Keep one set of
+# semaphores per loop so a finished loop never leaks a bound semaphore.
+_semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """Get the shared semaphore for a provider on the running event loop."""
+    loop = asyncio.get_running_loop()
+    loop_semaphores = _semaphores.setdefault(loop, {})
+
+    if provider not in loop_semaphores:
+        limit = PROVIDER_LIMITS.get(provider, DEFAULT_PROVIDER_LIMIT)
+        loop_semaphores[provider] = asyncio.Semaphore(limit)
+
+    return loop_semaphores[provider]
+
+
+@asynccontextmanager
+async def provider_slot(provider: str) -> AsyncIterator[None]:
+    """Hold one of the provider's in-flight request slots for the block."""
+    async with get_provider_semaphore(provider):
+        yield
@@ -1,9 +1,17 @@
 """Supabase client for database operations."""
 
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
 from supabase import Client, create_client
 
 from .config import settings
 
+T = TypeVar("T")
+
 
 # Module-level client instance (replaces @lru_cache which caches errors)
 _supabase_client: Client | None = None
@@ -48,6 +56,52 @@ def reset_supabase_client() -> None:
     _supabase_client = None
 
 
+# =============================================================================
+# Async access
+# =============================================================================
+#
+# supabase-py's sync client blocks the calling thread for the whole HTTP
+# round trip. Called from a coroutine, that stalls every other in-flight
+# task (e.g. the parallel searches in search_resort_info). Async code should
+# hand blocking calls to this bounded pool instead. The pool is shared by
+# all event loops in the process, and its size caps concurrent DB requests.
+
+_db_executor: ThreadPoolExecutor | None = None
+
+
+def _get_db_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.db_max_workers),
+            thread_name_prefix="supabase",
+        )
+    return _db_executor
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking database function without stalling the event loop.
+
+    Usage:
+        cached = await run_db(get_cached_results, resort_name, country, "lift_prices", "exa")
+    """
+    loop = asyncio.get_running_loop()
+    # Carry context variables (spend meters, publish outbox) into the worker
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _get_db_executor(), functools.partial(context.run, fn, *args, **kwargs)
+    )
+
+
+async def execute_async(query: Any) -> Any:
+    """Execute a built supabase-py query on the DB pool.
+
+    Usage:
+        result = await execute_async(client.table("resorts").select("id").eq("slug", slug))
+    """
+    return await run_db(query.execute)
+
+
 def get_resort_with_details(resort_id: str) -> dict | None:
     """Fetch a resort with all related data."""
     client = get_supabase_client()
@@ -0,0 +1,10 @@
+"""Shared pytest setup.
+
+Settings requires these at import time; tests never reach the real services.
+"""
+
+import os
+
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:54321")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-anthropic-key")
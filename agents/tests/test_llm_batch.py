@@ -0,0 +1,121 @@
+"""MessageBatchJob against the local Message Batches API stub."""
+
+import json
+import random
+
+import pytest
+
+from scripts.batch_api_stub import start_stub_server
+from shared import llm_batch
+from shared.budget_ledger import BudgetLedger
+from shared.config import settings
+from shared.llm_batch import BatchResult, MessageBatchJob
+from shared.llm_client import reset_claude_clients
+
+POLL_INTERVAL = 0.05
+
+
+@pytest.fixture
+def batch_api(monkeypatch):
+    """Start stub servers on free ports and point the Claude client at them."""
+    servers = []
+
+    def start(latency: float = 0.1, error_rate: float = 0.0):
+        server = start_stub_server(port=0, latency=latency, error_rate=error_rate)
+        servers.append(server)
+        host, port = server.server_address[:2]
+        monkeypatch.setattr(settings, "anthropic_base_url", f"http://{host}:{port}")
+        reset_claude_clients()
+        return server
+
+    # Budget and cost rows live in Supabase; keep both in memory
+    ledger = BudgetLedger(daily_limit=100.0)
+    monkeypatch.setattr(ledger, "refresh", lambda: 0.0)
+    monkeypatch.setattr(llm_batch, "get_budget_ledger", lambda: ledger)
+    monkeypatch.setattr(llm_batch, "record_llm_usage", lambda *args, **kwargs: 0.001)
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+    reset_claude_clients()
+
+
+def _job(tmp_path, received: list[BatchResult], count: int = 5) -> MessageBatchJob:
+    job = MessageBatchJob("test-job", cost_per_request_usd=0.01, state_dir=tmp_path)
+
+    async def handler(result: BatchResult) -> None:
+        received.append(result)
+
+    for i in range(count):
+        job.add(f"item-{i}", f"prompt {i}", handler=handler, model="claude-test")
+    return job
+
+
+async def test_results_come_back_in_order(batch_api, tmp_path):
+    batch_api()
+    received: list[BatchResult] = []
+
+    report = await _job(tmp_path, received).run(poll_interval=POLL_INTERVAL, timeout=10)
+
+    assert report.complete
+    assert report.submitted == 5
+    assert report.delivered == 5
+    assert [r.custom_id for r in received] == [f"item-{i}" for i in range(5)]
+    assert [r.text for r in received] == [f"[stub] prompt {i}" for i in range(5)]
+    assert all(r.succeeded for r in received)
+
+
+async def test_errored_requests_are_resubmitted(batch_api, tmp_path):
+    random.seed(7)  # The stub draws errors from the module-level generator
+    batch_api(error_rate=0.5)
+    received: list[BatchResult] = []
+
+    reports = []
+    for _ in range(20):
+        report = await _job(tmp_path, received, count=8).run(
+            poll_interval=POLL_INTERVAL, timeout=10
+        )
+        reports.append(report)
+        if report.complete:
+            break
+
+    assert reports[0].errored > 0
+    assert reports[-1].complete
+    # Each rerun sends only what errored before
+    assert [r.submitted for r in reports[1:]] == [r.errored for r in reports[:-1]]
+
+    succeeded = [r.custom_id for r in received if r.succeeded]
+    assert sorted(succeeded) == [f"item-{i}" for i in range(8)]
+    assert all(r.error == "stub error" for r in received if not r.succeeded)
+
+
+async def test_job_resumes_from_saved_batch_id(batch_api, tmp_path):
+    batch_api(latency=0.5)
+
+    # First run stops waiting before the batch ends
+    first_received: list[BatchResult] = []
+    first = await _job(tmp_path, first_received).run(poll_interval=POLL_INTERVAL, timeout=0)
+
+    assert first.submitted == 5
+    assert first.pending == 5
+    assert first_received == []
+    state = json.loads((tmp_path / "test-job.json").read_text())
+    assert list(state["batches"]) == first.batch_ids
+
+    # A re-run with the same requests picks the saved batch up instead of resubmitting
+    received: list[BatchResult] = []
+    second = await _job(tmp_path, received).run(poll_interval=POLL_INTERVAL, timeout=10)
+
+    assert second.submitted == 0
+    assert second.batch_ids == first.batch_ids
+    assert second.delivered == 5
+    assert second.complete
+    assert [r.custom_id for r in received] == [f"item-{i}" for i in range(5)]
+
+    # Delivered results are recorded, so a third run does nothing
+    third = await _job(tmp_path, []).run(poll_interval=POLL_INTERVAL, timeout=10)
+    assert third.submitted == 0
+    assert third.delivered == 0
+    assert third.previously_delivered == 5
@@ -0,0 +1,17 @@
+-- Migration: Daily API spend aggregate
+-- Purpose: Let the agents' budget ledger load today's spend in one query
+-- instead of fetching every api_cost row and summing in Python
+
+-- Partial index: budget lookups only ever touch api_cost rows by time
+CREATE INDEX IF NOT EXISTS idx_audit_api_cost_created
+    ON agent_audit_log(created_at DESC)
+    WHERE action = 'api_cost';
+
+-- Sum of api_cost amounts logged since p_since (usually UTC midnight)
+CREATE OR REPLACE FUNCTION get_api_spend_since(p_since TIMESTAMPTZ)
+RETURNS NUMERIC AS $$
+    SELECT COALESCE(SUM((input_data->>'amount_usd')::NUMERIC), 0)
+    FROM agent_audit_log
+    WHERE action = 'api_cost'
+      AND created_at >= p_since;
+$$ LANGUAGE sql STABLE;
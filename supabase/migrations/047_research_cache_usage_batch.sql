@@ -0,0 +1,24 @@
+-- Migration: Batched research cache usage tracking
+-- Purpose: The agents count cache hits in memory and write them back in one
+-- call instead of an UPDATE per hit on the search critical path
+
+-- Add p_counts[i] to use_count for research_cache row p_ids[i]
+CREATE OR REPLACE FUNCTION increment_research_cache_usage(
+    p_ids UUID[],
+    p_counts INTEGER[],
+    p_last_used_at TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS INTEGER AS $$
+DECLARE
+    updated INTEGER;
+BEGIN
+    UPDATE research_cache rc
+    SET use_count = COALESCE(rc.use_count, 0) + u.hits,
+        last_used_at = GREATEST(COALESCE(rc.last_used_at, p_last_used_at), p_last_used_at)
+    FROM unnest(p_ids, p_counts) AS u(id, hits)
+    WHERE rc.id = u.id;
+
+    GET DIAGNOSTICS updated = ROW_COUNT;
+    RETURN updated;
+END;
+$$ LANGUAGE plpgsql;
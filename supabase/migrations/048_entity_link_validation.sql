@@ -0,0 +1,20 @@
+-- Migration: Entity link validation state
+-- Purpose: Let the weekly link validator walk the whole entity_link_cache.
+-- Each run checks the rows with the oldest last_checked_at (never-checked
+-- rows first) and writes the result back, so consecutive runs cover the
+-- next slice instead of re-checking the same links.
+
+ALTER TABLE entity_link_cache ADD COLUMN IF NOT EXISTS last_checked_at TIMESTAMPTZ;
+ALTER TABLE entity_link_cache ADD COLUMN IF NOT EXISTS link_status TEXT;      -- 'ok', 'broken', 'rate_limited', 'error'
+ALTER TABLE entity_link_cache ADD COLUMN IF NOT EXISTS last_status_code INTEGER;
+ALTER TABLE entity_link_cache ADD COLUMN IF NOT EXISTS last_check_error TEXT;
+
+-- Validation cursor: oldest-checked links that have a direct_url
+CREATE INDEX IF NOT EXISTS idx_entity_link_cache_last_checked
+ON entity_link_cache(last_checked_at NULLS FIRST, id)
+WHERE direct_url IS NOT NULL;
+
+-- Broken-link reporting
+CREATE INDEX IF NOT EXISTS idx_entity_link_cache_link_status
+ON entity_link_cache(link_status)
+WHERE link_status IS NOT NULL AND link_status <> 'ok';
@@ -0,0 +1,17 @@
+-- Migration: Responsive image derivatives
+-- Purpose: Images are now stored with a ladder of width-bucketed WebP (and
+-- optionally AVIF) derivatives plus a tiny blurred placeholder. Record them
+-- on the image row so the web app can build srcset/sizes and a blurDataURL
+-- without probing storage.
+--
+-- variants: [{"url", "format", "width", "height", "size"}, ...] ordered by width
+-- placeholder: data:image/webp;base64,... (~300 bytes)
+-- width/height (existing columns) now hold the original's dimensions.
+
+ALTER TABLE resort_images ADD COLUMN IF NOT EXISTS variants JSONB NOT NULL DEFAULT '[]'::jsonb;
+ALTER TABLE resort_images ADD COLUMN IF NOT EXISTS placeholder TEXT;
+
+COMMENT ON COLUMN resort_images.variants IS
+'Responsive derivatives: [{url, format, width, height, size}] ordered by width';
+COMMENT ON COLUMN resort_images.placeholder IS
+'Tiny blurred WebP data URI for next/image placeholder="blur"';
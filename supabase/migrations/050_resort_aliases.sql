@@ -0,0 +1,10 @@
+-- Migration: Resort name aliases
+-- Purpose: Alternate names a resort is known by ("Whistler" for Whistler
+-- Blackcomb, "Alpe d'Huez Grand Domaine" for Alpe d'Huez). The in-process
+-- resort name index (resort_index.py) matches these exactly, alongside the
+-- name and slug, when checking discovery candidates for duplicates.
+
+ALTER TABLE resorts ADD COLUMN IF NOT EXISTS aliases TEXT[] NOT NULL DEFAULT '{}';
+
+COMMENT ON COLUMN resorts.aliases IS
+'Alternate resort names used for duplicate detection (normalized at match time)';
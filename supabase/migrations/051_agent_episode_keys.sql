@@ -0,0 +1,44 @@
+-- Migration: Indexed objective keys for episodic memory recall
+-- Purpose: AgentMemory.recall_similar() used to fetch an agent's 50 most
+-- recent episodes and substring-match the JSON-encoded objective, decoding
+-- four blobs per hit. Episodes older than the last 50 were never found.
+-- The objective keys recall matches on now live in their own columns, with
+-- lowercased *_key columns and composite indexes for the lookups.
+
+ALTER TABLE agent_episodes ADD COLUMN IF NOT EXISTS resort_name TEXT;
+ALTER TABLE agent_episodes ADD COLUMN IF NOT EXISTS country TEXT;
+ALTER TABLE agent_episodes ADD COLUMN IF NOT EXISTS task_type TEXT;
+ALTER TABLE agent_episodes ADD COLUMN IF NOT EXISTS resort_key TEXT;
+ALTER TABLE agent_episodes ADD COLUMN IF NOT EXISTS country_key TEXT;
+
+-- Backfill from existing objectives. store_episode() wrote json.dumps()
+-- output, so most objectives are JSONB strings wrapping the object.
+WITH parsed AS (
+    SELECT
+        id,
+        CASE jsonb_typeof(objective)
+            WHEN 'string' THEN (objective #>> '{}')::jsonb
+            ELSE objective
+        END AS obj
+    FROM agent_episodes
+    WHERE resort_name IS NULL AND country IS NULL AND task_type IS NULL
+)
+UPDATE agent_episodes e
+SET
+    resort_name = parsed.obj ->> 'resort_name',
+    country = parsed.obj ->> 'country',
+    task_type = parsed.obj ->> 'task_type',
+    resort_key = lower(btrim(parsed.obj ->> 'resort_name')),
+    country_key = lower(btrim(parsed.obj ->> 'country'))
+FROM parsed
+WHERE e.id = parsed.id AND jsonb_typeof(parsed.obj) = 'object';
+
+CREATE INDEX IF NOT EXISTS idx_agent_episodes_resort_key
+    ON agent_episodes(agent_name, resort_key, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_agent_episodes_country_key
+    ON agent_episodes(agent_name, country_key, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_agent_episodes_task_type
+    ON agent_episodes(agent_name, task_type, created_at DESC);
+
+COMMENT ON COLUMN agent_episodes.resort_key IS
+'lower(trim(objective.resort_name)), matched by AgentMemory.recall_similar()';
@@ -0,0 +1,27 @@
+-- Migration: Trail map (Overpass) cache
+-- Purpose: get_trail_map() posted a large Overpass query on every full
+-- pipeline run. Parsed, simplified pistes and lifts are now cached here,
+-- keyed by the query bbox snapped to a 0.01° grid, so refreshes of the same
+-- resort (or a neighbour with the same snapped bbox) skip Overpass.
+-- Geometry is stored as flat [lat, lon, lat, lon, ...] arrays after
+-- Douglas-Peucker simplification.
+
+CREATE TABLE IF NOT EXISTS trail_map_cache (
+    bbox_key TEXT PRIMARY KEY,          -- "south,west,north,east" on the 0.01° grid
+    payload JSONB NOT NULL,             -- {"v": 1, "pistes": [...], "lifts": [...]}
+    piste_count INTEGER NOT NULL DEFAULT 0,
+    lift_count INTEGER NOT NULL DEFAULT 0,
+    fetched_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_trail_map_cache_expires ON trail_map_cache(expires_at);
+
+ALTER TABLE trail_map_cache ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role manages trail map cache"
+ON trail_map_cache
+FOR ALL
+TO service_role
+USING (true)
+WITH CHECK (true);
@@ -0,0 +1,116 @@
+-- Migration: Materialized Perfect Page scores
+-- Purpose: score_resort_page() re-derived every checklist item from six
+-- queries each time it ran. Scores are now stored per resort with a hash of
+-- the inputs they were computed from. Triggers on the tables the checks read
+-- bump an invalidation counter, so refresh_page_scores() only re-scores
+-- stale rows, and the orchestrator's quality queue reads low scores with a
+-- single indexed query.
+--
+-- Staleness uses counters rather than timestamps: the refresh job records
+-- the invalidation count it read *before* loading inputs, so a change that
+-- lands mid-refresh leaves the row stale instead of being lost.
+
+CREATE TABLE IF NOT EXISTS resort_page_scores (
+    resort_id UUID PRIMARY KEY REFERENCES resorts(id) ON DELETE CASCADE,
+    input_hash TEXT,                        -- sha256 of the inputs the checks read
+    score_pct REAL,
+    passed_checks SMALLINT,
+    total_checks SMALLINT,
+    failing_checks TEXT[] NOT NULL DEFAULT '{}',
+    check_results JSONB NOT NULL DEFAULT '{}'::JSONB,   -- {check_id: passed}
+    resort_status TEXT,                     -- Copy of resorts.status for the queue index
+    invalidations BIGINT NOT NULL DEFAULT 1,   -- Bumped by triggers on input changes
+    scored_version BIGINT NOT NULL DEFAULT 0,  -- invalidations value the score reflects
+    stale BOOLEAN GENERATED ALWAYS AS (invalidations > scored_version) STORED,
+    scored_at TIMESTAMP WITH TIME ZONE
+);
+
+-- Quality queue: lowest fresh scores for a status
+CREATE INDEX IF NOT EXISTS idx_resort_page_scores_queue
+ON resort_page_scores(resort_status, score_pct)
+WHERE NOT stale;
+
+-- Refresh worklist
+CREATE INDEX IF NOT EXISTS idx_resort_page_scores_stale
+ON resort_page_scores(resort_id)
+WHERE stale;
+
+-- Every existing resort starts stale (scored on the first refresh)
+INSERT INTO resort_page_scores (resort_id)
+SELECT id FROM resorts
+ON CONFLICT (resort_id) DO NOTHING;
+
+-- ============================================
+-- INVALIDATION TRIGGERS
+-- ============================================
+
+CREATE OR REPLACE FUNCTION invalidate_resort_page_score()
+RETURNS TRIGGER AS $$
+DECLARE
+    target UUID;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        -- Update only: during a resort delete cascade the resort is already gone
+        UPDATE resort_page_scores
+        SET invalidations = invalidations + 1
+        WHERE resort_id = OLD.resort_id;
+        RETURN NULL;
+    END IF;
+
+    -- Separate branches: NEW.id only exists on resorts
+    IF TG_TABLE_NAME = 'resorts' THEN
+        target := NEW.id;
+    ELSE
+        target := NEW.resort_id;
+    END IF;
+
+    INSERT INTO resort_page_scores (resort_id)
+    VALUES (target)
+    ON CONFLICT (resort_id) DO UPDATE
+    SET invalidations = resort_page_scores.invalidations + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER resorts_invalidate_page_score
+    AFTER INSERT OR UPDATE OF name, status, trail_map_data ON resorts
+    FOR EACH ROW
+    EXECUTE FUNCTION invalidate_resort_page_score();
+
+CREATE TRIGGER resort_content_invalidate_page_score
+    AFTER INSERT OR UPDATE OR DELETE ON resort_content
+    FOR EACH ROW
+    EXECUTE FUNCTION invalidate_resort_page_score();
+
+CREATE TRIGGER resort_family_metrics_invalidate_page_score
+    AFTER INSERT OR UPDATE OR DELETE ON resort_family_metrics
+    FOR EACH ROW
+    EXECUTE FUNCTION invalidate_resort_page_score();
+
+CREATE TRIGGER resort_costs_invalidate_page_score
+    AFTER INSERT OR UPDATE OR DELETE ON resort_costs
+    FOR EACH ROW
+    EXECUTE FUNCTION invalidate_resort_page_score();
+
+CREATE TRIGGER resort_images_invalidate_page_score
+    AFTER INSERT OR UPDATE OR DELETE ON resort_images
+    FOR EACH ROW
+    EXECUTE FUNCTION invalidate_resort_page_score();
+
+CREATE TRIGGER resort_links_invalidate_page_score
+    AFTER INSERT OR UPDATE OR DELETE ON resort_links
+    FOR EACH ROW
+    EXECUTE FUNCTION invalidate_resort_page_score();
+
+-- ============================================
+-- ROW LEVEL SECURITY
+-- ============================================
+
+ALTER TABLE resort_page_scores ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role manages page scores"
+ON resort_page_scores
+FOR ALL
+TO service_role
+USING (true)
+WITH CHECK (true);
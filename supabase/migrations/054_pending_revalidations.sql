@@ -0,0 +1,26 @@
+-- Migration: Pending page revalidations
+-- Purpose: the publish outbox defers revalidation and IndexNow pings to the
+-- end of a run, then sends them paced to /api/revalidate's 10 requests per
+-- minute. Paths are written here before sending and deleted once sent, so a
+-- run that is killed or hits its send deadline leaves them for the next
+-- run's flush instead of losing them.
+
+CREATE TABLE IF NOT EXISTS pending_revalidations (
+    path TEXT PRIMARY KEY,                  -- Page path, e.g. /resorts/austria/st-anton
+    reasons TEXT[] NOT NULL DEFAULT '{}',
+    revalidate BOOLEAN NOT NULL DEFAULT TRUE,
+    indexnow BOOLEAN NOT NULL DEFAULT FALSE,
+    queued_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_pending_revalidations_queued
+ON pending_revalidations(queued_at);
+
+ALTER TABLE pending_revalidations ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role manages pending revalidations"
+ON pending_revalidations
+FOR ALL
+TO service_role
+USING (true)
+WITH CHECK (true);
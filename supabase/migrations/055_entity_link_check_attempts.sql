@@ -0,0 +1,8 @@
+-- Migration: Entity link check attempts
+-- Purpose: Transient link check failures (timeouts, connection errors,
+-- HTTP 429) are retried on the next validation runs without stamping
+-- last_checked_at. This counter caps those retries so a link that keeps
+-- failing gets recorded and moves to the back of the cursor instead of
+-- holding the front on every run.
+
+ALTER TABLE entity_link_cache ADD COLUMN IF NOT EXISTS check_attempts INTEGER NOT NULL DEFAULT 0;